@@ -0,0 +1,51 @@
+# This Python file contains the generator of synthetic contacts used by the benchmarks, which draws the forenames,
+# surnames, and email domains from small pools (such that, as in a real contact book, many contacts share them) with a
+# seeded random number generator, such that every run of a benchmark measures the same contacts.
+
+import random
+from typing import Dict
+
+from contact_book.src.contact_book.constants import CONTACTS_DICT_KEYS
+
+FORENAMES = (
+    'Albert', 'Ada', 'Alan', 'Barbara', 'Blaise', 'Carl', 'Charles', 'Dorothy', 'Edsger', 'Emmy', 'Enrico', 'Erwin',
+    'Frances', 'Grace', 'Hedy', 'Isaac', 'James', 'Johannes', 'John', 'Katherine', 'Leonhard', 'Lise', 'Margaret',
+    'Marie', 'Max', 'Niels', 'Paul', 'Richard', 'Rosalind', 'Sophie', 'Werner', 'Wolfgang'
+)
+SURNAMES = (
+    'Bohr', 'Born', 'Byron', 'Curie', 'Dijkstra', 'Dirac', 'Einstein', 'Euler', 'Fermi', 'Feynman', 'Franklin', 'Gauss',
+    'Germain', 'Goodall', 'Heisenberg', 'Hodgkin', 'Hopper', 'Johnson', 'Kepler', 'Lamarr', 'Liskov', 'Lovelace',
+    'Maxwell', 'Meitner', 'Newton', 'Noether', 'Pascal', 'Pauli', 'Planck', 'Schrodinger', 'Turing', 'Von Neumann'
+)
+EMAIL_DOMAINS = (
+    'myquantummail.com', 'mytopquantummail.com', 'mybestquantummail.com', 'mycatsmailmaybe.com', 'myphdmail.com'
+)
+
+
+def generate_contacts_dict(number_of_contacts: int, seed: int = 0, first_id: int = 1) -> Dict:
+    """
+    Generate a dictionary of synthetic contacts in the format of contacts_dict.txt
+
+    :param number_of_contacts: the number of contacts to generate.
+    :param seed: the seed of the random number generator, such that the same contacts are generated for the same seed.
+    :param first_id: the id of the first contact generated, the next ones having consecutive ids.
+    :return: a dictionary with the keys "id", "forename", "surname", "email_address", and "mobile_number", each
+            mapped to a list of values
+    """
+
+    random_generator = random.Random(seed)
+    contacts_dict = {key: [] for key in CONTACTS_DICT_KEYS}
+
+    for contact_id in range(first_id, first_id + number_of_contacts):
+        forename = random_generator.choice(FORENAMES)
+        surname = random_generator.choice(SURNAMES)
+
+        contacts_dict['id'].append(contact_id)
+        contacts_dict['forename'].append(forename)
+        contacts_dict['surname'].append(surname)
+        contacts_dict['email_address'].append(
+            f'{forename}.{surname}{contact_id}@{random_generator.choice(EMAIL_DOMAINS)}'.lower().replace(' ', '')
+        )
+        contacts_dict['mobile_number'].append('07' + ''.join(random_generator.choices('0123456789', k=9)))
+
+    return contacts_dict
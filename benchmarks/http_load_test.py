@@ -0,0 +1,226 @@
+# This Python file contains the load test of the HTTP API server of the contacts (see 'http_server.py'), which starts
+# the server on synthetic contacts (see 'contacts_generator.py') in a separate process, sends it a mix of reads and
+# writes from several client processes over keep-alive connections for a given duration, and reports the requests
+# served per second and the percentiles of their latency, exiting with an error if fewer requests than a given minimum
+# were served per second.
+#
+# Usage (from the root directory of the repository):
+#     python -m benchmarks.http_load_test --number-of-contacts 100000 --duration 10
+#     python -m benchmarks.http_load_test --url http://127.0.0.1:8080  (to load test a server already running)
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+from benchmarks.contacts_generator import SURNAMES, generate_contacts_dict
+from contact_book.root import get_contact_book_root
+from contact_book.src.contact_book.constants import FILE_NAME_CONTACTS_DICT
+
+DEFAULT_NUMBER_OF_CONTACTS = 100000
+DEFAULT_DURATION_SECONDS = 10.0
+DEFAULT_CLIENT_PROCESSES = 2
+DEFAULT_CONNECTIONS_PER_PROCESS = 16
+DEFAULT_WRITE_RATIO = 0.1
+DEFAULT_MIN_REQUESTS_PER_SECOND = 1000
+
+
+def build_request(random_generator: random.Random, number_of_contacts: int, write_ratio: float) -> bytes:
+    """
+    Build a random request of the mix sent to the server: a write (creating or updating a contact) with the given
+    probability, or else a read (getting a contact, a page of contacts, or searching for a surname)
+    """
+
+    contact_id = random_generator.randint(1, number_of_contacts)
+    if random_generator.random() < write_ratio:
+        body = json.dumps({
+            'forename': 'Sheldon',
+            'surname': random_generator.choice(SURNAMES),
+            'email_address': 'sheldor@myphdmail.com',
+            'mobile_number': '07000000073'
+        }).encode('utf-8')
+        method, target = random_generator.choice((('POST', '/contacts'), ('PUT', f'/contacts/{contact_id}')))
+    else:
+        body = b''
+        method, target = 'GET', random_generator.choice((
+            f'/contacts/{contact_id}',
+            f'/contacts?offset={contact_id}&limit=10',
+            f'/search?query={random_generator.choice(SURNAMES)[:3]}&limit=10',
+        ))
+
+    return f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+async def run_connection(
+        host: str, port: int, deadline: float, number_of_contacts: int, write_ratio: float, seed: int
+) -> Tuple[List[float], int]:
+    """
+    Send requests one after the other on a keep-alive connection until the deadline
+
+    :return: a tuple (latencies of the requests served successfully in seconds, number of failed requests)
+    """
+
+    random_generator = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    latencies, number_of_failed_requests = [], 0
+
+    try:
+        while time.perf_counter() < deadline:
+            start_time = time.perf_counter()
+            writer.write(build_request(random_generator, number_of_contacts, write_ratio))
+
+            status = int((await reader.readline()).split()[1])
+            content_length = 0
+            while True:
+                header_line = await reader.readline()
+                if header_line == b'\r\n':
+                    break
+                if header_line.lower().startswith(b'content-length:'):
+                    content_length = int(header_line.split(b':')[1])
+            await reader.readexactly(content_length)
+
+            if status < 400:
+                latencies.append(time.perf_counter() - start_time)
+            else:
+                number_of_failed_requests += 1
+    finally:
+        writer.close()
+
+    return latencies, number_of_failed_requests
+
+
+def run_client_process(arguments: Tuple) -> Tuple[List[float], int]:
+
+    host, port, duration_seconds, connections, number_of_contacts, write_ratio, seed = arguments
+
+    async def run_connections():
+        deadline = time.perf_counter() + duration_seconds
+        return await asyncio.gather(*[
+            run_connection(host, port, deadline, number_of_contacts, write_ratio, seed * connections + connection)
+            for connection in range(connections)
+        ])
+
+    latencies, number_of_failed_requests = [], 0
+    for connection_latencies, connection_failed_requests in asyncio.run(run_connections()):
+        latencies.extend(connection_latencies)
+        number_of_failed_requests += connection_failed_requests
+    return latencies, number_of_failed_requests
+
+
+def start_server(number_of_contacts: int, temporary_dir: str) -> Tuple[subprocess.Popen, int]:
+    """
+    Start the server in a separate process on synthetic contacts saved in a temporary directory, on a port chosen by the
+    system
+
+    :return: a tuple (process of the server, port the server listens to)
+    """
+
+    with open(os.path.join(temporary_dir, FILE_NAME_CONTACTS_DICT), 'w') as contacts_dict_file:
+        json.dump(generate_contacts_dict(number_of_contacts), contacts_dict_file)
+
+    server_process = subprocess.Popen(
+        [
+            sys.executable, '-m', 'contact_book.src.contact_book.service.http_server', '--port', '0',
+            '--contacts-file-root-dir', os.path.relpath(temporary_dir, get_contact_book_root()) + '/'
+        ],
+        cwd=get_contact_book_root(),
+        stdout=subprocess.PIPE,
+        text=True
+    )
+
+    # The server prints the URL it serves on once the contacts are loaded, e.g., 'Serving ... on http://127.0.0.1:8080'
+    serving_line = server_process.stdout.readline()
+    if not serving_line:
+        raise RuntimeError("The server exited before serving the contacts.")
+    return server_process, urlsplit(serving_line.split()[-1]).port
+
+
+def run_http_load_test(
+        host: str,
+        port: int,
+        number_of_contacts: int,
+        duration_seconds: float,
+        client_processes: int,
+        connections_per_process: int,
+        write_ratio: float
+) -> Tuple[float, List[float], int]:
+    """
+    Load test a running server from several client processes
+
+    :return: a tuple (requests served successfully per second, their latencies in seconds, number of failed requests)
+    """
+
+    with multiprocessing.Pool(client_processes) as pool:
+        start_time = time.perf_counter()
+        process_results = pool.map(run_client_process, [
+            (host, port, duration_seconds, connections_per_process, number_of_contacts, write_ratio, seed)
+            for seed in range(client_processes)
+        ])
+        elapsed_seconds = time.perf_counter() - start_time
+
+    latencies, number_of_failed_requests = [], 0
+    for process_latencies, process_failed_requests in process_results:
+        latencies.extend(process_latencies)
+        number_of_failed_requests += process_failed_requests
+    return len(latencies) / elapsed_seconds, latencies, number_of_failed_requests
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Load test the HTTP API server of the contacts.")
+    argument_parser.add_argument('--url', help="the URL of a server already running, instead of starting one")
+    argument_parser.add_argument('--number-of-contacts', type=int, default=DEFAULT_NUMBER_OF_CONTACTS)
+    argument_parser.add_argument('--duration', type=float, default=DEFAULT_DURATION_SECONDS, help="in seconds")
+    argument_parser.add_argument('--client-processes', type=int, default=DEFAULT_CLIENT_PROCESSES)
+    argument_parser.add_argument('--connections-per-process', type=int, default=DEFAULT_CONNECTIONS_PER_PROCESS)
+    argument_parser.add_argument('--write-ratio', type=float, default=DEFAULT_WRITE_RATIO)
+    argument_parser.add_argument('--min-requests-per-second', type=float, default=DEFAULT_MIN_REQUESTS_PER_SECOND)
+    arguments = argument_parser.parse_args()
+
+    server_process, temporary_dir = None, None
+    try:
+        if arguments.url:
+            server_url = urlsplit(arguments.url)
+            server_host, server_port = server_url.hostname, server_url.port
+        else:
+            temporary_dir = tempfile.mkdtemp()
+            server_process, server_port = start_server(arguments.number_of_contacts, temporary_dir)
+            server_host = '127.0.0.1'
+
+        requests_per_second, request_latencies, failed_requests = run_http_load_test(
+            server_host,
+            server_port,
+            arguments.number_of_contacts,
+            arguments.duration,
+            arguments.client_processes,
+            arguments.connections_per_process,
+            arguments.write_ratio
+        )
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait()
+        if temporary_dir is not None:
+            shutil.rmtree(temporary_dir)
+
+    latency_percentiles = statistics.quantiles(request_latencies, n=100)
+    print(f"{len(request_latencies)} requests served ({failed_requests} failed) in {arguments.duration:g} s")
+    print(f"{requests_per_second:.0f} requests per second")
+    print(
+        f"latency (ms): p50 {latency_percentiles[49] * 1000:.2f}, p95 {latency_percentiles[94] * 1000:.2f}, "
+        f"p99 {latency_percentiles[98] * 1000:.2f}"
+    )
+
+    if requests_per_second < arguments.min_requests_per_second:
+        print(f"Fewer than {arguments.min_requests_per_second:g} requests per second were served.")
+        sys.exit(1)
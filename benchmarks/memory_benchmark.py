@@ -0,0 +1,95 @@
+# This Python file contains the benchmark of the memory held by the in-memory contact book, which loads the same
+# synthetic contacts both as plain lists (the representation loaded from contacts_dict.txt, indexed by a dictionary
+# from each id to its position) and as the compact contacts' store, and reports the bytes allocated per contact by each,
+# as traced by tracemalloc.
+#
+# Usage (from the root directory of the repository):
+#     python -m benchmarks.memory_benchmark --number-of-contacts 1000000
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from benchmarks.contacts_generator import generate_contacts_dict
+from contact_book.root import get_contact_book_root
+from contact_book.src.contact_book.constants import FILE_NAME_CONTACTS_DICT
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.sorted_index import SortedContactIndex
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+from contact_book.src.contact_book.service.utils import get_contacts_dict
+
+DEFAULT_NUMBER_OF_CONTACTS = 1000000
+
+
+def load_plain_contacts(contacts_file_root_dir: str) -> Tuple:
+    """
+    Load the contacts as plain lists of boxed integers and separate strings, with a dictionary from each id to its
+    position and the index of the contacts sorted by surname
+
+    :param contacts_file_root_dir: the root directory of the contacts_dict.txt file, relative to the repository.
+    :return: a tuple of the objects held in memory
+    """
+
+    contacts_dict = get_contacts_dict(contacts_file_root_dir, FILE_NAME_CONTACTS_DICT)
+    position_by_id = {contact_id: position for position, contact_id in enumerate(contacts_dict['id'])}
+    return contacts_dict, position_by_id, SortedContactIndex(contacts_dict)
+
+
+def load_contact_store(contacts_file_root_dir: str) -> ContactStore:
+    return ContactStore(storage_backend=JsonFileStorageBackend(contacts_file_root_dir, FILE_NAME_CONTACTS_DICT))
+
+
+def measure_memory(load_contacts: Callable, contacts_file_root_dir: str) -> Tuple[int, float]:
+    """
+    Measure the memory held by the contacts loaded by a function, once loaded
+
+    :param load_contacts: the function loading the contacts from the given root directory.
+    :param contacts_file_root_dir: the root directory of the contacts_dict.txt file, relative to the repository.
+    :return: a tuple (bytes held, seconds taken to load the contacts)
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+
+    loaded_contacts = load_contacts(contacts_file_root_dir)
+
+    elapsed_time = time.perf_counter() - start_time
+    gc.collect()
+    bytes_held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del loaded_contacts
+    return bytes_held, elapsed_time
+
+
+def run_memory_benchmark(number_of_contacts: int = DEFAULT_NUMBER_OF_CONTACTS, seed: int = 0) -> None:
+
+    temporary_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(temporary_dir, FILE_NAME_CONTACTS_DICT), 'w') as contacts_dict_file:
+            json.dump(generate_contacts_dict(number_of_contacts, seed), contacts_dict_file)
+        contacts_file_root_dir = os.path.relpath(temporary_dir, get_contact_book_root()) + '/'
+
+        print(f"{'representation':<16}{'bytes/contact':>16}{'load time (s)':>16}")
+        for representation, load_contacts in (('plain lists', load_plain_contacts), ('compact', load_contact_store)):
+            bytes_held, elapsed_time = measure_memory(load_contacts, contacts_file_root_dir)
+            print(f"{representation:<16}{bytes_held / number_of_contacts:>16.1f}{elapsed_time:>16.2f}")
+    finally:
+        shutil.rmtree(temporary_dir)
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Benchmark the memory held per contact in memory.")
+    argument_parser.add_argument('--number-of-contacts', type=int, default=DEFAULT_NUMBER_OF_CONTACTS)
+    argument_parser.add_argument('--seed', type=int, default=0)
+    arguments = argument_parser.parse_args()
+
+    run_memory_benchmark(arguments.number_of_contacts, arguments.seed)
@@ -0,0 +1,269 @@
+# This Python file contains the benchmark suite of the operations of the contacts' service on synthetic contact books
+# of increasing sizes (see 'contacts_generator.py'), which reports the time taken (median of several runs) and the
+# peak memory allocated (as traced by tracemalloc) by each operation, and compares them against a baseline saved by a
+# previous run, exiting with an error if any of them regressed by more than a given tolerance.
+#
+# Usage (from the root directory of the repository):
+#     python -m benchmarks.operations_benchmark --numbers-of-contacts 10000 100000 1000000
+#     python -m benchmarks.operations_benchmark --save-baseline  (to record the baseline on the machine running it)
+
+import argparse
+import gc
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.contacts_generator import SURNAMES, generate_contacts_dict
+from contact_book.root import get_contact_book_root
+from contact_book.src.contact_book.constants import FILE_NAME_CONTACTS_DICT
+from contact_book.src.contact_book.service.binary_search import binary_search
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.utils import (
+    convert_contacts_dict_to_df, get_contacts_dict, save_contacts_dict)
+
+DEFAULT_NUMBERS_OF_CONTACTS = (10000, 100000, 1000000)
+FILE_PATH_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'operations_baseline.json')
+
+# Relative increase of the time taken or of the peak memory allocated by an operation, with respect to the baseline,
+# above which it is reported as a regression (the time is noisier than the memory from one run to another)
+DEFAULT_TIME_TOLERANCE = 0.5
+DEFAULT_MEMORY_TOLERANCE = 0.1
+
+# Increases of the time taken or of the peak memory allocated below which an operation is not reported as a regression
+# whatever the tolerance, as they are within the noise of the measurement for operations taking a few microseconds or
+# allocating a few bytes (e.g., when a list over-allocates on append)
+MINIMUM_REGRESSION_SECONDS = 0.0001
+MINIMUM_REGRESSION_BYTES = 64 * 1024
+
+# Number of times an operation on a single contact, or on the whole contacts' file, is timed
+REPETITIONS_CONTACT_OPERATION = 100
+REPETITIONS_FILE_OPERATION = 3
+
+
+def prepare_create_contact_logic(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+    return lambda: ContactsService.create_contact_logic(
+        contacts_dict, 'Sheldon', 'Cooper', 'sheldor@myphdmail.com', '07000000073'
+    )
+
+
+def prepare_update_contact_logic(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+
+    # A contact is updated as a dataframe of one row, which is selected by id from the dataframe of all the contacts
+    contacts_df = convert_contacts_dict_to_df(contacts_dict)
+    contact_id = contacts_dict['id'][len(contacts_dict['id']) // 2]
+    return lambda: ContactsService.update_contact_logic(
+        contacts_df[contacts_df['id'] == contact_id].copy(),
+        'Wolfgang', 'Pauli', 'pauli@exclusionmail.com', '07000000022'
+    )
+
+
+def prepare_remove_contact_logic(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+
+    # Removing the contact in the middle shifts half of the contacts, i.e., the average case
+    return lambda: ContactsService.remove_contact_logic(contacts_dict, len(contacts_dict['id']) // 2)
+
+
+def prepare_binary_search(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+
+    sorted_surnames = sorted(contacts_dict['surname'])
+    return lambda: binary_search(sorted_surnames, SURNAMES[len(SURNAMES) // 2])
+
+
+def prepare_get_contacts_dict(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+    return lambda: get_contacts_dict(contacts_file_root_dir, FILE_NAME_CONTACTS_DICT)
+
+
+def prepare_save_contacts_dict(contacts_dict: Dict, contacts_file_root_dir: str) -> Callable:
+    return lambda: save_contacts_dict(contacts_dict, contacts_file_root_dir, FILE_NAME_CONTACTS_DICT)
+
+
+# Operations benchmarked, each with the function preparing it (untimed) on a copy of the contacts generated, which
+# returns the function performing the operation once, and the number of times the operation is timed
+OPERATIONS = {
+    'create_contact_logic': (prepare_create_contact_logic, REPETITIONS_CONTACT_OPERATION),
+    'update_contact_logic': (prepare_update_contact_logic, REPETITIONS_CONTACT_OPERATION),
+    'remove_contact_logic': (prepare_remove_contact_logic, REPETITIONS_CONTACT_OPERATION),
+    'binary_search': (prepare_binary_search, REPETITIONS_CONTACT_OPERATION),
+    'get_contacts_dict': (prepare_get_contacts_dict, REPETITIONS_FILE_OPERATION),
+    'save_contacts_dict': (prepare_save_contacts_dict, REPETITIONS_FILE_OPERATION),
+}
+
+
+def measure_operation(operation: Callable, repetitions: int) -> Tuple[float, int]:
+    """
+    Measure the time taken by an operation, and the peak memory allocated while it runs, separately, as tracing the
+    memory allocations slows the operation down
+
+    :param operation: the function performing the operation once.
+    :param repetitions: the number of times the operation is timed.
+    :return: a tuple (median of the seconds taken, peak bytes allocated on top of the memory already held)
+    """
+
+    elapsed_times = []
+    for _ in range(repetitions):
+        start_time = time.perf_counter()
+        operation()
+        elapsed_times.append(time.perf_counter() - start_time)
+
+    gc.collect()
+    tracemalloc.start()
+    bytes_held_before, _ = tracemalloc.get_traced_memory()
+    operation()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistics.median(elapsed_times), peak_bytes - bytes_held_before
+
+
+def run_operations_benchmark(numbers_of_contacts: List[int], seed: int = 0) -> Dict:
+    """
+    Run every operation on synthetic contact books of the given sizes
+
+    :param numbers_of_contacts: the numbers of contacts of the contact books generated.
+    :param seed: the seed of the random number generator of the contacts.
+    :return: a dictionary mapping each operation to a dictionary mapping each number of contacts (as a string) to a
+            dictionary {"seconds": median of the seconds taken, "peak_bytes": peak bytes allocated}
+    """
+
+    results = {operation_name: {} for operation_name in OPERATIONS}
+
+    for number_of_contacts in numbers_of_contacts:
+        contacts_dict = generate_contacts_dict(number_of_contacts, seed)
+
+        temporary_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(temporary_dir, FILE_NAME_CONTACTS_DICT), 'w') as contacts_dict_file:
+                json.dump(contacts_dict, contacts_dict_file)
+            contacts_file_root_dir = os.path.relpath(temporary_dir, get_contact_book_root()) + '/'
+
+            for operation_name, (prepare_operation, repetitions) in OPERATIONS.items():
+                # Each operation works on its own copy of the contacts, as some of them modify the contacts
+                operation = prepare_operation(
+                    {key: list(values) for key, values in contacts_dict.items()}, contacts_file_root_dir
+                )
+                seconds, peak_bytes = measure_operation(operation, repetitions)
+                results[operation_name][str(number_of_contacts)] = {'seconds': seconds, 'peak_bytes': peak_bytes}
+                del operation
+        finally:
+            shutil.rmtree(temporary_dir)
+
+    return results
+
+
+def find_regressions(
+        results: Dict,
+        baseline: Dict,
+        time_tolerance: float = DEFAULT_TIME_TOLERANCE,
+        memory_tolerance: float = DEFAULT_MEMORY_TOLERANCE
+) -> List[str]:
+    """
+    Compare the results of a run against a baseline, for the operations and numbers of contacts found in both
+
+    :param results: the results of the run, as returned by 'run_operations_benchmark'.
+    :param baseline: the results of a previous run, in the same format.
+    :param time_tolerance: the relative increase of the time taken above which an operation regressed.
+    :param memory_tolerance: the relative increase of the peak memory allocated above which an operation regressed.
+    :return: a list of descriptions of the regressions, empty if none
+    """
+
+    regressions = []
+    for operation_name, results_by_number_of_contacts in results.items():
+        for number_of_contacts, result in results_by_number_of_contacts.items():
+            baseline_result = baseline.get(operation_name, {}).get(number_of_contacts)
+            if baseline_result is None:
+                continue
+
+            for measure, tolerance, minimum_regression in (
+                    ('seconds', time_tolerance, MINIMUM_REGRESSION_SECONDS),
+                    ('peak_bytes', memory_tolerance, MINIMUM_REGRESSION_BYTES)
+            ):
+                increase = result[measure] - baseline_result[measure]
+                if increase > baseline_result[measure] * tolerance and increase > minimum_regression:
+                    regressions.append(
+                        f"{operation_name} on {number_of_contacts} contacts: {measure} went from "
+                        f"{baseline_result[measure]:.6g} to {result[measure]:.6g}"
+                    )
+    return regressions
+
+
+def print_results(results: Dict, baseline: Dict) -> None:
+
+    print(f"{'operation':<24}{'contacts':>10}{'time (ms)':>14}{'baseline':>12}{'peak (MB)':>12}{'baseline':>12}")
+    for operation_name, results_by_number_of_contacts in results.items():
+        for number_of_contacts, result in results_by_number_of_contacts.items():
+            baseline_result = baseline.get(operation_name, {}).get(number_of_contacts)
+            baseline_milliseconds, baseline_megabytes = (
+                ('-', '-') if baseline_result is None else
+                (f"{baseline_result['seconds'] * 1000:.3f}", f"{baseline_result['peak_bytes'] / 1e6:.2f}")
+            )
+            print(
+                f"{operation_name:<24}{number_of_contacts:>10}{result['seconds'] * 1000:>14.3f}"
+                f"{baseline_milliseconds:>12}{result['peak_bytes'] / 1e6:>12.2f}{baseline_megabytes:>12}"
+            )
+
+
+def load_baseline(baseline_file_path: str) -> Dict:
+
+    if not os.path.exists(baseline_file_path):
+        return {}
+    with open(baseline_file_path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(results: Dict, baseline_file_path: str) -> None:
+    """
+    Save the results of a run as the baseline, replacing the baseline of the operations and numbers of contacts run
+    only
+
+    :param results: the results of the run, as returned by 'run_operations_benchmark'.
+    :param baseline_file_path: the path of the baseline file.
+    """
+
+    baseline = load_baseline(baseline_file_path)
+    for operation_name, results_by_number_of_contacts in results.items():
+        baseline.setdefault(operation_name, {}).update(results_by_number_of_contacts)
+
+    with open(baseline_file_path, 'w') as baseline_file:
+        json.dump(baseline, baseline_file, indent=4, sort_keys=True)
+        baseline_file.write('\n')
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(
+        description="Benchmark the operations of the contacts' service and compare them against a baseline."
+    )
+    argument_parser.add_argument(
+        '--numbers-of-contacts', type=int, nargs='+', default=list(DEFAULT_NUMBERS_OF_CONTACTS),
+        help="the sizes of the contact books generated, e.g., up to 10000000"
+    )
+    argument_parser.add_argument('--seed', type=int, default=0)
+    argument_parser.add_argument('--baseline', default=FILE_PATH_BASELINE, help="the path of the baseline file")
+    argument_parser.add_argument(
+        '--save-baseline', action='store_true', help="save the results as the baseline instead of comparing them"
+    )
+    argument_parser.add_argument('--time-tolerance', type=float, default=DEFAULT_TIME_TOLERANCE)
+    argument_parser.add_argument('--memory-tolerance', type=float, default=DEFAULT_MEMORY_TOLERANCE)
+    arguments = argument_parser.parse_args()
+
+    benchmark_results = run_operations_benchmark(arguments.numbers_of_contacts, arguments.seed)
+    saved_baseline = load_baseline(arguments.baseline)
+    print_results(benchmark_results, saved_baseline)
+
+    if arguments.save_baseline:
+        save_baseline(benchmark_results, arguments.baseline)
+        print(f"Baseline saved to {arguments.baseline}.")
+    else:
+        regressions = find_regressions(
+            benchmark_results, saved_baseline, arguments.time_tolerance, arguments.memory_tolerance
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}.")
+        if regressions:
+            sys.exit(1)
@@ -1 +1,3 @@
-from . import app, constants, data, gui, service
+# The GUI is not imported along with the package, such that the contacts' service can be imported without tkinter (and
+# without a display), e.g., by the command-line interface or the HTTP API server
+from . import constants, data, service
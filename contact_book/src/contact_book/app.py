@@ -10,10 +10,16 @@ class RunAPP:
     """
     The main class to run the contact book application, which opens a GUI for the user to perform
     CRUD operations (creating, reading, updating, deleting contacts), as well as clear the window.
+
+    Note: the window is only opened when the application is run, rather than when this module is imported, such that
+            the modules of the application can be imported without a display (see 'contacts_cli.py' to maintain the
+            contacts from the command line instead).
     """
-    tkinter_main_window = Tk()
-    ApplicationWindow(tkinter_main_window)
-    tkinter_main_window.mainloop()
+
+    def __init__(self):  # pragma: no cover
+        tkinter_main_window = Tk()
+        ApplicationWindow(tkinter_main_window)
+        tkinter_main_window.mainloop()
 
 
 if __name__ == "__main__":
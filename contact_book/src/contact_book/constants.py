@@ -3,6 +3,65 @@
 
 ROOT_DIR_CONTACTS_DICT_FILE = 'contact_book/src/contact_book/data/'
 FILE_NAME_CONTACTS_DICT = 'contacts_dict.txt'
+FILE_NAME_ID_SEQUENCE = 'contacts_id_sequence.txt'
+FILE_NAME_CONTACTS_JOURNAL = 'contacts_journal.txt'
+FILE_NAME_CONTACTS_DATABASE = 'contacts.db'
+FILE_NAME_CONTACTS_BINARY = 'contacts.bin'
+FILE_NAME_BINARY_CONTACTS_JOURNAL = 'contacts_bin_journal.txt'
+FILE_NAME_SUFFIX_COMPACTING_JOURNAL = '.compacting'
+FILE_NAME_SUFFIX_LOCK = '.lock'
+FILE_NAME_SUFFIX_COMPACTION_LOCK = '.compaction.lock'
+FILE_NAME_SUFFIX_TEMPORARY_FILE = '.tmp'
+
+# Journal of the CRUD operations performed since the last snapshot of the contacts was saved, which is compacted into a
+# new snapshot in the background once it grows past the threshold below (in bytes)
+USE_CONTACTS_JOURNAL = True
+JOURNAL_COMPACTION_THRESHOLD_BYTES = 1024 * 1024
+JOURNAL_OPERATION_CREATE = 'create'
+JOURNAL_OPERATION_UPDATE = 'update'
+JOURNAL_OPERATION_DELETE = 'delete'
+
+# Record starting the journal after a snapshot was saved, with the version of the contacts saved in the snapshot (i.e.,
+# the number of operations journaled before it), such that the processes sharing the journal can tell whether they
+# missed some of the operations compacted into the snapshot (see 'JsonFileStorageBackend.read_new_journal_records')
+JOURNAL_OPERATION_CHECKPOINT = 'checkpoint'
+
+# Storage backend in which the contacts are saved ('json' for the contacts_dict.txt file and its journal, 'sqlite' for
+# the contacts.db SQLite database, 'binary' for the contacts.bin binary file and its journal), which can be overridden
+# by the environment variable below
+STORAGE_BACKEND_JSON = 'json'
+STORAGE_BACKEND_SQLITE = 'sqlite'
+STORAGE_BACKEND_BINARY = 'binary'
+STORAGE_BACKEND = STORAGE_BACKEND_JSON
+ENVIRONMENT_VARIABLE_STORAGE_BACKEND = 'CONTACT_BOOK_STORAGE_BACKEND'
+
+# Identification of the binary contacts file format (see 'binary_contacts_file.py')
+BINARY_CONTACTS_FILE_MAGIC = b'CBKB'
+BINARY_CONTACTS_FILE_VERSION = 1
+
+# Keys (columns) of the dictionary of contacts, in the order in which they are displayed on the GUI
+CONTACTS_DICT_KEYS = ('id', 'forename', 'surname', 'email_address', 'mobile_number')
+
+# Compact in-memory representation of the contacts (see 'compact_contacts_dict' in 'contact_store.py'): the ids are
+# packed as signed 64-bit integers and the values of the keys shared by many contacts are interned
+ARRAY_TYPE_CODE_CONTACT_IDS = 'q'
+INTERNED_CONTACTS_DICT_KEYS = ('forename', 'surname')
+
+# Tombstones of the contacts removed from the store (see 'tombstones.py'), whose rows are reclaimed by compacting the
+# columns of the store in the background once at least the ratio below of its rows (and the minimum number of rows
+# below) are tombstones
+TOMBSTONE_COMPACTION_THRESHOLD_RATIO = 0.25
+TOMBSTONE_COMPACTION_MIN_TOMBSTONES = 1024
+
+# Undo/redo history of the CRUD operations performed on the store (see 'undo_history.py'), keeping the inverse journal
+# records of at most the number of operations (or batches of operations, e.g., the chunks of a bulk import) below, and
+# of at most the number of journal records below in total, the oldest ones being dropped
+UNDO_HISTORY_DEPTH = 100
+UNDO_HISTORY_MAX_JOURNAL_RECORDS = 100000
+
+# Incremental reading of the contacts_dict.txt file (see 'contacts_dict_reader.py'), which is parsed one block of the
+# size below (in bytes) at a time rather than as a whole
+CONTACTS_DICT_READ_BLOCK_SIZE = 1024 * 1024
 
 TEXT_FONT_AND_SIZE_FORMAT_WINDOW_FRAME = "*font"
 TEXT_FONT_AND_SIZE_MAIN_WINDOW_FRAME = "Verdana 12"
@@ -16,6 +75,9 @@ WIDTH_VISIBLE_CONTACT_FIELD = 30
 TITLE_MAIN_WINDOW_FRAME = 'My contact book'
 
 EVENT_PATTERN_LIST_BOX_LABEL = "<<ListboxSelect>>"
+EVENT_PATTERN_UNDO = "<Control-z>"
+EVENT_PATTERN_REDO = "<Control-y>"
+EVENT_MODE_WRITE_VARIABLE = "write"
 
 PADDING_X_OUTER_FRAME = 30
 PADDING_Y_OUTER_FRAME = 15
@@ -25,6 +87,70 @@ PADDING_Y_BUTTON = 10
 
 ROW_SPAN = 8
 
+# Number of rows of the contacts' list visible on the GUI, and number of rows rendered above and below them, such that
+# only those (rather than all the contacts) are held by the 'Listbox'
+VISIBLE_ROWS_CONTACTS_BOX = 10
+OVERSCAN_ROWS_CONTACTS_BOX = 50
+
+# Changes of the list of contacts displayed on the GUI, applied row by row to the contacts' Listbox after each CRUD
+# operation instead of listing all the contacts again
+CONTACTS_LIST_CHANGE_INSERT = 'insert'
+CONTACTS_LIST_CHANGE_REMOVE = 'remove'
+CONTACTS_LIST_CHANGE_MOVE = 'move'
+CONTACTS_LIST_CHANGE_RESET = 'reset'
+
+# Loading of the contacts on a worker thread at startup, whose events (the first screen of contacts, the fraction of the
+# contacts' file read, the loaded store, or the error raised) are polled by the GUI at the interval below (in
+# milliseconds) while a progress bar is shown
+CONTACTS_LOADING_EVENT_PREVIEW = 'preview'
+CONTACTS_LOADING_EVENT_PROGRESS = 'progress'
+CONTACTS_LOADING_EVENT_LOADED = 'loaded'
+CONTACTS_LOADING_EVENT_FAILED = 'failed'
+CONTACTS_LOADING_POLL_INTERVAL_MS = 20
+PROGRESS_BAR_MODE_INDETERMINATE = 'indeterminate'
+PROGRESS_BAR_MODE_DETERMINATE = 'determinate'
+PROGRESS_BAR_MAXIMUM = 100
+
+# Bulk import of contacts from CSV and vCard files, which are read, validated, and committed to the store in chunks of
+# the size below, such that the memory used does not depend on the size of the file imported
+CONTACTS_FILE_FORMAT_CSV = 'csv'
+CONTACTS_FILE_FORMAT_VCARD = 'vcard'
+CONTACTS_IMPORT_CHUNK_SIZE = 10000
+CONTACTS_IMPORT_MAX_REPORTED_ERRORS = 100
+EMAIL_ADDRESS_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+MOBILE_NUMBER_MIN_DIGITS = 7
+MOBILE_NUMBER_MAX_DIGITS = 15
+
+# Export of contacts to CSV, vCard, and JSON Lines files, which are written one contact at a time in either of the
+# orders below (alphabetical order of the surnames, as listed on the GUI, or order of the ids)
+CONTACTS_FILE_FORMAT_JSON_LINES = 'jsonl'
+CONTACTS_EXPORT_ORDER_SURNAME = 'surname'
+CONTACTS_EXPORT_ORDER_ID = 'id'
+
+# Opt-in instrumentation of the contacts' service and of the storage calls (see 'metrics.py'), which is enabled by
+# setting the first environment variable below (e.g., to '1'), and dumped when the application exits to the metrics file
+# (JSON if its name ends with '.json', Prometheus text otherwise) and the cProfile file named by the other two, if set
+ENVIRONMENT_VARIABLE_METRICS = 'CONTACT_BOOK_METRICS'
+ENVIRONMENT_VARIABLE_METRICS_FILE = 'CONTACT_BOOK_METRICS_FILE'
+ENVIRONMENT_VARIABLE_PROFILE_FILE = 'CONTACT_BOOK_PROFILE_FILE'
+METRICS_LATENCY_BUCKETS_SECONDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+METRICS_SLOW_OPERATION_THRESHOLD_SECONDS = 0.1
+METRICS_FILE_FORMAT_JSON = 'json'
+METRICS_FILE_FORMAT_PROMETHEUS = 'prometheus'
+METRICS_PROMETHEUS_PREFIX = 'contact_book'
+
+# Headless HTTP API over the contacts' service (see 'http_server.py'): the address it listens to by default, the number
+# of contacts listed per page by default (and at most), the largest request body accepted (in bytes), the largest
+# number of queued writes applied and then persisted as a single batch, and the interval (in seconds) between two
+# attempts to lock the contacts for a batch while another process holds the lock, which the event loop does not wait for
+HTTP_SERVER_HOST = '127.0.0.1'
+HTTP_SERVER_PORT = 8080
+HTTP_SERVER_PAGE_SIZE = 100
+HTTP_SERVER_MAX_PAGE_SIZE = 1000
+HTTP_SERVER_MAX_REQUEST_BODY_BYTES = 1024 * 1024
+HTTP_SERVER_MAX_WRITE_BATCH_SIZE = 1000
+HTTP_SERVER_LOCK_RETRY_INTERVAL_SECONDS = 0.01
+
 ZERO_VALUE = 0
 ONE_VALUE = 1
 TWO_VALUE = 2
@@ -43,3 +169,26 @@ REMOVE_FIELD_LABEL = "Remove"
 CLEAR_FIELD_LABEL = "Clear"
 
 SEARCH_BOX_MESSAGE = "Enter contact to search"
+
+# Maximum number of contacts listed on the GUI as the results of a search, and highest character used to find the upper
+# bound of the range of keys starting with a prefix
+SEARCH_RESULTS_LIMIT = 500
+HIGHEST_UNICODE_CHARACTER = chr(0x10FFFF)
+
+# Maximum edit distance between a query and a contact's forename, surname, or email address for the contact to be found
+# by the typo-tolerant search (lowered for short queries to one edit per number of characters below), which generates
+# candidates from an inverted index of trigrams
+FUZZY_SEARCH_MAX_EDIT_DISTANCE = 2
+FUZZY_SEARCH_CHARACTERS_PER_EDIT = 3
+TRIGRAM_LENGTH = 3
+
+# Duplicate detection (see 'duplicate_contacts.py'): the contacts are only compared with the ones sharing a blocking key
+# (phonetic code of the surname, normalised mobile number, or case-folded email address), in buckets of at most the
+# size below (larger ones, e.g., of a placeholder mobile number, telling nothing about duplicates), and two contacts
+# are duplicates if their similarity (from 0 to 1) is at least the threshold below. The pairs of contacts compared are
+# fanned out over several processes, in chunks of the size below, once there are at least the number below of them.
+DUPLICATES_SIMILARITY_THRESHOLD = 0.75
+DUPLICATES_MAX_BUCKET_SIZE = 1000
+DUPLICATES_MIN_PAIRS_FOR_PROCESSES = 100000
+DUPLICATES_PAIRS_PER_CHUNK = 20000
+SOUNDEX_CODE_LENGTH = 4
@@ -1 +1 @@
-from . import application_window, contacts_user_interface
+from . import application_window, contacts_user_interface, virtual_listbox
@@ -55,16 +55,21 @@ class ApplicationWindow(Frame):
         self.contacts_fields.append(self.email_address_field)
         self.contacts_fields.append(self.mobile_number_field)
 
+        # Set field for the query typed in the 'Search' box
+        self.search_field = StringVar()
+
         # Initialise empty list of contacts to display them
         self.contacts_list = []
         self.contacts_box_running_index = ZERO_VALUE
+        self.contacts_loading = False
 
         # Show GUI into main window frame
         contacts_user_interface.get_user_interface(self)
 
         # Instantiate the object by feeding 'application' as context to the 'ContactsService' class to be
-        # able to consume it and leverage its 'load_contacts_list' method
+        # able to consume it and leverage its 'load_contacts_list_in_background' method
         contact_service_object = ContactsService(self)
 
-        # Populate list of contacts with the saved ones
-        contact_service_object.load_contacts_list()
+        # Populate list of contacts with the saved ones, which are loaded in the background, such that the window
+        # appears straight away
+        contact_service_object.load_contacts_list_in_background()
@@ -4,15 +4,19 @@
 # # https://github.com/rhdalton/Python-Contact-book-application.
 
 from tkinter import (EW, NSEW, RAISED, SINGLE, VERTICAL, Button, E, Entry,
-                     Frame, Label, Listbox, N, S, Scrollbar, W)
+                     Frame, Label, N, S, Scrollbar, W)
+from tkinter.ttk import Progressbar
 
 from contact_book.src.contact_book.constants import (
     BG_COLOUR, CLEAR_FIELD_LABEL, CREATE_FIELD_LABEL,
-    EMAIL_ADDRESS_FIELD_LABEL, EVENT_PATTERN_LIST_BOX_LABEL,
+    EMAIL_ADDRESS_FIELD_LABEL, EVENT_MODE_WRITE_VARIABLE,
+    EVENT_PATTERN_LIST_BOX_LABEL, EVENT_PATTERN_REDO, EVENT_PATTERN_UNDO,
     FORENAME_FIELD_LABEL, MOBILE_NUMBER_FIELD_LABEL, ONE_VALUE,
-    PADDING_X_BUTTON, PADDING_Y_BUTTON, REMOVE_FIELD_LABEL, ROW_SPAN,
+    PADDING_X_BUTTON, PADDING_Y_BUTTON, PROGRESS_BAR_MODE_INDETERMINATE,
+    REMOVE_FIELD_LABEL, ROW_SPAN,
     SEARCH_BOX_MESSAGE, SURNAME_FIELD_LABEL, TWO_VALUE, UPDATE_FIELD_LABEL,
     WIDTH_VISIBLE_CONTACT_FIELD, ZERO_VALUE)
+from contact_book.src.contact_book.gui.virtual_listbox import VirtualListbox
 from contact_book.src.contact_book.service.contacts_service import \
     ContactsService
 from contact_book.src.contact_book.service.utils import clear_window_frame
@@ -132,17 +136,26 @@ def get_user_interface(application) -> None:
         padx=PADDING_X_BUTTON)
     application.button_to_clear_frame.grid_remove()
 
-    # Add the 'Listbox' containing the contacts with a scroll bar
+    # Keyboard shortcuts to undo and redo the last CRUD operations, e.g., a contact removed by mistake
+    application.main_frame.bind_all(
+        EVENT_PATTERN_UNDO,
+        lambda event: contact_service_object.undo_contact_change_on_gui()
+    )
+    application.main_frame.bind_all(
+        EVENT_PATTERN_REDO,
+        lambda event: contact_service_object.redo_contact_change_on_gui()
+    )
+
+    # Add the 'Listbox' containing the contacts with a scroll bar, which only renders the contacts in view
     side_scroll_bar = Scrollbar(application.main_frame, orient=VERTICAL)
-    application.contacts_box = Listbox(
+    application.contacts_box = VirtualListbox(
         application.main_frame,
+        side_scroll_bar,
         exportselection=ZERO_VALUE,
-        yscrollcommand=side_scroll_bar.set,
         width=WIDTH_VISIBLE_CONTACT_FIELD - TWO_VALUE,
         selectmode=SINGLE
     )
     application.contacts_box.bind(EVENT_PATTERN_LIST_BOX_LABEL, lambda event: contact_service_object.choose_contact())
-    side_scroll_bar.config(command=application.contacts_box.yview)
     application.contacts_box.grid(
         row=ONE_VALUE,
         column=ONE_VALUE,
@@ -152,19 +165,31 @@ def get_user_interface(application) -> None:
     )
     side_scroll_bar.grid(row=ONE_VALUE, column=TWO_VALUE, rowspan=ROW_SPAN, sticky=N+S+E)
 
-    # TODO: To be enabled/integrated on the GUI (functionality is working in
-    # 'Search' box to look for a contact based on a string/keyword
+    # Add the progress bar shown below the contacts while they are loaded in the background
+    application.loading_progress_bar = Progressbar(application.main_frame, mode=PROGRESS_BAR_MODE_INDETERMINATE)
+    application.loading_progress_bar.grid(
+        row=ROW_SPAN + ONE_VALUE,
+        column=ONE_VALUE,
+        padx=(WIDTH_VISIBLE_CONTACT_FIELD - PADDING_X_BUTTON, ZERO_VALUE),
+        sticky=EW
+    )
+
+    # 'Search' box to look for a contact based on a string/keyword, whose results are listed as the user types
     Label(application.main_frame, text=SEARCH_BOX_MESSAGE).grid(
         row=ZERO_VALUE,
         column=ONE_VALUE,
         sticky=W,
         padx=(WIDTH_VISIBLE_CONTACT_FIELD + PADDING_X_BUTTON, ZERO_VALUE)
     )
-    application_main_frame_to_search = Entry(application.main_frame)
+    application_main_frame_to_search = Entry(application.main_frame, textvariable=application.search_field)
     application_main_frame_to_search.grid(
         row=ZERO_VALUE,
         column=ONE_VALUE,
         sticky=W,
         padx=(WIDTH_VISIBLE_CONTACT_FIELD + PADDING_X_BUTTON, ZERO_VALUE)
     )
+    application.search_field.trace_add(
+        EVENT_MODE_WRITE_VARIABLE,
+        lambda *args: contact_service_object.load_contacts_list()
+    )
     application_main_frame_to_search.focus_set()
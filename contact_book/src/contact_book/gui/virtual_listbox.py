@@ -0,0 +1,274 @@
+# This Python file contains the virtualised list of contacts displayed on the GUI, which only renders the contacts in
+# view (plus a few rows above and below them) into tkinter's Listbox, and maps the position of the scroll bar onto the
+# whole list of contacts, such that displaying or refreshing a list of any length costs the same.
+
+from tkinter import END, Listbox, Scrollbar
+from typing import Dict, Optional, Sequence, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_LIST_CHANGE_INSERT, CONTACTS_LIST_CHANGE_MOVE,
+    CONTACTS_LIST_CHANGE_REMOVE, CONTACTS_LIST_CHANGE_RESET, ONE_VALUE,
+    OVERSCAN_ROWS_CONTACTS_BOX, TWO_VALUE, VISIBLE_ROWS_CONTACTS_BOX,
+    ZERO_VALUE)
+
+SCROLL_BAR_COMMAND_MOVE_TO = 'moveto'
+SCROLL_BAR_UNIT_PAGES = 'pages'
+
+
+class VirtualListbox(Listbox):
+    """
+    A tkinter Listbox holding only a window of rows of a (possibly very long) sequence of contacts, i.e., the rows in
+    view plus 'overscan_rows' rows above and below them, which absorb small scrolls (e.g., via the mouse wheel) without
+    re-rendering. Positions are given in the whole sequence of contacts, whereas indexes are given in the Listbox.
+    """
+
+    def __init__(
+            self,
+            master,
+            scroll_bar: Scrollbar,
+            visible_rows: int = VISIBLE_ROWS_CONTACTS_BOX,
+            overscan_rows: int = OVERSCAN_ROWS_CONTACTS_BOX,
+            **kwargs
+    ):
+        self.scroll_bar = scroll_bar
+        self.visible_rows = visible_rows
+        self.overscan_rows = overscan_rows
+
+        # 'contacts_source' is a sequence of tuples of two elements for each contact (id, 'Forename Surname')
+        self.contacts_source = []
+        self.top_position = ZERO_VALUE
+        self.first_rendered_position = ZERO_VALUE
+        self.end_rendered_position = ZERO_VALUE
+
+        # The selected position is remembered, such that it is restored when it is scrolled back into the window
+        self.selected_position = None
+
+        Listbox.__init__(self, master, height=visible_rows, yscrollcommand=self.on_listbox_scrolled, **kwargs)
+        self.scroll_bar.config(command=self.on_scroll_bar_moved)
+
+    def set_contacts(self, contacts_source: Sequence[Tuple]) -> None:
+        """
+        Display a sequence of contacts, keeping the current scroll position where possible.
+
+        :param contacts_source: a sequence of tuples of two elements for each contact (id, 'Forename Surname'), which
+                                only needs to support 'len' and indexing, e.g., a 'ContactsListView'.
+        """
+
+        self.contacts_source = contacts_source
+        self.clear_selection()
+        self.render(self.top_position)
+
+    def render(self, top_position: int) -> None:
+        """
+        Render the window of rows around the contact to be displayed at the top of the view.
+
+        :param top_position: the position of the contact to be displayed at the top of the view.
+        """
+
+        self.remember_selection()
+
+        number_of_contacts = len(self.contacts_source)
+        self.top_position = max(min(top_position, number_of_contacts - self.visible_rows), ZERO_VALUE)
+        self.first_rendered_position = max(self.top_position - self.overscan_rows, ZERO_VALUE)
+        self.end_rendered_position = min(self.top_position + self.visible_rows + self.overscan_rows, number_of_contacts)
+
+        self.delete(ZERO_VALUE, END)
+        rendered_names = [
+            self.contacts_source[position][ONE_VALUE]
+            for position in range(self.first_rendered_position, self.end_rendered_position)
+        ]
+        if rendered_names:
+            self.insert(END, *rendered_names)
+
+        if self.is_rendered(self.selected_position):
+            self.selection_set(self.selected_position - self.first_rendered_position)
+
+        self.yview(self.top_position - self.first_rendered_position)
+        self.update_scroll_bar()
+
+    def is_rendered(self, position: Optional[int]) -> bool:
+        return position is not None and self.first_rendered_position <= position < self.end_rendered_position
+
+    def remember_selection(self) -> None:
+        selected_indexes = self.curselection()
+        if selected_indexes:
+            self.selected_position = self.first_rendered_position + selected_indexes[ZERO_VALUE]
+
+    def get_selected_position(self) -> Optional[int]:
+        """
+        Get the position of the selected contact in the whole sequence of contacts
+
+        :return: the position of the selected contact, or None if no contact is selected
+        """
+
+        self.remember_selection()
+        return self.selected_position
+
+    def get_selected_contact(self) -> Optional[Tuple]:
+        """
+        Get the selected contact
+
+        :return: a tuple of two elements (id, 'Forename Surname') of the selected contact, or None if no contact is
+                selected
+        """
+
+        selected_position = self.get_selected_position()
+        if selected_position is None or selected_position >= len(self.contacts_source):
+            return None
+        return self.contacts_source[selected_position]
+
+    def clear_selection(self) -> None:
+        self.selection_clear(ZERO_VALUE, END)
+        self.selected_position = None
+
+    def apply_contacts_list_change(self, contacts_list_change: Dict) -> None:
+        """
+        Apply a change of the sequence of contacts displayed (which already reflects it, e.g., a 'ContactsListView') as
+        single-row insertions and deletions, keeping the selected contact and the contacts in view where they are.
+
+        :param contacts_list_change: the change, e.g., {'change': 'move', 'position': 4, 'new_position': 0}.
+        """
+
+        if contacts_list_change['change'] == CONTACTS_LIST_CHANGE_RESET:
+            # The positions of any contacts may have changed, such that the selection cannot be kept
+            self.clear_selection()
+            self.render(self.top_position)
+            return
+
+        self.remember_selection()
+        selected_position = self.selected_position
+        position = contacts_list_change['position']
+
+        if contacts_list_change['change'] == CONTACTS_LIST_CHANGE_INSERT:
+            self.insert_row(position)
+        elif contacts_list_change['change'] == CONTACTS_LIST_CHANGE_REMOVE:
+            self.delete_row(position)
+        elif contacts_list_change['change'] == CONTACTS_LIST_CHANGE_MOVE:
+            new_position = contacts_list_change['new_position']
+            self.delete_row(position)
+            self.insert_row(new_position)
+            # The selected contact stays selected wherever they are moved
+            if selected_position == position:
+                self.selected_position = new_position
+
+        self.selection_clear(ZERO_VALUE, END)
+        if self.is_rendered(self.selected_position):
+            self.selection_set(self.selected_position - self.first_rendered_position)
+
+        # Rows are only inserted into or deleted from the window, such that it is rendered again only if it no longer
+        # covers the view, e.g., after removing several contacts in view
+        if (self.top_position + self.visible_rows <= self.end_rendered_position or
+                self.end_rendered_position == len(self.contacts_source)):
+            self.yview(self.top_position - self.first_rendered_position)
+            self.update_scroll_bar()
+        else:
+            self.render(self.top_position)
+
+    def insert_row(self, position: int) -> None:
+        """
+        Insert the row of the contact inserted at a position, shifting the positions after it
+
+        :param position: the position at which the contact was inserted.
+        """
+
+        if position < self.first_rendered_position:
+            self.first_rendered_position += ONE_VALUE
+            self.end_rendered_position += ONE_VALUE
+        elif position <= self.end_rendered_position:
+            self.insert(position - self.first_rendered_position, self.contacts_source[position][ONE_VALUE])
+            self.end_rendered_position += ONE_VALUE
+
+        if position < self.top_position:
+            self.top_position += ONE_VALUE
+        if self.selected_position is not None and position <= self.selected_position:
+            self.selected_position += ONE_VALUE
+
+    def delete_row(self, position: int) -> None:
+        """
+        Delete the row of the contact removed from a position, shifting the positions after it
+
+        :param position: the position from which the contact was removed.
+        """
+
+        if position < self.first_rendered_position:
+            self.first_rendered_position -= ONE_VALUE
+            self.end_rendered_position -= ONE_VALUE
+        elif position < self.end_rendered_position:
+            self.delete(position - self.first_rendered_position)
+            self.end_rendered_position -= ONE_VALUE
+
+        if position < self.top_position:
+            self.top_position -= ONE_VALUE
+        if self.selected_position == position:
+            self.selected_position = None
+        elif self.selected_position is not None and position < self.selected_position:
+            self.selected_position -= ONE_VALUE
+
+    def see_position(self, position: int) -> None:
+        """
+        Scroll the view such that the contact at a position is displayed, re-rendering the window if needed.
+
+        :param position: the position of the contact to display.
+        """
+
+        if not self.top_position <= position < self.top_position + self.visible_rows:
+            self.render(position - self.visible_rows // TWO_VALUE)
+
+    def on_listbox_scrolled(self, first_fraction: str, last_fraction: str) -> None:
+        """
+        Handle the scrolling of the rows rendered in the Listbox (e.g., via the mouse wheel), re-rendering the window
+        around the view once it gets close to either of its ends.
+
+        :param first_fraction: the fraction of the rendered rows above the view.
+        :param last_fraction: the fraction of the rendered rows above the bottom of the view.
+        """
+
+        number_of_rendered_rows = self.end_rendered_position - self.first_rendered_position
+        if not number_of_rendered_rows:
+            self.update_scroll_bar()
+            return
+
+        # The number of visible rows follows the actual height of the Listbox, which may be stretched by the grid
+        self.visible_rows = max(
+            round((float(last_fraction) - float(first_fraction)) * number_of_rendered_rows), ONE_VALUE
+        )
+        self.top_position = self.first_rendered_position + round(float(first_fraction) * number_of_rendered_rows)
+
+        near_first_rendered_row = (
+            self.first_rendered_position > ZERO_VALUE and
+            self.top_position - self.first_rendered_position < self.overscan_rows // TWO_VALUE
+        )
+        near_last_rendered_row = (
+            self.end_rendered_position < len(self.contacts_source) and
+            self.end_rendered_position - self.top_position - self.visible_rows < self.overscan_rows // TWO_VALUE
+        )
+        if near_first_rendered_row or near_last_rendered_row:
+            self.render(self.top_position)
+        else:
+            self.update_scroll_bar()
+
+    def on_scroll_bar_moved(self, command: str, *args) -> None:
+        """
+        Handle the scroll bar being dragged or clicked, mapping its position onto the whole sequence of contacts.
+
+        :param command: 'moveto' followed by the fraction to move to, or 'scroll' followed by the number of units or
+                        pages to scroll by.
+        """
+
+        if command == SCROLL_BAR_COMMAND_MOVE_TO:
+            self.render(int(float(args[ZERO_VALUE]) * len(self.contacts_source)))
+        else:
+            number_of_steps, step_unit = int(args[ZERO_VALUE]), args[ONE_VALUE]
+            rows_per_step = self.visible_rows if step_unit == SCROLL_BAR_UNIT_PAGES else ONE_VALUE
+            self.render(self.top_position + number_of_steps * rows_per_step)
+
+    def update_scroll_bar(self) -> None:
+
+        number_of_contacts = len(self.contacts_source)
+        if not number_of_contacts:
+            self.scroll_bar.set(ZERO_VALUE, ONE_VALUE)
+            return
+        self.scroll_bar.set(
+            self.top_position / number_of_contacts,
+            min((self.top_position + self.visible_rows) / number_of_contacts, ONE_VALUE)
+        )
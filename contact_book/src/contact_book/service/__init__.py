@@ -1 +1,6 @@
-from . import contacts_service, utils
+from . import (binary_contacts_file, binary_search, contact_index,
+               contact_store, contacts_dict_reader, contacts_exporter,
+               contacts_importer, contacts_loader, contacts_service,
+               duplicate_contacts, file_lock, fuzzy_search, journal, metrics,
+               prefix_search, secondary_indexes, sorted_index,
+               storage_backends, tombstones, undo_history, utils)
@@ -0,0 +1,269 @@
+# This Python file contains the binary contacts file, an alternative on-disk format to contacts_dict.txt which can be
+# read at random via a memory map: a header, followed by one length-prefixed record per contact, by an index block
+# mapping each id to the offset of their record, and by the ids in alphabetical order of the contacts' surnames, such
+# that reading one contact (or the first screen of contacts) only decodes their records instead of the whole file.
+#
+# Layout of the file (all integers little-endian):
+#   - header: magic (4 bytes), version (uint16), reserved (uint16), number of contacts n (uint64), next id (int64),
+#     offset of the index block (uint64), offset of the sorted ids block (uint64);
+#   - records: for each contact, the length of the rest of the record (uint32), their id (int64), the lengths of their
+#     UTF-8 encoded forename, surname, email address, and mobile number (4 x uint32), and then those four fields;
+#   - index block: the n ids in increasing order (n x int64), followed by the offsets of their records (n x uint64);
+#   - sorted ids block: the n ids in order of (surname, forename, id), as listed on the GUI (n x int64).
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from contact_book.src.contact_book.constants import (
+    BINARY_CONTACTS_FILE_MAGIC, BINARY_CONTACTS_FILE_VERSION,
+    CONTACTS_DICT_KEYS, FILE_NAME_SUFFIX_TEMPORARY_FILE, ZERO_VALUE)
+
+HEADER_STRUCT = struct.Struct('<4sHHQqQQ')
+RECORD_HEADER_STRUCT = struct.Struct('<IqIIII')
+RECORD_LENGTH_STRUCT = struct.Struct('<I')
+INT64_SIZE = 8
+
+
+def convert_array_to_little_endian(values: array) -> array:
+    """
+    Convert an array of 64-bit integers between the native byte order and the little-endian one of the file, in place
+
+    :param values: the array to convert.
+    :return: the array converted
+    """
+
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values
+
+
+def encode_contact_record(contact_id: int, contact_fields: List[str]) -> bytes:
+    """
+    Encode the record of a contact, prefixed by its length
+
+    :param contact_id: the id of the contact.
+    :param contact_fields: the forename, surname, email address, and mobile number of the contact.
+    :return: the record as bytes
+    """
+
+    forename, surname, email_address, mobile_number = [field.encode('utf-8') for field in contact_fields]
+    record_length = (
+        RECORD_HEADER_STRUCT.size - RECORD_LENGTH_STRUCT.size +
+        len(forename) + len(surname) + len(email_address) + len(mobile_number)
+    )
+    return b''.join((
+        RECORD_HEADER_STRUCT.pack(
+            record_length, contact_id, len(forename), len(surname), len(email_address), len(mobile_number)
+        ),
+        forename, surname, email_address, mobile_number
+    ))
+
+
+def write_binary_contacts_file(contacts_dict: Dict, next_id: int, file_path: str) -> None:
+    """
+    Write a dictionary of contacts to a binary contacts file, such that a crash partway through the write leaves either
+    its previous or its new content (see 'write_file_atomically' in 'utils.py')
+
+    :param contacts_dict: the dictionary of contacts to write, with a list (or array) of values for each key.
+    :param next_id: the next id to be assigned to a new contact.
+    :param file_path: the path of the binary contacts file.
+    """
+
+    contact_ids = contacts_dict['id']
+    number_of_contacts = len(contact_ids)
+    record_offsets = array('Q')
+
+    temporary_file_path = file_path + FILE_NAME_SUFFIX_TEMPORARY_FILE
+    with open(temporary_file_path, 'wb') as temporary_file:
+        temporary_file.write(b'\0' * HEADER_STRUCT.size)
+
+        offset = HEADER_STRUCT.size
+        contacts_values = zip(*(contacts_dict[key] for key in CONTACTS_DICT_KEYS))
+        for contact_id, *contact_fields in contacts_values:
+            contact_record = encode_contact_record(contact_id, contact_fields)
+            temporary_file.write(contact_record)
+            record_offsets.append(offset)
+            offset += len(contact_record)
+
+        # The index block lists the ids in increasing order, as the contacts' store keeps them
+        index_offset = offset
+        positions_by_id = sorted(range(number_of_contacts), key=contact_ids.__getitem__)
+        ids_in_index = array('q', (contact_ids[position] for position in positions_by_id))
+        offsets_in_index = array('Q', (record_offsets[position] for position in positions_by_id))
+        temporary_file.write(convert_array_to_little_endian(ids_in_index).tobytes())
+        temporary_file.write(convert_array_to_little_endian(offsets_in_index).tobytes())
+
+        sorted_ids_offset = index_offset + 2 * INT64_SIZE * number_of_contacts
+        sorted_ids = array('q', (
+            contact_id for _, _, contact_id in
+            sorted(zip(contacts_dict['surname'], contacts_dict['forename'], contact_ids))
+        ))
+        temporary_file.write(convert_array_to_little_endian(sorted_ids).tobytes())
+
+        temporary_file.seek(ZERO_VALUE)
+        temporary_file.write(HEADER_STRUCT.pack(
+            BINARY_CONTACTS_FILE_MAGIC, BINARY_CONTACTS_FILE_VERSION, ZERO_VALUE, number_of_contacts, next_id,
+            index_offset, sorted_ids_offset
+        ))
+        temporary_file.flush()
+        os.fsync(temporary_file.fileno())
+    os.replace(temporary_file_path, file_path)
+
+
+def decode_contact_record(buffer, offset: int) -> Tuple:
+    """
+    Decode the record of a contact starting at a given offset of a buffer
+
+    :param buffer: the buffer holding the record, e.g., the memory map of a binary contacts file.
+    :param offset: the offset of the record in the buffer.
+    :return: a tuple (id, forename, surname, email address, mobile number)
+    """
+
+    (_, contact_id, forename_length, surname_length, email_address_length,
+     mobile_number_length) = RECORD_HEADER_STRUCT.unpack_from(buffer, offset)
+
+    forename_offset = offset + RECORD_HEADER_STRUCT.size
+    surname_offset = forename_offset + forename_length
+    email_address_offset = surname_offset + surname_length
+    mobile_number_offset = email_address_offset + email_address_length
+    return (
+        contact_id,
+        buffer[forename_offset:surname_offset].decode('utf-8'),
+        buffer[surname_offset:email_address_offset].decode('utf-8'),
+        buffer[email_address_offset:mobile_number_offset].decode('utf-8'),
+        buffer[mobile_number_offset:mobile_number_offset + mobile_number_length].decode('utf-8')
+    )
+
+
+class BinaryContactsFile:
+    """
+    A binary contacts file opened via a memory map, of which only the header and the index block are read when opened;
+    each contact's record is then decoded only when that contact is read. It can be used as a context manager.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+
+        with open(file_path, 'rb') as binary_file:
+            self.memory_map = mmap.mmap(binary_file.fileno(), ZERO_VALUE, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, version, _, self.number_of_contacts, self.next_id, index_offset,
+             self.sorted_ids_offset) = HEADER_STRUCT.unpack_from(self.memory_map)
+        except struct.error:
+            magic, version = None, None
+        if magic != BINARY_CONTACTS_FILE_MAGIC or version != BINARY_CONTACTS_FILE_VERSION:
+            self.memory_map.close()
+            raise ValueError(f"{file_path} is not a binary contacts file of version {BINARY_CONTACTS_FILE_VERSION}.")
+
+        self.records_end_offset = index_offset
+        offsets_offset = index_offset + INT64_SIZE * self.number_of_contacts
+
+        # The ids are searched by binary search to find the offset of their record
+        self.ids = convert_array_to_little_endian(array('q', self.memory_map[index_offset:offsets_offset]))
+        self.offsets = convert_array_to_little_endian(
+            array('Q', self.memory_map[offsets_offset:self.sorted_ids_offset])
+        )
+
+    def __enter__(self) -> 'BinaryContactsFile':
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.number_of_contacts
+
+    def __contains__(self, contact_id: int) -> bool:
+        return self.get_record_offset(contact_id) is not None
+
+    def get_record_offset(self, contact_id: int) -> Optional[int]:
+        position = bisect_left(self.ids, contact_id)
+        if position == self.number_of_contacts or self.ids[position] != contact_id:
+            return None
+        return self.offsets[position]
+
+    def get_contact(self, contact_id: int) -> Optional[Dict]:
+        """
+        Get the details of a contact by their id, decoding their record only
+
+        :param contact_id: the id of the contact to get.
+        :return: a dictionary with the details of the contact, or None if no contact has the given id
+        """
+
+        offset = self.get_record_offset(contact_id)
+        if offset is None:
+            return None
+        return dict(zip(CONTACTS_DICT_KEYS, decode_contact_record(self.memory_map, offset)))
+
+    def iter_contacts(self) -> Iterator[Tuple]:
+        """
+        Iterate over the contacts in the order in which they were written, decoding their records one at a time
+
+        :return: an iterator of tuples (id, forename, surname, email address, mobile number)
+        """
+
+        # The records are copied out of the memory map at once, which makes decoding them all faster than one at a time
+        records = self.memory_map[HEADER_STRUCT.size:self.records_end_offset]
+
+        offset = ZERO_VALUE
+        while offset < len(records):
+            record_length, = RECORD_LENGTH_STRUCT.unpack_from(records, offset)
+            yield decode_contact_record(records, offset)
+            offset += RECORD_LENGTH_STRUCT.size + record_length
+
+    def iter_contacts_sorted_by_surname(self, limit: int = None) -> Iterator[Tuple]:
+        """
+        Iterate over the contacts in alphabetical order of their surnames (and forenames) via the sorted ids block,
+        decoding only the records of the contacts iterated over
+
+        :param limit: the maximum number of contacts to iterate over, e.g., the first screen of contacts; by default,
+                    all of them.
+        :return: an iterator of tuples (id, forename, surname, email address, mobile number)
+        """
+
+        number_of_contacts = self.number_of_contacts if limit is None else min(limit, self.number_of_contacts)
+        sorted_ids = convert_array_to_little_endian(array(
+            'q', self.memory_map[self.sorted_ids_offset:self.sorted_ids_offset + INT64_SIZE * number_of_contacts]
+        ))
+        for contact_id in sorted_ids:
+            yield decode_contact_record(self.memory_map, self.get_record_offset(contact_id))
+
+    def get_contacts_dict(self) -> Dict:
+        """
+        Decode all the contacts into a dictionary of contacts, in the format of the contacts_dict.txt file
+
+        :return: a dictionary with the keys "id", "forename", "surname", "email_address", and "mobile_number", each
+                mapped to a list of values in the order in which the contacts were written
+        """
+
+        contact_ids, forenames, surnames, email_addresses, mobile_numbers = [], [], [], [], []
+
+        # The records are decoded in a single loop, as decoding all of them is on the path of loading the contacts
+        records = self.memory_map[HEADER_STRUCT.size:self.records_end_offset]
+        unpack_record_header = RECORD_HEADER_STRUCT.unpack_from
+        offset = ZERO_VALUE
+        while offset < len(records):
+            (_, contact_id, forename_length, surname_length, email_address_length,
+             mobile_number_length) = unpack_record_header(records, offset)
+            contact_ids.append(contact_id)
+
+            offset += RECORD_HEADER_STRUCT.size
+            forenames.append(records[offset:offset + forename_length].decode('utf-8'))
+            offset += forename_length
+            surnames.append(records[offset:offset + surname_length].decode('utf-8'))
+            offset += surname_length
+            email_addresses.append(records[offset:offset + email_address_length].decode('utf-8'))
+            offset += email_address_length
+            mobile_numbers.append(records[offset:offset + mobile_number_length].decode('utf-8'))
+            offset += mobile_number_length
+
+        return dict(zip(CONTACTS_DICT_KEYS, (contact_ids, forenames, surnames, email_addresses, mobile_numbers)))
+
+    def close(self) -> None:
+        self.memory_map.close()
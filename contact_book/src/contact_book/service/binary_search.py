@@ -2,8 +2,10 @@
 # surname)
 
 import logging
-from typing import List
+from bisect import bisect_left
+from typing import Iterable, List, Tuple
 
+from contact_book.src.contact_book.constants import HIGHEST_UNICODE_CHARACTER
 from contact_book.src.contact_book.service.utils import get_contacts_dict
 
 
@@ -40,6 +42,93 @@ def binary_search(
     return low_value
 
 
+def binary_search_upper_bound(
+        sorted_list: List,
+        element_to_be_searched,
+        low_value: int = 0,
+        high_value: int = None
+) -> int:
+    """
+    A function to perform a binary search of the position right after the last element of a sorted list that is lower
+    than or equal to the element to be searched (whereas 'binary_search' returns the position of the first element
+    that is greater than or equal to it).
+    :param sorted_list: a sorted list, e.g., a list of contacts' surnames in alphabetical order.
+    :param element_to_be_searched: the element to be searched, e.g., the surname of a contact.
+    :param low_value: 0 by default.
+    :param high_value: None by default.
+    :return: the index right after the last element lower than or equal to the element to be searched.
+    """
+
+    if high_value is None:
+        high_value = len(sorted_list)
+
+    while low_value < high_value:
+
+        middle_value = int((low_value + high_value)/2)
+        if element_to_be_searched < sorted_list[middle_value]:
+            high_value = middle_value
+        else:
+            low_value = middle_value + 1
+
+    return low_value
+
+
+def find_prefix_range(sorted_list_of_keys: List[Tuple], prefix_to_be_searched: str) -> Tuple[int, int]:
+    """
+    A function to find the range of keys starting with a prefix in a sorted list of keys via two binary searches (a
+    lower-bound and an upper-bound one), i.e., in O(log n).
+    :param sorted_list_of_keys: a sorted list of tuples whose first element is a string, e.g., [('cooper', 16), etc.].
+    :param prefix_to_be_searched: the prefix to be searched, e.g., 'coo'.
+    :return: a tuple (start, end) such that the keys starting with the prefix are sorted_list_of_keys[start:end].
+    """
+
+    start_index = binary_search(sorted_list_of_keys, (prefix_to_be_searched,))
+    end_index = binary_search_upper_bound(
+        sorted_list_of_keys,
+        (prefix_to_be_searched + HIGHEST_UNICODE_CHARACTER,),
+        low_value=start_index
+    )
+    return start_index, end_index
+
+
+def merge_sorted_keys(sorted_list_of_keys: List, keys_to_be_merged: Iterable) -> List:
+    """
+    A function to merge keys into a sorted list of keys, by sorting the k keys to be merged and copying the runs of the
+    list between their positions found by binary search, i.e., in O(k log n) comparisons plus one O(n) copy, rather
+    than O(n) per key inserted one at a time or O(n) comparisons to sort the list again.
+    :param sorted_list_of_keys: a sorted list of keys, e.g., [('Cooper', 'Sheldon', 16), etc.].
+    :param keys_to_be_merged: the keys to be merged into the list, in any order.
+    :return: the new sorted list of keys, including the ones merged.
+    """
+
+    merged_keys = []
+    start_index = 0
+    for key in sorted(keys_to_be_merged):
+        end_index = bisect_left(sorted_list_of_keys, key, start_index)
+        merged_keys.extend(sorted_list_of_keys[start_index:end_index])
+        merged_keys.append(key)
+        start_index = end_index
+    merged_keys.extend(sorted_list_of_keys[start_index:])
+
+    return merged_keys
+
+
+def remove_sorted_keys(sorted_list_of_keys: List, keys_to_be_removed: Iterable) -> List:
+    """
+    A function to remove keys from a sorted list of keys in a single O(n) pass over the list, which keeps it sorted,
+    rather than O(n) per key deleted one at a time.
+    :param sorted_list_of_keys: a sorted list of keys, e.g., [('Cooper', 'Sheldon', 16), etc.].
+    :param keys_to_be_removed: the keys to be removed from the list, in any order (the ones not in it are ignored).
+    :return: the new sorted list of keys, without the ones removed.
+    """
+
+    keys_to_be_removed = set(keys_to_be_removed)
+    if not keys_to_be_removed:
+        return sorted_list_of_keys
+
+    return [key for key in sorted_list_of_keys if key not in keys_to_be_removed]
+
+
 def find_contact(
         list_of_strings: List[str],
         string_to_be_searched: str,
@@ -0,0 +1,87 @@
+# This Python file contains the base class of the indexes kept in sync with the contacts' store, which notifies each of
+# its indexes of every contact created, updated, or removed, such that they are maintained incrementally instead of
+# being rebuilt from all the contacts after each CRUD operation.
+
+from typing import Dict, List, Tuple
+
+from contact_book.src.contact_book.constants import CONTACTS_DICT_KEYS, ZERO_VALUE
+
+
+class ContactIndex:
+    """
+    The base class of an index over the contacts of a 'ContactStore', where each contact is given as a dictionary keyed
+    by "id", "forename", "surname", "email_address", and "mobile_number".
+    """
+
+    def build(self, contacts_dict: Dict):
+        """
+        Build the index from all the contacts of a dictionary of contacts, by default by adding them one at a time
+
+        :param contacts_dict: the dictionary of contacts to index.
+        """
+
+        for contact_values in zip(*(contacts_dict[key] for key in CONTACTS_DICT_KEYS)):
+            self.add_contact(contact_values[ZERO_VALUE], dict(zip(CONTACTS_DICT_KEYS, contact_values)))
+
+    def add_contact(self, contact_id: int, contact: Dict):
+        """
+        Add a contact to the index
+
+        :param contact_id: the id of the contact to add.
+        :param contact: the details of the contact to add.
+        """
+
+        raise NotImplementedError
+
+    def add_contacts(self, contacts: List[Tuple[int, Dict]]):
+        """
+        Add a batch of contacts to the index, by default by adding them one at a time
+
+        :param contacts: a list of tuples (id, details) of the contacts to add.
+        """
+
+        for contact_id, contact in contacts:
+            self.add_contact(contact_id, contact)
+
+    def remove_contact(self, contact_id: int, contact: Dict):
+        """
+        Remove a contact from the index
+
+        :param contact_id: the id of the contact to remove.
+        :param contact: the details of the contact to remove, as they were indexed.
+        """
+
+        raise NotImplementedError
+
+    def remove_contacts(self, contacts: List[Tuple[int, Dict]]):
+        """
+        Remove a batch of contacts from the index, by default by removing them one at a time
+
+        :param contacts: a list of tuples (id, details as they were indexed) of the contacts to remove.
+        """
+
+        for contact_id, contact in contacts:
+            self.remove_contact(contact_id, contact)
+
+    def update_contact(self, contact_id: int, contact_before_update: Dict, contact_after_update: Dict):
+        """
+        Update a contact in the index, by default by removing their previous details and adding the updated ones
+
+        :param contact_id: the id of the contact to update.
+        :param contact_before_update: the details of the contact before the update, as they were indexed.
+        :param contact_after_update: the details of the contact after the update.
+        """
+
+        self.remove_contact(contact_id, contact_before_update)
+        self.add_contact(contact_id, contact_after_update)
+
+    def update_contacts(self, contacts: List[Tuple[int, Dict, Dict]]):
+        """
+        Update a batch of contacts in the index, by default by updating them one at a time
+
+        :param contacts: a list of tuples (id, details before the update, details after the update) of the contacts to
+                        update.
+        """
+
+        for contact_id, contact_before_update, contact_after_update in contacts:
+            self.update_contact(contact_id, contact_before_update, contact_after_update)
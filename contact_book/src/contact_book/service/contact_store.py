@@ -0,0 +1,1067 @@
+# This Python file contains the in-memory store of contacts, which loads the dictionary of contacts once and keeps it
+# in memory for the lifetime of the application in a compact form (the ids packed in an array sorted by id, which also
+# serves as the index from each contact's id to their position, and the forenames and surnames interned), along with
+# a persisted id sequence used to assign ids to new contacts. Removing a contact marks their row as a tombstone (see
+# 'tombstones.py'), whose space is reclaimed by compacting the columns in the background once there are enough of
+# them. Each CRUD operation is persisted to the storage backend selected by configuration (see 'storage_backends.py')
+# as a journal record, once the operations persisted by the other processes working on the same contacts, if any, have
+# been merged into the store. The operations performed on the store can be undone and redone (see 'undo_history.py').
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
+from itertools import chain, compress
+from typing import (TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List,
+                    Mapping, Set, Tuple)
+
+from contact_book.src.contact_book.constants import (
+    ARRAY_TYPE_CODE_CONTACT_IDS, CONTACTS_DICT_KEYS, FILE_NAME_CONTACTS_DICT,
+    CONTACTS_LIST_CHANGE_RESET, INTERNED_CONTACTS_DICT_KEYS,
+    JOURNAL_OPERATION_CREATE, JOURNAL_OPERATION_DELETE,
+    JOURNAL_OPERATION_UPDATE, ONE_VALUE, ROOT_DIR_CONTACTS_DICT_FILE,
+    TOMBSTONE_COMPACTION_MIN_TOMBSTONES, TOMBSTONE_COMPACTION_THRESHOLD_RATIO,
+    UNDO_HISTORY_DEPTH, ZERO_VALUE)
+
+from .contact_index import ContactIndex
+from .journal import create_journal_record
+from .metrics import record_cache_access
+from .sorted_index import SortedContactIndex, create_contacts_list_change
+from .storage_backends import StorageBackend, get_storage_backend
+from .tombstones import LiveColumns, TombstoneBitmap
+from .undo_history import UndoHistory, copy_journal_record
+from .utils import convert_contacts_dict_to_df
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def compact_contacts_dict(contacts_dict: Dict) -> Dict:
+    """
+    Convert a dictionary of contacts, as loaded from a storage backend, into the compact form held by the store: the
+    contacts sorted by id, the ids packed in an array of 64-bit integers (8 bytes each, rather than a pointer to an
+    integer object of 28 bytes), and the forenames and surnames interned, such that the contacts sharing a forename or
+    surname share a single string object
+
+    :param contacts_dict: the dictionary of contacts, with a list of values for each key.
+    :return: the compact dictionary of contacts, with the same keys
+    """
+
+    # Contacts are given increasing ids and appended, such that their ids are only out of order in a file edited by
+    # hand, in which case the contacts are sorted once, as the store looks their ids up by binary search
+    contact_ids = contacts_dict['id']
+    if any(previous_id >= contact_id for previous_id, contact_id in zip(contact_ids, contact_ids[ONE_VALUE:])):
+        positions_sorted_by_id = sorted(range(len(contact_ids)), key=contact_ids.__getitem__)
+        contacts_dict = {
+            key: [contacts_dict[key][position] for position in positions_sorted_by_id] for key in CONTACTS_DICT_KEYS
+        }
+
+    compact_contacts_dict = {}
+    for key in CONTACTS_DICT_KEYS:
+        if key == 'id':
+            compact_contacts_dict[key] = array(ARRAY_TYPE_CODE_CONTACT_IDS, contacts_dict[key])
+        elif key in INTERNED_CONTACTS_DICT_KEYS:
+            compact_contacts_dict[key] = list(map(sys.intern, contacts_dict[key]))
+        else:
+            compact_contacts_dict[key] = contacts_dict[key]
+    return compact_contacts_dict
+
+
+class ConcurrentModificationError(Exception):
+    """
+    Raised when a contact to update or remove was modified (e.g., by another process) since the version of the contact
+    the operation was based on.
+    """
+
+    def __init__(self, contact_id: int, expected_version: int, version: int):
+        super().__init__(f"The contact of id {contact_id} is at version {version} rather than {expected_version}.")
+        self.contact_id = contact_id
+        self.expected_version = expected_version
+        self.version = version
+
+
+class ContactStore:
+    """
+    A long-lived, in-memory store of contacts that reads the saved contacts only once and keeps the five columns of the
+    dictionary of contacts ("id", "forename", "surname", "email_address", "mobile_number") in the compact form given
+    by 'compact_contacts_dict', sorted by id, such that reading, updating, or removing a contact by its id is a binary
+    search of the ids, which neither requires to parse the contacts' file again nor to scan every contact. The rows of
+    the contacts removed stay in the columns as tombstones until the columns are compacted, such that 'contacts_dict'
+    is only read through the methods of the store, which skip them.
+    """
+
+    def __init__(
+            self,
+            contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+            contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+            storage_backend: StorageBackend = None,
+            loading_progress_callback: Callable[[float], None] = None,
+            undo_history_depth: int = UNDO_HISTORY_DEPTH
+    ):
+        if storage_backend is None:
+            storage_backend = get_storage_backend(
+                contacts_file_root_dir=contacts_file_root_dir,
+                contacts_file_name=contacts_file_name
+            )
+        self.storage_backend = storage_backend
+
+        contacts_dict, self.next_id = self.storage_backend.load(loading_progress_callback)
+        self.contacts_dict = compact_contacts_dict(contacts_dict)
+
+        # Rows of the contacts removed, reclaimed by a compaction of the columns on a background thread once at least
+        # the given ratio (and number) of the rows are tombstones (see 'start_tombstone_compaction')
+        self.tombstones = TombstoneBitmap(len(self.contacts_dict['id']))
+        self.tombstone_compaction_threshold_ratio = TOMBSTONE_COMPACTION_THRESHOLD_RATIO
+        self.tombstone_compaction_min_tombstones = TOMBSTONE_COMPACTION_MIN_TOMBSTONES
+        self.tombstone_compaction_thread = None
+        self.tombstone_compaction_result = None
+        self.contact_ids_changed_during_compaction = None
+
+        # Indexes notified of every contact created, updated, or removed, starting with the index of the contacts sorted
+        # in the order in which they are listed on the GUI
+        self.sorted_index = SortedContactIndex(self.contacts_dict)
+        self.indexes = [self.sorted_index]
+
+        # Journal records of the operations whose persistence is deferred, if any (see 'deferred_persistence')
+        self.deferred_journal_records = None
+
+        # Versions of the contacts created or updated since the contacts were loaded, the other contacts being at most
+        # at the version of the contacts loaded (see 'get_contact_version')
+        self.loaded_version = self.storage_backend.version
+        self.contact_versions = {}
+
+        # Inverse journal records of the last operations performed on the store, up to the given depth (see 'undo')
+        self.undo_history = UndoHistory(undo_history_depth)
+
+    def register_index(self, contact_index: ContactIndex) -> None:
+        """
+        Register an index to be kept in sync with the store, adding every contact already stored to it.
+
+        :param contact_index: the index to register.
+        """
+
+        contact_index.build(self.get_live_columns())
+        self.indexes.append(contact_index)
+
+    def get_index(self, contact_index_class: type) -> ContactIndex:
+        """
+        Get the index of the given class kept in sync with the store, building and registering it on first use only,
+        such that indexes only needed by some features (e.g., searching) do not slow down loading the contacts.
+
+        :param contact_index_class: the class of the index, a subclass of 'ContactIndex'.
+        :return: the index of the given class
+        """
+
+        for contact_index in self.indexes:
+            if type(contact_index) is contact_index_class:
+                record_cache_access('contact_indexes', is_hit=True)
+                return contact_index
+
+        record_cache_access('contact_indexes', is_hit=False)
+        contact_index = contact_index_class()
+        self.register_index(contact_index)
+        return contact_index
+
+    def __len__(self) -> int:
+        return len(self.contacts_dict['id']) - self.tombstones.count
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Iterate over the ids of the contacts, in increasing order, skipping the contacts removed
+        """
+
+        return compress(self.contacts_dict['id'], self.tombstones.get_live_rows())
+
+    def __contains__(self, contact_id: int) -> bool:
+        position = bisect_left(self.contacts_dict['id'], contact_id)
+        return (
+            position < len(self.contacts_dict['id'])
+            and self.contacts_dict['id'][position] == contact_id
+            and position not in self.tombstones
+        )
+
+    def get_position(self, contact_id: int) -> int:
+        """
+        Get the position of a contact in the columns of the store via a binary search of their id
+
+        :param contact_id: the id of the contact.
+        :return: the position of the contact, e.g., 0 for the contact with the lowest id
+        """
+
+        position = bisect_left(self.contacts_dict['id'], contact_id)
+        if (
+                position == len(self.contacts_dict['id'])
+                or self.contacts_dict['id'][position] != contact_id
+                or position in self.tombstones
+        ):
+            raise KeyError(contact_id)
+        return position
+
+    def get_contact(self, contact_id: int) -> Dict:
+        """
+        Get the details of a contact by their id
+
+        :param contact_id: the id of the contact to get.
+        :return: a dictionary with the details of the contact, keyed by "id", "forename", "surname", "email_address",
+                and "mobile_number"
+        """
+
+        position = self.get_position(contact_id)
+        return {key: self.contacts_dict[key][position] for key in CONTACTS_DICT_KEYS}
+
+    def get_contact_values(self, contact_id: int) -> Tuple:
+        """
+        Get the details of a contact by their id, in the order in which they are displayed on the GUI
+
+        :param contact_id: the id of the contact to get.
+        :return: a tuple (id, forename, surname, email address, mobile number)
+        """
+
+        position = self.get_position(contact_id)
+        return tuple(self.contacts_dict[key][position] for key in CONTACTS_DICT_KEYS)
+
+    def get_contact_version(self, contact_id: int) -> int:
+        """
+        Get the version of a contact, which changes whenever they are updated, by this process or another, such that an
+        operation based on a version of the contact can check it is still current (see 'update_contact')
+
+        :param contact_id: the id of the contact.
+        :return: the version of the contact, e.g., 42
+        """
+
+        self.get_position(contact_id)
+        return self.contact_versions.get(contact_id, self.loaded_version)
+
+    def check_contact_version(self, contact_id: int, expected_version: int = None) -> None:
+        """
+        Check that a contact is still at the version an operation is based on, if any, raising a
+        'ConcurrentModificationError' otherwise.
+        """
+
+        if expected_version is not None and self.get_contact_version(contact_id) != expected_version:
+            raise ConcurrentModificationError(contact_id, expected_version, self.get_contact_version(contact_id))
+
+    def get_contacts_dict(self) -> Dict:
+        """
+        Get a copy of all the contacts held by the store in the format of the contacts_dict.txt file
+
+        :return: a dictionary with the keys "id", "forename", "surname", "email_address", and "mobile_number", each
+                mapped to a list of values
+        """
+
+        live_columns = self.get_live_columns()
+        return {key: list(live_columns[key]) for key in CONTACTS_DICT_KEYS}
+
+    def get_live_columns(self) -> Mapping:
+        """
+        Get the columns of the store without the rows of the contacts removed, e.g., to save them, which are only
+        filtered when read if there are any
+
+        :return: the dictionary of contacts of the store if it has no tombstones, or else a 'LiveColumns' view of it
+        """
+
+        if not self.tombstones.count:
+            return self.contacts_dict
+        return LiveColumns(self.contacts_dict, self.tombstones)
+
+    def get_contacts_df(self) -> 'pd.DataFrame':
+        """
+        Get a pandas dataframe of all the contacts held by the store, e.g., to analyse them, importing pandas only then
+
+        :return: a copy of the contacts as a pandas dataframe with the columns "id", "forename", "surname",
+                "email_address", and "mobile_number"
+        """
+
+        return convert_contacts_dict_to_df(self.get_contacts_dict())
+
+    def create_contact(
+            self,
+            forename_to_create: str,
+            surname_to_create: str,
+            email_address_to_create: str,
+            mobile_number_to_create: str
+    ) -> int:
+        """
+        Append a contact to create to the store, assigning them the next id of the id sequence
+
+        :param forename_to_create: the forename of the contact to create.
+        :param surname_to_create: the surname of the contact to create.
+        :param email_address_to_create: the email address of the contact to create.
+        :param mobile_number_to_create: the mobile number of the contact to create.
+        :return: the id assigned to the contact created
+        """
+
+        with self.synchronized():
+            contact_id = self.next_id
+            self.next_id += ONE_VALUE
+
+            contact_fields = {
+                'forename': forename_to_create,
+                'surname': surname_to_create,
+                'email_address': email_address_to_create,
+                'mobile_number': mobile_number_to_create
+            }
+            self.insert_contact(contact_id, contact_fields)
+            journal_records = [create_journal_record(JOURNAL_OPERATION_CREATE, contact_id, contact_fields)]
+            try:
+                self.persist(journal_records)
+            except OSError:
+                self.reload()
+                raise
+            self.undo_history.record(journal_records, {})
+
+        return contact_id
+
+    def create_contacts(self, contacts_to_create: List[Dict]) -> List[int]:
+        """
+        Append a batch of contacts to create to the store, assigning them a block of consecutive ids of the id sequence
+        and persisting them with a single write to the storage backend (see 'apply_changeset')
+
+        :param contacts_to_create: a list of dictionaries with the "forename", "surname", "email_address", and
+                                    "mobile_number" of each contact to create.
+        :return: the list of ids assigned to the contacts created
+        """
+
+        return self.apply_changeset(contacts_to_create=contacts_to_create)
+
+    def update_contacts(self, contacts_to_update: Dict[int, Dict], expected_versions: Dict[int, int] = None) -> None:
+        """
+        Update a batch of contacts in place, persisting them with a single write to the storage backend (see
+        'apply_changeset')
+
+        :param contacts_to_update: a dictionary mapping the id of each contact to update to the fields to set, e.g.,
+                                    {16: {'surname': 'Cooper'}}.
+        :param expected_versions: a dictionary mapping the id of some of the contacts to update to the version the
+                                update is based on, if any (see 'update_contact').
+        """
+
+        self.apply_changeset(contacts_to_update=contacts_to_update, expected_versions=expected_versions)
+
+    def remove_contacts(self, contact_ids_to_remove: Iterable[int], expected_versions: Dict[int, int] = None) -> None:
+        """
+        Remove a batch of contacts from the store by their ids, in a single pass over the columns of the store and with
+        a single write to the storage backend (see 'apply_changeset')
+
+        :param contact_ids_to_remove: the ids of the contacts to remove.
+        :param expected_versions: a dictionary mapping the id of some of the contacts to remove to the version the
+                                removal is based on, if any (see 'remove_contact').
+        """
+
+        self.apply_changeset(contact_ids_to_remove=contact_ids_to_remove, expected_versions=expected_versions)
+
+    def apply_changeset(
+            self,
+            contacts_to_create: List[Dict] = (),
+            contacts_to_update: Dict[int, Dict] = None,
+            contact_ids_to_remove: Iterable[int] = (),
+            expected_versions: Dict[int, int] = None
+    ) -> List[int]:
+        """
+        Create, update, and remove a batch of contacts all at once, or none of them: the whole changeset is checked
+        before any contact is changed, the columns of the store are then patched (for the updates) and rebuilt (for the
+        removals) in a single pass, and all the operations are persisted with a single write to the storage backend.
+        Should that write fail, the store is loaded again from the storage backend, such that it holds none of the
+        operations of the changeset.
+
+        :param contacts_to_create: a list of dictionaries with the "forename", "surname", "email_address", and
+                                    "mobile_number" of each contact to create.
+        :param contacts_to_update: a dictionary mapping the id of each contact to update to the fields to set, e.g.,
+                                    {16: {'surname': 'Cooper'}}.
+        :param contact_ids_to_remove: the ids of the contacts to remove, which cannot also be updated.
+        :param expected_versions: a dictionary mapping the id of some of the contacts to update or remove to the version
+                                the operation is based on (see 'get_contact_version'), such that a
+                                'ConcurrentModificationError' is raised if any of them was modified since.
+        :return: the list of ids assigned to the contacts created, in the order in which they were given
+        """
+
+        contacts_to_update = contacts_to_update or {}
+        contact_ids_to_remove = set(contact_ids_to_remove)
+        expected_versions = expected_versions or {}
+
+        with self.synchronized():
+            self.check_changeset(contacts_to_create, contacts_to_update, contact_ids_to_remove, expected_versions)
+
+            # Only the fields whose values changed are set and journaled
+            changed_fields_by_id = {}
+            for contact_id, fields_to_update in contacts_to_update.items():
+                position = self.get_position(contact_id)
+                changed_fields = {
+                    key: value for key, value in fields_to_update.items() if self.contacts_dict[key][position] != value
+                }
+                if changed_fields:
+                    changed_fields_by_id[contact_id] = changed_fields
+
+            first_id = self.next_id
+            self.next_id += len(contacts_to_create)
+            contact_ids = list(range(first_id, self.next_id))
+
+            # The details of the contacts updated or removed are kept to undo the changeset (see 'undo')
+            contacts_before = {
+                contact_id: self.get_contact(contact_id)
+                for contact_id in chain(changed_fields_by_id, contact_ids_to_remove)
+            }
+
+            self.set_contacts_fields(changed_fields_by_id)
+            self.delete_contacts(contact_ids_to_remove)
+            self.append_contacts(contact_ids, contacts_to_create)
+
+            journal_records = [
+                create_journal_record(JOURNAL_OPERATION_UPDATE, contact_id, changed_fields)
+                for contact_id, changed_fields in changed_fields_by_id.items()
+            ]
+            journal_records.extend(
+                create_journal_record(JOURNAL_OPERATION_DELETE, contact_id)
+                for contact_id in sorted(contact_ids_to_remove)
+            )
+            journal_records.extend(
+                create_journal_record(
+                    JOURNAL_OPERATION_CREATE,
+                    contact_id,
+                    {key: contact[key] for key in CONTACTS_DICT_KEYS[ONE_VALUE:]}
+                )
+                for contact_id, contact in zip(contact_ids, contacts_to_create)
+            )
+            if not journal_records:
+                return contact_ids
+
+            try:
+                self.persist(journal_records)
+            except OSError:
+                self.reload()
+                raise
+            self.undo_history.record(journal_records, contacts_before)
+
+        return contact_ids
+
+    def check_changeset(
+            self,
+            contacts_to_create: List[Dict],
+            contacts_to_update: Dict[int, Dict],
+            contact_ids_to_remove: Set[int],
+            expected_versions: Dict[int, int]
+    ) -> None:
+        """
+        Check that a changeset can be applied as a whole (see 'apply_changeset'), raising a ValueError if any of its
+        contacts has missing or unknown fields, or is both updated and removed, a KeyError if any contact to update or
+        remove is not stored, or a 'ConcurrentModificationError' if any of them is not at its expected version.
+        """
+
+        contact_fields = set(CONTACTS_DICT_KEYS[ONE_VALUE:])
+        for contact in contacts_to_create:
+            if set(contact) != contact_fields:
+                raise ValueError(
+                    f"A contact to create has the fields {sorted(contact)} rather than {sorted(contact_fields)}."
+                )
+
+        for contact_id, fields_to_update in contacts_to_update.items():
+            if not set(fields_to_update) <= contact_fields:
+                raise ValueError(
+                    f"The contact of id {contact_id} to update has unknown fields {sorted(fields_to_update)}."
+                )
+
+        if not contact_ids_to_remove.isdisjoint(contacts_to_update):
+            contact_ids_updated_and_removed = sorted(contact_ids_to_remove.intersection(contacts_to_update))
+            raise ValueError(f"The contacts of ids {contact_ids_updated_and_removed} are both updated and removed.")
+
+        for contact_id in expected_versions:
+            if contact_id not in contacts_to_update and contact_id not in contact_ids_to_remove:
+                raise ValueError(
+                    f"The contact of id {contact_id} has an expected version but is neither updated nor removed."
+                )
+
+        for contact_id in chain(contacts_to_update, contact_ids_to_remove):
+            self.get_position(contact_id)
+            self.check_contact_version(contact_id, expected_versions.get(contact_id))
+
+    def update_contact(
+            self,
+            contact_id: int,
+            forename_to_update: str,
+            surname_to_update: str,
+            email_address_to_update: str,
+            mobile_number_to_update: str,
+            expected_version: int = None
+    ) -> None:
+        """
+        Update the details (forename, surname, email address, and mobile number) of a contact in place
+
+        :param contact_id: the id of the contact to update.
+        :param forename_to_update: the forename of the contact to update.
+        :param surname_to_update: the surname of the contact to update.
+        :param email_address_to_update: the email address of the contact to update.
+        :param mobile_number_to_update: the mobile number of the contact to update.
+        :param expected_version: the version of the contact the update is based on (see 'get_contact_version'), if any,
+                                such that a 'ConcurrentModificationError' is raised if the contact was modified since.
+        """
+
+        with self.synchronized():
+            self.check_contact_version(contact_id, expected_version)
+
+            position = self.get_position(contact_id)
+            fields_to_update = {
+                'forename': forename_to_update,
+                'surname': surname_to_update,
+                'email_address': email_address_to_update,
+                'mobile_number': mobile_number_to_update
+            }
+
+            # Only the fields whose values changed are set and journaled
+            changed_fields = {
+                key: value for key, value in fields_to_update.items() if self.contacts_dict[key][position] != value
+            }
+            if not changed_fields:
+                return
+
+            contact_before = self.get_contact(contact_id)
+            self.set_contact_fields(contact_id, changed_fields)
+            journal_records = [create_journal_record(JOURNAL_OPERATION_UPDATE, contact_id, changed_fields)]
+            try:
+                self.persist(journal_records)
+            except OSError:
+                self.reload()
+                raise
+            self.undo_history.record(journal_records, {contact_id: contact_before})
+
+    def remove_contact(self, contact_id: int, expected_version: int = None) -> None:
+        """
+        Remove a contact from the store by their id
+
+        :param contact_id: the id of the contact to remove.
+        :param expected_version: the version of the contact the removal is based on (see 'get_contact_version'), if
+                                any, such that a 'ConcurrentModificationError' is raised if the contact was modified
+                                since.
+        """
+
+        with self.synchronized():
+            self.check_contact_version(contact_id, expected_version)
+
+            contact_before = self.get_contact(contact_id)
+            self.delete_contact(contact_id)
+            journal_records = [create_journal_record(JOURNAL_OPERATION_DELETE, contact_id)]
+            try:
+                self.persist(journal_records)
+            except OSError:
+                self.reload()
+                raise
+            self.undo_history.record(journal_records, {contact_id: contact_before})
+
+    def undo(self) -> List[int]:
+        """
+        Undo the last operation (or changeset) performed on the store that was not undone yet, if any, by applying and
+        persisting its inverse journal records like any other operation, e.g., creating a contact removed by mistake
+        back with the same id and details. Restoring a contact removed revives their row left as a tombstone, which
+        costs a binary search of the ids (and the update of the indexes) per contact, whatever the number of contacts.
+        However, once a compaction of the tombstones (see 'start_tombstone_compaction') has reclaimed their row, the
+        contact is inserted back into the middle of the columns, which shifts the rows after them in each column and
+        in the tombstones, i.e., costs O(n) per contact, and discards any compaction in progress.
+
+        :return: the ids of the contacts the operation undone was performed on, or an empty list if there was none
+
+        Note: a 'ConcurrentModificationError' (or a KeyError) is raised, and nothing is undone, if any of the contacts
+                was modified (or removed) since the operation, e.g., by another process, as their changes would be lost.
+        """
+
+        with self.synchronized():
+            history_entry = self.undo_history.get_entry_to_undo()
+            if history_entry is None:
+                return []
+
+            journal_records = self.apply_history_entry(history_entry)
+            self.undo_history.record_undone(journal_records)
+
+        return [journal_record['id'] for journal_record in journal_records]
+
+    def redo(self) -> List[int]:
+        """
+        Redo the last operation undone (see 'undo'), if no other operation was performed on the store since
+
+        :return: the ids of the contacts the operation redone was performed on, or an empty list if there was none
+        """
+
+        with self.synchronized():
+            history_entry = self.undo_history.get_entry_to_redo()
+            if history_entry is None:
+                return []
+
+            journal_records = self.apply_history_entry(history_entry)
+            self.undo_history.record_redone(journal_records)
+
+        return [journal_record['id'] for journal_record in journal_records]
+
+    def apply_history_entry(self, history_entry: Dict) -> List[Dict]:
+        """
+        Apply and persist the inverse journal records of an entry of the undo/redo history, once checked that the
+        contacts are still at the versions the journal records of the entry were persisted at
+
+        :param history_entry: the entry of the history (see 'create_history_entry').
+        :return: the journal records applied
+        """
+
+        for journal_record in history_entry['journal_records']:
+            contact_id = journal_record['id']
+            if journal_record['operation'] != JOURNAL_OPERATION_DELETE:
+                self.get_position(contact_id)
+                self.check_contact_version(contact_id, journal_record.get('version'))
+            elif contact_id in self:
+                raise ConcurrentModificationError(
+                    contact_id, journal_record.get('version'), self.get_contact_version(contact_id)
+                )
+
+        journal_records = list(map(copy_journal_record, history_entry['inverse_journal_records']))
+        self.apply_journal_records(journal_records)
+        try:
+            self.persist(journal_records)
+        except OSError:
+            self.reload()
+            raise
+
+        return journal_records
+
+    def insert_contact(self, contact_id: int, contact_fields: Dict) -> None:
+        """
+        Insert a contact into the columns of the store and its indexes, at the position of their id. Reviving the row of
+        a contact removed and not compacted yet, or appending a contact created, costs O(log n), whereas inserting a
+        contact whose row was compacted (e.g., by undoing their removal) before the last row costs O(n).
+
+        :param contact_id: the id of the contact to insert.
+        :param contact_fields: the "forename", "surname", "email_address", and "mobile_number" of the contact.
+        """
+
+        # A contact created has the highest id, such that they are appended, which keeps the ids sorted
+        position = bisect_left(self.contacts_dict['id'], contact_id)
+        if position < len(self.contacts_dict['id']) and self.contacts_dict['id'][position] == contact_id:
+            # The contact was removed and is created again, e.g., by replaying the journal of another process, in the
+            # row left as a tombstone, which a compaction in progress would not have kept
+            self.cancel_tombstone_compaction()
+            self.tombstones.discard(position)
+            for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+                value = contact_fields[key]
+                self.contacts_dict[key][position] = sys.intern(value) if key in INTERNED_CONTACTS_DICT_KEYS else value
+        else:
+            for key in CONTACTS_DICT_KEYS:
+                value = contact_id if key == 'id' else contact_fields[key]
+                if key in INTERNED_CONTACTS_DICT_KEYS:
+                    value = sys.intern(value)
+                self.contacts_dict[key].insert(position, value)
+
+            if position == len(self.tombstones):
+                self.tombstones.extend(ONE_VALUE)
+            else:
+                # The positions of the rows after the contact are shifted, which a compaction in progress did not see
+                self.cancel_tombstone_compaction()
+                self.tombstones.insert(position)
+
+        contact_inserted = self.get_contact(contact_id)
+        for contact_index in self.indexes:
+            contact_index.add_contact(contact_id, contact_inserted)
+
+    def set_contact_fields(self, contact_id: int, changed_fields: Dict) -> None:
+        """
+        Set some of the details of a contact in the columns of the store and update them in its indexes
+
+        :param contact_id: the id of the contact to update.
+        :param changed_fields: the fields to set, e.g., {'surname': 'Cooper'}.
+        """
+
+        position = self.get_position(contact_id)
+        contact_before_update = self.get_contact(contact_id)
+        for key, value in changed_fields.items():
+            self.contacts_dict[key][position] = sys.intern(value) if key in INTERNED_CONTACTS_DICT_KEYS else value
+        self.record_contact_change(contact_id)
+
+        contact_after_update = self.get_contact(contact_id)
+        for contact_index in self.indexes:
+            contact_index.update_contact(contact_id, contact_before_update, contact_after_update)
+
+    def delete_contact(self, contact_id: int) -> None:
+        """
+        Delete a contact from the store and from its indexes, by marking their row as a tombstone in O(1) rather than
+        popping it from each column, which would shift the rows after it
+
+        :param contact_id: the id of the contact to delete.
+        """
+
+        contact_to_remove = self.get_contact(contact_id)
+        for contact_index in self.indexes:
+            contact_index.remove_contact(contact_id, contact_to_remove)
+
+        self.tombstones.add(self.get_position(contact_id))
+        self.record_contact_change(contact_id)
+        self.start_tombstone_compaction_if_needed()
+
+    def append_contacts(self, contact_ids: List[int], contacts_to_append: List[Dict]) -> None:
+        """
+        Append a batch of contacts, whose ids are higher than the ones stored, to the columns of the store and add them
+        to its indexes at once
+
+        :param contact_ids: the ids of the contacts to append, in increasing order.
+        :param contacts_to_append: the "forename", "surname", "email_address", and "mobile_number" of each contact.
+        """
+
+        if not contact_ids:
+            return
+
+        self.contacts_dict['id'].extend(contact_ids)
+        for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+            if key in INTERNED_CONTACTS_DICT_KEYS:
+                self.contacts_dict[key].extend(sys.intern(contact[key]) for contact in contacts_to_append)
+            else:
+                self.contacts_dict[key].extend(contact[key] for contact in contacts_to_append)
+        self.tombstones.extend(len(contact_ids))
+
+        contacts_appended = [(contact_id, self.get_contact(contact_id)) for contact_id in contact_ids]
+        for contact_index in self.indexes:
+            contact_index.add_contacts(contacts_appended)
+
+    def set_contacts_fields(self, changed_fields_by_id: Dict[int, Dict]) -> None:
+        """
+        Set some of the details of a batch of contacts in the columns of the store, in place, and update them in its
+        indexes at once
+
+        :param changed_fields_by_id: a dictionary mapping the id of each contact to update to the fields to set.
+        """
+
+        if not changed_fields_by_id:
+            return
+
+        contacts_updated = []
+        for contact_id, changed_fields in changed_fields_by_id.items():
+            position = self.get_position(contact_id)
+            contact_before_update = self.get_contact(contact_id)
+            for key, value in changed_fields.items():
+                self.contacts_dict[key][position] = sys.intern(value) if key in INTERNED_CONTACTS_DICT_KEYS else value
+            self.record_contact_change(contact_id)
+            contacts_updated.append((contact_id, contact_before_update, self.get_contact(contact_id)))
+
+        for contact_index in self.indexes:
+            contact_index.update_contacts(contacts_updated)
+
+    def delete_contacts(self, contact_ids: Set[int]) -> None:
+        """
+        Delete a batch of contacts from the store, marking their rows as tombstones, and remove them from its indexes at
+        once
+
+        :param contact_ids: the ids of the contacts to delete.
+        """
+
+        if not contact_ids:
+            return
+
+        contacts_to_remove = [(contact_id, self.get_contact(contact_id)) for contact_id in contact_ids]
+        for contact_index in self.indexes:
+            contact_index.remove_contacts(contacts_to_remove)
+
+        for contact_id in contact_ids:
+            self.tombstones.add(self.get_position(contact_id))
+            self.record_contact_change(contact_id)
+        self.start_tombstone_compaction_if_needed()
+
+    def record_contact_change(self, contact_id: int) -> None:
+
+        # The contacts updated or removed while the columns are compacted are updated or removed again in the compacted
+        # columns once they replace them (see 'apply_tombstone_compaction')
+        if self.contact_ids_changed_during_compaction is not None:
+            self.contact_ids_changed_during_compaction.add(contact_id)
+
+    def start_tombstone_compaction_if_needed(self) -> None:
+
+        if (
+                self.tombstone_compaction_thread is None
+                and self.tombstones.count >= self.tombstone_compaction_min_tombstones
+                and self.tombstones.count >= self.tombstone_compaction_threshold_ratio * len(self.tombstones)
+        ):
+            self.start_tombstone_compaction()
+
+    def start_tombstone_compaction(self) -> None:
+        """
+        Start compacting the columns of the store on a background thread, which copies the live rows of each column,
+        i.e., without the tombstones, as they are when the compaction starts. The compacted columns replace the columns
+        of the store once they are ready, on the thread of the next operation (see 'apply_tombstone_compaction').
+        """
+
+        tombstones = self.tombstones.copy()
+        self.tombstone_compaction_result = tombstone_compaction_result = []
+        self.contact_ids_changed_during_compaction = set()
+        self.tombstone_compaction_thread = threading.Thread(
+            target=self.compact_columns,
+            args=(self.contacts_dict, tombstones, tombstone_compaction_result),
+            daemon=True
+        )
+        self.tombstone_compaction_thread.start()
+
+    @staticmethod
+    def compact_columns(contacts_dict: Dict, tombstones: TombstoneBitmap, tombstone_compaction_result: List) -> None:
+        """
+        Copy the live rows of the columns of a store given its tombstones, the rows appended since being left out
+
+        :param contacts_dict: the columns of the store.
+        :param tombstones: a copy of the tombstones of the store when the compaction started.
+        :param tombstone_compaction_result: the list the compacted columns are appended to once they are all copied.
+        """
+
+        compacted_contacts_dict = {}
+        for key in CONTACTS_DICT_KEYS:
+            live_values = compress(contacts_dict[key], tombstones.get_live_rows())
+            if key == 'id':
+                compacted_contacts_dict[key] = array(ARRAY_TYPE_CODE_CONTACT_IDS, live_values)
+            else:
+                compacted_contacts_dict[key] = list(live_values)
+        tombstone_compaction_result.append((compacted_contacts_dict, len(tombstones)))
+
+    def apply_tombstone_compaction(self) -> None:
+        """
+        Replace the columns of the store with the compacted ones, if the compaction in the background is over, after
+        appending the rows appended since it started and applying the updates and removals performed since to them
+        """
+
+        if self.tombstone_compaction_thread is None or not self.tombstone_compaction_result:
+            return
+
+        compacted_contacts_dict, number_of_rows_compacted = self.tombstone_compaction_result[ZERO_VALUE]
+        compacted_tombstones = TombstoneBitmap(len(compacted_contacts_dict['id']))
+        for key in CONTACTS_DICT_KEYS:
+            compacted_contacts_dict[key].extend(self.contacts_dict[key][number_of_rows_compacted:])
+        for position in range(number_of_rows_compacted, len(self.tombstones)):
+            compacted_tombstones.extend(ONE_VALUE)
+            if position in self.tombstones:
+                compacted_tombstones.add(len(compacted_tombstones) - ONE_VALUE)
+
+        # The contacts changed since the compaction started were all live when it started, as the tombstones only
+        # become live again by cancelling the compaction (see 'insert_contact')
+        for contact_id in self.contact_ids_changed_during_compaction:
+            position = bisect_left(self.contacts_dict['id'], contact_id)
+            compacted_position = bisect_left(compacted_contacts_dict['id'], contact_id)
+            for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+                compacted_contacts_dict[key][compacted_position] = self.contacts_dict[key][position]
+            if position in self.tombstones:
+                compacted_tombstones.add(compacted_position)
+
+        self.contacts_dict = compacted_contacts_dict
+        self.tombstones = compacted_tombstones
+        self.cancel_tombstone_compaction()
+
+    def cancel_tombstone_compaction(self) -> None:
+
+        # A compaction still in progress completes in the background, but its compacted columns are discarded
+        self.tombstone_compaction_thread = None
+        self.tombstone_compaction_result = None
+        self.contact_ids_changed_during_compaction = None
+
+    def wait_for_tombstone_compaction(self) -> None:
+        """
+        Wait for the compaction of the columns in the background, if any, and replace the columns with the compacted
+        ones
+        """
+
+        if self.tombstone_compaction_thread is not None:
+            self.tombstone_compaction_thread.join()
+            self.apply_tombstone_compaction()
+
+    def persist(self, journal_records: List[Dict]) -> None:
+        """
+        Persist the CRUD operations described by the given journal records to the storage backend, or collect them if
+        their persistence is deferred.
+
+        :param journal_records: the journal records describing the operations performed on the store.
+        """
+
+        if self.deferred_journal_records is not None:
+            self.deferred_journal_records.extend(journal_records)
+            return
+
+        self.write_journal_records(journal_records)
+
+    def write_journal_records(self, journal_records: List[Dict]) -> None:
+        """
+        Write the journal records of the operations performed on the store to the storage backend, which assigns them
+        their versions, while holding the lock of the storage backend (see 'synchronized').
+
+        :param journal_records: the journal records describing the operations performed on the store.
+        """
+
+        self.storage_backend.persist(journal_records, self.get_live_columns(), self.next_id)
+        self.record_contact_versions(journal_records)
+
+    def record_contact_versions(self, journal_records: List[Dict]) -> None:
+
+        for journal_record in journal_records:
+            if journal_record['operation'] == JOURNAL_OPERATION_DELETE:
+                self.contact_versions.pop(journal_record['id'], None)
+            elif 'version' in journal_record:
+                self.contact_versions[journal_record['id']] = journal_record['version']
+
+    @contextmanager
+    def deferred_persistence(self) -> Iterator[List[Dict]]:
+        """
+        Defer the persistence of the operations performed within the context, collecting their journal records instead,
+        such that a batch of operations can then be persisted with a single write to the storage backend by passing
+        them to 'write_journal_records' before leaving the context (e.g., once the operations are applied, and outside
+        of the thread serving reads). The lock of the storage backend is held throughout the context.
+
+        :return: the list the journal records of the operations performed within the context are collected in
+        """
+
+        if self.deferred_journal_records is not None:
+            raise RuntimeError("The persistence of the operations is already deferred.")
+
+        with self.synchronized():
+            self.deferred_journal_records = deferred_journal_records = []
+            try:
+                yield deferred_journal_records
+            finally:
+                self.deferred_journal_records = None
+
+    @contextmanager
+    def synchronized(self) -> Iterator[None]:
+        """
+        Hold the lock of the storage backend, which serialises the writes of the processes working on the same saved
+        contacts, once the operations persisted by the other processes since the last ones merged are merged into the
+        store, such that the operations performed within the context are based on all the operations persisted before.
+        """
+
+        with self.storage_backend.lock():
+            # Within a batch of operations whose persistence is deferred, the lock is already held since the operations
+            # of the other processes were last merged
+            if self.deferred_journal_records is None:
+                self.merge_new_journal_records()
+                self.apply_tombstone_compaction()
+            yield
+
+    def synchronize(self, blocking: bool = True) -> bool:
+        """
+        Merge the operations persisted by the other processes into the store, if any, e.g., before serving a read. It
+        only costs a check of the size of the journal when there are none.
+
+        :param blocking: whether to wait for the lock of the storage backend if another process holds it (e.g., while
+                        persisting a batch of operations), rather than leave the store as it is until the next time.
+        :return: False if the operations persisted by the other processes could not be merged without waiting, True
+                otherwise
+        """
+
+        if self.deferred_journal_records is not None:
+            return True
+
+        self.apply_tombstone_compaction()
+        if not self.storage_backend.has_new_journal_records():
+            return True
+        if not self.storage_backend.acquire_lock(blocking):
+            return False
+        try:
+            with self.synchronized():
+                pass
+        finally:
+            self.storage_backend.release_lock()
+        return True
+
+    def merge_new_journal_records(self) -> None:
+        """
+        Merge the operations persisted by the other processes since the last ones merged into the store and its indexes,
+        by applying their journal records, or load the saved contacts again if some of them can no longer be read.
+        """
+
+        if not self.storage_backend.has_new_journal_records():
+            return
+
+        journal_records = self.storage_backend.read_new_journal_records()
+        if journal_records is None:
+            self.reload()
+            return
+
+        self.apply_journal_records(journal_records)
+        self.record_contact_versions(journal_records)
+
+    def apply_journal_records(self, journal_records: List[Dict]) -> None:
+        """
+        Apply the operations described by journal records to the store and its indexes, e.g., the operations persisted
+        by the other processes, the operations on contacts no longer stored being skipped
+
+        :param journal_records: the journal records, in the order in which the operations are to be applied.
+        """
+
+        for journal_record in journal_records:
+            contact_id = journal_record['id']
+            if journal_record['operation'] == JOURNAL_OPERATION_CREATE:
+                self.next_id = max(self.next_id, contact_id + ONE_VALUE)
+                if contact_id in self:
+                    self.set_contact_fields(contact_id, journal_record['fields'])
+                else:
+                    self.insert_contact(contact_id, journal_record['fields'])
+            elif contact_id not in self:
+                continue
+            elif journal_record['operation'] == JOURNAL_OPERATION_UPDATE:
+                self.set_contact_fields(contact_id, journal_record['fields'])
+            elif journal_record['operation'] == JOURNAL_OPERATION_DELETE:
+                self.delete_contact(contact_id)
+
+    def reload(self) -> None:
+        """
+        Load the saved contacts again, rebuilding the indexes of the store, e.g., when the operations persisted by the
+        other processes were compacted into a snapshot before this process could merge them.
+        """
+
+        contacts_dict, self.next_id = self.storage_backend.load()
+        self.contacts_dict = compact_contacts_dict(contacts_dict)
+        self.tombstones = TombstoneBitmap(len(self.contacts_dict['id']))
+        self.cancel_tombstone_compaction()
+        self.loaded_version = self.storage_backend.version
+        self.contact_versions = {}
+
+        # The operations of the history were performed on the contacts held before, which the ones loaded replace
+        self.undo_history = UndoHistory(self.undo_history.depth)
+
+        # The sorted index is kept, as the GUI lists the contacts from it, and is told to list them all again
+        self.sorted_index.build(self.contacts_dict)
+        self.sorted_index.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_RESET, ZERO_VALUE))
+
+        contact_index_classes = [type(contact_index) for contact_index in self.indexes[ONE_VALUE:]]
+        self.indexes = [self.sorted_index]
+        for contact_index_class in contact_index_classes:
+            self.register_index(contact_index_class())
+
+    def save(self) -> None:
+        """
+        Save all the contacts and the id sequence held by the store to the storage backend.
+        """
+
+        with self.synchronized():
+            self.storage_backend.save(self.get_live_columns(), self.next_id)
+
+
+# Stores already loaded, keyed by the (root directory, file name) of their contacts' file, such that every
+# 'ContactsService' of the application shares the same store. The lock ensures that a store being loaded by a worker
+# thread (see 'contacts_loader.py') is not loaded a second time by another thread, which waits for it instead.
+_contact_stores = {}
+_contact_stores_lock = threading.Lock()
+
+
+def get_contact_store(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+        loading_progress_callback: Callable[[float], None] = None
+) -> ContactStore:
+    """
+    Get the store of the contacts saved in the given file, loading it the first time only
+
+    :param contacts_file_root_dir: the root directory where the file with the saved contacts is stored.
+    :param contacts_file_name: the .txt file with the saved contacts.
+    :param loading_progress_callback: a function called with the fraction of the saved contacts read (from 0 to 1)
+                                    while they are loaded the first time, if any (see 'StorageBackend.load').
+    :return: the 'ContactStore' of the contacts saved in the given file
+    """
+
+    store_key = (contacts_file_root_dir, contacts_file_name)
+    with _contact_stores_lock:
+        record_cache_access('contact_stores', is_hit=store_key in _contact_stores)
+        if store_key not in _contact_stores:
+            _contact_stores[store_key] = ContactStore(
+                contacts_file_root_dir, contacts_file_name, loading_progress_callback=loading_progress_callback
+            )
+        return _contact_stores[store_key]
+
+
+def is_contact_store_loaded(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT
+) -> bool:
+    return (contacts_file_root_dir, contacts_file_name) in _contact_stores
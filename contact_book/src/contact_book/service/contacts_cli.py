@@ -0,0 +1,384 @@
+# This Python file contains the command-line interface of the contact book, which performs the CRUD operations, the
+# searches, the import and export of contacts, and the statistics of the contacts' store without the GUI, i.e., without
+# tkinter being imported nor a display being needed, such that the contacts can be maintained from scripts:
+#   - add <forename> <surname> [--email-address] [--mobile-number]: create a contact;
+#   - get <id>: read a contact, along with their version;
+#   - update <id> [--forename] [--surname] [--email-address] [--mobile-number] [--if-version]: update the details given
+#     of a contact, failing if they were modified since the version given, if any (e.g., by another process);
+#   - remove <id> [--if-version]: remove a contact, failing if they were modified since the version given, if any;
+#   - search [<query>] [--fuzzy] [--email-domain] [--mobile-number-suffix]: the searches of the contacts' service;
+#   - import <file> and export <file>: the bulk import and export of contacts (see 'contacts_importer.py' and
+#     'contacts_exporter.py');
+#   - undo and redo: undo the last operation of a batch, or redo the last one undone (see 'ContactStore.undo');
+#   - stats: the number of contacts, the next id, and the version of the contacts' store, among others;
+#   - batch: perform the operations above read from the standard input, one per line (with the same arguments as on the
+#     command line, e.g., 'add Sheldon Cooper'), in a single process, such that a shell pipeline of many operations
+#     only pays for starting the interpreter and loading the contacts once, rather than once per operation.
+#
+# The result of each operation is written to the standard output as a line of JSON (e.g., the details of the contact
+# read), or {"error": "..."} if the operation failed, such that the results of a batch follow the order of its lines.
+#
+# Usage (from the root directory of the repository):
+#     python -m contact_book.src.contact_book.service.contacts_cli add Sheldon Cooper --mobile-number 00000000073
+#     printf 'get 16\nremove 16\n' | python -m contact_book.src.contact_book.service.contacts_cli batch
+
+import argparse
+import json
+import shlex
+import sys
+from typing import Dict, Iterable, List, Optional, TextIO
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, CONTACTS_EXPORT_ORDER_ID,
+    CONTACTS_EXPORT_ORDER_SURNAME, CONTACTS_FILE_FORMAT_CSV,
+    CONTACTS_FILE_FORMAT_JSON_LINES, CONTACTS_FILE_FORMAT_VCARD,
+    CONTACTS_IMPORT_CHUNK_SIZE, FILE_NAME_CONTACTS_DICT,
+    FUZZY_SEARCH_MAX_EDIT_DISTANCE, ONE_VALUE, ROOT_DIR_CONTACTS_DICT_FILE,
+    SEARCH_RESULTS_LIMIT, ZERO_VALUE)
+
+from .contact_store import ConcurrentModificationError, get_contact_store
+from .contacts_exporter import export_contacts
+from .contacts_importer import import_contacts
+from .contacts_service import ContactsService
+
+# Character starting a line of the standard input of a batch which is not an operation
+BATCH_COMMENT_PREFIX = '#'
+
+
+class CommandLineError(Exception):
+    """
+    An error in the arguments of an operation, raised rather than exiting the process, such that an operation of a batch
+    fails on its own.
+    """
+
+
+class ContactsArgumentParser(argparse.ArgumentParser):
+    """
+    An argument parser raising a 'CommandLineError' on invalid arguments, instead of printing its usage and exiting. It
+    has no -h/--help option, nor do the parsers of its subcommands (which are of the same class), such that no usage is
+    printed among the results of a batch.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **dict(kwargs, add_help=False))
+
+    def error(self, message: str):
+        raise CommandLineError(message)
+
+    def exit(self, status: int = ZERO_VALUE, message: Optional[str] = None):
+        raise CommandLineError(message or f"exited with the status {status}.")
+
+
+def get_contact_with_version(contacts_service: ContactsService, contact_id: int) -> Dict:
+    """
+    Get the details of a contact along with their version, which an update or a removal may be made conditional on
+
+    :param contacts_service: the contacts' service of the store of the contact.
+    :param contact_id: the id of the contact.
+    :return: a dictionary with the "id", "forename", "surname", "email_address", "mobile_number", and "version" of the
+            contact
+    """
+
+    contact_store = contacts_service.contact_store
+    return dict(contact_store.get_contact(contact_id), version=contact_store.get_contact_version(contact_id))
+
+
+def add_contact(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    if not arguments.forename or not arguments.surname:
+        raise CommandLineError("forename and surname must not be empty.")
+
+    contact_id = contacts_service.contact_store.create_contact(
+        arguments.forename, arguments.surname, arguments.email_address, arguments.mobile_number
+    )
+    return get_contact_with_version(contacts_service, contact_id)
+
+
+def get_contact(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    return get_contact_with_version(contacts_service, arguments.id)
+
+
+def update_contact(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+    """
+    Update the details of a contact given as arguments, keeping the others as they are
+    """
+
+    contact = contacts_service.contact_store.get_contact(arguments.id)
+    contact_fields = [
+        contact[key] if getattr(arguments, key) is None else getattr(arguments, key)
+        for key in CONTACTS_DICT_KEYS[ONE_VALUE:]
+    ]
+    if not contact_fields[ZERO_VALUE] or not contact_fields[ONE_VALUE]:
+        raise CommandLineError("forename and surname must not be empty.")
+
+    contacts_service.contact_store.update_contact(arguments.id, *contact_fields, expected_version=arguments.if_version)
+    return get_contact_with_version(contacts_service, arguments.id)
+
+
+def remove_contact(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    contacts_service.contact_store.remove_contact(arguments.id, expected_version=arguments.if_version)
+    return {'id': arguments.id}
+
+
+def search_contacts(contacts_service: ContactsService, arguments: argparse.Namespace) -> List[Dict]:
+    """
+    Search for contacts by the query given (by prefix, or typo-tolerant), or by email domain or mobile number suffix
+
+    :return: a list of dictionaries with the "id" and "name" of each contact found by the query, or with the details of
+            each contact found by email domain or mobile number suffix
+    """
+
+    if arguments.email_domain is not None:
+        return contacts_service.find_contacts_by_email_domain(arguments.email_domain)
+    if arguments.mobile_number_suffix is not None:
+        return contacts_service.find_contacts_by_mobile_number_suffix(arguments.mobile_number_suffix)
+    if arguments.query is None:
+        raise CommandLineError("a query, an email domain, or a mobile number suffix is required.")
+
+    if arguments.fuzzy:
+        contacts_found = contacts_service.fuzzy_search_contacts(
+            arguments.query, arguments.max_distance, arguments.limit
+        )
+    else:
+        contacts_found = contacts_service.search_contacts(arguments.query, arguments.limit)
+    return [{'id': contact_id, 'name': contact_name} for contact_id, contact_name in contacts_found]
+
+
+def import_contacts_file(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    contact_store = contacts_service.contact_store
+    report = import_contacts(arguments.file_path, contact_store, arguments.file_format, arguments.chunk_size)
+
+    # Save a snapshot of all the contacts, such that the journal of the chunks imported is not replayed on each load
+    contact_store.save()
+
+    return {
+        'imported': report.number_of_contacts_imported,
+        'rejected': report.number_of_contacts_rejected,
+        'rejected_records': [
+            {'record_number': record_number, 'reason': reason} for record_number, reason in report.rejected_records
+        ]
+    }
+
+
+def export_contacts_file(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    number_of_contacts_exported = export_contacts(
+        arguments.file_path,
+        contacts_service.contact_store,
+        arguments.file_format,
+        arguments.order,
+        arguments.query,
+        arguments.email_domain,
+        arguments.mobile_number_suffix
+    )
+    return {'exported': number_of_contacts_exported}
+
+
+def undo_contact_change(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    return {'ids': contacts_service.contact_store.undo()}
+
+
+def redo_contact_change(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    return {'ids': contacts_service.contact_store.redo()}
+
+
+def get_contact_store_stats(contacts_service: ContactsService, arguments: argparse.Namespace) -> Dict:
+
+    contact_store = contacts_service.contact_store
+    return {
+        'number_of_contacts': len(contact_store),
+        'next_id': contact_store.next_id,
+        'version': contact_store.storage_backend.version,
+        'number_of_tombstones': contact_store.tombstones.count,
+        'storage_backend': type(contact_store.storage_backend).__name__
+    }
+
+
+def add_operation_parsers(subparsers: argparse._SubParsersAction) -> None:
+    """
+    Add the parser of the arguments of each operation, which sets the function performing the operation as 'operation'
+
+    :param subparsers: the subparsers of the command line, or of a line of a batch.
+    """
+
+    add_parser = subparsers.add_parser('add', help="create a contact")
+    add_parser.add_argument('forename')
+    add_parser.add_argument('surname')
+    add_parser.add_argument('--email-address', default='')
+    add_parser.add_argument('--mobile-number', default='')
+    add_parser.set_defaults(operation=add_contact)
+
+    get_parser = subparsers.add_parser('get', help="read a contact")
+    get_parser.add_argument('id', type=int)
+    get_parser.set_defaults(operation=get_contact)
+
+    update_parser = subparsers.add_parser('update', help="update the details given of a contact")
+    update_parser.add_argument('id', type=int)
+    for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+        update_parser.add_argument('--' + key.replace('_', '-'))
+    update_parser.add_argument('--if-version', type=int, help="fail if the contact is no longer at this version")
+    update_parser.set_defaults(operation=update_contact)
+
+    remove_parser = subparsers.add_parser('remove', help="remove a contact")
+    remove_parser.add_argument('id', type=int)
+    remove_parser.add_argument('--if-version', type=int, help="fail if the contact is no longer at this version")
+    remove_parser.set_defaults(operation=remove_contact)
+
+    search_parser = subparsers.add_parser('search', help="search for contacts")
+    search_parser.add_argument('query', nargs='?')
+    search_parser.add_argument('--fuzzy', action='store_true', help="tolerate typos in the query")
+    search_parser.add_argument('--max-distance', type=int, default=FUZZY_SEARCH_MAX_EDIT_DISTANCE)
+    search_parser.add_argument('--limit', type=int, default=SEARCH_RESULTS_LIMIT)
+    search_parser.add_argument('--email-domain')
+    search_parser.add_argument('--mobile-number-suffix')
+    search_parser.set_defaults(operation=search_contacts)
+
+    import_parser = subparsers.add_parser('import', help="import contacts from a CSV, vCard, or JSON Lines file")
+    import_parser.add_argument('file_path')
+    import_parser.add_argument(
+        '--file-format',
+        choices=[CONTACTS_FILE_FORMAT_CSV, CONTACTS_FILE_FORMAT_VCARD, CONTACTS_FILE_FORMAT_JSON_LINES]
+    )
+    import_parser.add_argument('--chunk-size', type=int, default=CONTACTS_IMPORT_CHUNK_SIZE)
+    import_parser.set_defaults(operation=import_contacts_file)
+
+    export_parser = subparsers.add_parser('export', help="export contacts to a CSV, vCard, or JSON Lines file")
+    export_parser.add_argument('file_path')
+    export_parser.add_argument(
+        '--file-format',
+        choices=[CONTACTS_FILE_FORMAT_CSV, CONTACTS_FILE_FORMAT_VCARD, CONTACTS_FILE_FORMAT_JSON_LINES]
+    )
+    export_parser.add_argument(
+        '--order',
+        choices=[CONTACTS_EXPORT_ORDER_SURNAME, CONTACTS_EXPORT_ORDER_ID],
+        default=CONTACTS_EXPORT_ORDER_SURNAME
+    )
+    export_parser.add_argument('--query')
+    export_parser.add_argument('--email-domain')
+    export_parser.add_argument('--mobile-number-suffix')
+    export_parser.set_defaults(operation=export_contacts_file)
+
+    undo_parser = subparsers.add_parser('undo', help="undo the last operation performed in this process")
+    undo_parser.set_defaults(operation=undo_contact_change)
+
+    redo_parser = subparsers.add_parser('redo', help="redo the last operation undone in this process")
+    redo_parser.set_defaults(operation=redo_contact_change)
+
+    stats_parser = subparsers.add_parser('stats', help="show statistics of the contacts")
+    stats_parser.set_defaults(operation=get_contact_store_stats)
+
+
+def create_argument_parser() -> argparse.ArgumentParser:
+    """
+    Create the parser of the command line, whose 'batch' command reads the operations from the standard input
+    """
+
+    argument_parser = argparse.ArgumentParser(description="Maintain the contacts from the command line.")
+    argument_parser.add_argument('--contacts-file-root-dir', default=ROOT_DIR_CONTACTS_DICT_FILE)
+    argument_parser.add_argument('--contacts-file-name', default=FILE_NAME_CONTACTS_DICT)
+
+    subparsers = argument_parser.add_subparsers(dest='command', required=True)
+    add_operation_parsers(subparsers)
+    subparsers.add_parser('batch', help="perform the operations read from the standard input, one per line")
+
+    return argument_parser
+
+
+def create_batch_line_parser() -> ContactsArgumentParser:
+    """
+    Create the parser of a line of a batch, which raises a 'CommandLineError' on invalid arguments
+    """
+
+    batch_line_parser = ContactsArgumentParser(prog='batch')
+    add_operation_parsers(batch_line_parser.add_subparsers(dest='command', required=True))
+    return batch_line_parser
+
+
+def perform_operation(contacts_service: ContactsService, arguments: argparse.Namespace) -> object:
+    """
+    Perform an operation once the operations persisted by the other processes, if any, are merged into the store
+
+    :param contacts_service: the contacts' service of the store to perform the operation on.
+    :param arguments: the arguments of the operation, parsed by the parser added by 'add_operation_parsers'.
+    :return: the result of the operation, to write as JSON, e.g., the details of the contact read
+    """
+
+    contacts_service.contact_store.synchronize()
+
+    try:
+        return arguments.operation(contacts_service, arguments)
+    except KeyError as error:
+        if not isinstance(error.args[ZERO_VALUE], int):
+            raise
+        raise CommandLineError(f"No contact has the id {error.args[ZERO_VALUE]}.")
+    except (ConcurrentModificationError, OSError, ValueError) as error:
+        raise CommandLineError(str(error))
+
+
+def run_batch(contacts_service: ContactsService, operation_lines: Iterable[str], output_file: TextIO) -> int:
+    """
+    Perform the operations of a batch one line at a time, writing the result of each of them as it is performed, such
+    that a pipeline may read the results while writing further operations
+
+    :param contacts_service: the contacts' service of the store to perform the operations on.
+    :param operation_lines: the lines of the batch, e.g., the standard input. The blank lines, and the lines starting
+                            with '#', are skipped.
+    :param output_file: the file to write the result of each operation to, as a line of JSON.
+    :return: the number of operations that failed
+    """
+
+    batch_line_parser = create_batch_line_parser()
+    number_of_failed_operations = ZERO_VALUE
+
+    for operation_line in operation_lines:
+        if not operation_line.strip() or operation_line.lstrip().startswith(BATCH_COMMENT_PREFIX):
+            continue
+
+        try:
+            operation_result = perform_operation(
+                contacts_service, batch_line_parser.parse_args(shlex.split(operation_line))
+            )
+        except (CommandLineError, ValueError) as error:
+            operation_result = {'error': str(error)}
+            number_of_failed_operations += ONE_VALUE
+
+        output_file.write(json.dumps(operation_result) + '\n')
+        output_file.flush()
+
+    return number_of_failed_operations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Perform the operation given on the command line, or the operations of a batch read from the standard input
+
+    :param argv: the arguments of the command line, without the name of the program; by default, 'sys.argv'.
+    :return: the exit status of the process, i.e., 0 if every operation succeeded, or 1 otherwise
+    """
+
+    arguments = create_argument_parser().parse_args(argv)
+    contacts_service = ContactsService(
+        application=None,
+        contact_store=get_contact_store(arguments.contacts_file_root_dir, arguments.contacts_file_name)
+    )
+
+    if arguments.command == 'batch':
+        return ONE_VALUE if run_batch(contacts_service, sys.stdin, sys.stdout) else ZERO_VALUE
+
+    try:
+        operation_result = perform_operation(contacts_service, arguments)
+    except CommandLineError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return ONE_VALUE
+
+    print(json.dumps(operation_result))
+    return ZERO_VALUE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+# This Python file contains the incremental reader of the contacts_dict.txt file, which parses its column-oriented
+# dictionary of contacts ({"id": [...], "forename": [...], ...}) one block of the file at a time and yields the values
+# of each column in chunks as they are parsed, such that the whole text of the file is never held in memory along with
+# the contacts decoded from it, and the chunks can be consumed (e.g., appended to the columns of the store, or counted
+# to report the progress of the loading) before the end of the file is read.
+
+import codecs
+import json
+import re
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_READ_BLOCK_SIZE, ONE_VALUE, ZERO_VALUE)
+
+# JSON only allows these four whitespace characters between values
+NON_WHITESPACE_PATTERN = re.compile(r'[^ \t\n\r]')
+
+
+class ContactsDictReader:
+    """
+    An incremental parser of a dictionary of contacts saved as a JSON object mapping each key to an array of values,
+    read from a file opened in binary mode one block at a time. The values of a column are parsed in bulk, a block at a
+    time, with a single call to the C parser of the 'json' module, and one at a time only around the end of a column or
+    wherever a string contains a comma.
+    """
+
+    def __init__(self, contacts_dict_file: BinaryIO, block_size: int = CONTACTS_DICT_READ_BLOCK_SIZE):
+        self.contacts_dict_file = contacts_dict_file
+        self.block_size = block_size
+
+        self.utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.json_decoder = json.JSONDecoder()
+
+        # The text read but not parsed yet starts at 'position' in 'buffer'
+        self.buffer = ''
+        self.position = ZERO_VALUE
+        self.number_of_bytes_read = ZERO_VALUE
+
+    def read_block(self) -> bool:
+        """
+        Append the next block of the file to the text left to parse, dropping the text already parsed
+
+        :return: False if the end of the file had already been reached, True otherwise
+        """
+
+        block = self.contacts_dict_file.read(self.block_size)
+        self.number_of_bytes_read += len(block)
+
+        # A character whose bytes are split across two blocks is decoded once the second block is read
+        text = self.utf8_decoder.decode(block, final=not block)
+        self.buffer = self.buffer[self.position:] + text
+        self.position = ZERO_VALUE
+        return bool(block)
+
+    def get_error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.position)
+
+    def skip_whitespace(self) -> str:
+        """
+        Skip the whitespace ahead, reading further blocks if needed
+
+        :return: the next character to parse, which is not consumed, or an empty string at the end of the file
+        """
+
+        while True:
+            match = NON_WHITESPACE_PATTERN.search(self.buffer, self.position)
+            if match is not None:
+                self.position = match.start()
+                return self.buffer[self.position]
+
+            self.position = len(self.buffer)
+            if not self.read_block():
+                return ''
+
+    def consume(self, expected_character: str) -> None:
+        if self.skip_whitespace() != expected_character:
+            raise self.get_error(f"Expecting '{expected_character}'")
+        self.position += ONE_VALUE
+
+    def decode_value(self):
+        """
+        Decode the JSON value ahead, reading further blocks until the value is complete
+
+        :return: the value decoded
+        """
+
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end_position = self.json_decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if self.read_block():
+                    continue
+                raise
+
+            # A number ending with the text read so far might continue in the next block
+            if end_position == len(self.buffer) and self.read_block():
+                continue
+
+            self.position = end_position
+            return value
+
+    def decode_values_in_bulk(self) -> Optional[List]:
+        """
+        Decode at once the values of the current column ahead, up to the last comma of the text read so far (or to the
+        last comma before the first ']', which might end the column)
+
+        :return: the list of values decoded, or None if the text up to that comma is not a sequence of complete values,
+                i.e., if the comma is within a string, or if the column ends before it
+        """
+
+        end_position = self.buffer.find(']', self.position)
+        if end_position == -1:
+            end_position = len(self.buffer)
+        last_comma_position = self.buffer.rfind(',', self.position, end_position)
+        if last_comma_position == -1:
+            return None
+
+        try:
+            values = json.loads('[' + self.buffer[self.position:last_comma_position] + ']')
+        except json.JSONDecodeError:
+            return None
+        if not values:
+            return None
+
+        self.position = last_comma_position + ONE_VALUE
+        return values
+
+    def decode_values_one_at_a_time(self) -> Tuple[List, bool]:
+        """
+        Decode the values of the current column ahead one at a time, until the end of the column or of the text read so
+        far
+
+        :return: a tuple of the list of values decoded and whether the end of the column was reached
+        """
+
+        values = []
+        while True:
+            values.append(self.decode_value())
+
+            separator = self.skip_whitespace()
+            self.position += ONE_VALUE
+            if separator == ']':
+                return values, True
+            if separator != ',':
+                raise self.get_error("Expecting ',' delimiter")
+            if self.buffer.find(',', self.position) == -1:
+                return values, False
+
+    def iter_column_chunks(self, key: str) -> Iterator[Tuple[str, List]]:
+        """
+        Iterate over the chunks of values of a column, once its opening '[' has been consumed
+
+        :param key: the key of the column.
+        :return: an iterator of tuples (key, list of values)
+        """
+
+        if self.skip_whitespace() == ']':
+            self.position += ONE_VALUE
+            yield key, []
+            return
+
+        while True:
+            # The last value read so far might be cut by the end of the block, so that the next block is read first
+            # unless the column ends within the text read so far
+            if (self.buffer.find(',', self.position) == -1 and self.buffer.find(']', self.position) == -1 and
+                    self.read_block()):
+                continue
+
+            values = self.decode_values_in_bulk()
+            if values is not None:
+                yield key, values
+                continue
+
+            values, is_end_of_column = self.decode_values_one_at_a_time()
+            yield key, values
+            if is_end_of_column:
+                return
+
+    def iter_chunks(self) -> Iterator[Tuple[str, List]]:
+        """
+        Iterate over the chunks of values of each column of the dictionary of contacts, in the order of the file
+
+        :return: an iterator of tuples (key, list of values), where the values of a column are split across as many
+                chunks as blocks of the file they span (and each column yields at least one chunk, possibly empty)
+        """
+
+        self.read_block()
+        self.consume('{')
+
+        if self.skip_whitespace() == '}':
+            self.position += ONE_VALUE
+        else:
+            while True:
+                key = self.decode_value()
+                if not isinstance(key, str):
+                    raise self.get_error("Expecting property name enclosed in double quotes")
+                self.consume(':')
+                self.consume('[')
+                yield from self.iter_column_chunks(key)
+
+                separator = self.skip_whitespace()
+                self.position += ONE_VALUE
+                if separator == '}':
+                    break
+                if separator != ',':
+                    raise self.get_error("Expecting ',' delimiter")
+
+        if self.skip_whitespace():
+            raise self.get_error("Extra data")
@@ -0,0 +1,271 @@
+# This Python file contains the exporter of contacts to CSV, vCard, and JSON Lines files (e.g., to hand them to other
+# systems), which iterates over the contacts of the store lazily, in alphabetical order of their surnames or in order
+# of their ids, optionally filtered via the service's search logic, and writes them one at a time, such that the
+# memory used by the exporter does not depend on the number of contacts exported.
+
+import argparse
+import csv
+import json
+import sys
+from typing import Dict, Iterator, Optional, Set, TextIO
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, CONTACTS_EXPORT_ORDER_ID,
+    CONTACTS_EXPORT_ORDER_SURNAME, CONTACTS_FILE_FORMAT_CSV,
+    CONTACTS_FILE_FORMAT_JSON_LINES, CONTACTS_FILE_FORMAT_VCARD, ZERO_VALUE)
+
+from .contact_store import ContactStore, get_contact_store
+from .contacts_importer import get_contacts_file_format
+from .contacts_service import ContactsService
+
+VCARD_CHARACTERS_TO_ESCAPE = {'\\': '\\\\', ',': '\\,', ';': '\\;', '\n': '\\n'}
+
+
+def get_filtered_contact_ids(
+        contact_store: ContactStore,
+        query: str = None,
+        email_domain: str = None,
+        mobile_number_suffix: str = None
+) -> Optional[Set[int]]:
+    """
+    Get the ids of the contacts matching all the filters given, via the same search logic as the GUI
+
+    :param contact_store: the store of the contacts to filter.
+    :param query: the text the contacts' surname, forename, or full name starts with (or, if none does, which is within
+                a small edit distance of their forename, surname, or email address), as typed in the 'Search' box.
+    :param email_domain: the domain of the contacts' email address, e.g., 'example.com'.
+    :param mobile_number_suffix: the last digits of the contacts' mobile number, e.g., '4821'.
+    :return: the set of ids of the contacts matching the filters, or None if no filter was given
+    """
+
+    contacts_service = ContactsService(application=None, contact_store=contact_store)
+    filtered_contact_ids = None
+
+    def intersect(contact_ids) -> Set[int]:
+        contact_ids = set(contact_ids)
+        return contact_ids if filtered_contact_ids is None else filtered_contact_ids & contact_ids
+
+    if query is not None:
+        # Unlike the 'Search' box, all the contacts found are exported
+        contacts_found = (
+            contacts_service.search_contacts(query, limit=len(contact_store)) or
+            contacts_service.fuzzy_search_contacts(query, limit=len(contact_store))
+        )
+        filtered_contact_ids = intersect(contact_id for contact_id, _ in contacts_found)
+    if email_domain is not None:
+        filtered_contact_ids = intersect(
+            contact['id'] for contact in contacts_service.find_contacts_by_email_domain(email_domain)
+        )
+    if mobile_number_suffix is not None:
+        filtered_contact_ids = intersect(
+            contact['id'] for contact in contacts_service.find_contacts_by_mobile_number_suffix(mobile_number_suffix)
+        )
+    return filtered_contact_ids
+
+
+def iter_contacts(
+        contact_store: ContactStore,
+        order: str = CONTACTS_EXPORT_ORDER_SURNAME,
+        contact_ids: Optional[Set[int]] = None
+) -> Iterator[Dict]:
+    """
+    Iterate over the contacts of a store one at a time, without copying them
+
+    :param contact_store: the store of the contacts to iterate over.
+    :param order: 'surname' for the alphabetical order of the contacts' surnames (and forenames), as listed on the GUI,
+                or 'id' for the order of their ids.
+    :param contact_ids: the ids of the only contacts to iterate over, e.g., the ones found by
+                        'get_filtered_contact_ids'; by default, all of them.
+    :return: an iterator of dictionaries with the details of the contacts, keyed by "id", "forename", "surname",
+            "email_address", and "mobile_number"
+    """
+
+    if order == CONTACTS_EXPORT_ORDER_SURNAME:
+        ordered_contact_ids = (
+            contact_store.sorted_index.get_contact_entry(position)[ZERO_VALUE]
+            for position in range(len(contact_store.sorted_index))
+        )
+    elif order == CONTACTS_EXPORT_ORDER_ID:
+        # The contacts are stored in order of their ids, as new contacts are given increasing ids and appended
+        ordered_contact_ids = iter(contact_store)
+    else:
+        raise ValueError(f"The contacts cannot be exported in order of {order}.")
+
+    for contact_id in ordered_contact_ids:
+        if contact_ids is None or contact_id in contact_ids:
+            yield contact_store.get_contact(contact_id)
+
+
+def escape_vcard_value(value: str) -> str:
+    return ''.join(VCARD_CHARACTERS_TO_ESCAPE.get(character, character) for character in value)
+
+
+def write_csv_contacts(contacts: Iterator[Dict], contacts_file: TextIO) -> int:
+    """
+    Write contacts to a CSV file with a header row, one row at a time
+
+    :param contacts: an iterator of dictionaries with the details of the contacts.
+    :param contacts_file: the CSV file, opened with newline=''.
+    :return: the number of contacts written
+    """
+
+    csv_writer = csv.writer(contacts_file)
+    csv_writer.writerow(CONTACTS_DICT_KEYS)
+
+    number_of_contacts_written = ZERO_VALUE
+    for contact in contacts:
+        csv_writer.writerow([contact[key] for key in CONTACTS_DICT_KEYS])
+        number_of_contacts_written += 1
+    return number_of_contacts_written
+
+
+def write_vcard_contacts(contacts: Iterator[Dict], contacts_file: TextIO) -> int:
+    """
+    Write contacts to a vCard (version 3.0) file, one card at a time
+
+    :param contacts: an iterator of dictionaries with the details of the contacts.
+    :param contacts_file: the vCard file, opened with newline=''.
+    :return: the number of contacts written
+    """
+
+    number_of_contacts_written = ZERO_VALUE
+    for contact in contacts:
+        forename = escape_vcard_value(contact['forename'])
+        surname = escape_vcard_value(contact['surname'])
+
+        card_lines = ['BEGIN:VCARD', 'VERSION:3.0', f'N:{surname};{forename};;;', f'FN:{forename} {surname}']
+        if contact['email_address']:
+            card_lines.append('EMAIL;TYPE=INTERNET:' + escape_vcard_value(contact['email_address']))
+        if contact['mobile_number']:
+            card_lines.append('TEL;TYPE=CELL:' + escape_vcard_value(contact['mobile_number']))
+        card_lines.append('END:VCARD')
+
+        # vCard lines end with a carriage return and a line feed
+        contacts_file.write('\r\n'.join(card_lines) + '\r\n')
+        number_of_contacts_written += 1
+    return number_of_contacts_written
+
+
+def write_json_lines_contacts(contacts: Iterator[Dict], contacts_file: TextIO) -> int:
+    """
+    Write contacts to a JSON Lines file, i.e., one JSON object per contact and per line
+
+    :param contacts: an iterator of dictionaries with the details of the contacts.
+    :param contacts_file: the JSON Lines file.
+    :return: the number of contacts written
+    """
+
+    number_of_contacts_written = ZERO_VALUE
+    for contact in contacts:
+        contacts_file.write(json.dumps(contact) + '\n')
+        number_of_contacts_written += 1
+    return number_of_contacts_written
+
+
+CONTACTS_WRITER_BY_FILE_FORMAT = {
+    CONTACTS_FILE_FORMAT_CSV: write_csv_contacts,
+    CONTACTS_FILE_FORMAT_VCARD: write_vcard_contacts,
+    CONTACTS_FILE_FORMAT_JSON_LINES: write_json_lines_contacts
+}
+
+
+def export_contacts_file(
+        contacts_file: TextIO,
+        file_format: str,
+        contact_store: ContactStore,
+        order: str = CONTACTS_EXPORT_ORDER_SURNAME,
+        query: str = None,
+        email_domain: str = None,
+        mobile_number_suffix: str = None
+) -> int:
+    """
+    Export the contacts of a store, optionally filtered, to an open CSV, vCard, or JSON Lines file
+
+    :param contacts_file: the file to export the contacts to, opened with newline=''.
+    :param file_format: 'csv', 'vcard', or 'jsonl'.
+    :param contact_store: the store of the contacts to export.
+    :param order: 'surname' or 'id', the order in which the contacts are exported.
+    :param query: only export the contacts found by searching for this text, as typed in the 'Search' box.
+    :param email_domain: only export the contacts having an email address at this domain.
+    :param mobile_number_suffix: only export the contacts whose mobile number ends with these digits.
+    :return: the number of contacts exported
+    """
+
+    if file_format not in CONTACTS_WRITER_BY_FILE_FORMAT:
+        raise ValueError(f"The format {file_format} is not supported.")
+
+    contact_ids = get_filtered_contact_ids(contact_store, query, email_domain, mobile_number_suffix)
+    return CONTACTS_WRITER_BY_FILE_FORMAT[file_format](iter_contacts(contact_store, order, contact_ids), contacts_file)
+
+
+def export_contacts(
+        file_path: str,
+        contact_store: ContactStore = None,
+        file_format: str = None,
+        order: str = CONTACTS_EXPORT_ORDER_SURNAME,
+        query: str = None,
+        email_domain: str = None,
+        mobile_number_suffix: str = None
+) -> int:
+    """
+    Export the contacts of a store, optionally filtered, to a CSV, vCard, or JSON Lines file
+
+    :param file_path: the path of the file to export the contacts to, e.g., 'contacts.csv'.
+    :param contact_store: the store of the contacts to export; by default, the store of the saved contacts.
+    :param file_format: 'csv', 'vcard', or 'jsonl'; by default, it is inferred from the extension of the file.
+    :param order: 'surname' or 'id', the order in which the contacts are exported.
+    :param query: only export the contacts found by searching for this text, as typed in the 'Search' box.
+    :param email_domain: only export the contacts having an email address at this domain.
+    :param mobile_number_suffix: only export the contacts whose mobile number ends with these digits.
+    :return: the number of contacts exported
+    """
+
+    if contact_store is None:
+        contact_store = get_contact_store()
+    if file_format is None:
+        file_format = get_contacts_file_format(file_path)
+
+    with open(file_path, 'w', newline='', encoding='utf-8') as contacts_file:
+        return export_contacts_file(
+            contacts_file, file_format, contact_store, order, query, email_domain, mobile_number_suffix
+        )
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Export contacts to a CSV, vCard, or JSON Lines file.")
+    argument_parser.add_argument('file_path', help="the file to export the contacts to, or '-' for the standard output")
+    argument_parser.add_argument(
+        '--file-format',
+        choices=[CONTACTS_FILE_FORMAT_CSV, CONTACTS_FILE_FORMAT_VCARD, CONTACTS_FILE_FORMAT_JSON_LINES]
+    )
+    argument_parser.add_argument(
+        '--order',
+        choices=[CONTACTS_EXPORT_ORDER_SURNAME, CONTACTS_EXPORT_ORDER_ID],
+        default=CONTACTS_EXPORT_ORDER_SURNAME
+    )
+    argument_parser.add_argument('--query')
+    argument_parser.add_argument('--email-domain')
+    argument_parser.add_argument('--mobile-number-suffix')
+    arguments = argument_parser.parse_args()
+
+    if arguments.file_path == '-':
+        export_contacts_file(
+            sys.stdout,
+            arguments.file_format or CONTACTS_FILE_FORMAT_JSON_LINES,
+            get_contact_store(),
+            arguments.order,
+            arguments.query,
+            arguments.email_domain,
+            arguments.mobile_number_suffix
+        )
+    else:
+        number_of_contacts_exported = export_contacts(
+            arguments.file_path,
+            file_format=arguments.file_format,
+            order=arguments.order,
+            query=arguments.query,
+            email_domain=arguments.email_domain,
+            mobile_number_suffix=arguments.mobile_number_suffix
+        )
+        print(f"{number_of_contacts_exported} contacts were exported to {arguments.file_path}.")
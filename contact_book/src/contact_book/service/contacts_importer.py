@@ -0,0 +1,411 @@
+# This Python file contains the bulk importer of contacts from CSV and vCard files (e.g., exported from a CRM), and from
+# the JSON Lines files written by the exporter, which streams the file in chunks of contacts, validates and normalises
+# the email addresses and mobile numbers of each chunk, and commits each chunk to the contacts' store with a block of
+# ids and a single write to the storage backend, such that importing a file costs one write per chunk rather than one
+# per contact, and the memory used by the importer does not depend on the size of the file.
+
+import argparse
+import csv
+import json
+import re
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, CONTACTS_FILE_FORMAT_CSV,
+    CONTACTS_FILE_FORMAT_JSON_LINES, CONTACTS_FILE_FORMAT_VCARD,
+    CONTACTS_IMPORT_CHUNK_SIZE, CONTACTS_IMPORT_MAX_REPORTED_ERRORS,
+    EMAIL_ADDRESS_PATTERN, MOBILE_NUMBER_MAX_DIGITS, MOBILE_NUMBER_MIN_DIGITS,
+    ONE_VALUE, TWO_VALUE, ZERO_VALUE)
+
+from .contact_store import ContactStore, get_contact_store
+from .secondary_indexes import normalise_mobile_number
+
+# Names of the columns of a CSV file (case-folded, with spaces and hyphens replaced by underscores) accepted for each
+# field of a contact, besides the field's own name, e.g., 'First Name' for 'forename'
+CSV_COLUMN_ALIASES = {
+    'first_name': 'forename',
+    'given_name': 'forename',
+    'last_name': 'surname',
+    'family_name': 'surname',
+    'email': 'email_address',
+    'e_mail': 'email_address',
+    'mobile': 'mobile_number',
+    'mobile_phone': 'mobile_number',
+    'phone': 'mobile_number',
+    'phone_number': 'mobile_number'
+}
+
+# Extensions of the files of each format, used when the format is not given explicitly
+CONTACTS_FILE_FORMAT_BY_EXTENSION = {
+    '.csv': CONTACTS_FILE_FORMAT_CSV,
+    '.vcf': CONTACTS_FILE_FORMAT_VCARD,
+    '.vcard': CONTACTS_FILE_FORMAT_VCARD,
+    '.jsonl': CONTACTS_FILE_FORMAT_JSON_LINES
+}
+
+EMAIL_ADDRESS_REGEX = re.compile(EMAIL_ADDRESS_PATTERN)
+LETTER_REGEX = re.compile(r'[^\W\d_]')
+
+VCARD_ESCAPED_CHARACTERS = {'n': '\n', 'N': '\n', ',': ',', ';': ';', '\\': '\\'}
+
+
+class ContactsImportReport:
+    """
+    The report of a bulk import of contacts, counting the contacts imported and rejected, and keeping the reasons of
+    the first rejections (e.g., (12, 'invalid email address')) to be shown to the user.
+    """
+
+    def __init__(self):
+        self.number_of_contacts_imported = ZERO_VALUE
+        self.number_of_contacts_rejected = ZERO_VALUE
+        self.rejected_records = []
+
+    def reject(self, record_number: int, reason: str) -> None:
+
+        self.number_of_contacts_rejected += ONE_VALUE
+        if len(self.rejected_records) < CONTACTS_IMPORT_MAX_REPORTED_ERRORS:
+            self.rejected_records.append((record_number, reason))
+
+
+def get_contacts_file_format(file_path: str) -> str:
+    """
+    Get the format of a file of contacts from its extension
+
+    :param file_path: the path of the file, e.g., 'crm_export.vcf'.
+    :return: 'csv', 'vcard', or 'jsonl'
+    """
+
+    for extension, file_format in CONTACTS_FILE_FORMAT_BY_EXTENSION.items():
+        if file_path.lower().endswith(extension):
+            return file_format
+    raise ValueError(f"The format of the file {file_path} cannot be inferred from its extension.")
+
+
+def normalise_email_address(email_address: str) -> Optional[str]:
+    """
+    Normalise an email address, whose domain is case-insensitive
+
+    :param email_address: the email address, e.g., ' Sheldor@MyPhdMail.com '.
+    :return: the normalised email address, e.g., 'Sheldor@myphdmail.com', an empty string if none was given, or None if
+            it is invalid
+    """
+
+    email_address = email_address.strip()
+    if not email_address:
+        return ''
+    if not EMAIL_ADDRESS_REGEX.fullmatch(email_address):
+        return None
+
+    local_part, _, email_domain = email_address.rpartition('@')
+    return local_part + '@' + email_domain.lower()
+
+
+def normalise_mobile_number_to_store(mobile_number: str) -> Optional[str]:
+    """
+    Normalise a mobile number to the digits it is stored as, with the international prefix '+' written as '00'
+
+    :param mobile_number: the mobile number, e.g., '+44 (0)7700 900-482'.
+    :return: the normalised mobile number, e.g., '004407700900482', an empty string if none was given, or None if it is
+            invalid (i.e., it has letters or too few or too many digits)
+    """
+
+    mobile_number = mobile_number.strip()
+    if not mobile_number:
+        return ''
+    if LETTER_REGEX.search(mobile_number):
+        return None
+
+    mobile_number_digits = normalise_mobile_number(mobile_number)
+    if not MOBILE_NUMBER_MIN_DIGITS <= len(mobile_number_digits) <= MOBILE_NUMBER_MAX_DIGITS:
+        return None
+    return ('00' if mobile_number.startswith('+') else '') + mobile_number_digits
+
+
+def iter_csv_contacts(contacts_file: TextIO) -> Iterator[Tuple[int, Dict]]:
+    """
+    Iterate over the contacts of a CSV file with a header row, one row at a time
+
+    :param contacts_file: the CSV file, opened with newline=''.
+    :return: an iterator of tuples (line number, contact), where each contact is a dictionary with the "forename",
+            "surname", "email_address", and "mobile_number" read (empty if their column is missing)
+    """
+
+    csv_reader = csv.reader(contacts_file)
+    header_row = next(csv_reader, [])
+
+    column_positions = {}
+    for position, column_name in enumerate(header_row):
+        column_name = re.sub(r'[\s-]+', '_', column_name.strip().casefold())
+        key = CSV_COLUMN_ALIASES.get(column_name, column_name)
+        if key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+            column_positions.setdefault(key, position)
+
+    for row in csv_reader:
+        if not any(row):
+            continue
+        yield csv_reader.line_num, {
+            key: row[column_positions[key]] if key in column_positions and column_positions[key] < len(row) else ''
+            for key in CONTACTS_DICT_KEYS[ONE_VALUE:]
+        }
+
+
+def iter_json_lines_contacts(contacts_file: TextIO) -> Iterator[Tuple[int, Optional[Dict]]]:
+    """
+    Iterate over the contacts of a JSON Lines file (e.g., exported by 'contacts_exporter.py'), one line at a time, the
+    ids of the contacts, if any, being ignored, as the contacts imported are given new ids
+
+    :param contacts_file: the JSON Lines file.
+    :return: an iterator of tuples (line number, contact), where each contact is a dictionary with the "forename",
+            "surname", "email_address", and "mobile_number" read (empty if their key is missing), or None if the line
+            is not a JSON object
+    """
+
+    for line_number, line in enumerate(contacts_file, ONE_VALUE):
+        if not line.strip():
+            continue
+        try:
+            json_object = json.loads(line)
+        except ValueError:
+            json_object = None
+        if not isinstance(json_object, dict):
+            yield line_number, None
+            continue
+        yield line_number, {
+            key: '' if json_object.get(key) is None else str(json_object[key]) for key in CONTACTS_DICT_KEYS[ONE_VALUE:]
+        }
+
+
+def unescape_vcard_value(value: str) -> List[str]:
+    """
+    Split a vCard value into its components separated by unescaped semicolons, and unescape them
+
+    :param value: the value, e.g., 'Cooper;Sheldon;Lee;Dr.;'.
+    :return: the list of components, e.g., ['Cooper', 'Sheldon', 'Lee', 'Dr.', '']
+    """
+
+    components = ['']
+    characters = iter(value)
+    for character in characters:
+        if character == '\\':
+            escaped_character = next(characters, '')
+            components[-ONE_VALUE] += VCARD_ESCAPED_CHARACTERS.get(escaped_character, escaped_character)
+        elif character == ';':
+            components.append('')
+        else:
+            components[-ONE_VALUE] += character
+    return components
+
+
+def iter_vcard_lines(contacts_file: TextIO) -> Iterator[str]:
+    """
+    Iterate over the logical lines of a vCard file, unfolding the lines continued on the next one(s)
+
+    :param contacts_file: the vCard file.
+    :return: an iterator of the unfolded lines
+    """
+
+    unfolded_line = None
+    for line in contacts_file:
+        line = line.rstrip('\r\n')
+        if line[:ONE_VALUE] in (' ', '\t') and unfolded_line is not None:
+            unfolded_line += line[ONE_VALUE:]
+            continue
+        if unfolded_line is not None:
+            yield unfolded_line
+        unfolded_line = line
+    if unfolded_line is not None:
+        yield unfolded_line
+
+
+def get_vcard_contact(card_properties: Dict) -> Dict:
+    """
+    Get a contact from the properties of a vCard
+
+    :param card_properties: the first value of each property of the vCard, e.g., {'N': 'Cooper;Sheldon;;;', etc.}.
+    :return: a dictionary with the "forename", "surname", "email_address", and "mobile_number" of the contact
+    """
+
+    if 'N' in card_properties:
+        surname, forename = (unescape_vcard_value(card_properties['N']) + ['', ''])[:TWO_VALUE]
+    else:
+        forename, _, surname = unescape_vcard_value(card_properties.get('FN', ''))[ZERO_VALUE].strip().rpartition(' ')
+
+    return {
+        'forename': forename.strip(),
+        'surname': surname.strip(),
+        'email_address': unescape_vcard_value(card_properties.get('EMAIL', ''))[ZERO_VALUE],
+        'mobile_number': card_properties.get('CELL', card_properties.get('TEL', ''))
+    }
+
+
+def iter_vcard_contacts(contacts_file: TextIO) -> Iterator[Tuple[int, Dict]]:
+    """
+    Iterate over the contacts of a vCard file, one card at a time. The forename and surname are read from the 'N'
+    property (or from 'FN' if it is missing), the email address from the first 'EMAIL' property, and the mobile number
+    from the first 'TEL' property of type 'CELL' (or from the first 'TEL' property otherwise).
+
+    :param contacts_file: the vCard file.
+    :return: an iterator of tuples (card number, contact), where each contact is a dictionary with the "forename",
+            "surname", "email_address", and "mobile_number" read (empty if their property is missing)
+    """
+
+    card_number = ZERO_VALUE
+    card_properties = None
+    for line in iter_vcard_lines(contacts_file):
+        name_and_parameters, _, value = line.partition(':')
+        name, *parameters = name_and_parameters.upper().split(';')
+        name = name.rpartition('.')[-ONE_VALUE]
+
+        if name == 'BEGIN':
+            card_number += ONE_VALUE
+            card_properties = {}
+        elif card_properties is None:
+            continue
+        elif name == 'END':
+            yield card_number, get_vcard_contact(card_properties)
+            card_properties = None
+        elif name == 'TEL' and any('CELL' in parameter for parameter in parameters):
+            card_properties.setdefault('CELL', value)
+        else:
+            card_properties.setdefault(name, value)
+
+
+def validate_contacts(
+        records: List[Tuple[int, Dict]],
+        contacts_import_report: ContactsImportReport
+) -> List[Dict]:
+    """
+    Validate and normalise a chunk of contacts read from a file, rejecting the ones without a forename or surname, or
+    with an invalid email address or mobile number
+
+    :param records: a list of tuples (record number, contact) read from the file.
+    :param contacts_import_report: the report of the import, to which the contacts rejected are added.
+    :return: the list of valid contacts, normalised
+    """
+
+    valid_contacts = []
+    for record_number, contact in records:
+        if contact is None:
+            contacts_import_report.reject(record_number, "invalid JSON object")
+            continue
+
+        forename = contact['forename'].strip()
+        surname = contact['surname'].strip()
+        email_address = normalise_email_address(contact['email_address'])
+        mobile_number = normalise_mobile_number_to_store(contact['mobile_number'])
+
+        if not forename or not surname:
+            contacts_import_report.reject(record_number, "missing forename or surname")
+        elif email_address is None:
+            contacts_import_report.reject(record_number, "invalid email address")
+        elif mobile_number is None:
+            contacts_import_report.reject(record_number, "invalid mobile number")
+        else:
+            valid_contacts.append({
+                'forename': forename,
+                'surname': surname,
+                'email_address': email_address,
+                'mobile_number': mobile_number
+            })
+    return valid_contacts
+
+
+def iter_chunks(records: Iterable, chunk_size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most 'chunk_size' elements, without reading it all
+
+    :param records: the iterable to split.
+    :param chunk_size: the maximum number of elements of each chunk.
+    :return: an iterator of the chunks
+    """
+
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def import_contacts_file(
+        contacts_file: TextIO,
+        file_format: str,
+        contact_store: ContactStore,
+        chunk_size: int = CONTACTS_IMPORT_CHUNK_SIZE
+) -> ContactsImportReport:
+    """
+    Import the contacts of an open CSV, vCard, or JSON Lines file into a contacts' store, one chunk at a time
+
+    :param contacts_file: the file of contacts, opened with newline=''.
+    :param file_format: 'csv', 'vcard', or 'jsonl'.
+    :param contact_store: the store to import the contacts into.
+    :param chunk_size: the number of contacts read, validated, and committed at once.
+    :return: the report of the import
+    """
+
+    if file_format == CONTACTS_FILE_FORMAT_CSV:
+        records = iter_csv_contacts(contacts_file)
+    elif file_format == CONTACTS_FILE_FORMAT_VCARD:
+        records = iter_vcard_contacts(contacts_file)
+    elif file_format == CONTACTS_FILE_FORMAT_JSON_LINES:
+        records = iter_json_lines_contacts(contacts_file)
+    else:
+        raise ValueError(f"The format {file_format} is not supported.")
+
+    contacts_import_report = ContactsImportReport()
+    for chunk in iter_chunks(records, chunk_size):
+        valid_contacts = validate_contacts(chunk, contacts_import_report)
+        if valid_contacts:
+            contact_store.create_contacts(valid_contacts)
+            contacts_import_report.number_of_contacts_imported += len(valid_contacts)
+    return contacts_import_report
+
+
+def import_contacts(
+        file_path: str,
+        contact_store: ContactStore = None,
+        file_format: str = None,
+        chunk_size: int = CONTACTS_IMPORT_CHUNK_SIZE
+) -> ContactsImportReport:
+    """
+    Import the contacts of a CSV, vCard, or JSON Lines file into a contacts' store, one chunk at a time
+
+    :param file_path: the path of the file of contacts, e.g., 'crm_export.csv'.
+    :param contact_store: the store to import the contacts into; by default, the store of the saved contacts.
+    :param file_format: 'csv', 'vcard', or 'jsonl'; by default, it is inferred from the extension of the file.
+    :param chunk_size: the number of contacts read, validated, and committed at once.
+    :return: the report of the import
+    """
+
+    if contact_store is None:
+        contact_store = get_contact_store()
+    if file_format is None:
+        file_format = get_contacts_file_format(file_path)
+
+    # 'utf-8-sig' skips the byte order mark written by some spreadsheet applications at the start of CSV files
+    with open(file_path, newline='', encoding='utf-8-sig') as contacts_file:
+        return import_contacts_file(contacts_file, file_format, contact_store, chunk_size)
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Import contacts from a CSV, vCard, or JSON Lines file.")
+    argument_parser.add_argument('file_path')
+    argument_parser.add_argument(
+        '--file-format',
+        choices=[CONTACTS_FILE_FORMAT_CSV, CONTACTS_FILE_FORMAT_VCARD, CONTACTS_FILE_FORMAT_JSON_LINES]
+    )
+    argument_parser.add_argument('--chunk-size', type=int, default=CONTACTS_IMPORT_CHUNK_SIZE)
+    arguments = argument_parser.parse_args()
+
+    saved_contact_store = get_contact_store()
+    report = import_contacts(arguments.file_path, saved_contact_store, arguments.file_format, arguments.chunk_size)
+
+    # Save a snapshot of all the contacts, such that the journal of the chunks imported is not replayed on each load
+    saved_contact_store.save()
+
+    print(f"{report.number_of_contacts_imported} contacts were imported, "
+          f"{report.number_of_contacts_rejected} were rejected.")
+    for rejected_record_number, rejection_reason in report.rejected_records:
+        print(f"Record {rejected_record_number}: {rejection_reason}.")
@@ -0,0 +1,161 @@
+# This Python file contains the loader of the contacts at startup, which loads the contacts' store on a worker thread,
+# such that the GUI appears (and remains responsive) however big the contact book is, and hands the contacts back to
+# the GUI through a queue of events polled by the thread running tkinter's main loop (tkinter must only be used from
+# that thread).
+
+import os
+import threading
+from queue import Empty, Queue
+from typing import List, Optional, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, CONTACTS_LOADING_EVENT_FAILED,
+    CONTACTS_LOADING_EVENT_LOADED, CONTACTS_LOADING_EVENT_PREVIEW,
+    CONTACTS_LOADING_EVENT_PROGRESS, FILE_NAME_CONTACTS_DICT, OVERSCAN_ROWS_CONTACTS_BOX,
+    ROOT_DIR_CONTACTS_DICT_FILE, STORAGE_BACKEND_BINARY,
+    STORAGE_BACKEND_SQLITE, VISIBLE_ROWS_CONTACTS_BOX)
+
+from .binary_contacts_file import BinaryContactsFile
+from .contact_store import get_contact_store, is_contact_store_loaded
+from .storage_backends import (BinaryFileStorageBackend, SQLiteStorageBackend,
+                               get_storage_backend_type)
+
+
+class ContactsLoader:
+    """
+    A loader of the contacts' store on a worker thread, which posts the following events, as tuples (event, value),
+    to a queue:
+        - ('preview', contacts): the first screen of contacts, as a list of tuples (id, 'Forename Surname') in
+          alphabetical order of their surnames, if the storage backend can list them without loading every contact
+          (i.e., the 'sqlite' one via its surname index, or the 'binary' one via its sorted ids block if no operation
+          was journaled since its last snapshot);
+        - ('progress', fraction): the fraction of the saved contacts read (from 0 to 1), posted after each chunk of
+          contacts read if the storage backend reports it (i.e., the 'json' one, whose file is parsed incrementally);
+        - ('loaded', contact_store): the 'ContactStore' loaded, which is also shared via 'get_contact_store';
+        - ('failed', error): the exception raised while loading the contacts.
+    """
+
+    def __init__(
+            self,
+            contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+            contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+            number_of_contacts_previewed: int = VISIBLE_ROWS_CONTACTS_BOX + OVERSCAN_ROWS_CONTACTS_BOX
+    ):
+        self.contacts_file_root_dir = contacts_file_root_dir
+        self.contacts_file_name = contacts_file_name
+        self.number_of_contacts_previewed = number_of_contacts_previewed
+
+        self.events_queue = Queue()
+        self.loading_thread = threading.Thread(target=self.load_contacts, daemon=True)
+
+        # The storage backend or file the preview is read from, which is kept open to read the details of the contacts
+        # previewed (see 'get_contact_values') until the loader is closed
+        self.preview_source = None
+
+    def start(self) -> None:
+        self.loading_thread.start()
+
+    def is_loading(self) -> bool:
+        return self.loading_thread.is_alive()
+
+    def load_contacts(self) -> None:
+        """
+        Load the contacts' store, posting the first screen of contacts beforehand if possible.
+        """
+
+        try:
+            contacts_preview = self.get_contacts_preview()
+            if contacts_preview:
+                self.events_queue.put((CONTACTS_LOADING_EVENT_PREVIEW, contacts_preview))
+
+            contact_store = get_contact_store(
+                self.contacts_file_root_dir, self.contacts_file_name, loading_progress_callback=self.post_progress
+            )
+            self.events_queue.put((CONTACTS_LOADING_EVENT_LOADED, contact_store))
+        except Exception as error:
+            self.events_queue.put((CONTACTS_LOADING_EVENT_FAILED, error))
+
+    def post_progress(self, fraction_read: float) -> None:
+        self.events_queue.put((CONTACTS_LOADING_EVENT_PROGRESS, fraction_read))
+
+    def get_contacts_preview(self) -> List[Tuple]:
+        """
+        Get the first screen of contacts via an indexed query or the sorted ids block of the binary contacts file, if
+        the storage backend supports it and the store is not loaded already
+
+        :return: a list of tuples of two elements for each contact (id, 'Forename Surname'), in alphabetical order of
+                their surnames, or an empty list
+        """
+
+        if is_contact_store_loaded(self.contacts_file_root_dir, self.contacts_file_name):
+            return []
+
+        self.preview_source = self.open_preview_source()
+        if self.preview_source is None:
+            return []
+
+        contact_rows = self.preview_source.iter_contacts_sorted_by_surname(self.number_of_contacts_previewed)
+        return [
+            (contact_id, forename + " " + surname)
+            for contact_id, forename, surname, _, _ in contact_rows
+        ]
+
+    def open_preview_source(self):
+        """
+        Open the storage backend or file the first screen of contacts can be read from without loading every contact
+
+        :return: an 'SQLiteStorageBackend' or a 'BinaryContactsFile', both providing the methods
+                'iter_contacts_sorted_by_surname', 'get_contact', and 'close', or None if the storage backend selected
+                by configuration cannot list the contacts without loading them
+        """
+
+        storage_backend_type = get_storage_backend_type()
+        if storage_backend_type == STORAGE_BACKEND_SQLITE:
+            return SQLiteStorageBackend(self.contacts_file_root_dir)
+
+        if storage_backend_type == STORAGE_BACKEND_BINARY:
+            # The snapshot alone is only previewed if it is up to date, i.e., if its journal is empty
+            binary_storage_backend = BinaryFileStorageBackend(self.contacts_file_root_dir)
+            if (os.path.exists(binary_storage_backend.binary_file_path) and
+                    not binary_storage_backend.has_journal_records()):
+                return BinaryContactsFile(binary_storage_backend.binary_file_path)
+
+        return None
+
+    def get_contact_values(self, contact_id: int) -> Optional[Tuple]:
+        """
+        Get the details of a contact previewed while the contacts' store is being loaded, reading their row or record
+        only
+
+        :param contact_id: the id of the contact previewed.
+        :return: a tuple (id, forename, surname, email address, mobile number), or None if nothing was previewed
+        """
+
+        if self.preview_source is None:
+            return None
+
+        contact = self.preview_source.get_contact(contact_id)
+        return None if contact is None else tuple(contact[key] for key in CONTACTS_DICT_KEYS)
+
+    def close(self) -> None:
+        """
+        Close the storage backend or file the preview was read from, once the contacts' store has been loaded.
+        """
+
+        if self.preview_source is not None:
+            self.preview_source.close()
+            self.preview_source = None
+
+    def get_events(self) -> List[Tuple]:
+        """
+        Get the events posted by the worker thread since they were last got, without waiting for any
+
+        :return: a list of tuples (event, value)
+        """
+
+        events = []
+        while True:
+            try:
+                events.append(self.events_queue.get_nowait())
+            except Empty:
+                return events
@@ -10,94 +10,336 @@
 # and 'utils.py' files to facilitate maintainability and reusability of constants/fixed parameters and utility-type
 # of functions.
 
-from collections import deque
-from typing import Dict
-
-import pandas as pd
+from itertools import compress
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 from contact_book.root import get_contact_book_root
-from contact_book.src.contact_book.constants import (ONE_VALUE, TWO_VALUE,
-                                                     ZERO_VALUE)
-
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, CONTACTS_LOADING_EVENT_FAILED, CONTACTS_LOADING_EVENT_LOADED,
+    CONTACTS_LOADING_EVENT_PREVIEW, CONTACTS_LOADING_EVENT_PROGRESS,
+    CONTACTS_LOADING_POLL_INTERVAL_MS, FUZZY_SEARCH_MAX_EDIT_DISTANCE,
+    ONE_VALUE, PROGRESS_BAR_MAXIMUM, PROGRESS_BAR_MODE_DETERMINATE,
+    SEARCH_RESULTS_LIMIT, ZERO_VALUE)
+
+from .contact_store import (ConcurrentModificationError, ContactStore,
+                            get_contact_store)
+from .contacts_loader import ContactsLoader
+from .duplicate_contacts import apply_merge_proposals, find_merge_proposals
+from .fuzzy_search import TrigramIndex
+from .metrics import instrument_methods
+from .prefix_search import PrefixSearchIndex
+from .secondary_indexes import EmailDomainIndex, MobileNumberSuffixIndex
+from .sorted_index import ContactsListView, SortedContactIndex
 from .utils import (check_forename_or_surname_availability, clear_window_frame,
-                    clear_window_frame_contacts_fields,
-                    convert_contacts_dict_to_df, create_gui_buttons,
-                    get_contacts_dict, insert_contacts_into_box,
-                    save_contacts_dict)
+                    clear_window_frame_contacts_fields, create_gui_buttons,
+                    insert_contacts_into_box)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 root_dir = get_contact_book_root()
 
 
+@instrument_methods
 class ContactsService:
     """
     A contacts service class that implements the business logic and enables to perform CRUD operations for the user
-    to interact with the application and maintain their contacts' list.
+    to interact with the application and maintain their contacts' list. Its public methods are instrumented (see
+    'metrics.py'), which only records their calls when enabled.
     """
 
-    def __init__(self, application):
+    def __init__(self, application, contact_store: ContactStore = None):
         self.application = application
+        self._contact_store = contact_store
+
+        # The loader of the contacts in the background at startup, if any (see 'load_contacts_list_in_background')
+        self.contacts_loader = None
+
+        # The version of the contact chosen on the GUI when they were chosen, such that updating or removing them fails
+        # if they were modified by another process since (see 'ContactStore.get_contact_version')
+        self.chosen_contact_version = None
+
+    @property
+    def contact_store(self) -> ContactStore:
+        """
+        The in-memory store of contacts the service reads and mutates, which is loaded on first use and shared by
+        every 'ContactsService' of the application unless a specific store is given.
+        """
+
+        if self._contact_store is None:
+            self._contact_store = get_contact_store()
+        return self._contact_store
 
     def load_contacts_list(self) -> None:  # pragma: no cover
         """
         Extract the dictionary of contacts and add it to the 'contacts_list' and then to the 'contacts_box' of
-        the application.
+        the application. If the user typed a query in the 'Search' box, only the contacts found are added.
         """
 
-        # Clear list of contacts
-        self.application.contacts_list.clear()
+        # The contacts (and the query typed meanwhile) are listed once they have been loaded in the background
+        if self.application.contacts_loading:
+            return
+
+        query = self.application.search_field.get()
+        if query.strip():
+            # Fall back to the typo-tolerant search if no contact starts with the query
+            self.application.contacts_list = self.search_contacts(query) or self.fuzzy_search_contacts(query)
+        else:
+            # The contacts are already sorted in alphabetical order based on their surnames (and forenames) by the
+            # sorted index of the store, which is maintained incrementally as contacts are created, updated, or removed.
+            # 'contacts_list' is a live view of the sorted index, listing a tuple of two elements for each contact
+            # (id, 'Forename Surname') without copying them.
+            self.application.contacts_list = ContactsListView(self.contact_store.sorted_index)
 
-        contacts_dict = get_contacts_dict()
-        contacts_df_from_dict = convert_contacts_dict_to_df(contacts_dict)
+        # The positions in the 'contacts_box' now correspond to different contacts
+        self.application.contacts_box_running_index = ZERO_VALUE
+
+        insert_contacts_into_box(self.application)
 
-        # Sort contacts in alphabetical order based on their surnames
-        contacts_df_from_dict.sort_values(by=['surname'], inplace=True, ascending=True)
+    def load_contacts_list_in_background(self) -> None:  # pragma: no cover
+        """
+        Load the contacts on a worker thread and list them in the 'contacts_box' once loaded, showing a progress bar
+        meanwhile, such that the GUI does not wait for the contacts to be loaded to appear.
+        """
 
-        # 'row' is a tuple of three elements (id as int, forename as str, surname as str), e.g., (1, 'Kate', 'Beckett')
-        contacts_deque = deque()
-        for index, row in contacts_df_from_dict.iterrows():
-            # Add each id, forename, and surname of each contact to the 'contacts_deque'
-            contacts_deque.append((row[ZERO_VALUE], row[ONE_VALUE] + " " + row[TWO_VALUE]))
+        self.application.contacts_loading = True
+        self.application.loading_progress_bar.start()
 
-        self.application.contacts_list = list(contacts_deque)
+        self.contacts_loader = ContactsLoader()
+        self.contacts_loader.start()
+        self.application.after(CONTACTS_LOADING_POLL_INTERVAL_MS, self.poll_contacts_loader, self.contacts_loader)
 
-        insert_contacts_into_box(self.application)
+    def poll_contacts_loader(self, contacts_loader: ContactsLoader) -> None:  # pragma: no cover
+        """
+        Handle the events posted by the worker thread loading the contacts, polling it again until they are loaded.
+
+        :param contacts_loader: the loader of the contacts running in the background.
+        """
+
+        for event, value in contacts_loader.get_events():
+            if event == CONTACTS_LOADING_EVENT_PREVIEW:
+                # Show the first screen of contacts until all of them are loaded
+                self.application.contacts_list = value
+                insert_contacts_into_box(self.application)
+            elif event == CONTACTS_LOADING_EVENT_PROGRESS:
+                # Show how much of the contacts' file has been read so far
+                self.application.loading_progress_bar.stop()
+                self.application.loading_progress_bar.configure(
+                    mode=PROGRESS_BAR_MODE_DETERMINATE,
+                    maximum=PROGRESS_BAR_MAXIMUM,
+                    value=value * PROGRESS_BAR_MAXIMUM
+                )
+            else:
+                self.application.contacts_loading = False
+                self.application.loading_progress_bar.stop()
+                self.application.loading_progress_bar.grid_remove()
+                contacts_loader.close()
+
+                if event == CONTACTS_LOADING_EVENT_FAILED:
+                    raise value
+                if event == CONTACTS_LOADING_EVENT_LOADED:
+                    self._contact_store = value
+                    self.subscribe_to_contacts_list_changes()
+                    self.load_contacts_list()
+                return
+
+        self.application.after(CONTACTS_LOADING_POLL_INTERVAL_MS, self.poll_contacts_loader, contacts_loader)
+
+    def subscribe_to_contacts_list_changes(self) -> None:  # pragma: no cover
+        """
+        Apply the changes of the sorted index of the store to the 'contacts_box' row by row from now on, such that
+        refreshing the contacts displayed after a CRUD operation costs O(log n) rather than listing all of them again.
+        """
+
+        self.contact_store.sorted_index.add_change_listener(self.apply_contacts_list_change)
+
+    def apply_contacts_list_change(self, contacts_list_change: Dict) -> None:  # pragma: no cover
+        """
+        Apply a change of the sorted index of the store to the 'contacts_box', if it lists all the contacts.
+
+        :param contacts_list_change: the change, e.g., {'change': 'insert', 'position': 4}.
+        """
+
+        if isinstance(self.application.contacts_list, ContactsListView):
+            self.application.contacts_box.apply_contacts_list_change(contacts_list_change)
+
+            # The positions in the 'contacts_box' after the change now correspond to different contacts
+            self.application.contacts_box_running_index = ZERO_VALUE
+
+    def refresh_contacts_list(self) -> None:  # pragma: no cover
+        """
+        Refresh the contacts displayed after a CRUD operation. The search results are listed again, whereas the list of
+        all the contacts was already updated row by row by 'apply_contacts_list_change'.
+        """
+
+        if not isinstance(self.application.contacts_list, ContactsListView):
+            self.load_contacts_list()
+
+    def see_contact_on_gui(self, contact_id: int) -> None:  # pragma: no cover
+        """
+        Scroll the 'contacts_box' to a contact created or updated (which may have moved in the alphabetical order of the
+        surnames), if it lists all the contacts.
+
+        :param contact_id: the id of the contact.
+        """
+
+        if isinstance(self.application.contacts_list, ContactsListView) and contact_id in self.contact_store:
+            position = self.contact_store.sorted_index.get_position(
+                contact_id, self.contact_store.get_contact(contact_id)
+            )
+            self.application.contacts_box.see_position(position)
+
+    def search_contacts(self, query: str, limit: int = SEARCH_RESULTS_LIMIT) -> List[Tuple]:
+        """
+        Search for the contacts whose surname, forename, or full name starts with a query (case-insensitive)
+
+        :param query: the query typed by the user, e.g., 'Sheldon Co'.
+        :param limit: the maximum number of contacts to return.
+        :return: a list of tuples of two elements for each contact found (id, 'Forename Surname'), in alphabetical
+                order based on their surnames
+        """
+
+        prefix_search_index = self.contact_store.get_index(PrefixSearchIndex)
+
+        contacts_found = [
+            self.contact_store.get_contact(contact_id) for contact_id in prefix_search_index.search(query, limit)
+        ]
+        contacts_found.sort(key=lambda contact: SortedContactIndex.get_sort_key(contact['id'], contact))
+
+        return [(contact['id'], contact['forename'] + " " + contact['surname']) for contact in contacts_found]
+
+    def fuzzy_search_contacts(
+            self,
+            query: str,
+            max_distance: int = FUZZY_SEARCH_MAX_EDIT_DISTANCE,
+            limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[Tuple]:
+        """
+        Search for the contacts whose forename, surname, or email address is within an edit distance of a query, to
+        tolerate typos (case-insensitive)
+
+        :param query: the query typed by the user, e.g., 'Shledon'.
+        :param max_distance: the maximum edit distance between the query and a field of the contacts found.
+        :param limit: the maximum number of contacts to return.
+        :return: a list of tuples of two elements for each contact found (id, 'Forename Surname'), from the closest
+                to the query to the furthest
+        """
+
+        trigram_index = self.contact_store.get_index(TrigramIndex)
+
+        contacts_found = [
+            self.contact_store.get_contact(contact_id)
+            for contact_id in trigram_index.search(query, max_distance, limit)
+        ]
+
+        return [(contact['id'], contact['forename'] + " " + contact['surname']) for contact in contacts_found]
+
+    def find_contacts_by_email_domain(self, email_domain: str) -> List[Dict]:
+        """
+        Find the contacts having an email address at a domain, e.g., all the contacts at 'example.com'
+
+        :param email_domain: the domain (case-insensitive), e.g., 'example.com'.
+        :return: a list of dictionaries with the details of the contacts found, in order of their ids
+        """
+
+        email_domain_index = self.contact_store.get_index(EmailDomainIndex)
+        return [self.contact_store.get_contact(contact_id) for contact_id in email_domain_index.find(email_domain)]
+
+    def find_contacts_by_mobile_number_suffix(self, mobile_number_suffix: str) -> List[Dict]:
+        """
+        Find the contacts whose mobile number ends with given digits, e.g., all the numbers ending in '4821'
+
+        :param mobile_number_suffix: the last digits of the mobile number, e.g., '4821'.
+        :return: a list of dictionaries with the details of the contacts found, in order of their ids
+        """
+
+        mobile_number_suffix_index = self.contact_store.get_index(MobileNumberSuffixIndex)
+        return [
+            self.contact_store.get_contact(contact_id)
+            for contact_id in mobile_number_suffix_index.find(mobile_number_suffix)
+        ]
+
+    def find_duplicate_contacts(self) -> List[Dict]:
+        """
+        Find the contacts entered more than once and propose to merge them (see 'duplicate_contacts.py')
+
+        :return: the list of merge proposals, e.g., [{'kept_id': 16, 'duplicate_ids': [42], 'fields': {},
+                'similarity': 0.9}]
+        """
+
+        return find_merge_proposals(self.contact_store.get_live_columns())
+
+    def merge_duplicate_contacts(self, merge_proposals: List[Dict]) -> None:
+        """
+        Merge the duplicates of the given merge proposals, e.g., the ones accepted by the user, in one batch
+
+        :param merge_proposals: the merge proposals to apply (see 'find_duplicate_contacts').
+        """
+
+        apply_merge_proposals(self.contact_store, merge_proposals)
 
     def choose_contact(self) -> None:  # pragma: no cover
         """
         Choose the contact corresponding to the user's click on the GUI.
         """
 
-        # 'index' is an int denoting the contact's position in tkinter's Listbox
-        index = self.application.contacts_box.curselection()[ZERO_VALUE] + ONE_VALUE
+        # 'index' is an int denoting the contact's position in the 'contacts_list' (+ 1), which the virtualised
+        # 'contacts_box' maps from the row selected in tkinter's Listbox
+        selected_position = self.application.contacts_box.get_selected_position()
+        if selected_position is None:
+            return
+        index = selected_position + ONE_VALUE
 
         # Check if chosen 'index' were not the running one in the contact box
         if index != self.application.contacts_box_running_index:
             self.application.contacts_box_running_index = index
 
             # 'chosen_id' is an int (e.g., 4) indicating the id of the chosen contact.
-            # 'application.contacts_list' is a list of tuples of two elements for each contact, e.g.,
+            # 'application.contacts_list' is a sequence of tuples of two elements for each contact, e.g.,
             # [(1, 'Kate Beckett'), (2, 'Richard Castle'), etc.].
-            chosen_id = (self.application.contacts_list[index - ONE_VALUE][ZERO_VALUE],)
-            contacts_dict = get_contacts_dict()
+            chosen_id = self.application.contacts_box.get_selected_contact()[ZERO_VALUE]
+
+            # 'contact_chosen' is a tuple (id, forename, surname, email address, mobile number) looked up by id. While
+            # the contacts are loading, the contact previewed is read on their own from the storage backend instead.
+            if self.application.contacts_loading:
+                contact_chosen = self.contacts_loader.get_contact_values(chosen_id)
+                if contact_chosen is None:
+                    return
+                self.chosen_contact_version = None
+            else:
+                # The operations persisted by the other processes, if any, are merged first, such that the details of
+                # the contact are up to date, unless the contact was removed by one of them
+                self.contact_store.synchronize()
+                if chosen_id not in self.contact_store:
+                    return
+                contact_chosen = self.contact_store.get_contact_values(chosen_id)
+                self.chosen_contact_version = self.contact_store.get_contact_version(chosen_id)
+
+            self.show_chosen_contact(contact_chosen)
+
+    def show_chosen_contact(self, contact_chosen: Tuple) -> None:  # pragma: no cover
+        """
+        Populate the contact's fields with the details of the chosen contact, i.e., a tuple (id, forename, surname,
+        email address, mobile number), and show the buttons to update or remove them.
+        """
 
-            # Initialise placeholder/empty pandas series for 'contact_chosen'
-            contact_chosen = pd.Series(
-                data=[ZERO_VALUE, "", "", "", ""],
-                index=['id', 'forename', 'surname', 'email_address', 'mobile_number']
-            )
-            for key, val in contacts_dict.items():
-                if key == 'id':
-                    contacts_df_from_dict = convert_contacts_dict_to_df(contacts_dict)
-                    contact_chosen = contacts_df_from_dict[
-                        contacts_df_from_dict['id'] == chosen_id[ZERO_VALUE]
-                    ].iloc[ZERO_VALUE]
-                    break
+        for i in range(len(self.application.contacts_fields)):
+            self.application.contacts_fields[i].set(contact_chosen[i])
 
-            for i in range(len(self.application.contacts_fields)):
-                # Populate the contact's fields with the details of the chosen contact
-                self.application.contacts_fields[i].set(contact_chosen[i])
+        create_gui_buttons(self.application, create_contact=False)
+
+    def show_concurrent_modification(self, contact_id: int) -> None:  # pragma: no cover
+        """
+        Show the current details of a contact that was modified or removed by another process since they were chosen,
+        instead of updating or removing them, such that the user can decide again based on them.
+        """
 
-            create_gui_buttons(self.application, create_contact=False)
+        if contact_id in self.contact_store:
+            self.chosen_contact_version = self.contact_store.get_contact_version(contact_id)
+            self.show_chosen_contact(self.contact_store.get_contact_values(contact_id))
+        else:
+            clear_window_frame(self.application)
+            self.refresh_contacts_list()
 
     @staticmethod
     def create_contact_logic(
@@ -127,6 +369,24 @@ class ContactsService:
 
         return contacts_dict
 
+    @staticmethod
+    def create_contacts_logic(contacts_dict: Dict, contacts_to_create: List[Dict]) -> Dict:
+        """
+        Append a batch of contacts to create to existing dictionary of contacts, extending each of its lists once
+
+        :param contacts_dict: the initial dictionary of contacts.
+        :param contacts_to_create: a list of dictionaries with the "forename", "surname", "email_address", and
+                                    "mobile_number" of each contact to create.
+        :return: the updated dictionary of contacts with the new contacts created as well, given consecutive ids
+        """
+
+        first_id = max(contacts_dict['id'], default=ZERO_VALUE) + ONE_VALUE
+        contacts_dict['id'].extend(range(first_id, first_id + len(contacts_to_create)))
+        for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+            contacts_dict[key].extend(contact[key] for contact in contacts_to_create)
+
+        return contacts_dict
+
     def create_contact_on_gui(self) -> None:  # pragma: no cover
         """
         Create a contact and show it on the GUI.
@@ -140,29 +400,25 @@ class ContactsService:
         email_address_to_create = self.application.email_address_field.get()
         mobile_number_to_create = self.application.mobile_number_field.get()
 
-        contacts_dict = get_contacts_dict()
-
-        updated_contacts_dict = self.create_contact_logic(
-            contacts_dict,
+        created_id = self.contact_store.create_contact(
             forename_to_create,
             surname_to_create,
             email_address_to_create,
             mobile_number_to_create
         )
 
-        save_contacts_dict(updated_contacts_dict)
-
         clear_window_frame_contacts_fields(self.application)
-        self.load_contacts_list()
+        self.refresh_contacts_list()
+        self.see_contact_on_gui(created_id)
 
     @staticmethod
     def update_contact_logic(
-            contact_to_update: pd.DataFrame,
+            contact_to_update: 'pd.DataFrame',
             forename_to_update: str,
             surname_to_update: str,
             email_address_to_update: str,
             mobile_number_to_update: str
-    ) -> pd.DataFrame:
+    ) -> 'pd.DataFrame':
         """
         Update the details (forename, surname, email address, and mobile number) of a contact
 
@@ -181,6 +437,36 @@ class ContactsService:
 
         return contact_to_update
 
+    @staticmethod
+    def update_contacts_logic(contacts_dict: Dict, contacts_to_update: Dict[int, Dict]) -> Dict:
+        """
+        Update the details of a batch of contacts of an existing dictionary of contacts in place, in a single pass over
+        its ids
+
+        :param contacts_dict: the initial dictionary of contacts.
+        :param contacts_to_update: a dictionary mapping the id of each contact to update to the details to set, e.g.,
+                                    {16: {'surname': 'Cooper'}}.
+        :return: the updated dictionary of contacts. A KeyError is raised if any contact to update is not in the
+                dictionary, or a ValueError if any of their details is not a field of the dictionary, in which case no
+                contact is updated
+        """
+
+        unknown_contact_ids = set(contacts_to_update).difference(contacts_dict['id'])
+        if unknown_contact_ids:
+            raise KeyError(min(unknown_contact_ids))
+
+        for contact_id, fields_to_update in contacts_to_update.items():
+            if not set(fields_to_update) <= set(contacts_dict).difference(['id']):
+                raise ValueError(
+                    f"The contact of id {contact_id} to update has unknown fields {sorted(fields_to_update)}."
+                )
+
+        for index, contact_id in enumerate(contacts_dict['id']):
+            for key, value in contacts_to_update.get(contact_id, {}).items():
+                contacts_dict[key][index] = value
+
+        return contacts_dict
+
     def update_contact_on_gui(self) -> None:  # pragma: no cover
         """
         Update a contact and show it on the GUI.
@@ -194,28 +480,58 @@ class ContactsService:
         email_address_to_update = self.application.email_address_field.get()
         mobile_number_to_update = self.application.mobile_number_field.get()
 
-        contacts_dict = get_contacts_dict()
-        contacts_df_from_dict = convert_contacts_dict_to_df(contacts_dict)
+        # Update contact's forename, surname, email address, and mobile number based on new inputs from user on the GUI,
+        # unless the contact was modified or removed by another process since they were chosen
+        try:
+            self.contact_store.update_contact(
+                int(id_to_update),
+                forename_to_update,
+                surname_to_update,
+                email_address_to_update,
+                mobile_number_to_update,
+                expected_version=self.chosen_contact_version
+            )
+        except (ConcurrentModificationError, KeyError):
+            self.show_concurrent_modification(int(id_to_update))
+            return
 
-        contact_to_update = contacts_df_from_dict[contacts_df_from_dict['id'] == int(id_to_update)]
+        clear_window_frame(self.application)
+        self.refresh_contacts_list()
+        self.see_contact_on_gui(int(id_to_update))
 
-        # Update contact's forename, surname, email address, and mobile number based on new inputs from user on the GUI
-        updated_contact = self.update_contact_logic(
-            contact_to_update,
-            forename_to_update,
-            surname_to_update,
-            email_address_to_update,
-            mobile_number_to_update
-        )
+    def undo_contact_change_on_gui(self) -> None:  # pragma: no cover
+        """
+        Undo the last CRUD operation (e.g., a contact removed by mistake) and show the contacts accordingly.
+        """
 
-        # Replace previous version of a contact with its updated version based on user's inputs on the GUI
-        contacts_df_from_dict[contacts_df_from_dict['id'] == int(id_to_update)] = updated_contact
+        self.apply_contact_change_history_on_gui(self.contact_store.undo)
+
+    def redo_contact_change_on_gui(self) -> None:  # pragma: no cover
+        """
+        Redo the last CRUD operation undone and show the contacts accordingly.
+        """
+
+        self.apply_contact_change_history_on_gui(self.contact_store.redo)
+
+    def apply_contact_change_history_on_gui(self, history_operation) -> None:  # pragma: no cover
+        """
+        Undo or redo a CRUD operation, ringing the bell instead if the contacts it changed were modified or removed by
+        another process since, such that their changes are not lost.
+
+        :param history_operation: the 'undo' or 'redo' method of the store.
+        """
 
-        contacts_dict_from_df = contacts_df_from_dict.to_dict(orient='list')
-        save_contacts_dict(contacts_dict_from_df)
+        if self.application.contacts_loading:
+            return
+
+        try:
+            history_operation()
+        except (ConcurrentModificationError, KeyError):
+            self.application.bell()
+            return
 
         clear_window_frame(self.application)
-        self.load_contacts_list()
+        self.refresh_contacts_list()
 
     @staticmethod
     def remove_contact_logic(
@@ -242,24 +558,40 @@ class ContactsService:
 
         return contacts_dict
 
-    def remove_contact_on_gui(self) -> None:  # pragma: no cover
+    @staticmethod
+    def remove_contacts_logic(contacts_dict: Dict, ids_to_be_removed: List[int]) -> Dict:
         """
-        Remove a contact and ensure it is no longer visible on the GUI.
+        Remove a batch of contacts from an existing dictionary of contacts by their ids
+
+        :param contacts_dict: the initial dictionary of contacts.
+        :param ids_to_be_removed: the ids of the contacts to remove.
+        :return: the updated dictionary of contacts without the contacts removed
+
+        Note: each list is rebuilt in a single pass (O(n)) without the contacts removed, rather than popping them one at
+                a time, which would shift the rest of each list once per contact removed (O(n) each, i.e., O(n * k)).
         """
 
-        id_to_be_removed = int(self.application.id_field.get())
+        ids_to_be_removed = set(ids_to_be_removed)
+        contacts_kept = [contact_id not in ids_to_be_removed for contact_id in contacts_dict['id']]
+        for key in contacts_dict:
+            contacts_dict[key][:] = compress(contacts_dict[key], contacts_kept)
 
-        contacts_dict = get_contacts_dict()
+        return contacts_dict
 
-        index_of_id_to_be_removed = contacts_dict['id'].index(id_to_be_removed)
+    def remove_contact_on_gui(self) -> None:  # pragma: no cover
+        """
+        Remove a contact and ensure it is no longer visible on the GUI.
+        """
 
-        # Remove contact based on the index of its ID
-        updated_contacts_dict = self.remove_contact_logic(
-            contacts_dict,
-            index_of_id_to_be_removed
-        )
+        id_to_be_removed = int(self.application.id_field.get())
 
-        save_contacts_dict(updated_contacts_dict)
+        # Remove contact based on their ID, which the store resolves to their position via its index, unless the contact
+        # was modified or removed by another process since they were chosen
+        try:
+            self.contact_store.remove_contact(id_to_be_removed, expected_version=self.chosen_contact_version)
+        except (ConcurrentModificationError, KeyError):
+            self.show_concurrent_modification(id_to_be_removed)
+            return
 
         clear_window_frame(self.application)
-        self.load_contacts_list()
+        self.refresh_contacts_list()
@@ -0,0 +1,337 @@
+# This Python file contains the duplicate detection and merge engine, which finds the contacts entered more than once
+# (e.g., 'Sheldon Cooper' and 'Sheldon Coopper' with the same mobile number) without comparing every pair of contacts.
+# The contacts are first bucketed by blocking keys (the phonetic code of their surname along with the initial of their
+# forename, their normalised mobile number, and their case-folded email address), such that only the contacts sharing a
+# bucket are compared, with the pairs to compare fanned out over several processes for large contact books. The
+# duplicates found are grouped into merge proposals, which are applied to the contacts' store as a single changeset.
+
+import logging
+import unicodedata
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import TYPE_CHECKING, Dict, List, Mapping, Set, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, DUPLICATES_MAX_BUCKET_SIZE,
+    DUPLICATES_MIN_PAIRS_FOR_PROCESSES, DUPLICATES_PAIRS_PER_CHUNK,
+    DUPLICATES_SIMILARITY_THRESHOLD, ONE_VALUE, SOUNDEX_CODE_LENGTH,
+    ZERO_VALUE)
+
+from .fuzzy_search import get_bounded_edit_distance
+from .prefix_search import normalise_search_key
+from .secondary_indexes import normalise_mobile_number
+
+if TYPE_CHECKING:
+    from .contact_store import ContactStore
+
+# Digit of each consonant in the Soundex phonetic code, the vowels (and 'h', 'w', and 'y') having none
+SOUNDEX_DIGITS = {
+    letter: str(digit)
+    for digit, letters in enumerate(('bfpv', 'cgjkqsxz', 'dt', 'l', 'mn', 'r'), start=ONE_VALUE)
+    for letter in letters
+}
+
+# Weight of the similarity of the full names of two contacts in their similarity, whereas their email addresses and
+# mobile numbers (when both contacts have one) weigh one each
+NAME_SIMILARITY_WEIGHT = 2
+
+CONTACT_FIELDS = CONTACTS_DICT_KEYS[ONE_VALUE:]
+
+
+def get_soundex_code(surname: str) -> str:
+    """
+    Get the Soundex phonetic code of a surname, which is the same for surnames pronounced alike in English, e.g.,
+    'Robert' and 'Rupert'
+
+    :param surname: the surname, e.g., 'Schrödinger' (accents are ignored, as are the characters other than letters).
+    :return: the code, i.e., the first letter of the surname followed by three digits, e.g., 'S623', or an empty
+            string if the surname has no letter
+    """
+
+    letters = [
+        character for character in unicodedata.normalize('NFKD', surname.casefold()) if 'a' <= character <= 'z'
+    ]
+    if not letters:
+        return ''
+
+    soundex_code = letters[ZERO_VALUE].upper()
+    previous_digit = SOUNDEX_DIGITS.get(letters[ZERO_VALUE], '')
+    for letter in letters[ONE_VALUE:]:
+        digit = SOUNDEX_DIGITS.get(letter, '')
+        if digit and digit != previous_digit:
+            soundex_code += digit
+            if len(soundex_code) == SOUNDEX_CODE_LENGTH:
+                break
+        # Consonants with the same digit separated by 'h' or 'w' are coded once, but not when separated by a vowel
+        if letter not in 'hw':
+            previous_digit = digit
+
+    return soundex_code.ljust(SOUNDEX_CODE_LENGTH, '0')
+
+
+def get_blocking_keys(contact: Dict) -> List[Tuple[str, str]]:
+    """
+    Get the blocking keys of a contact, i.e., the keys of the buckets of contacts they are compared with
+
+    :param contact: the details of the contact, keyed by "forename", "surname", "email_address", and "mobile_number".
+    :return: a list of tuples (field, key), e.g., [('surname', 'C160 s'), ('mobile_number', '00000000073')], without
+            the fields the contact has no value for
+    """
+
+    blocking_keys = []
+
+    # The phonetic code of the surname alone would put thousands of contacts in the same bucket for common surnames
+    soundex_code = get_soundex_code(contact['surname'])
+    if soundex_code:
+        blocking_keys.append(('surname', soundex_code + ' ' + normalise_search_key(contact['forename'])[:ONE_VALUE]))
+
+    mobile_number = normalise_mobile_number(contact['mobile_number'])
+    if mobile_number:
+        blocking_keys.append(('mobile_number', mobile_number))
+
+    email_address = contact['email_address'].strip().casefold()
+    if email_address:
+        blocking_keys.append(('email_address', email_address))
+
+    return blocking_keys
+
+
+def get_comparison_key(contact: Dict) -> Tuple[str, str, str]:
+    """
+    Get the normalised details of a contact two contacts are compared by
+
+    :param contact: the details of the contact, keyed by "forename", "surname", "email_address", and "mobile_number".
+    :return: a tuple (full name, email address, mobile number), e.g., ('sheldon cooper', 'sheldor@myphdmail.com',
+            '00000000073')
+    """
+
+    return (
+        normalise_search_key(contact['forename'] + ' ' + contact['surname']).strip(),
+        contact['email_address'].strip().casefold(),
+        normalise_mobile_number(contact['mobile_number'])
+    )
+
+
+def get_contact_similarity(
+        first_comparison_key: Tuple[str, str, str],
+        second_comparison_key: Tuple[str, str, str],
+        similarity_threshold: float = ZERO_VALUE
+) -> float:
+    """
+    Get the similarity of two contacts, i.e., the weighted average of the similarity of their full names (one minus
+    their edit distance relative to the length of the longer one) and of whether their email addresses and mobile
+    numbers are the same, leaving out the ones either contact has no value for
+
+    :param first_comparison_key: the comparison key of the first contact (see 'get_comparison_key').
+    :param second_comparison_key: the comparison key of the second contact.
+    :param similarity_threshold: the similarity below which the contacts are not duplicates, such that the edit
+                                distance of their names is only computed up to the bound needed to reach it.
+    :return: the similarity, from 0 to 1, or 0 if it is below 'similarity_threshold'
+    """
+
+    first_name, second_name = first_comparison_key[ZERO_VALUE], second_comparison_key[ZERO_VALUE]
+
+    total_weight, weighted_similarity = NAME_SIMILARITY_WEIGHT, ZERO_VALUE
+    for first_value, second_value in zip(first_comparison_key[ONE_VALUE:], second_comparison_key[ONE_VALUE:]):
+        if first_value and second_value:
+            total_weight += ONE_VALUE
+            weighted_similarity += first_value == second_value
+
+    # The lowest similarity of the names for the contacts to reach the threshold bounds their edit distance
+    longer_name_length = max(len(first_name), len(second_name), ONE_VALUE)
+    min_name_similarity = (similarity_threshold * total_weight - weighted_similarity) / NAME_SIMILARITY_WEIGHT
+    if min_name_similarity > ONE_VALUE:
+        return ZERO_VALUE
+    max_distance = int((ONE_VALUE - max(min_name_similarity, ZERO_VALUE)) * longer_name_length)
+
+    edit_distance = get_bounded_edit_distance(first_name, second_name, max_distance)
+    if edit_distance > max_distance:
+        return ZERO_VALUE
+
+    name_similarity = ONE_VALUE - edit_distance / longer_name_length
+    similarity = (weighted_similarity + NAME_SIMILARITY_WEIGHT * name_similarity) / total_weight
+    return similarity if similarity >= similarity_threshold else ZERO_VALUE
+
+
+def find_candidate_pairs(contacts_dict: Mapping, max_bucket_size: int = DUPLICATES_MAX_BUCKET_SIZE) -> Set[Tuple]:
+    """
+    Find the pairs of contacts sharing a blocking key, which are the only ones compared
+
+    :param contacts_dict: the dictionary of contacts, e.g., the live columns of a 'ContactStore'.
+    :param max_bucket_size: the largest bucket whose contacts are compared, the larger ones being skipped (e.g., the
+                            contacts sharing a placeholder mobile number), as they would add quadratically many pairs.
+    :return: the set of pairs (lower id, higher id) of the contacts to compare
+    """
+
+    buckets = defaultdict(list)
+    for contact_values in zip(*(contacts_dict[key] for key in CONTACTS_DICT_KEYS)):
+        for blocking_key in get_blocking_keys(dict(zip(CONTACTS_DICT_KEYS, contact_values))):
+            buckets[blocking_key].append(contact_values[ZERO_VALUE])
+
+    candidate_pairs = set()
+    for blocking_key, contact_ids in buckets.items():
+        if len(contact_ids) > max_bucket_size:
+            logging.warning(f"The {len(contact_ids)} contacts with the {blocking_key[ZERO_VALUE]} key "
+                            f"'{blocking_key[ONE_VALUE]}' were not compared, as there are too many of them.")
+            continue
+        candidate_pairs.update(combinations(sorted(contact_ids), 2))
+
+    return candidate_pairs
+
+
+def score_candidate_pairs(
+        comparison_keys: Dict[int, Tuple], candidate_pairs: List[Tuple[int, int]], similarity_threshold: float
+) -> List[Tuple[int, int, float]]:
+    """
+    Compare pairs of contacts, e.g., in a worker process, given the comparison keys of (at least) the contacts compared
+
+    :param comparison_keys: a dictionary mapping the id of each contact to their comparison key.
+    :param candidate_pairs: the pairs of ids of the contacts to compare.
+    :param similarity_threshold: the similarity from which two contacts are duplicates.
+    :return: a list of tuples (id, id, similarity) of the pairs of duplicates found
+    """
+
+    duplicate_pairs = []
+    for first_id, second_id in candidate_pairs:
+        similarity = get_contact_similarity(comparison_keys[first_id], comparison_keys[second_id], similarity_threshold)
+        if similarity:
+            duplicate_pairs.append((first_id, second_id, similarity))
+    return duplicate_pairs
+
+
+def create_merge_proposal(kept_id: int, duplicate_ids: List[int], fields: Dict, similarity: float) -> Dict:
+    """
+    Create a proposal to merge duplicates into one of them
+
+    :param kept_id: the id of the contact kept, i.e., the one entered first.
+    :param duplicate_ids: the ids of the duplicates of the contact kept, to remove.
+    :param fields: the fields of the contact kept to update, filled in from the duplicates where the contact kept has no
+                    value, e.g., {'mobile_number': '00000000073'}.
+    :param similarity: the lowest similarity of the pairs of duplicates the contacts were grouped by.
+    :return: the merge proposal as a dictionary, e.g., {'kept_id': 16, 'duplicate_ids': [42], 'fields': {},
+            'similarity': 0.9}
+    """
+
+    return {'kept_id': kept_id, 'duplicate_ids': duplicate_ids, 'fields': fields, 'similarity': similarity}
+
+
+def group_duplicate_pairs(contacts_dict: Mapping, duplicate_pairs: List[Tuple[int, int, float]]) -> List[Dict]:
+    """
+    Group the pairs of duplicates into sets of contacts that are all duplicates of one another (e.g., 'A' and 'C' when
+    'A' is a duplicate of 'B' and 'B' of 'C'), with a union-find, and propose to merge each set into its first contact
+
+    :param contacts_dict: the dictionary of contacts the duplicates were found in.
+    :param duplicate_pairs: a list of tuples (id, id, similarity) of the pairs of duplicates.
+    :return: the list of merge proposals (see 'create_merge_proposal'), in order of the ids of the contacts kept
+    """
+
+    parent_ids = {}
+
+    def find_root_id(contact_id: int) -> int:
+        while parent_ids.setdefault(contact_id, contact_id) != contact_id:
+            parent_ids[contact_id] = parent_ids[parent_ids[contact_id]]
+            contact_id = parent_ids[contact_id]
+        return contact_id
+
+    for first_id, second_id, _ in duplicate_pairs:
+        first_root_id, second_root_id = find_root_id(first_id), find_root_id(second_id)
+        if first_root_id != second_root_id:
+            parent_ids[max(first_root_id, second_root_id)] = min(first_root_id, second_root_id)
+
+    grouped_ids, similarities = defaultdict(list), {}
+    for contact_id in sorted(parent_ids):
+        grouped_ids[find_root_id(contact_id)].append(contact_id)
+    for first_id, _, similarity in duplicate_pairs:
+        root_id = find_root_id(first_id)
+        similarities[root_id] = min(similarity, similarities.get(root_id, similarity))
+
+    positions = {contact_id: position for position, contact_id in enumerate(contacts_dict['id'])}
+    columns = {key: contacts_dict[key] for key in CONTACT_FIELDS}
+
+    merge_proposals = []
+    for kept_id, contact_ids in sorted(grouped_ids.items()):
+        # The fields the contact kept has no value for are filled in from their duplicates, in order of their ids
+        fields = {}
+        for key in CONTACT_FIELDS:
+            if columns[key][positions[kept_id]].strip():
+                continue
+            for duplicate_id in contact_ids[ONE_VALUE:]:
+                if columns[key][positions[duplicate_id]].strip():
+                    fields[key] = columns[key][positions[duplicate_id]]
+                    break
+        merge_proposals.append(create_merge_proposal(kept_id, contact_ids[ONE_VALUE:], fields, similarities[kept_id]))
+
+    return merge_proposals
+
+
+def find_merge_proposals(
+        contacts_dict: Mapping,
+        similarity_threshold: float = DUPLICATES_SIMILARITY_THRESHOLD,
+        max_bucket_size: int = DUPLICATES_MAX_BUCKET_SIZE,
+        max_workers: int = None,
+        min_pairs_for_processes: int = DUPLICATES_MIN_PAIRS_FOR_PROCESSES
+) -> List[Dict]:
+    """
+    Find the duplicates among contacts and propose to merge them, comparing only the contacts sharing a blocking key
+
+    :param contacts_dict: the dictionary of contacts, e.g., the live columns of a 'ContactStore'.
+    :param similarity_threshold: the similarity from which two contacts are duplicates (see 'get_contact_similarity').
+    :param max_bucket_size: the largest bucket of contacts sharing a blocking key whose contacts are compared.
+    :param max_workers: the number of processes the pairs of contacts are compared in, by default one per CPU; 1 to
+                        compare them in the calling process.
+    :param min_pairs_for_processes: the number of pairs of contacts to compare from which they are compared in several
+                                    processes, below which starting the processes would cost more than it saves.
+    :return: the list of merge proposals (see 'create_merge_proposal'), in order of the ids of the contacts kept
+    """
+
+    candidate_pairs = sorted(find_candidate_pairs(contacts_dict, max_bucket_size))
+    comparison_keys = {
+        contact_values[ZERO_VALUE]: get_comparison_key(dict(zip(CONTACTS_DICT_KEYS, contact_values)))
+        for contact_values in zip(*(contacts_dict[key] for key in CONTACTS_DICT_KEYS))
+    }
+
+    if len(candidate_pairs) < min_pairs_for_processes or max_workers == ONE_VALUE:
+        duplicate_pairs = score_candidate_pairs(comparison_keys, candidate_pairs, similarity_threshold)
+    else:
+        # Each chunk of pairs is sent along with the comparison keys of its contacts only, rather than all of them
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = []
+            for start_index in range(ZERO_VALUE, len(candidate_pairs), DUPLICATES_PAIRS_PER_CHUNK):
+                chunk_pairs = candidate_pairs[start_index:start_index + DUPLICATES_PAIRS_PER_CHUNK]
+                chunk_comparison_keys = {
+                    contact_id: comparison_keys[contact_id] for pair in chunk_pairs for contact_id in pair
+                }
+                futures.append(
+                    executor.submit(score_candidate_pairs, chunk_comparison_keys, chunk_pairs, similarity_threshold)
+                )
+            duplicate_pairs = [duplicate_pair for future in futures for duplicate_pair in future.result()]
+
+    return group_duplicate_pairs(contacts_dict, duplicate_pairs)
+
+
+def apply_merge_proposals(
+        contact_store: 'ContactStore', merge_proposals: List[Dict], expected_versions: Dict[int, int] = None
+) -> None:
+    """
+    Merge duplicates as proposed, updating each contact kept with the fields filled in from their duplicates and
+    removing the duplicates, all as a single changeset persisted with a single write (see
+    'ContactStore.apply_changeset')
+
+    :param contact_store: the store of the contacts the merge proposals were found in.
+    :param merge_proposals: the merge proposals to apply, e.g., the ones accepted by the user.
+    :param expected_versions: a dictionary mapping the id of some of the contacts updated or removed to the version
+                            they were compared at, if any, such that no merge is applied if any of them was modified
+                            since.
+    """
+
+    contact_store.apply_changeset(
+        contacts_to_update={
+            merge_proposal['kept_id']: merge_proposal['fields']
+            for merge_proposal in merge_proposals if merge_proposal['fields']
+        },
+        contact_ids_to_remove=[
+            duplicate_id for merge_proposal in merge_proposals for duplicate_id in merge_proposal['duplicate_ids']
+        ],
+        expected_versions=expected_versions
+    )
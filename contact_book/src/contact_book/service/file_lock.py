@@ -0,0 +1,112 @@
+# This Python file contains the lock shared by the processes (and the threads of each process) working on the same
+# contact book, which is an exclusive advisory lock of a lock file next to the contacts' files (with fcntl.flock on
+# POSIX systems, or msvcrt.locking on Windows), released by the operating system if the process holding it dies.
+
+import os
+import threading
+import time
+
+from contact_book.src.contact_book.constants import ONE_VALUE, ZERO_VALUE
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Windows, which has no fcntl module
+    fcntl = None
+    import msvcrt
+
+# Interval (in seconds) between two attempts to lock a file on Windows, whose msvcrt.locking cannot wait indefinitely
+WINDOWS_LOCK_RETRY_INTERVAL_SECONDS = 0.01
+
+
+def lock_file(file_descriptor: int, blocking: bool) -> None:
+    """
+    Lock an open file exclusively, raising a BlockingIOError if it is already locked and 'blocking' is False
+    """
+
+    if fcntl is not None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+
+    while True:  # pragma: no cover
+        try:
+            msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+            return
+        except OSError as error:
+            if not blocking:
+                raise BlockingIOError(*error.args)
+            time.sleep(WINDOWS_LOCK_RETRY_INTERVAL_SECONDS)
+
+
+def unlock_file(file_descriptor: int) -> None:
+
+    if fcntl is not None:
+        fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+    else:  # pragma: no cover
+        os.lseek(file_descriptor, 0, os.SEEK_SET)
+        msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+
+
+class InterProcessLock:
+    """
+    An exclusive lock held by at most one thread of one process at a time across all the processes locking the same
+    lock file. As a threading.RLock, it may be acquired again by the thread holding it, which then releases it as many
+    times as it acquired it.
+    """
+
+    def __init__(self, lock_file_path: str):
+        self.lock_file_path = lock_file_path
+
+        # The threads of a process wait for each other on 'thread_lock' first, such that only one of them waits for the
+        # lock file, whose file descriptor is only opened (and locked) while the lock is held
+        self.thread_lock = threading.RLock()
+        self.lock_file_descriptor = None
+        self.acquisition_count = ZERO_VALUE
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock, waiting for the other threads and processes holding it to release it if 'blocking' is True
+
+        :param blocking: whether to wait for the lock to be released if it is held, rather than give up straight away.
+        :return: True if the lock was acquired, False otherwise
+        """
+
+        if not self.thread_lock.acquire(blocking):
+            return False
+
+        if self.acquisition_count == ZERO_VALUE:
+            try:
+                lock_file_descriptor = os.open(self.lock_file_path, os.O_RDWR | os.O_CREAT)
+                try:
+                    lock_file(lock_file_descriptor, blocking)
+                except BaseException:
+                    os.close(lock_file_descriptor)
+                    raise
+            except BlockingIOError:
+                self.thread_lock.release()
+                return False
+            except BaseException:
+                self.thread_lock.release()
+                raise
+            self.lock_file_descriptor = lock_file_descriptor
+
+        self.acquisition_count += ONE_VALUE
+        return True
+
+    def release(self) -> None:
+
+        self.acquisition_count -= ONE_VALUE
+        if self.acquisition_count == ZERO_VALUE:
+            lock_file_descriptor, self.lock_file_descriptor = self.lock_file_descriptor, None
+            try:
+                unlock_file(lock_file_descriptor)
+            finally:
+                os.close(lock_file_descriptor)
+        self.thread_lock.release()
+
+    def __enter__(self) -> 'InterProcessLock':
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
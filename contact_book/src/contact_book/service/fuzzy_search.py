@@ -0,0 +1,164 @@
+# This Python file contains the typo-tolerant (fuzzy) search engine, which looks for contacts whose forename, surname,
+# or email address is within a small edit distance of a query. Rather than computing the edit distance to every contact,
+# it generates candidates from an inverted index of the trigrams (sequences of three characters) of those fields, and
+# only ranks the contacts sharing enough trigrams with the query.
+
+from collections import Counter
+from typing import Dict, List, Set
+
+from contact_book.src.contact_book.constants import (
+    FUZZY_SEARCH_CHARACTERS_PER_EDIT, FUZZY_SEARCH_MAX_EDIT_DISTANCE,
+    ONE_VALUE, SEARCH_RESULTS_LIMIT, TRIGRAM_LENGTH, ZERO_VALUE)
+
+from .contact_index import ContactIndex
+from .prefix_search import normalise_search_key
+
+FUZZY_SEARCH_FIELDS = ('forename', 'surname', 'email_address')
+
+
+def get_trigrams(text: str) -> Set[str]:
+    """
+    Get the trigrams of a text, which is padded with spaces, such that its first and last characters are part of as
+    many trigrams as the ones in the middle
+
+    :param text: the normalised text, e.g., 'cooper'.
+    :return: the set of trigrams of the text, e.g., {'  c', ' co', 'coo', 'oop', 'ope', 'per', 'er '}
+    """
+
+    padded_text = ' ' * (TRIGRAM_LENGTH - ONE_VALUE) + text + ' '
+    return {padded_text[i:i + TRIGRAM_LENGTH] for i in range(len(padded_text) - TRIGRAM_LENGTH + ONE_VALUE)}
+
+
+def get_bounded_edit_distance(first_text: str, second_text: str, max_distance: int) -> int:
+    """
+    Get the edit (Levenshtein) distance between two texts, giving up as soon as it is known to exceed a bound
+
+    :param first_text: the first text.
+    :param second_text: the second text.
+    :param max_distance: the bound of the edit distance.
+    :return: the edit distance if it is lower than or equal to 'max_distance', or 'max_distance' + 1 otherwise
+    """
+
+    if abs(len(first_text) - len(second_text)) > max_distance:
+        return max_distance + ONE_VALUE
+
+    previous_row = list(range(len(second_text) + ONE_VALUE))
+    for i, first_character in enumerate(first_text, start=ONE_VALUE):
+        current_row = [i]
+        for j, second_character in enumerate(second_text, start=ONE_VALUE):
+            current_row.append(min(
+                previous_row[j] + ONE_VALUE,
+                current_row[j - ONE_VALUE] + ONE_VALUE,
+                previous_row[j - ONE_VALUE] + (first_character != second_character)
+            ))
+        # Each row's minimum never decreases, such that the distance is already known to exceed the bound
+        if min(current_row) > max_distance:
+            return max_distance + ONE_VALUE
+        previous_row = current_row
+
+    return min(previous_row[-1], max_distance + ONE_VALUE)
+
+
+class TrigramIndex(ContactIndex):
+    """
+    An inverted index mapping each trigram of the contacts' forenames, surnames, and email addresses to the ids of the
+    contacts whose fields contain it (its posting list), which is maintained incrementally as contacts are created,
+    updated, or removed.
+    """
+
+    def __init__(self):
+
+        # 'posting_lists' maps each trigram to the set of ids of the contacts containing it, e.g., {'coo': {16}}
+        self.posting_lists = {}
+
+        # 'indexed_fields' maps each contact's id to their normalised forename, surname, and email address
+        self.indexed_fields = {}
+
+    @staticmethod
+    def get_normalised_fields(contact: Dict) -> tuple:
+        return tuple(normalise_search_key(contact[field]).strip() for field in FUZZY_SEARCH_FIELDS)
+
+    def add_contact(self, contact_id: int, contact: Dict):
+
+        normalised_fields = self.get_normalised_fields(contact)
+        self.indexed_fields[contact_id] = normalised_fields
+        for normalised_field in normalised_fields:
+            for trigram in get_trigrams(normalised_field):
+                self.posting_lists.setdefault(trigram, set()).add(contact_id)
+
+    def remove_contact(self, contact_id: int, contact: Dict):
+
+        for normalised_field in self.indexed_fields.pop(contact_id):
+            for trigram in get_trigrams(normalised_field):
+                posting_list = self.posting_lists.get(trigram)
+                if posting_list is not None:
+                    posting_list.discard(contact_id)
+                    if not posting_list:
+                        del self.posting_lists[trigram]
+
+    def get_candidates(self, query_trigrams: Set[str], max_distance: int) -> List[int]:
+        """
+        Get the ids of the contacts sharing enough trigrams with a query to be within the given edit distance of it, by
+        merging the posting lists of the query's trigrams
+
+        :param query_trigrams: the trigrams of the normalised query.
+        :param max_distance: the maximum edit distance.
+        :return: the list of ids of the candidate contacts
+        """
+
+        # Each edit changes at most three trigrams, such that a field within 'max_distance' edits of the query shares
+        # at least this number of trigrams with it
+        min_shared_trigrams = max(len(query_trigrams) - TRIGRAM_LENGTH * max_distance, ONE_VALUE)
+
+        # A contact sharing 'min_shared_trigrams' trigrams with the query is in at least one of its
+        # len(query_trigrams) - min_shared_trigrams + 1 shortest posting lists, such that only those are merged to
+        # generate candidates, whose shared trigrams in the longer posting lists are then counted by lookup
+        posting_lists = sorted((self.posting_lists.get(trigram, set()) for trigram in query_trigrams), key=len)
+        number_of_merged_posting_lists = len(posting_lists) - min_shared_trigrams + ONE_VALUE
+
+        shared_trigrams_counter = Counter()
+        for posting_list in posting_lists[:number_of_merged_posting_lists]:
+            shared_trigrams_counter.update(posting_list)
+        for posting_list in posting_lists[number_of_merged_posting_lists:]:
+            for contact_id in shared_trigrams_counter:
+                if contact_id in posting_list:
+                    shared_trigrams_counter[contact_id] += ONE_VALUE
+
+        return [
+            contact_id for contact_id, shared_trigrams in shared_trigrams_counter.items()
+            if shared_trigrams >= min_shared_trigrams
+        ]
+
+    def search(
+            self,
+            query: str,
+            max_distance: int = FUZZY_SEARCH_MAX_EDIT_DISTANCE,
+            limit: int = SEARCH_RESULTS_LIMIT
+    ) -> List[int]:
+        """
+        Search for the contacts whose forename, surname, or email address is within an edit distance of a query
+
+        :param query: the query typed by the user, e.g., 'Shledon'; it is case-insensitive.
+        :param max_distance: the maximum edit distance between the query and a field of the contacts found.
+        :param limit: the maximum number of contacts to return.
+        :return: the list of ids of the contacts found (at most 'limit' of them), ranked by edit distance to the query
+        """
+
+        normalised_query = normalise_search_key(query).strip()
+        if not normalised_query:
+            return []
+
+        # Short queries tolerate fewer typos, e.g., one for a query of three to five characters
+        max_distance = min(max_distance, len(normalised_query) // FUZZY_SEARCH_CHARACTERS_PER_EDIT)
+
+        ranked_contacts = []
+        for contact_id in self.get_candidates(get_trigrams(normalised_query), max_distance):
+            edit_distance = min(
+                get_bounded_edit_distance(normalised_query, normalised_field, max_distance)
+                for normalised_field in self.indexed_fields[contact_id]
+            )
+            if edit_distance <= max_distance:
+                ranked_contacts.append((edit_distance, contact_id))
+
+        ranked_contacts.sort()
+        return [contact_id for _, contact_id in ranked_contacts[ZERO_VALUE:limit]]
@@ -0,0 +1,496 @@
+# This Python file contains the headless HTTP API server over the contacts' service, which serves the CRUD operations
+# and the searches of the contacts as JSON endpoints on an asyncio event loop (with the standard library only), such
+# that several users can work on the same contact book without the GUI:
+#   - GET /contacts?offset=&limit=: the contacts in alphabetical order of their surnames, a page at a time;
+#   - POST /contacts, GET/PUT/DELETE /contacts/<id>: creating, reading, updating, and removing a contact, whose version
+#     is sent as the ETag of the response, such that an update or a removal conditional on it (with an If-Match header)
+#     fails with 412 Precondition Failed if the contact was modified since (e.g., by another user or process);
+#   - GET /search?query=&limit=, GET /search/fuzzy?query=&max_distance=&limit=,
+#     GET /search/email-domain?email_domain=, GET /search/mobile-number-suffix?mobile_number_suffix=: the searches of
+#     the contacts' service;
+#   - GET /metrics: the metrics collected by the instrumentation, if enabled (see 'metrics.py').
+#
+# Reads are served straight from the in-memory store by the event loop (once the operations persisted by the other
+# processes working on the same contacts, if any, are merged into it, unless one of them holds the lock of the contacts
+# meanwhile), between and during the persistence of the writes, whereas writes are queued and applied by a single
+# task, which applies all the writes queued meanwhile as a batch and then persists them with a single write to the
+# storage backend on a worker thread, before responding to them.
+#
+# Usage (from the root directory of the repository):
+#     python -m contact_book.src.contact_book.service.http_server --port 8080
+
+import argparse
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from http import HTTPStatus
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, FILE_NAME_CONTACTS_DICT,
+    FUZZY_SEARCH_MAX_EDIT_DISTANCE, HTTP_SERVER_HOST,
+    HTTP_SERVER_LOCK_RETRY_INTERVAL_SECONDS, HTTP_SERVER_MAX_PAGE_SIZE,
+    HTTP_SERVER_MAX_REQUEST_BODY_BYTES, HTTP_SERVER_MAX_WRITE_BATCH_SIZE,
+    HTTP_SERVER_PAGE_SIZE, HTTP_SERVER_PORT, ONE_VALUE, ROOT_DIR_CONTACTS_DICT_FILE, SEARCH_RESULTS_LIMIT, ZERO_VALUE)
+
+from .contact_store import (ConcurrentModificationError, ContactStore,
+                            get_contact_store)
+from .contacts_service import ContactsService
+from .metrics import get_metrics
+
+
+class HttpError(Exception):
+    """
+    An error to respond to a request with, with its HTTP status code and a message.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def encode_http_response(status: int, payload, keep_alive: bool, headers: Dict[str, str] = None) -> bytes:
+    """
+    Encode an HTTP/1.1 response with a JSON body
+
+    :param status: the HTTP status code of the response.
+    :param payload: the object to send as JSON, or None for an empty body.
+    :param keep_alive: whether the connection is kept open for further requests.
+    :param headers: the headers of the response other than the ones of its body and connection, if any, e.g., its ETag.
+    :return: the response as bytes
+    """
+
+    body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+    header_lines = ''.join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    status_and_headers = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"{header_lines}"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return status_and_headers.encode('latin-1') + body
+
+
+def parse_integer(value: str, name: str, minimum: int = ZERO_VALUE, maximum: int = None) -> int:
+
+    try:
+        integer = int(value)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer.")
+    if maximum is None and integer < minimum:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"{name} must be at least {minimum}.")
+    if maximum is not None and not minimum <= integer <= maximum:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"{name} must be between {minimum} and {maximum}.")
+    return integer
+
+
+def parse_expected_version(headers: Dict[str, str]) -> Optional[int]:
+    """
+    Parse the version of a contact an update or a removal is conditional on from the If-Match header of its request
+
+    :param headers: the headers of the request, keyed by their lowercase names.
+    :return: the version, or None if the request is not conditional (i.e., without an If-Match header, or with '*')
+    """
+
+    entity_tag = headers.get('if-match', '*').strip()
+    if entity_tag == '*':
+        return None
+    return parse_integer(entity_tag.strip('"'), 'If-Match')
+
+
+def parse_contact_fields(body: bytes) -> List[str]:
+    """
+    Parse the details of a contact to create or update from the JSON body of a request
+
+    :param body: the body of the request, a JSON object with the "forename", "surname", "email_address", and
+                "mobile_number" of the contact (strings, the forename and surname not being empty, as on the GUI).
+    :return: the list [forename, surname, email address, mobile number]
+    """
+
+    try:
+        contact = json.loads(body)
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object.")
+    if not isinstance(contact, dict):
+        raise HttpError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object.")
+
+    contact_fields = []
+    for key in CONTACTS_DICT_KEYS[ONE_VALUE:]:
+        if not isinstance(contact.get(key), str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"{key} must be a string.")
+        contact_fields.append(contact[key])
+
+    if not contact['forename'] or not contact['surname']:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "forename and surname must not be empty.")
+    return contact_fields
+
+
+class ContactsHttpServer:
+    """
+    An asyncio HTTP server exposing the operations of a contacts' store and the searches of the contacts' service as
+    JSON endpoints, with persistent (keep-alive) connections.
+    """
+
+    def __init__(
+            self,
+            contact_store: ContactStore,
+            host: str = HTTP_SERVER_HOST,
+            port: int = HTTP_SERVER_PORT,
+            max_write_batch_size: int = HTTP_SERVER_MAX_WRITE_BATCH_SIZE
+    ):
+        self.contact_store = contact_store
+        self.contacts_service = ContactsService(application=None, contact_store=contact_store)
+        self.host = host
+        self.port = port
+        self.max_write_batch_size = max_write_batch_size
+
+        self.server = None
+        self.write_queue = None
+        self.writing_task = None
+        self.connection_writers = set()
+        self.number_of_write_batches = ZERO_VALUE
+
+    async def start(self) -> None:
+        """
+        Start listening to the host and port of the server (the port being chosen by the system if 0) and applying the
+        writes queued.
+        """
+
+        self.write_queue = asyncio.Queue()
+        self.writing_task = asyncio.ensure_future(self.apply_writes())
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[ZERO_VALUE].getsockname()[ONE_VALUE]
+
+    async def serve_forever(self) -> None:
+        await self.server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stop accepting connections, close the open ones, and wait for the writes queued to be persisted.
+        """
+
+        self.server.close()
+        for connection_writer in list(self.connection_writers):
+            connection_writer.close()
+        await self.server.wait_closed()
+
+        await self.write_queue.join()
+        self.writing_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.writing_task
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve the requests sent on a connection one after the other until the client closes it or asks to close it.
+        """
+
+        self.connection_writers.add(writer)
+        try:
+            keep_alive = True
+            while keep_alive:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                try:
+                    method, target, headers, keep_alive, body = await self.read_request(request_line, reader)
+                    status, payload, response_headers = await self.handle_request(method, target, headers, body)
+                except HttpError as error:
+                    status, payload, response_headers = error.status, {'error': error.message}, None
+                    keep_alive = keep_alive and error.status != HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+                writer.write(encode_http_response(status, payload, keep_alive, response_headers))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+            # The client disconnected, or sent a request line or header longer than the limit of the stream reader
+            pass
+        finally:
+            self.connection_writers.discard(writer)
+            writer.close()
+
+    async def read_request(
+            self, request_line: bytes, reader: asyncio.StreamReader
+    ) -> Tuple[str, str, Dict[str, str], bool, bytes]:
+        """
+        Read the headers and the body of a request following its request line
+
+        :param request_line: the request line, e.g., b'GET /contacts/1 HTTP/1.1\\r\\n'.
+        :param reader: the stream the request is read from.
+        :return: a tuple (method, target, headers keyed by their lowercase names, whether the connection is kept alive,
+                body)
+        """
+
+        try:
+            method, target, http_version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+        headers = {}
+        while True:
+            header_line = await reader.readline()
+            if header_line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = header_line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        # HTTP/1.1 connections are kept alive unless the client asks to close them, and HTTP/1.0 ones conversely
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if http_version == 'HTTP/1.1' else connection == 'keep-alive'
+
+        content_length = parse_integer(headers.get('content-length', '0'), 'Content-Length')
+        if content_length > HTTP_SERVER_MAX_REQUEST_BODY_BYTES:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "The body of the request is too large.")
+        body = await reader.readexactly(content_length) if content_length else b''
+
+        return method, target, headers, keep_alive, body
+
+    async def handle_request(
+            self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, object, Optional[Dict[str, str]]]:
+        """
+        Route a request to the operation of its endpoint
+
+        :param method: the method of the request, e.g., 'GET'.
+        :param target: the path and query string of the request, e.g., '/search?query=Pau'.
+        :param headers: the headers of the request, keyed by their lowercase names.
+        :param body: the body of the request.
+        :return: a tuple (HTTP status code, object to send as JSON or None, headers of the response or None)
+        """
+
+        path, _, query_string = target.partition('?')
+        query = {name: values[-1] for name, values in parse_qs(query_string).items()}
+        path_segments = [unquote(path_segment) for path_segment in path.split('/') if path_segment]
+
+        try:
+            # A read is served from the store as it is if another process holds the lock of the contacts, rather than
+            # blocking the event loop until it is released
+            if method == 'GET':
+                self.contact_store.synchronize(blocking=False)
+
+            if path_segments == ['contacts']:
+                if method == 'GET':
+                    return HTTPStatus.OK, self.list_contacts(query), None
+                if method == 'POST':
+                    contact_fields = parse_contact_fields(body)
+                    contact_created = await self.submit_write(
+                        lambda: self.contact_store.get_contact(self.contact_store.create_contact(*contact_fields))
+                    )
+                    return HTTPStatus.CREATED, contact_created, self.get_entity_tag_header(contact_created['id'])
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on /contacts.")
+
+            if len(path_segments) == 2 and path_segments[ZERO_VALUE] == 'contacts':
+                contact_id = parse_integer(path_segments[ONE_VALUE], 'The id of the contact', minimum=-2 ** 63)
+                if method == 'GET':
+                    return HTTPStatus.OK, self.contact_store.get_contact(contact_id), \
+                        self.get_entity_tag_header(contact_id)
+                if method == 'PUT':
+                    contact_fields = parse_contact_fields(body)
+                    expected_version = parse_expected_version(headers)
+                    contact_updated = await self.submit_write(
+                        lambda: self.update_contact(contact_id, contact_fields, expected_version)
+                    )
+                    return HTTPStatus.OK, contact_updated, self.get_entity_tag_header(contact_id)
+                if method == 'DELETE':
+                    expected_version = parse_expected_version(headers)
+                    await self.submit_write(lambda: self.contact_store.remove_contact(contact_id, expected_version))
+                    return HTTPStatus.NO_CONTENT, None, None
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on /contacts/<id>.")
+
+            read_operation = self.get_read_operation(path_segments)
+            if read_operation is None:
+                raise HttpError(HTTPStatus.NOT_FOUND, f"No endpoint at {path}.")
+            if method != 'GET':
+                raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on {path}.")
+            return HTTPStatus.OK, read_operation(query), None
+
+        except ConcurrentModificationError as error:
+            raise HttpError(HTTPStatus.PRECONDITION_FAILED, str(error))
+        except KeyError as error:
+            if isinstance(error.args[ZERO_VALUE], int):
+                raise HttpError(HTTPStatus.NOT_FOUND, f"No contact has the id {error.args[ZERO_VALUE]}.")
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"The query parameter {error.args[ZERO_VALUE]} is missing.")
+        except HttpError:
+            raise
+        except Exception:
+            logging.exception(f"{method} {target} failed.")
+            raise HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, "The request failed.")
+
+    def get_read_operation(self, path_segments: List[str]) -> Optional[Callable[[Dict], object]]:
+        """
+        Get the read operation of the endpoint at the given path, other than the ones of the contacts
+
+        :param path_segments: the segments of the path of the request, e.g., ['search', 'fuzzy'].
+        :return: a function of the query parameters of the request returning the object to send as JSON, or None if
+                there is no such endpoint
+        """
+
+        return {
+            ('search',): lambda query: self.format_search_results(self.contacts_service.search_contacts(
+                query['query'],
+                parse_integer(
+                    query.get('limit', SEARCH_RESULTS_LIMIT), 'limit', minimum=ONE_VALUE, maximum=SEARCH_RESULTS_LIMIT
+                )
+            )),
+            ('search', 'fuzzy'): lambda query: self.format_search_results(self.contacts_service.fuzzy_search_contacts(
+                query['query'],
+                parse_integer(query.get('max_distance', FUZZY_SEARCH_MAX_EDIT_DISTANCE), 'max_distance',
+                              maximum=FUZZY_SEARCH_MAX_EDIT_DISTANCE),
+                parse_integer(
+                    query.get('limit', SEARCH_RESULTS_LIMIT), 'limit', minimum=ONE_VALUE, maximum=SEARCH_RESULTS_LIMIT
+                )
+            )),
+            ('search', 'email-domain'): lambda query: self.contacts_service.find_contacts_by_email_domain(
+                query['email_domain']
+            ),
+            ('search', 'mobile-number-suffix'): lambda query: (
+                self.contacts_service.find_contacts_by_mobile_number_suffix(query['mobile_number_suffix'])
+            ),
+            ('metrics',): lambda query: get_metrics(),
+        }.get(tuple(path_segments))
+
+    @staticmethod
+    def format_search_results(contacts_found: List[Tuple]) -> List[Dict]:
+        return [{'id': contact_id, 'name': contact_name} for contact_id, contact_name in contacts_found]
+
+    def list_contacts(self, query: Dict) -> Dict:
+        """
+        List a page of the contacts in alphabetical order of their surnames, as listed on the GUI
+
+        :param query: the query parameters of the request, with the optional "offset" and "limit" of the page.
+        :return: a dictionary with the total number of contacts ("total") and the details of the contacts of the page
+                ("contacts")
+        """
+
+        offset = parse_integer(query.get('offset', ZERO_VALUE), 'offset')
+        limit = parse_integer(query.get('limit', HTTP_SERVER_PAGE_SIZE), 'limit', maximum=HTTP_SERVER_MAX_PAGE_SIZE)
+
+        sorted_index = self.contact_store.sorted_index
+        return {
+            'total': len(sorted_index),
+            'contacts': [
+                self.contact_store.get_contact(contact_id)
+                for _, _, contact_id in sorted_index[offset:offset + limit]
+            ]
+        }
+
+    def update_contact(self, contact_id: int, contact_fields: List[str], expected_version: Optional[int]) -> Dict:
+
+        self.contact_store.update_contact(contact_id, *contact_fields, expected_version=expected_version)
+        return self.contact_store.get_contact(contact_id)
+
+    def get_entity_tag_header(self, contact_id: int) -> Optional[Dict[str, str]]:
+        """
+        Get the ETag header of a response with the details of a contact, i.e., the version of the contact, if they were
+        not removed in the meantime
+
+        :param contact_id: the id of the contact.
+        :return: the header as a dictionary, e.g., {'ETag': '"42"'}, or None
+        """
+
+        with suppress(KeyError):
+            return {'ETag': f'"{self.contact_store.get_contact_version(contact_id)}"'}
+        return None
+
+    async def submit_write(self, write_operation: Callable):
+        """
+        Queue a write to be applied and persisted by the task applying the writes, and wait for it to be persisted
+
+        :param write_operation: the function applying the write to the store, which returns the object to respond with.
+        :return: the value returned by the write operation
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.write_queue.put_nowait((write_operation, future))
+        return await future
+
+    async def apply_writes(self) -> None:
+        """
+        Apply the writes queued, one batch at a time: the writes queued while the previous batch was being persisted
+        are applied to the store in the order in which they were queued, and then persisted with a single write to
+        the storage backend on a worker thread, such that the event loop keeps serving reads meanwhile.
+        """
+
+        loop = asyncio.get_running_loop()
+        while True:
+            write_requests = [await self.write_queue.get()]
+            while len(write_requests) < self.max_write_batch_size and not self.write_queue.empty():
+                write_requests.append(self.write_queue.get_nowait())
+
+            # The lock of the storage backend is held until the batch is persisted, such that the other processes
+            # working on the same contacts do not persist operations in between. It is acquired without blocking the
+            # event loop, which keeps serving reads while another process holds it.
+            while not self.contact_store.storage_backend.acquire_lock(blocking=False):
+                await asyncio.sleep(HTTP_SERVER_LOCK_RETRY_INTERVAL_SECONDS)
+
+            write_results = []
+            persistence_error = None
+            try:
+                with self.contact_store.deferred_persistence() as journal_records:
+                    for write_operation, future in write_requests:
+                        try:
+                            write_results.append((future, write_operation(), None))
+                        except Exception as error:
+                            write_results.append((future, None, error))
+
+                    if journal_records:
+                        try:
+                            await loop.run_in_executor(None, self.contact_store.write_journal_records, journal_records)
+                        except Exception as error:
+                            logging.exception("Persisting a batch of writes failed.")
+                            persistence_error = error
+
+                            # The writes of the batch were applied to the store but not persisted, such that the saved
+                            # contacts are loaded again rather than serving them
+                            self.contact_store.reload()
+            finally:
+                self.contact_store.storage_backend.release_lock()
+            self.number_of_write_batches += ONE_VALUE
+
+            for future, write_result, error in write_results:
+                error = error or persistence_error
+                if future.cancelled():
+                    pass
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(write_result)
+            for _ in write_requests:
+                self.write_queue.task_done()
+
+
+async def run_http_server(
+        host: str = HTTP_SERVER_HOST,
+        port: int = HTTP_SERVER_PORT,
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT
+) -> None:
+    """
+    Load the contacts' store and serve it over HTTP until interrupted.
+    """
+
+    contacts_http_server = ContactsHttpServer(get_contact_store(contacts_file_root_dir, contacts_file_name), host, port)
+    await contacts_http_server.start()
+    print(f"Serving the contacts on http://{host}:{contacts_http_server.port}", flush=True)
+    try:
+        await contacts_http_server.serve_forever()
+    finally:
+        await contacts_http_server.close()
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Serve the contacts over a JSON HTTP API.")
+    argument_parser.add_argument('--host', default=HTTP_SERVER_HOST)
+    argument_parser.add_argument('--port', type=int, default=HTTP_SERVER_PORT, help="0 to let the system choose it")
+    argument_parser.add_argument('--contacts-file-root-dir', default=ROOT_DIR_CONTACTS_DICT_FILE)
+    argument_parser.add_argument('--contacts-file-name', default=FILE_NAME_CONTACTS_DICT)
+    arguments = argument_parser.parse_args()
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(run_http_server(
+            arguments.host, arguments.port, arguments.contacts_file_root_dir, arguments.contacts_file_name
+        ))
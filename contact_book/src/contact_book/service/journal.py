@@ -0,0 +1,174 @@
+# This Python file contains the functions to persist the CRUD operations performed on the contacts as an append-only
+# journal, with one small record per operation (create, update, or delete), which is replayed on top of the last saved
+# snapshot of the contacts (i.e., the contacts_dict.txt file) when loading them. Each record carries the version of the
+# contacts it results in, such that the processes sharing the journal can read the records appended by the others since
+# they last read it (see 'tail_journal_records'), rather than the whole contacts' file again.
+
+import json
+import logging
+import os
+from typing import Dict, List, Tuple
+
+from contact_book.root import get_contact_book_root
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, FILE_NAME_CONTACTS_JOURNAL,
+    JOURNAL_OPERATION_CHECKPOINT, JOURNAL_OPERATION_CREATE,
+    JOURNAL_OPERATION_DELETE, JOURNAL_OPERATION_UPDATE,
+    ROOT_DIR_CONTACTS_DICT_FILE, ZERO_VALUE)
+
+root_dir = get_contact_book_root()
+
+
+def get_journal_file_path(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        journal_file_name: str = FILE_NAME_CONTACTS_JOURNAL
+) -> str:
+    """
+    Get the path of the journal of the CRUD operations performed on the contacts
+
+    :param contacts_file_root_dir: the root directory where the journal is stored.
+    :param journal_file_name: the .txt file with the journal.
+    :return: the path of the journal
+    """
+
+    return root_dir + '/' + contacts_file_root_dir + journal_file_name
+
+
+def create_journal_record(operation: str, contact_id: int, contact_fields: Dict = None) -> Dict:
+    """
+    Create a journal record describing a CRUD operation performed on a contact
+
+    :param operation: the operation performed, i.e., 'create', 'update', or 'delete'.
+    :param contact_id: the id of the contact the operation was performed on.
+    :param contact_fields: the fields of the contact created, or only the fields changed for an update (e.g.,
+                            {'surname': 'Cooper'}); None for a deletion.
+    :return: the journal record as a dictionary, e.g., {'operation': 'update', 'id': 4, 'fields': {'surname': 'Cooper'}}
+    """
+
+    journal_record = {'operation': operation, 'id': contact_id}
+    if contact_fields is not None:
+        journal_record['fields'] = contact_fields
+    return journal_record
+
+
+def create_checkpoint_record(version: int) -> Dict:
+    """
+    Create the journal record starting the journal after a snapshot of the contacts was saved
+
+    :param version: the version of the contacts saved in the snapshot.
+    :return: the journal record as a dictionary, e.g., {'operation': 'checkpoint', 'version': 42}
+    """
+
+    return {'operation': JOURNAL_OPERATION_CHECKPOINT, 'version': version}
+
+
+def append_journal_records(journal_records: List[Dict], journal_file_path: str) -> int:
+    """
+    Append journal records to the journal and flush them to disk, such that each write only costs the size of the
+    records appended, however big the contact book is
+
+    :param journal_records: the journal records to append.
+    :param journal_file_path: the path of the journal.
+    :return: the size of the journal (in bytes) after the records have been appended
+    """
+
+    with open(journal_file_path, 'a') as journal_file:
+        journal_file.write(''.join(json.dumps(journal_record) + '\n' for journal_record in journal_records))
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+        return journal_file.tell()
+
+
+def read_journal_records(journal_file_path: str) -> List[Dict]:
+    """
+    Read the journal records from the journal, if any
+
+    :param journal_file_path: the path of the journal.
+    :return: the list of journal records, in the order in which they were appended
+
+    Note: a last record that was only partly written (e.g., because of a crash during the write) is discarded, since the
+            operation it describes was never acknowledged.
+    """
+
+    return tail_journal_records(journal_file_path)[ZERO_VALUE]
+
+
+def tail_journal_records(journal_file_path: str, offset: int = ZERO_VALUE) -> Tuple[List[Dict], int]:
+    """
+    Read the journal records appended to the journal from the given offset onwards, if any, such that a process reads
+    each record once, however long the journal has grown
+
+    :param journal_file_path: the path of the journal.
+    :param offset: the offset (in bytes) in the journal where the records to read start, e.g., the offset returned by
+                    the previous call.
+    :return: a tuple of the list of journal records, in the order in which they were appended, and the offset of the
+            end of the last record read
+    """
+
+    journal_records = []
+    try:
+        journal_file = open(journal_file_path, 'rb')
+    except FileNotFoundError:
+        return journal_records, offset
+
+    with journal_file:
+        journal_file.seek(offset)
+        for journal_line in journal_file:
+            try:
+                journal_records.append(json.loads(journal_line))
+            except json.JSONDecodeError:
+                logging.error(f"A partly written record was discarded from the journal at {journal_file_path}.")
+                break
+            offset += len(journal_line)
+    return journal_records, offset
+
+
+def replay_journal_records(contacts_dict: Dict, journal_records: List[Dict]) -> Dict:
+    """
+    Replay journal records on top of a snapshot of the dictionary of contacts
+
+    :param contacts_dict: the dictionary of contacts loaded from the last snapshot, which is modified in place.
+    :param journal_records: the journal records to replay, in the order in which they were appended.
+    :return: the dictionary of contacts with the journal records applied
+
+    Note: replaying is idempotent (creating an existing contact overwrites it, and deleting or updating a missing
+            contact is ignored), such that records already included in the snapshot can safely be replayed again.
+    """
+
+    position_by_id = {contact_id: position for position, contact_id in enumerate(contacts_dict['id'])}
+    positions_to_delete = set()
+
+    for journal_record in journal_records:
+        if journal_record['operation'] == JOURNAL_OPERATION_CHECKPOINT:
+            continue
+
+        contact_id = journal_record['id']
+        position = position_by_id.get(contact_id)
+
+        if journal_record['operation'] == JOURNAL_OPERATION_CREATE:
+            if position is None:
+                position_by_id[contact_id] = len(contacts_dict['id'])
+                for key in CONTACTS_DICT_KEYS:
+                    contacts_dict[key].append(contact_id if key == 'id' else journal_record['fields'][key])
+            else:
+                positions_to_delete.discard(position)
+                for key, value in journal_record['fields'].items():
+                    contacts_dict[key][position] = value
+
+        elif journal_record['operation'] == JOURNAL_OPERATION_UPDATE:
+            if position is not None and position not in positions_to_delete:
+                for key, value in journal_record['fields'].items():
+                    contacts_dict[key][position] = value
+
+        elif journal_record['operation'] == JOURNAL_OPERATION_DELETE:
+            if position is not None:
+                positions_to_delete.add(position)
+
+    # Remove the deleted contacts in a single pass rather than shifting the lists once per deletion
+    if positions_to_delete:
+        for key in CONTACTS_DICT_KEYS:
+            contacts_dict[key] = [
+                value for position, value in enumerate(contacts_dict[key]) if position not in positions_to_delete
+            ]
+
+    return contacts_dict
@@ -0,0 +1,353 @@
+# This Python file contains the opt-in instrumentation of the contacts' service and of the storage calls: a latency
+# histogram and counters of calls and errors for each operation, the bytes read from and written to each file, the
+# hit rates of the caches, a log of the operations slower than a threshold, and an optional capture of the profile of
+# the operations by cProfile. The metrics are collected in-process (see 'get_metrics') and can be dumped to a JSON or
+# Prometheus text file (see 'dump_metrics'). While the instrumentation is disabled, which is the default, an
+# instrumented function only checks a flag before running.
+
+import atexit
+import cProfile
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict
+
+from contact_book.src.contact_book.constants import (
+    ENVIRONMENT_VARIABLE_METRICS, ENVIRONMENT_VARIABLE_METRICS_FILE,
+    ENVIRONMENT_VARIABLE_PROFILE_FILE, METRICS_FILE_FORMAT_JSON,
+    METRICS_FILE_FORMAT_PROMETHEUS, METRICS_LATENCY_BUCKETS_SECONDS,
+    METRICS_PROMETHEUS_PREFIX, METRICS_SLOW_OPERATION_THRESHOLD_SECONDS,
+    ONE_VALUE, ZERO_VALUE)
+
+
+class MetricsRegistry:
+    """
+    The registry of the metrics collected by the instrumented functions, which is shared by the threads of the
+    application.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.slow_operation_threshold_seconds = METRICS_SLOW_OPERATION_THRESHOLD_SECONDS
+
+        # A single profiler is enabled by one thread at a time (the calls made meanwhile by other threads are timed but
+        # not profiled), as CPython does not allow several profilers to be enabled at once
+        self.profiler = None
+        self.profiler_lock = threading.Lock()
+
+        self.lock = threading.Lock()
+        self.latency_histograms = {}
+        self.error_counts = {}
+        self.bytes_read = {}
+        self.bytes_written = {}
+        self.cache_hits = {}
+        self.cache_misses = {}
+
+    def reset(self) -> None:
+
+        with self.lock:
+            self.latency_histograms.clear()
+            self.error_counts.clear()
+            self.bytes_read.clear()
+            self.bytes_written.clear()
+            self.cache_hits.clear()
+            self.cache_misses.clear()
+
+    def call_instrumented(self, operation_name: str, function: Callable, args: tuple, kwargs: dict):
+        """
+        Call a function, recording its latency (and whether it raised an error) under the given operation name, and
+        profiling it if the profiler is enabled
+
+        :param operation_name: the name of the operation, e.g., 'ContactsService.search_contacts'.
+        :param function: the function to call.
+        :param args: the positional arguments of the function.
+        :param kwargs: the keyword arguments of the function.
+        :return: the value returned by the function
+        """
+
+        profiler = self.profiler
+        is_profiling = profiler is not None and self.profiler_lock.acquire(blocking=False)
+        if is_profiling:
+            profiler.enable()
+
+        start_time = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            self.increment(self.error_counts, operation_name)
+            raise
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            if is_profiling:
+                profiler.disable()
+                self.profiler_lock.release()
+
+            self.record_latency(operation_name, elapsed_time)
+            if elapsed_time >= self.slow_operation_threshold_seconds:
+                logging.warning(f"Slow operation: {operation_name} took {elapsed_time:.3f} s.")
+
+    def record_latency(self, operation_name: str, elapsed_time: float) -> None:
+
+        bucket = bisect_left(METRICS_LATENCY_BUCKETS_SECONDS, elapsed_time)
+        with self.lock:
+            latency_histogram = self.latency_histograms.get(operation_name)
+            if latency_histogram is None:
+                latency_histogram = self.latency_histograms[operation_name] = {
+                    'bucket_counts': [ZERO_VALUE] * (len(METRICS_LATENCY_BUCKETS_SECONDS) + ONE_VALUE),
+                    'count': ZERO_VALUE,
+                    'total_seconds': 0.0,
+                    'max_seconds': 0.0
+                }
+            latency_histogram['bucket_counts'][bucket] += ONE_VALUE
+            latency_histogram['count'] += ONE_VALUE
+            latency_histogram['total_seconds'] += elapsed_time
+            latency_histogram['max_seconds'] = max(latency_histogram['max_seconds'], elapsed_time)
+
+    def increment(self, counts: Dict, name: str, amount: int = ONE_VALUE) -> None:
+
+        with self.lock:
+            counts[name] = counts.get(name, ZERO_VALUE) + amount
+
+    def get_snapshot(self) -> Dict:
+        """
+        Get a copy of the metrics collected so far
+
+        :return: a dictionary with the keys "operations" (for each operation, its number of calls and errors, total,
+                mean, and maximum latency, and the cumulative counts of its latency buckets, keyed by their upper bound
+                in seconds), "bytes_read" and "bytes_written" (for each file name, the bytes read or written), and
+                "caches" (for each cache, its hits, misses, and hit rate)
+        """
+
+        with self.lock:
+            operations = {}
+            for operation_name, latency_histogram in sorted(self.latency_histograms.items()):
+                cumulative_counts, cumulative_count = {}, ZERO_VALUE
+                bucket_bounds = [str(bound) for bound in METRICS_LATENCY_BUCKETS_SECONDS] + ['+Inf']
+                for bucket_bound, bucket_count in zip(bucket_bounds, latency_histogram['bucket_counts']):
+                    cumulative_count += bucket_count
+                    cumulative_counts[bucket_bound] = cumulative_count
+
+                operations[operation_name] = {
+                    'count': latency_histogram['count'],
+                    'errors': self.error_counts.get(operation_name, ZERO_VALUE),
+                    'total_seconds': latency_histogram['total_seconds'],
+                    'mean_seconds': latency_histogram['total_seconds'] / latency_histogram['count'],
+                    'max_seconds': latency_histogram['max_seconds'],
+                    'latency_buckets': cumulative_counts
+                }
+
+            caches = {}
+            for cache_name in sorted(set(self.cache_hits) | set(self.cache_misses)):
+                hits = self.cache_hits.get(cache_name, ZERO_VALUE)
+                misses = self.cache_misses.get(cache_name, ZERO_VALUE)
+                caches[cache_name] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}
+
+            return {
+                'operations': operations,
+                'bytes_read': dict(sorted(self.bytes_read.items())),
+                'bytes_written': dict(sorted(self.bytes_written.items())),
+                'caches': caches
+            }
+
+
+metrics_registry = MetricsRegistry()
+
+
+def instrument(operation_name: str) -> Callable:
+    """
+    Decorate a function such that its calls are recorded under the given operation name while the instrumentation is
+    enabled
+
+    :param operation_name: the name of the operation, e.g., 'utils.get_contacts_dict'.
+    :return: the decorator
+    """
+
+    def decorator(function: Callable) -> Callable:
+
+        @functools.wraps(function)
+        def instrumented_function(*args, **kwargs):
+            if not metrics_registry.enabled:
+                return function(*args, **kwargs)
+            return metrics_registry.call_instrumented(operation_name, function, args, kwargs)
+
+        return instrumented_function
+
+    return decorator
+
+
+def instrument_methods(instrumented_class: type) -> type:
+    """
+    Decorate a class such that the calls of its public methods (including its static methods) are recorded under the
+    name 'ClassName.method_name' while the instrumentation is enabled
+
+    :param instrumented_class: the class to instrument.
+    :return: the class, with its public methods instrumented
+    """
+
+    for attribute_name, attribute in list(vars(instrumented_class).items()):
+        if attribute_name.startswith('_'):
+            continue
+
+        operation_name = f'{instrumented_class.__name__}.{attribute_name}'
+        if isinstance(attribute, staticmethod):
+            setattr(instrumented_class, attribute_name, staticmethod(instrument(operation_name)(attribute.__func__)))
+        elif callable(attribute):
+            setattr(instrumented_class, attribute_name, instrument(operation_name)(attribute))
+
+    return instrumented_class
+
+
+def enable_metrics(slow_operation_threshold_seconds: float = None, profile: bool = False) -> None:
+    """
+    Enable the instrumentation
+
+    :param slow_operation_threshold_seconds: the latency from which an operation is logged as slow, if not the default.
+    :param profile: whether to capture the profile of the instrumented operations with cProfile (see 'dump_profile').
+    """
+
+    if slow_operation_threshold_seconds is not None:
+        metrics_registry.slow_operation_threshold_seconds = slow_operation_threshold_seconds
+    if profile and metrics_registry.profiler is None:
+        metrics_registry.profiler = cProfile.Profile()
+    metrics_registry.enabled = True
+
+
+def disable_metrics() -> None:
+
+    metrics_registry.enabled = False
+    with metrics_registry.profiler_lock:
+        metrics_registry.profiler = None
+    metrics_registry.slow_operation_threshold_seconds = METRICS_SLOW_OPERATION_THRESHOLD_SECONDS
+
+
+def reset_metrics() -> None:
+    metrics_registry.reset()
+
+
+def get_metrics() -> Dict:
+    return metrics_registry.get_snapshot()
+
+
+def record_bytes_read(file_name: str, number_of_bytes: int) -> None:
+    if metrics_registry.enabled:
+        metrics_registry.increment(metrics_registry.bytes_read, file_name, number_of_bytes)
+
+
+def record_bytes_written(file_name: str, number_of_bytes: int) -> None:
+    if metrics_registry.enabled:
+        metrics_registry.increment(metrics_registry.bytes_written, file_name, number_of_bytes)
+
+
+def record_cache_access(cache_name: str, is_hit: bool) -> None:
+    if metrics_registry.enabled:
+        metrics_registry.increment(metrics_registry.cache_hits if is_hit else metrics_registry.cache_misses, cache_name)
+
+
+def format_metrics_as_prometheus_text(metrics: Dict) -> str:
+    """
+    Format metrics in the Prometheus text exposition format
+
+    :param metrics: the metrics, as returned by 'get_metrics'.
+    :return: the text of the metrics, one sample per line
+    """
+
+    lines = [f'# TYPE {METRICS_PROMETHEUS_PREFIX}_operation_duration_seconds histogram']
+    for operation_name, operation_metrics in metrics['operations'].items():
+        for bucket_bound, cumulative_count in operation_metrics['latency_buckets'].items():
+            lines.append(
+                f'{METRICS_PROMETHEUS_PREFIX}_operation_duration_seconds_bucket'
+                f'{{operation="{operation_name}",le="{bucket_bound}"}} {cumulative_count}'
+            )
+        lines.append(
+            f'{METRICS_PROMETHEUS_PREFIX}_operation_duration_seconds_sum{{operation="{operation_name}"}} '
+            f'{operation_metrics["total_seconds"]}'
+        )
+        lines.append(
+            f'{METRICS_PROMETHEUS_PREFIX}_operation_duration_seconds_count{{operation="{operation_name}"}} '
+            f'{operation_metrics["count"]}'
+        )
+
+    lines.append(f'# TYPE {METRICS_PROMETHEUS_PREFIX}_operation_errors_total counter')
+    for operation_name, operation_metrics in metrics['operations'].items():
+        lines.append(
+            f'{METRICS_PROMETHEUS_PREFIX}_operation_errors_total{{operation="{operation_name}"}} '
+            f'{operation_metrics["errors"]}'
+        )
+
+    for direction in ('read', 'written'):
+        lines.append(f'# TYPE {METRICS_PROMETHEUS_PREFIX}_bytes_{direction}_total counter')
+        for file_name, number_of_bytes in metrics[f'bytes_{direction}'].items():
+            lines.append(f'{METRICS_PROMETHEUS_PREFIX}_bytes_{direction}_total{{file="{file_name}"}} {number_of_bytes}')
+
+    for cache_measure in ('hits', 'misses'):
+        lines.append(f'# TYPE {METRICS_PROMETHEUS_PREFIX}_cache_{cache_measure}_total counter')
+        for cache_name, cache_metrics in metrics['caches'].items():
+            lines.append(
+                f'{METRICS_PROMETHEUS_PREFIX}_cache_{cache_measure}_total{{cache="{cache_name}"}} '
+                f'{cache_metrics[cache_measure]}'
+            )
+
+    return '\n'.join(lines) + '\n'
+
+
+def dump_metrics(file_path: str, file_format: str = None) -> None:
+    """
+    Dump the metrics collected so far to a file
+
+    :param file_path: the path of the file.
+    :param file_format: 'json' or 'prometheus' (the text exposition format); by default, 'json' if the name of the
+                        file ends with '.json', 'prometheus' otherwise.
+    """
+
+    if file_format is None:
+        file_format = METRICS_FILE_FORMAT_JSON if file_path.endswith('.json') else METRICS_FILE_FORMAT_PROMETHEUS
+
+    metrics = get_metrics()
+    with open(file_path, 'w') as metrics_file:
+        if file_format == METRICS_FILE_FORMAT_JSON:
+            json.dump(metrics, metrics_file, indent=4)
+        elif file_format == METRICS_FILE_FORMAT_PROMETHEUS:
+            metrics_file.write(format_metrics_as_prometheus_text(metrics))
+        else:
+            raise ValueError(f"Unknown metrics file format: {file_format}.")
+
+
+def dump_profile(file_path: str) -> None:
+    """
+    Dump the profile captured by cProfile since the instrumentation was enabled with 'profile=True', which can be
+    read with the 'pstats' module (e.g., 'python -m pstats <file>') or tools such as snakeviz
+
+    :param file_path: the path of the file.
+    """
+
+    with metrics_registry.profiler_lock:
+        if metrics_registry.profiler is None:
+            raise ValueError("The profile of the operations is not being captured.")
+        metrics_registry.profiler.dump_stats(file_path)
+
+
+def enable_metrics_from_environment() -> None:
+    """
+    Enable the instrumentation if the environment variable 'CONTACT_BOOK_METRICS' is set (to anything but '0'), and
+    dump the metrics and the profile when the application exits to the files named by 'CONTACT_BOOK_METRICS_FILE' and
+    'CONTACT_BOOK_PROFILE_FILE', if set
+    """
+
+    if os.environ.get(ENVIRONMENT_VARIABLE_METRICS, '') in ('', '0'):
+        return
+
+    profile_file_path = os.environ.get(ENVIRONMENT_VARIABLE_PROFILE_FILE)
+    enable_metrics(profile=profile_file_path is not None)
+
+    metrics_file_path = os.environ.get(ENVIRONMENT_VARIABLE_METRICS_FILE)
+    if metrics_file_path is not None:
+        atexit.register(dump_metrics, metrics_file_path)
+    if profile_file_path is not None:
+        atexit.register(dump_profile, profile_file_path)
+
+
+enable_metrics_from_environment()
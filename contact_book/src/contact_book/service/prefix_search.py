@@ -0,0 +1,119 @@
+# This Python file contains the prefix search engine used to search for contacts as the user types, which answers a
+# query with two binary searches (lower and upper bounds) over a presorted array of case-folded keys, such that each
+# keystroke costs O(log n) plus the number of results listed, rather than a scan of every contact.
+
+import re
+from typing import Dict, List, Tuple
+
+from contact_book.src.contact_book.constants import (ONE_VALUE,
+                                                     SEARCH_RESULTS_LIMIT,
+                                                     ZERO_VALUE)
+
+from .binary_search import (binary_search, find_prefix_range,
+                            merge_sorted_keys, remove_sorted_keys)
+from .contact_index import ContactIndex
+
+WHITESPACE_REGEX = re.compile(r'\s+')
+
+
+def normalise_search_key(text: str) -> str:
+    """
+    Normalise a name or a query to the form in which it is compared by the prefix search engine
+
+    :param text: the text to normalise, e.g., '  Sheldon   COOPER'.
+    :return: the case-folded text without leading whitespace and with any run of whitespace collapsed into a single
+            space, e.g., 'sheldon cooper'
+    """
+
+    return WHITESPACE_REGEX.sub(' ', text.casefold().lstrip())
+
+
+class PrefixSearchIndex(ContactIndex):
+    """
+    An index of two case-folded keys per contact, 'surname forename' and 'forename surname', sorted together, such that
+    a query matches the contacts whose surname or forename starts with it (e.g., 'coo' or 'shel'), as well as the ones
+    whose full name starts with it in either order (e.g., 'sheldon co' or 'cooper sh').
+    """
+
+    def __init__(self):
+
+        # 'sorted_keys' is a sorted list of tuples (key, id), e.g., [('cooper sheldon', 16), ('sheldon cooper', 16)]
+        self.sorted_keys = []
+
+    @staticmethod
+    def get_search_keys(contact_id: int, contact: Dict) -> List:
+        forename = normalise_search_key(contact['forename'])
+        surname = normalise_search_key(contact['surname'])
+        return [(surname + ' ' + forename, contact_id), (forename + ' ' + surname, contact_id)]
+
+    def build(self, contacts_dict: Dict):
+
+        self.sorted_keys = sorted(
+            search_key
+            for contact_id, forename, surname in zip(
+                contacts_dict['id'], contacts_dict['forename'], contacts_dict['surname'])
+            for search_key in self.get_search_keys(contact_id, {'forename': forename, 'surname': surname})
+        )
+
+    def add_contact(self, contact_id: int, contact: Dict):
+
+        for search_key in self.get_search_keys(contact_id, contact):
+            self.sorted_keys.insert(binary_search(self.sorted_keys, search_key), search_key)
+
+    def add_contacts(self, contacts: List[Tuple[int, Dict]]):
+
+        self.sorted_keys = merge_sorted_keys(self.sorted_keys, (
+            search_key
+            for contact_id, contact in contacts
+            for search_key in self.get_search_keys(contact_id, contact)
+        ))
+
+    def remove_contact(self, contact_id: int, contact: Dict):
+
+        for search_key in self.get_search_keys(contact_id, contact):
+            position = binary_search(self.sorted_keys, search_key)
+            if position < len(self.sorted_keys) and self.sorted_keys[position] == search_key:
+                del self.sorted_keys[position]
+
+    def remove_contacts(self, contacts: List[Tuple[int, Dict]]):
+
+        self.sorted_keys = remove_sorted_keys(self.sorted_keys, (
+            search_key
+            for contact_id, contact in contacts
+            for search_key in self.get_search_keys(contact_id, contact)
+        ))
+
+    def update_contacts(self, contacts: List[Tuple[int, Dict, Dict]]):
+
+        self.remove_contacts([(contact_id, contact_before_update) for contact_id, contact_before_update, _ in contacts])
+        self.add_contacts([(contact_id, contact_after_update) for contact_id, _, contact_after_update in contacts])
+
+    def search(self, query: str, limit: int = SEARCH_RESULTS_LIMIT) -> List[int]:
+        """
+        Search for the contacts whose surname, forename, or full name starts with a query
+
+        :param query: the query typed by the user, e.g., 'Sheldon Co'; it is case-insensitive.
+        :param limit: the maximum number of contacts to return.
+        :return: the list of ids of the contacts found (at most 'limit' of them, i.e., none if it is not positive), in the
+                order of their search keys
+        """
+
+        if limit <= ZERO_VALUE:
+            return []
+
+        normalised_query = normalise_search_key(query)
+        start_index, end_index = find_prefix_range(self.sorted_keys, normalised_query)
+
+        # A contact may match on both of their keys, such that they are only returned once. The range is walked by
+        # position rather than sliced, such that a short query (e.g., 'a') does not copy a large part of the keys.
+        contact_ids_found = []
+        contact_ids_seen = set()
+        for position in range(start_index, end_index):
+            contact_id = self.sorted_keys[position][ONE_VALUE]
+            if contact_id not in contact_ids_seen:
+                contact_ids_seen.add(contact_id)
+                contact_ids_found.append(contact_id)
+                if len(contact_ids_found) == limit:
+                    break
+        return contact_ids_found
+
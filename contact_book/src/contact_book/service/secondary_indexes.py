@@ -0,0 +1,157 @@
+# This Python file contains the secondary indexes on the contacts' email addresses and mobile numbers, which answer the
+# lookups of the contacts having an email address at a given domain (e.g., 'example.com') and of the contacts whose
+# mobile number ends with given digits (e.g., '4821') without scanning every contact.
+
+import re
+from bisect import insort
+from typing import Dict, List, Tuple
+
+from contact_book.src.contact_book.constants import ONE_VALUE
+
+from .binary_search import (binary_search, find_prefix_range,
+                            merge_sorted_keys, remove_sorted_keys)
+from .contact_index import ContactIndex
+
+NON_DIGIT_REGEX = re.compile(r'\D')
+
+
+def get_email_domain(email_address: str) -> str:
+    """
+    Get the domain of an email address, case-folded
+
+    :param email_address: the email address, e.g., 'sheldor@MyPhdMail.com'.
+    :return: the domain of the email address, e.g., 'myphdmail.com', or an empty string if it has no '@'
+    """
+
+    _, at_sign, email_domain = email_address.strip().rpartition('@')
+    return email_domain.casefold() if at_sign else ''
+
+
+def normalise_mobile_number(mobile_number: str) -> str:
+    """
+    Normalise a mobile number to its digits only
+
+    :param mobile_number: the mobile number, e.g., '+44 (0)7700 900-482'.
+    :return: the digits of the mobile number, e.g., '4407700900482'
+    """
+
+    return NON_DIGIT_REGEX.sub('', mobile_number)
+
+
+class EmailDomainIndex(ContactIndex):
+    """
+    An index mapping each email domain to the ids of the contacts having an email address at that domain.
+    """
+
+    def __init__(self):
+
+        # 'contact_ids_by_email_domain' maps each domain to a set of ids of contacts, e.g., {'myphdmail.com': {16}}
+        self.contact_ids_by_email_domain = {}
+
+    def add_contact(self, contact_id: int, contact: Dict):
+
+        email_domain = get_email_domain(contact['email_address'])
+        if email_domain:
+            self.contact_ids_by_email_domain.setdefault(email_domain, set()).add(contact_id)
+
+    def remove_contact(self, contact_id: int, contact: Dict):
+
+        email_domain = get_email_domain(contact['email_address'])
+        contact_ids = self.contact_ids_by_email_domain.get(email_domain)
+        if contact_ids is not None:
+            contact_ids.discard(contact_id)
+            if not contact_ids:
+                del self.contact_ids_by_email_domain[email_domain]
+
+    def update_contact(self, contact_id: int, contact_before_update: Dict, contact_after_update: Dict):
+
+        if contact_before_update['email_address'] != contact_after_update['email_address']:
+            super().update_contact(contact_id, contact_before_update, contact_after_update)
+
+    def find(self, email_domain: str) -> List[int]:
+        """
+        Find the contacts having an email address at a domain
+
+        :param email_domain: the domain, e.g., 'example.com' (case-insensitive, a leading '@' is ignored).
+        :return: the sorted list of ids of the contacts found
+        """
+
+        return sorted(self.contact_ids_by_email_domain.get(email_domain.strip().lstrip('@').casefold(), ()))
+
+
+class MobileNumberSuffixIndex(ContactIndex):
+    """
+    An index of the contacts' normalised mobile numbers with their digits reversed, sorted, such that the mobile
+    numbers ending with given digits are found by a prefix range query on the reversed digits, i.e., in O(log n).
+    """
+
+    def __init__(self):
+
+        # 'sorted_keys' is a sorted list of tuples (reversed digits, id), e.g., [('37000000000', 16), etc.]
+        self.sorted_keys = []
+
+    @staticmethod
+    def get_key(contact_id: int, contact: Dict) -> tuple:
+        return normalise_mobile_number(contact['mobile_number'])[::-1], contact_id
+
+    def build(self, contacts_dict: Dict):
+
+        self.sorted_keys = sorted(
+            self.get_key(contact_id, {'mobile_number': mobile_number})
+            for contact_id, mobile_number in zip(contacts_dict['id'], contacts_dict['mobile_number'])
+        )
+
+    def add_contact(self, contact_id: int, contact: Dict):
+
+        insort(self.sorted_keys, self.get_key(contact_id, contact))
+
+    def add_contacts(self, contacts: List[Tuple[int, Dict]]):
+
+        self.sorted_keys = merge_sorted_keys(
+            self.sorted_keys,
+            (self.get_key(contact_id, contact) for contact_id, contact in contacts)
+        )
+
+    def remove_contact(self, contact_id: int, contact: Dict):
+
+        key = self.get_key(contact_id, contact)
+        position = binary_search(self.sorted_keys, key)
+        if position < len(self.sorted_keys) and self.sorted_keys[position] == key:
+            del self.sorted_keys[position]
+
+    def remove_contacts(self, contacts: List[Tuple[int, Dict]]):
+
+        self.sorted_keys = remove_sorted_keys(
+            self.sorted_keys,
+            (self.get_key(contact_id, contact) for contact_id, contact in contacts)
+        )
+
+    def update_contact(self, contact_id: int, contact_before_update: Dict, contact_after_update: Dict):
+
+        if contact_before_update['mobile_number'] != contact_after_update['mobile_number']:
+            super().update_contact(contact_id, contact_before_update, contact_after_update)
+
+    def update_contacts(self, contacts: List[Tuple[int, Dict, Dict]]):
+
+        contacts = [
+            (contact_id, contact_before_update, contact_after_update)
+            for contact_id, contact_before_update, contact_after_update in contacts
+            if contact_before_update['mobile_number'] != contact_after_update['mobile_number']
+        ]
+        self.remove_contacts([(contact_id, contact_before_update) for contact_id, contact_before_update, _ in contacts])
+        self.add_contacts([(contact_id, contact_after_update) for contact_id, _, contact_after_update in contacts])
+
+    def find(self, mobile_number_suffix: str) -> List[int]:
+        """
+        Find the contacts whose mobile number ends with given digits
+
+        :param mobile_number_suffix: the last digits of the mobile number, e.g., '4821' (non-digits are ignored).
+        :return: the sorted list of ids of the contacts found
+        """
+
+        reversed_suffix = normalise_mobile_number(mobile_number_suffix)[::-1]
+        if not reversed_suffix:
+            return []
+
+        start_index, end_index = find_prefix_range(self.sorted_keys, reversed_suffix)
+        return sorted(self.sorted_keys[position][ONE_VALUE] for position in range(start_index, end_index))
@@ -0,0 +1,242 @@
+# This Python file contains the index of contacts sorted in alphabetical order of their surnames (and then forenames
+# and ids), which is built once and then maintained incrementally via binary search (bisect) as contacts are created,
+# updated, or removed, such that the list of contacts displayed on the GUI never needs to be sorted again.
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_LIST_CHANGE_INSERT, CONTACTS_LIST_CHANGE_MOVE,
+    CONTACTS_LIST_CHANGE_REMOVE, CONTACTS_LIST_CHANGE_RESET, ZERO_VALUE)
+
+from .binary_search import merge_sorted_keys, remove_sorted_keys
+from .contact_index import ContactIndex
+
+
+def create_contacts_list_change(change: str, position: int, new_position: int = None) -> Dict:
+    """
+    Create a change of the list of contacts in the order in which they are listed on the GUI
+
+    :param change: the change, i.e., 'insert', 'remove', 'move', or 'reset' (i.e., any number of contacts changed, such
+                    that the list is to be displayed again).
+    :param position: the position at which the contact was inserted, from which they were removed, or from which they
+                    were moved.
+    :param new_position: the position to which the contact was moved, after removing them from 'position'; None for an
+                        insertion or a removal.
+    :return: the change as a dictionary, e.g., {'change': 'move', 'position': 4, 'new_position': 0}
+    """
+
+    contacts_list_change = {'change': change, 'position': position}
+    if new_position is not None:
+        contacts_list_change['new_position'] = new_position
+    return contacts_list_change
+
+
+class SortedContactIndex(ContactIndex):
+    """
+    An index of the contacts sorted by the key (surname, forename, id), which gives the order in which the contacts
+    are listed on the GUI. Finding the position of a contact to add or remove is a binary search, i.e., O(log n).
+    """
+
+    def __init__(self, contacts_dict: Dict = None):
+
+        # 'sorted_keys' is a sorted list of tuples (surname, forename, id), e.g., [('Beckett', 'Kate', 1), etc.]
+        self.sorted_keys = []
+
+        # Functions called with each change of the sorted index (see 'create_contacts_list_change'), e.g., to update the
+        # contacts displayed on the GUI row by row
+        self.change_listeners = []
+
+        if contacts_dict is not None:
+            self.build(contacts_dict)
+
+    def build(self, contacts_dict: Dict):
+
+        # Sorting all the keys at once is O(n log n), whereas adding them one at a time would be O(n^2)
+        self.sorted_keys = sorted(zip(contacts_dict['surname'], contacts_dict['forename'], contacts_dict['id']))
+
+    @staticmethod
+    def get_sort_key(contact_id: int, contact: Dict) -> Tuple:
+        return contact['surname'], contact['forename'], contact_id
+
+    def add_change_listener(self, change_listener: Callable[[Dict], None]) -> None:
+        self.change_listeners.append(change_listener)
+
+    def remove_change_listener(self, change_listener: Callable[[Dict], None]) -> None:
+        self.change_listeners.remove(change_listener)
+
+    def notify_change_listeners(self, contacts_list_change: Dict) -> None:
+        for change_listener in self.change_listeners:
+            change_listener(contacts_list_change)
+
+    def __len__(self) -> int:
+        return len(self.sorted_keys)
+
+    def __getitem__(self, position: int) -> Tuple:
+        return self.sorted_keys[position]
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return iter(self.sorted_keys)
+
+    def get_position(self, contact_id: int, contact: Dict) -> int:
+        """
+        Get the position of a contact in the sorted index
+
+        :param contact_id: the id of the contact.
+        :param contact: the details of the contact, as they were indexed.
+        :return: the position of the contact in the sorted index
+        """
+
+        sort_key = self.get_sort_key(contact_id, contact)
+        position = bisect_left(self.sorted_keys, sort_key)
+        if position == len(self.sorted_keys) or self.sorted_keys[position] != sort_key:
+            raise KeyError(f"The contact of id {contact_id} is not in the sorted index.")
+        return position
+
+    def add_contact(self, contact_id: int, contact: Dict) -> int:
+        """
+        Add a contact to the sorted index at the position given by binary search
+
+        :param contact_id: the id of the contact to add.
+        :param contact: the details of the contact to add.
+        :return: the position at which the contact was added
+        """
+
+        sort_key = self.get_sort_key(contact_id, contact)
+        position = bisect_left(self.sorted_keys, sort_key)
+        self.sorted_keys.insert(position, sort_key)
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_INSERT, position))
+        return position
+
+    def add_contacts(self, contacts: List[Tuple[int, Dict]]):
+        """
+        Add a batch of contacts to the sorted index at once, by merging their keys into the ones already indexed, which
+        copies the index once rather than once per contact added
+
+        :param contacts: a list of tuples (id, details) of the contacts to add.
+        """
+
+        self.sorted_keys = merge_sorted_keys(
+            self.sorted_keys,
+            (self.get_sort_key(contact_id, contact) for contact_id, contact in contacts)
+        )
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_RESET, ZERO_VALUE))
+
+    def remove_contact(self, contact_id: int, contact: Dict) -> int:
+        """
+        Remove a contact from the sorted index, finding their position by binary search
+
+        :param contact_id: the id of the contact to remove.
+        :param contact: the details of the contact to remove, as they were indexed.
+        :return: the position from which the contact was removed
+        """
+
+        position = self.get_position(contact_id, contact)
+        del self.sorted_keys[position]
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_REMOVE, position))
+        return position
+
+    def remove_contacts(self, contacts: List[Tuple[int, Dict]]):
+        """
+        Remove a batch of contacts from the sorted index at once, in a single pass over the keys indexed
+
+        :param contacts: a list of tuples (id, details as they were indexed) of the contacts to remove.
+        """
+
+        self.sorted_keys = remove_sorted_keys(
+            self.sorted_keys,
+            (self.get_sort_key(contact_id, contact) for contact_id, contact in contacts)
+        )
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_RESET, ZERO_VALUE))
+
+    def update_contact(self, contact_id: int, contact_before_update: Dict, contact_after_update: Dict):
+        """
+        Update a contact in the sorted index, moving them to their new position if their surname or forename changed
+
+        :param contact_id: the id of the contact to update.
+        :param contact_before_update: the details of the contact before the update, as they were indexed.
+        :param contact_after_update: the details of the contact after the update.
+        """
+
+        sort_key = self.get_sort_key(contact_id, contact_after_update)
+        position = self.get_position(contact_id, contact_before_update)
+        if self.sorted_keys[position] == sort_key:
+            return
+
+        # The contact is moved with a single change, even if their position stays the same, as their name changed
+        del self.sorted_keys[position]
+        new_position = bisect_left(self.sorted_keys, sort_key)
+        self.sorted_keys.insert(new_position, sort_key)
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_MOVE, position, new_position))
+
+    def update_contacts(self, contacts: List[Tuple[int, Dict, Dict]]):
+        """
+        Update a batch of contacts in the sorted index at once, by removing the keys of the contacts before the update
+        in a single pass and merging the keys after the update, such that the list is only displayed again once
+
+        :param contacts: a list of tuples (id, details before the update, details after the update) of the contacts to
+                        update.
+        """
+
+        sorted_keys_kept = remove_sorted_keys(
+            self.sorted_keys,
+            (self.get_sort_key(contact_id, contact_before_update) for contact_id, contact_before_update, _ in contacts)
+        )
+        self.sorted_keys = merge_sorted_keys(
+            sorted_keys_kept,
+            (self.get_sort_key(contact_id, contact_after_update) for contact_id, _, contact_after_update in contacts)
+        )
+        self.notify_change_listeners(create_contacts_list_change(CONTACTS_LIST_CHANGE_RESET, ZERO_VALUE))
+
+    def get_contact_entry(self, position: int) -> Tuple:
+        """
+        Get the contact at a position of the sorted index as listed on the GUI
+
+        :param position: the position of the contact in the sorted index.
+        :return: a tuple of two elements (id, 'Forename Surname'), e.g., (1, 'Kate Beckett')
+        """
+
+        surname, forename, contact_id = self.sorted_keys[position]
+        return contact_id, forename + " " + surname
+
+    def get_display_name(self, position: int) -> str:
+        """
+        Get the name of the contact at a position of the sorted index as displayed on the GUI
+
+        :param position: the position of the contact in the sorted index.
+        :return: the name of the contact as 'Forename Surname', e.g., 'Kate Beckett'
+        """
+
+        surname, forename, _ = self.sorted_keys[position]
+        return forename + " " + surname
+
+    def get_contacts_list(self) -> List[Tuple]:
+        """
+        Get the list of contacts in the order in which they are listed on the GUI
+
+        :return: a list of tuples of two elements for each contact (id, 'Forename Surname'), e.g.,
+                [(1, 'Kate Beckett'), (2, 'Richard Castle'), etc.]
+        """
+
+        return [(contact_id, forename + " " + surname) for surname, forename, contact_id in self.sorted_keys]
+
+
+class ContactsListView:
+    """
+    A read-only, live view of the contacts of a sorted index in the order in which they are listed on the GUI, which
+    behaves as the list of tuples (id, 'Forename Surname') returned by 'get_contacts_list', but builds each tuple on
+    demand, such that listing the contacts does not copy all of them.
+    """
+
+    def __init__(self, sorted_index: SortedContactIndex):
+        self.sorted_index = sorted_index
+
+    def __len__(self) -> int:
+        return len(self.sorted_index)
+
+    def __getitem__(self, position: int) -> Tuple:
+        return self.sorted_index.get_contact_entry(position)
+
+    def __iter__(self) -> Iterator[Tuple]:
+        for position in range(len(self.sorted_index)):
+            yield self.sorted_index.get_contact_entry(position)
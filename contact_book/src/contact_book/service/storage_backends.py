@@ -0,0 +1,773 @@
+# This Python file contains the storage backends the contacts' store can save the contacts in: the contacts_dict.txt
+# file along with its journal of CRUD operations ('json'), an SQLite database with indexes on the contacts' id,
+# surname, email address, and mobile number ('sqlite'), and the contacts.bin binary file along with its journal
+# ('binary'). It also contains the command to migrate the contacts from the first to the others, and back from the
+# binary file to the contacts_dict.txt file.
+#
+# Several processes (e.g., two copies of the application, or the application and the HTTP server) may work on the same
+# contacts saved by the 'json' or 'binary' storage backend: their writes are serialised by a lock across processes
+# (see 'file_lock.py'), under which each process first merges the operations journaled by the others since it last
+# read the journal, by reading the records appended to it since, before journaling its own.
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from contextlib import nullcontext
+from typing import (Callable, ContextManager, Dict, Iterator, List, Optional,
+                    Tuple)
+
+from contact_book.root import get_contact_book_root
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, ENVIRONMENT_VARIABLE_STORAGE_BACKEND,
+    FILE_NAME_BINARY_CONTACTS_JOURNAL, FILE_NAME_CONTACTS_BINARY,
+    FILE_NAME_CONTACTS_DATABASE, FILE_NAME_CONTACTS_DICT,
+    FILE_NAME_CONTACTS_JOURNAL, FILE_NAME_ID_SEQUENCE,
+    FILE_NAME_SUFFIX_COMPACTING_JOURNAL, FILE_NAME_SUFFIX_COMPACTION_LOCK,
+    FILE_NAME_SUFFIX_LOCK, JOURNAL_COMPACTION_THRESHOLD_BYTES,
+    JOURNAL_OPERATION_CHECKPOINT, JOURNAL_OPERATION_CREATE,
+    JOURNAL_OPERATION_DELETE, JOURNAL_OPERATION_UPDATE, ONE_VALUE,
+    ROOT_DIR_CONTACTS_DICT_FILE,
+    STORAGE_BACKEND, STORAGE_BACKEND_BINARY, STORAGE_BACKEND_JSON,
+    STORAGE_BACKEND_SQLITE, USE_CONTACTS_JOURNAL, ZERO_VALUE)
+
+from .binary_contacts_file import BinaryContactsFile, write_binary_contacts_file
+from .file_lock import InterProcessLock
+from .journal import (append_journal_records, create_checkpoint_record,
+                      get_journal_file_path, read_journal_records,
+                      replay_journal_records, tail_journal_records)
+from .utils import (get_contacts_dict, get_id_sequence, save_contacts_dict,
+                    save_id_sequence, write_file_atomically)
+
+root_dir = get_contact_book_root()
+
+
+class StorageBackend:
+    """
+    The interface of a storage backend, which the contacts' store loads the contacts from once and then persists the
+    CRUD operations performed on them to, each described by a journal record (see 'journal.py').
+    """
+
+    # Version of the saved contacts known to this process, i.e., the number of operations persisted until then, which
+    # is incremented by each operation persisted (see 'assign_versions')
+    version = ZERO_VALUE
+
+    def load(self, progress_callback: Callable[[float], None] = None) -> Tuple[Dict, int]:
+        """
+        Load the saved contacts
+
+        :param progress_callback: a function called with the fraction of the saved contacts read (from 0 to 1) while
+                                they are loaded, if any and if the storage backend can tell.
+        :return: a tuple of the dictionary of contacts and the next id to be assigned to a new contact
+        """
+
+        raise NotImplementedError
+
+    def persist(self, journal_records: List[Dict], contacts_dict: Dict, next_id: int) -> None:
+        """
+        Persist the CRUD operations described by the given journal records
+
+        :param journal_records: the journal records describing the operations performed on the contacts.
+        :param contacts_dict: the dictionary of contacts with the operations already applied.
+        :param next_id: the next id to be assigned to a new contact.
+        """
+
+        raise NotImplementedError
+
+    def save(self, contacts_dict: Dict, next_id: int) -> None:
+        """
+        Save all contacts, replacing the ones previously saved
+
+        :param contacts_dict: the dictionary of contacts to save.
+        :param next_id: the next id to be assigned to a new contact.
+        """
+
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def lock(self) -> ContextManager:
+        """
+        Get the lock serialising the writes of the processes working on the saved contacts, which the store holds while
+        it merges the operations persisted by the other processes, performs an operation, and persists it. By default,
+        the saved contacts are not shared with other processes, such that there is nothing to lock.
+
+        :return: a (reentrant) context manager holding the lock
+        """
+
+        return nullcontext()
+
+    def acquire_lock(self, blocking: bool = True) -> bool:
+        """
+        Acquire the lock of the storage backend (see 'lock') explicitly, e.g., without waiting for the other processes
+        holding it, such that a caller that cannot wait (e.g., an event loop) can do something else meanwhile. It is
+        released by 'release_lock'.
+
+        :param blocking: whether to wait for the lock to be released if it is held, rather than give up straight away.
+        :return: True if the lock was acquired, False otherwise
+        """
+
+        return True
+
+    def release_lock(self) -> None:
+        pass
+
+    def has_new_journal_records(self) -> bool:
+        """
+        Check cheaply, without holding the lock, whether other processes persisted operations since this process last
+        read them, which is never the case by default
+
+        :return: True if there are operations to merge (see 'read_new_journal_records'), False otherwise
+        """
+
+        return False
+
+    def read_new_journal_records(self) -> Optional[List[Dict]]:
+        """
+        Read the journal records of the operations persisted by other processes since this process last read them, to
+        merge them into the contacts loaded, while holding the lock (see 'lock')
+
+        :return: the list of journal records, in the order in which they were persisted, or None if some of them can no
+                longer be read, in which case the saved contacts are to be loaded again
+        """
+
+        return []
+
+    def assign_versions(self, journal_records: List[Dict]) -> None:
+        """
+        Assign consecutive versions to the journal records of the operations to persist, following the version known to
+        this process
+
+        :param journal_records: the journal records, to which a "version" is added in place.
+        """
+
+        for journal_record in journal_records:
+            self.version += ONE_VALUE
+            journal_record['version'] = self.version
+
+
+class JsonFileStorageBackend(StorageBackend):
+    """
+    A storage backend saving a snapshot of the contacts in the contacts_dict.txt file, appending each CRUD operation to
+    a journal that is replayed on top of the snapshot when loading, and compacting the journal into a new snapshot in
+    the background once it has grown past a size threshold. The journal is shared by the processes working on the same
+    contacts, which read the records appended to it by the others from the offset where they last stopped.
+    """
+
+    def __init__(
+            self,
+            contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+            contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+            id_sequence_file_name: str = FILE_NAME_ID_SEQUENCE,
+            journal_file_name: str = FILE_NAME_CONTACTS_JOURNAL,
+            use_journal: bool = USE_CONTACTS_JOURNAL,
+            journal_compaction_threshold_bytes: int = JOURNAL_COMPACTION_THRESHOLD_BYTES
+    ):
+        self.contacts_file_root_dir = contacts_file_root_dir
+        self.contacts_file_name = contacts_file_name
+        self.id_sequence_file_name = id_sequence_file_name
+        self.use_journal = use_journal
+        self.journal_compaction_threshold_bytes = journal_compaction_threshold_bytes
+
+        self.journal_file_path = get_journal_file_path(contacts_file_root_dir, journal_file_name)
+        self.compacting_journal_file_path = self.journal_file_path + FILE_NAME_SUFFIX_COMPACTING_JOURNAL
+
+        # 'write_lock' serialises the writes of the processes (and threads) working on the saved contacts, whereas
+        # 'compaction_lock' is held while a snapshot is being saved, such that a journal being compacted by a process
+        # that died (i.e., released it) can be told apart from one being compacted by a process that is still running
+        self.write_lock = InterProcessLock(self.journal_file_path + FILE_NAME_SUFFIX_LOCK)
+        self.compaction_lock = InterProcessLock(self.journal_file_path + FILE_NAME_SUFFIX_COMPACTION_LOCK)
+        self.compaction_thread = None
+
+        # Position up to which this process has read the journal, i.e., the inode of the journal file (which changes
+        # when the journal is rotated for compaction) and the offset in it
+        self.journal_inode = None
+        self.journal_offset = ZERO_VALUE
+
+    def read_snapshot(self, progress_callback: Callable[[float], None] = None) -> Tuple[Dict, Optional[int]]:
+        """
+        Read the last saved snapshot of the contacts
+
+        :param progress_callback: a function called with the fraction of the snapshot read (from 0 to 1), if any.
+        :return: a tuple of the dictionary of contacts and the next id to be assigned to a new contact, which is None if
+                the id sequence has not been saved yet
+        """
+
+        return (
+            get_contacts_dict(self.contacts_file_root_dir, self.contacts_file_name, progress_callback),
+            get_id_sequence(self.contacts_file_root_dir, self.id_sequence_file_name)
+        )
+
+    def write_snapshot(self, contacts_dict: Dict, next_id: int) -> None:
+        """
+        Write a snapshot of the contacts and the id sequence, replacing the last saved one
+
+        :param contacts_dict: the dictionary of contacts to save.
+        :param next_id: the next id to be assigned to a new contact.
+        """
+
+        save_contacts_dict(contacts_dict, self.contacts_file_root_dir, self.contacts_file_name)
+        save_id_sequence(next_id, self.contacts_file_root_dir, self.id_sequence_file_name)
+
+    def has_journal_records(self) -> bool:
+        """
+        Check whether operations were journaled since the last snapshot was saved, i.e., whether the snapshot alone is
+        out of date
+
+        :return: True if the journal (or a journal being compacted) has other records than a checkpoint, False otherwise
+        """
+
+        for journal_file_path in (self.journal_file_path, self.compacting_journal_file_path):
+            try:
+                with open(journal_file_path, 'rb') as journal_file:
+                    first_journal_line, second_journal_line = journal_file.readline(), journal_file.readline()
+            except FileNotFoundError:
+                continue
+
+            if second_journal_line:
+                return True
+            try:
+                if first_journal_line and json.loads(first_journal_line)['operation'] != JOURNAL_OPERATION_CHECKPOINT:
+                    return True
+            except json.JSONDecodeError:
+                return True
+        return False
+
+    def lock(self) -> ContextManager:
+        return self.write_lock
+
+    def acquire_lock(self, blocking: bool = True) -> bool:
+        return self.write_lock.acquire(blocking)
+
+    def release_lock(self) -> None:
+        self.write_lock.release()
+
+    def load(self, progress_callback: Callable[[float], None] = None) -> Tuple[Dict, int]:
+
+        # The snapshot and the journals are read while no other process writes to them, and once any compaction in
+        # progress is over, such that the journal being compacted is not discarded between reading them
+        with self.write_lock, self.compaction_lock:
+            contacts_dict, next_id = self.read_snapshot(progress_callback)
+
+            # Replay the operations journaled since the last snapshot, including those of a compaction that was
+            # interrupted
+            compacting_journal_records = read_journal_records(self.compacting_journal_file_path)
+            journal_records, journal_offset = tail_journal_records(self.journal_file_path)
+            self.set_journal_position(journal_offset)
+
+            journal_records = compacting_journal_records + journal_records
+            replay_journal_records(contacts_dict, journal_records)
+            self.version = max(
+                (journal_record.get('version', ZERO_VALUE) for journal_record in journal_records), default=ZERO_VALUE
+            )
+
+            # The id sequence is only derived from the saved contacts the first time, i.e., before it has been
+            # persisted, and is then moved past the ids of the contacts created since it was last saved
+            if next_id is None:
+                next_id = max(contacts_dict['id'], default=0) + ONE_VALUE
+            for journal_record in journal_records:
+                if journal_record['operation'] == JOURNAL_OPERATION_CREATE:
+                    next_id = max(next_id, journal_record['id'] + ONE_VALUE)
+
+            if compacting_journal_records:
+                self.save(contacts_dict, next_id)
+
+        return contacts_dict, next_id
+
+    def set_journal_position(self, journal_offset: int) -> None:
+        """
+        Record the position up to which this process has read (or written) the journal.
+
+        :param journal_offset: the offset (in bytes) in the journal up to which it was read.
+        """
+
+        try:
+            self.journal_inode = os.stat(self.journal_file_path).st_ino
+        except FileNotFoundError:
+            self.journal_inode = None
+        self.journal_offset = journal_offset if self.journal_inode is not None else ZERO_VALUE
+
+    def has_new_journal_records(self) -> bool:
+
+        try:
+            journal_stat = os.stat(self.journal_file_path)
+        except FileNotFoundError:
+            return self.journal_inode is not None
+        return (journal_stat.st_ino, journal_stat.st_size) != (self.journal_inode, self.journal_offset)
+
+    def read_new_journal_records(self) -> Optional[List[Dict]]:
+
+        journal_records = []
+        with self.write_lock:
+            try:
+                journal_inode = os.stat(self.journal_file_path).st_ino
+            except FileNotFoundError:
+                journal_inode = None
+
+            journal_offset = self.journal_offset
+            if journal_inode != self.journal_inode:
+                # The journal last read was rotated for compaction since, such that the records appended to it in the
+                # meantime are read from the journal being compacted, unless the compaction is already over
+                try:
+                    compacting_journal_inode = os.stat(self.compacting_journal_file_path).st_ino
+                except FileNotFoundError:
+                    compacting_journal_inode = None
+                if self.journal_inode is not None and compacting_journal_inode == self.journal_inode:
+                    journal_records += tail_journal_records(self.compacting_journal_file_path, journal_offset)[0]
+                journal_offset = ZERO_VALUE
+
+            new_journal_records, journal_offset = tail_journal_records(self.journal_file_path, journal_offset)
+            journal_records += new_journal_records
+
+            # Only the records following the version known to this process are new, and they are to follow each other
+            # without any gap, which a checkpoint of a later version reveals (i.e., some of the records were compacted
+            # into a snapshot before this process could read them)
+            version = self.version
+            new_journal_records = []
+            for journal_record in journal_records:
+                if journal_record.get('version', ZERO_VALUE) <= version:
+                    continue
+                if journal_record['operation'] == JOURNAL_OPERATION_CHECKPOINT or \
+                        journal_record['version'] != version + ONE_VALUE:
+                    return None
+                new_journal_records.append(journal_record)
+                version = journal_record['version']
+
+            self.set_journal_position(journal_offset)
+            self.version = version
+            return new_journal_records
+
+    def persist(self, journal_records: List[Dict], contacts_dict: Dict, next_id: int) -> None:
+
+        # The store holds the write lock (or, for a batch of operations, the thread applying them does, see
+        # 'ContactStore.deferred_persistence'), having merged the operations persisted by the other processes
+        self.assign_versions(journal_records)
+
+        if not self.use_journal:
+            self.write_contacts(contacts_dict, next_id)
+            return
+
+        journal_size = append_journal_records(journal_records, self.journal_file_path)
+        self.set_journal_position(journal_size)
+        if journal_size >= self.journal_compaction_threshold_bytes and \
+                not os.path.exists(self.compacting_journal_file_path):
+            self.start_compaction(contacts_dict, next_id)
+
+    def is_compacting(self) -> bool:
+        return self.compaction_thread is not None and self.compaction_thread.is_alive()
+
+    def start_compaction(self, contacts_dict: Dict, next_id: int) -> None:
+        """
+        Start compacting the journal into a new snapshot of the contacts in the background. The journal is rotated
+        first, such that the operations performed during the compaction are appended to a new journal, which starts
+        with a checkpoint of the version of the contacts saved in the snapshot.
+
+        :param contacts_dict: the dictionary of contacts to save as the new snapshot.
+        :param next_id: the next id to be assigned to a new contact.
+
+        Note: it must be called while holding the 'write_lock'.
+        """
+
+        os.replace(self.journal_file_path, self.compacting_journal_file_path)
+        self.set_journal_position(
+            append_journal_records([create_checkpoint_record(self.version)], self.journal_file_path)
+        )
+
+        # Copy the columns, such that the snapshot is not affected by the operations performed during the compaction
+        contacts_dict_snapshot = {key: list(contacts_dict[key]) for key in CONTACTS_DICT_KEYS}
+
+        # The write lock is only released once the compaction lock is held by the thread compacting the journal, which
+        # releases it once done
+        compaction_lock_acquired = threading.Event()
+        self.compaction_thread = threading.Thread(
+            target=self.compact_journal,
+            args=(contacts_dict_snapshot, next_id, compaction_lock_acquired),
+            daemon=True
+        )
+        self.compaction_thread.start()
+        compaction_lock_acquired.wait()
+
+    def wait_for_compaction(self) -> None:
+        if self.compaction_thread is not None:
+            self.compaction_thread.join()
+
+    def compact_journal(
+            self, contacts_dict_snapshot: Dict, next_id: int, compaction_lock_acquired: threading.Event
+    ) -> None:
+
+        try:
+            self.compaction_lock.acquire()
+        finally:
+            compaction_lock_acquired.set()
+
+        try:
+            self.save_snapshot(contacts_dict_snapshot, next_id)
+        finally:
+            self.compaction_lock.release()
+
+    def save_snapshot(self, contacts_dict_snapshot: Dict, next_id: int) -> None:
+        """
+        Save a snapshot of the contacts and the id sequence to their output .txt files, and then discard the rotated
+        journal, whose operations are included in the snapshot.
+
+        :param contacts_dict_snapshot: the dictionary of contacts to save.
+        :param next_id: the next id to be assigned to a new contact.
+        """
+
+        self.write_snapshot(contacts_dict_snapshot, next_id)
+        if os.path.exists(self.compacting_journal_file_path):
+            os.remove(self.compacting_journal_file_path)
+
+    def save(self, contacts_dict: Dict, next_id: int) -> None:
+
+        with self.write_lock:
+            self.write_contacts(contacts_dict, next_id)
+
+    def write_contacts(self, contacts_dict: Dict, next_id: int) -> None:
+        """
+        Save all the contacts as a new snapshot while holding the write lock, once any compaction in progress is over,
+        replacing the journal, which it makes redundant, with a checkpoint of the version of the contacts saved
+
+        :param contacts_dict: the dictionary of contacts to save.
+        :param next_id: the next id to be assigned to a new contact.
+        """
+
+        with self.compaction_lock:
+            self.save_snapshot(contacts_dict, next_id)
+            write_file_atomically(
+                self.journal_file_path, json.dumps(create_checkpoint_record(self.version)) + '\n'
+            )
+            self.set_journal_position(os.path.getsize(self.journal_file_path))
+
+
+class BinaryFileStorageBackend(JsonFileStorageBackend):
+    """
+    A storage backend saving a snapshot of the contacts, along with the id sequence, in the contacts.bin binary file
+    (see 'binary_contacts_file.py'), which can be read at random without being parsed, and journaling each CRUD
+    operation as the 'json' storage backend does.
+    """
+
+    def __init__(
+            self,
+            contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+            binary_file_name: str = FILE_NAME_CONTACTS_BINARY,
+            journal_file_name: str = FILE_NAME_BINARY_CONTACTS_JOURNAL,
+            use_journal: bool = USE_CONTACTS_JOURNAL,
+            journal_compaction_threshold_bytes: int = JOURNAL_COMPACTION_THRESHOLD_BYTES
+    ):
+        super().__init__(
+            contacts_file_root_dir,
+            contacts_file_name=binary_file_name,
+            journal_file_name=journal_file_name,
+            use_journal=use_journal,
+            journal_compaction_threshold_bytes=journal_compaction_threshold_bytes
+        )
+        self.binary_file_path = root_dir + '/' + contacts_file_root_dir + binary_file_name
+
+    def read_snapshot(self, progress_callback: Callable[[float], None] = None) -> Tuple[Dict, Optional[int]]:
+
+        # The records are decoded out of a memory map in a single pass, whose progress is not reported
+        with BinaryContactsFile(self.binary_file_path) as binary_contacts_file:
+            return binary_contacts_file.get_contacts_dict(), binary_contacts_file.next_id
+
+    def write_snapshot(self, contacts_dict: Dict, next_id: int) -> None:
+        write_binary_contacts_file(contacts_dict, next_id, self.binary_file_path)
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """
+    A storage backend saving the contacts in an SQLite database, with one row per contact and indexes on the contacts'
+    id (primary key), surname, email address, and mobile number, such that each CRUD operation is persisted as a
+    single-row statement and lookups and sorted listings run as indexed queries.
+    """
+
+    def __init__(
+            self,
+            contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+            database_file_name: str = FILE_NAME_CONTACTS_DATABASE
+    ):
+        self.database_file_path = root_dir + '/' + contacts_file_root_dir + database_file_name
+
+        # The connection is shared by the threads of the application, which is made safe by 'persistence_lock'
+        self.persistence_lock = threading.Lock()
+        self.connection = sqlite3.connect(self.database_file_path, check_same_thread=False)
+        self.create_tables()
+
+    def create_tables(self) -> None:
+
+        with self.persistence_lock, self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS contacts (
+                    id INTEGER PRIMARY KEY,
+                    forename TEXT NOT NULL,
+                    surname TEXT NOT NULL,
+                    email_address TEXT NOT NULL,
+                    mobile_number TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS contacts_surname_index ON contacts (surname, forename);
+                CREATE INDEX IF NOT EXISTS contacts_email_address_index ON contacts (email_address);
+                CREATE INDEX IF NOT EXISTS contacts_mobile_number_index ON contacts (mobile_number);
+                CREATE TABLE IF NOT EXISTS id_sequence (next_id INTEGER NOT NULL);
+            """)
+
+    def load(self, progress_callback: Callable[[float], None] = None) -> Tuple[Dict, int]:
+
+        contacts_dict = {key: [] for key in CONTACTS_DICT_KEYS}
+        with self.persistence_lock:
+            for contact_row in self.connection.execute(
+                    "SELECT id, forename, surname, email_address, mobile_number FROM contacts ORDER BY id"):
+                for key, value in zip(CONTACTS_DICT_KEYS, contact_row):
+                    contacts_dict[key].append(value)
+            id_sequence_row = self.connection.execute("SELECT next_id FROM id_sequence").fetchone()
+
+        if id_sequence_row is None:
+            next_id = max(contacts_dict['id'], default=0) + ONE_VALUE
+        else:
+            next_id = id_sequence_row[0]
+        return contacts_dict, next_id
+
+    def persist(self, journal_records: List[Dict], contacts_dict: Dict, next_id: int) -> None:
+
+        # All the operations are persisted in a single transaction
+        with self.persistence_lock, self.connection:
+            for journal_record in journal_records:
+                self.execute_journal_record(journal_record)
+            self.save_id_sequence(next_id)
+
+    def execute_journal_record(self, journal_record: Dict) -> None:
+        """
+        Execute the single-row SQL statement corresponding to a journal record
+
+        :param journal_record: the journal record describing a create, update, or delete operation.
+        """
+
+        if journal_record['operation'] == JOURNAL_OPERATION_CREATE:
+            contact_fields = journal_record['fields']
+            self.connection.execute(
+                "INSERT OR REPLACE INTO contacts (id, forename, surname, email_address, mobile_number) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (journal_record['id'], contact_fields['forename'], contact_fields['surname'],
+                 contact_fields['email_address'], contact_fields['mobile_number'])
+            )
+        elif journal_record['operation'] == JOURNAL_OPERATION_UPDATE:
+            # Only known column names are interpolated into the statement, the values are bound as parameters
+            changed_keys = [key for key in CONTACTS_DICT_KEYS if key in journal_record['fields']]
+            self.connection.execute(
+                "UPDATE contacts SET " + ", ".join(key + " = ?" for key in changed_keys) + " WHERE id = ?",
+                [journal_record['fields'][key] for key in changed_keys] + [journal_record['id']]
+            )
+        elif journal_record['operation'] == JOURNAL_OPERATION_DELETE:
+            self.connection.execute("DELETE FROM contacts WHERE id = ?", (journal_record['id'],))
+
+    def save_id_sequence(self, next_id: int) -> None:
+
+        self.connection.execute("DELETE FROM id_sequence")
+        self.connection.execute("INSERT INTO id_sequence (next_id) VALUES (?)", (next_id,))
+
+    def save(self, contacts_dict: Dict, next_id: int) -> None:
+
+        with self.persistence_lock, self.connection:
+            self.connection.execute("DELETE FROM contacts")
+            self.connection.executemany(
+                "INSERT INTO contacts (id, forename, surname, email_address, mobile_number) VALUES (?, ?, ?, ?, ?)",
+                zip(*(contacts_dict[key] for key in CONTACTS_DICT_KEYS))
+            )
+            self.save_id_sequence(next_id)
+
+    def get_contact(self, contact_id: int) -> Optional[Dict]:
+        """
+        Get the details of a contact by their id via the primary key index
+
+        :param contact_id: the id of the contact to get.
+        :return: a dictionary with the details of the contact, or None if no contact has the given id
+        """
+
+        with self.persistence_lock:
+            contact_row = self.connection.execute(
+                "SELECT id, forename, surname, email_address, mobile_number FROM contacts WHERE id = ?", (contact_id,)
+            ).fetchone()
+        return None if contact_row is None else dict(zip(CONTACTS_DICT_KEYS, contact_row))
+
+    def find_contacts(self, key: str, value: str) -> List[Dict]:
+        """
+        Find the contacts whose surname, email address, or mobile number is equal to the given value via its index
+
+        :param key: the field to look up, i.e., 'surname', 'email_address', or 'mobile_number'.
+        :param value: the value to look up.
+        :return: a list of dictionaries with the details of the contacts found
+        """
+
+        if key not in ('surname', 'email_address', 'mobile_number'):
+            raise ValueError(f"Contacts cannot be looked up by {key}, as it is not indexed.")
+
+        with self.persistence_lock:
+            contact_rows = self.connection.execute(
+                "SELECT id, forename, surname, email_address, mobile_number FROM contacts WHERE " + key + " = ? "
+                "ORDER BY id", (value,)
+            ).fetchall()
+        return [dict(zip(CONTACTS_DICT_KEYS, contact_row)) for contact_row in contact_rows]
+
+    def iter_contacts_sorted_by_surname(self, limit: int = None) -> Iterator[Tuple]:
+        """
+        Iterate over the contacts in alphabetical order of their surnames (and forenames) via the surname index
+
+        :param limit: the maximum number of contacts to iterate over, e.g., the first screen of contacts; by default,
+                    all of them.
+        :return: an iterator of tuples (id, forename, surname, email address, mobile number)
+        """
+
+        with self.persistence_lock:
+            contact_rows = self.connection.execute(
+                "SELECT id, forename, surname, email_address, mobile_number FROM contacts "
+                "ORDER BY surname, forename, id LIMIT ?", (-ONE_VALUE if limit is None else limit,)
+            ).fetchall()
+        return iter(contact_rows)
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def get_storage_backend_type() -> str:
+    """
+    Get the type of storage backend selected by configuration
+
+    :return: 'json', 'sqlite', or 'binary', taken from the environment variable 'CONTACT_BOOK_STORAGE_BACKEND' if set,
+            or from the 'STORAGE_BACKEND' constant otherwise
+    """
+
+    return os.environ.get(ENVIRONMENT_VARIABLE_STORAGE_BACKEND, STORAGE_BACKEND)
+
+
+def get_storage_backend(
+        storage_backend_type: str = None,
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT
+) -> StorageBackend:
+    """
+    Get the storage backend selected by configuration
+
+    :param storage_backend_type: 'json', 'sqlite', or 'binary'; by default, it is taken from the environment variable
+                                'CONTACT_BOOK_STORAGE_BACKEND' if set, or from the 'STORAGE_BACKEND' constant otherwise.
+    :param contacts_file_root_dir: the root directory where the saved contacts are stored.
+    :param contacts_file_name: the .txt file with the saved contacts, used by the 'json' storage backend.
+    :return: the storage backend
+    """
+
+    if storage_backend_type is None:
+        storage_backend_type = get_storage_backend_type()
+
+    if storage_backend_type == STORAGE_BACKEND_JSON:
+        return JsonFileStorageBackend(contacts_file_root_dir, contacts_file_name)
+    if storage_backend_type == STORAGE_BACKEND_SQLITE:
+        return SQLiteStorageBackend(contacts_file_root_dir)
+    if storage_backend_type == STORAGE_BACKEND_BINARY:
+        return BinaryFileStorageBackend(contacts_file_root_dir)
+    raise ValueError(f"The storage backend {storage_backend_type} is not supported.")
+
+
+def migrate_json_to_sqlite(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+        database_file_name: str = FILE_NAME_CONTACTS_DATABASE
+) -> int:
+    """
+    Migrate the contacts saved in the contacts_dict.txt file (including the operations in its journal) to the SQLite
+    database, replacing any contacts previously saved in the latter
+
+    :param contacts_file_root_dir: the root directory where the saved contacts are stored.
+    :param contacts_file_name: the .txt file with the saved contacts.
+    :param database_file_name: the SQLite database file to migrate the contacts to.
+    :return: the number of contacts migrated
+    """
+
+    contacts_dict, next_id = JsonFileStorageBackend(contacts_file_root_dir, contacts_file_name).load()
+
+    sqlite_storage_backend = SQLiteStorageBackend(contacts_file_root_dir, database_file_name)
+    sqlite_storage_backend.save(contacts_dict, next_id)
+    sqlite_storage_backend.close()
+
+    return len(contacts_dict['id'])
+
+
+def migrate_json_to_binary(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+        binary_file_name: str = FILE_NAME_CONTACTS_BINARY
+) -> int:
+    """
+    Migrate the contacts saved in the contacts_dict.txt file (including the operations in its journal) and the id
+    sequence to the binary contacts file, replacing any contacts previously saved in the latter
+
+    :param contacts_file_root_dir: the root directory where the saved contacts are stored.
+    :param contacts_file_name: the .txt file with the saved contacts.
+    :param binary_file_name: the binary contacts file to migrate the contacts to.
+    :return: the number of contacts migrated
+    """
+
+    contacts_dict, next_id = JsonFileStorageBackend(contacts_file_root_dir, contacts_file_name).load()
+    BinaryFileStorageBackend(contacts_file_root_dir, binary_file_name).save(contacts_dict, next_id)
+
+    return len(contacts_dict['id'])
+
+
+def migrate_binary_to_json(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        binary_file_name: str = FILE_NAME_CONTACTS_BINARY,
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT
+) -> int:
+    """
+    Migrate the contacts saved in the binary contacts file (including the operations in its journal) and the id
+    sequence back to the contacts_dict.txt file, replacing any contacts previously saved in the latter
+
+    :param contacts_file_root_dir: the root directory where the saved contacts are stored.
+    :param binary_file_name: the binary contacts file with the saved contacts.
+    :param contacts_file_name: the .txt file to migrate the contacts to.
+    :return: the number of contacts migrated
+    """
+
+    contacts_dict, next_id = BinaryFileStorageBackend(contacts_file_root_dir, binary_file_name).load()
+    JsonFileStorageBackend(contacts_file_root_dir, contacts_file_name).save(contacts_dict, next_id)
+
+    return len(contacts_dict['id'])
+
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(
+        description="Migrate the contacts from contacts_dict.txt to SQLite or to the binary file, or back from the "
+                    "binary file to contacts_dict.txt."
+    )
+    argument_parser.add_argument(
+        '--to',
+        choices=[STORAGE_BACKEND_SQLITE, STORAGE_BACKEND_BINARY, STORAGE_BACKEND_JSON],
+        default=STORAGE_BACKEND_SQLITE
+    )
+    argument_parser.add_argument('--contacts-file-root-dir', default=ROOT_DIR_CONTACTS_DICT_FILE)
+    argument_parser.add_argument('--contacts-file-name', default=FILE_NAME_CONTACTS_DICT)
+    argument_parser.add_argument('--database-file-name', default=FILE_NAME_CONTACTS_DATABASE)
+    argument_parser.add_argument('--binary-file-name', default=FILE_NAME_CONTACTS_BINARY)
+    arguments = argument_parser.parse_args()
+
+    if arguments.to == STORAGE_BACKEND_SQLITE:
+        number_of_contacts_migrated = migrate_json_to_sqlite(
+            arguments.contacts_file_root_dir,
+            arguments.contacts_file_name,
+            arguments.database_file_name
+        )
+        print(f"{number_of_contacts_migrated} contacts were migrated to {arguments.database_file_name}.")
+    elif arguments.to == STORAGE_BACKEND_BINARY:
+        number_of_contacts_migrated = migrate_json_to_binary(
+            arguments.contacts_file_root_dir,
+            arguments.contacts_file_name,
+            arguments.binary_file_name
+        )
+        print(f"{number_of_contacts_migrated} contacts were migrated to {arguments.binary_file_name}.")
+    else:
+        number_of_contacts_migrated = migrate_binary_to_json(
+            arguments.contacts_file_root_dir,
+            arguments.binary_file_name,
+            arguments.contacts_file_name
+        )
+        print(f"{number_of_contacts_migrated} contacts were migrated to {arguments.contacts_file_name}.")
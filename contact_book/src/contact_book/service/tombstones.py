@@ -0,0 +1,107 @@
+# This Python file contains the tombstones of the contacts removed from the contacts' store, which are marked as removed
+# in a bitmap (one bit per row of the columns of the store) rather than popped from each column, such that removing a
+# contact is O(1) and leaves the positions of the other contacts unchanged until the columns are compacted.
+
+from collections.abc import Mapping
+from itertools import chain, compress, islice
+from typing import Dict, Iterator
+
+from contact_book.src.contact_book.constants import ONE_VALUE, ZERO_VALUE
+
+BITS_PER_BYTE = 8
+
+# For each value of a byte of the bitmap, whether each of its 8 rows is live (i.e., not a tombstone), lowest bit first
+LIVE_ROWS_BY_BYTE = tuple(
+    tuple(not byte >> bit & ONE_VALUE for bit in range(BITS_PER_BYTE)) for byte in range(256)
+)
+
+
+class TombstoneBitmap:
+    """
+    A bitmap of the rows of the columns of a 'ContactStore' that are tombstones, i.e., contacts removed whose rows have
+    not been reclaimed yet, packed 8 rows per byte.
+    """
+
+    def __init__(self, number_of_rows: int = ZERO_VALUE):
+        self.bits = bytearray(-(-number_of_rows // BITS_PER_BYTE))
+        self.number_of_rows = number_of_rows
+        self.count = ZERO_VALUE
+
+    def __len__(self) -> int:
+        return self.number_of_rows
+
+    def __contains__(self, position: int) -> bool:
+        return bool(self.bits[position // BITS_PER_BYTE] >> position % BITS_PER_BYTE & ONE_VALUE)
+
+    def add(self, position: int) -> None:
+        """
+        Mark the row at the given position as a tombstone, if it is not one already
+        """
+
+        if position not in self:
+            self.bits[position // BITS_PER_BYTE] |= ONE_VALUE << position % BITS_PER_BYTE
+            self.count += ONE_VALUE
+
+    def discard(self, position: int) -> None:
+        """
+        Mark the row at the given position as live again, e.g., when the contact removed is created again
+        """
+
+        if position in self:
+            self.bits[position // BITS_PER_BYTE] &= ~(ONE_VALUE << position % BITS_PER_BYTE)
+            self.count -= ONE_VALUE
+
+    def extend(self, number_of_rows: int) -> None:
+        """
+        Add live rows at the end of the bitmap, for the contacts appended to the columns
+        """
+
+        self.number_of_rows += number_of_rows
+        self.bits.extend(bytes(-(-self.number_of_rows // BITS_PER_BYTE) - len(self.bits)))
+
+    def insert(self, position: int) -> None:
+        """
+        Insert a live row at the given position, shifting the rows after it by one, which is a single O(n) pass over the
+        bitmap as a whole
+        """
+
+        bits = int.from_bytes(self.bits, 'little')
+        lower_bits = bits & ((ONE_VALUE << position) - ONE_VALUE)
+        bits = lower_bits | bits >> position << position + ONE_VALUE
+        self.extend(ONE_VALUE)
+        self.bits[:] = bits.to_bytes(len(self.bits), 'little')
+
+    def copy(self) -> 'TombstoneBitmap':
+
+        tombstones = TombstoneBitmap()
+        tombstones.bits = bytearray(self.bits)
+        tombstones.number_of_rows = self.number_of_rows
+        tombstones.count = self.count
+        return tombstones
+
+    def get_live_rows(self) -> Iterator[bool]:
+        """
+        Get whether each row is live, in order, e.g., to filter a column with 'itertools.compress'
+        """
+
+        return islice(chain.from_iterable(map(LIVE_ROWS_BY_BYTE.__getitem__, self.bits)), self.number_of_rows)
+
+
+class LiveColumns(Mapping):
+    """
+    A read-only view of the columns of a 'ContactStore' without their tombstones, in the format of the contacts_dict.txt
+    file, each column being filtered only when it is read, e.g., by a storage backend saving a snapshot of the contacts.
+    """
+
+    def __init__(self, contacts_dict: Dict, tombstones: TombstoneBitmap):
+        self.contacts_dict = contacts_dict
+        self.tombstones = tombstones
+
+    def __getitem__(self, key: str) -> list:
+        return list(compress(self.contacts_dict[key], self.tombstones.get_live_rows()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.contacts_dict)
+
+    def __len__(self) -> int:
+        return len(self.contacts_dict)
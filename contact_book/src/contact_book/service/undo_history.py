@@ -0,0 +1,131 @@
+# This Python file contains the undo/redo history of the CRUD operations performed on the contacts' store, which keeps,
+# for each operation (or batch of operations, e.g., a changeset), its journal records along with their inverse journal
+# records (e.g., creating a contact back with the details they had when they were removed), rather than a copy of the
+# contacts, such that each entry of the history only costs the fields the operation changed, and undoing or redoing
+# it is applied to the store like any other operation (see 'ContactStore.undo').
+
+from collections import deque
+from typing import Dict, List, Optional
+
+from contact_book.src.contact_book.constants import (
+    CONTACTS_DICT_KEYS, JOURNAL_OPERATION_CREATE, JOURNAL_OPERATION_DELETE,
+    JOURNAL_OPERATION_UPDATE, ONE_VALUE, UNDO_HISTORY_DEPTH,
+    UNDO_HISTORY_MAX_JOURNAL_RECORDS)
+
+from .journal import create_journal_record
+
+
+def create_inverse_journal_record(journal_record: Dict, contact_before: Dict = None) -> Dict:
+    """
+    Create the journal record of the operation undoing the one described by a journal record
+
+    :param journal_record: the journal record of the operation to undo, i.e., a 'create', 'update', or 'delete'.
+    :param contact_before: the details of the contact before the operation, for an update or a deletion.
+    :return: the inverse journal record, i.e., a deletion for a creation, an update setting the fields changed back to
+            their previous values for an update, or a creation with the previous details of the contact for a deletion
+    """
+
+    operation, contact_id = journal_record['operation'], journal_record['id']
+    if operation == JOURNAL_OPERATION_CREATE:
+        return create_journal_record(JOURNAL_OPERATION_DELETE, contact_id)
+    if operation == JOURNAL_OPERATION_UPDATE:
+        return create_journal_record(
+            JOURNAL_OPERATION_UPDATE, contact_id, {key: contact_before[key] for key in journal_record['fields']}
+        )
+    return create_journal_record(
+        JOURNAL_OPERATION_CREATE, contact_id, {key: contact_before[key] for key in CONTACTS_DICT_KEYS[ONE_VALUE:]}
+    )
+
+
+def copy_journal_record(journal_record: Dict) -> Dict:
+    """
+    Copy a journal record of the history to be applied again, without the version it was persisted at
+
+    :param journal_record: the journal record.
+    :return: a new journal record of the same operation on the same contact
+    """
+
+    return create_journal_record(journal_record['operation'], journal_record['id'], journal_record.get('fields'))
+
+
+def create_history_entry(journal_records: List[Dict], inverse_journal_records: List[Dict]) -> Dict:
+    """
+    Create an entry of the undo/redo history
+
+    :param journal_records: the journal records of the operations performed, which are given their versions once they
+                            are persisted.
+    :param inverse_journal_records: the journal records of the operations undoing them, in the order in which they are
+                                    to be applied, i.e., the reverse order of the operations.
+    :return: the entry of the history as a dictionary, e.g., {'journal_records': [{'operation': 'delete', 'id': 4,
+            'version': 42}], 'inverse_journal_records': [{'operation': 'create', 'id': 4, 'fields': {...}}]}
+    """
+
+    return {'journal_records': journal_records, 'inverse_journal_records': inverse_journal_records}
+
+
+class UndoHistory:
+    """
+    The history of the operations performed on a 'ContactStore' that can be undone, and of the ones undone that can be
+    redone, bounded to a given depth and number of journal records, beyond which the oldest entries are dropped, such
+    that the memory it takes does not grow with the operations performed (e.g., by bulk imports). Performing a new
+    operation discards the operations undone, as they can no longer be redone on top of it.
+    """
+
+    def __init__(self, depth: int = UNDO_HISTORY_DEPTH, max_journal_records: int = UNDO_HISTORY_MAX_JOURNAL_RECORDS):
+        self.depth = depth
+        self.max_journal_records = max_journal_records
+        self.undo_entries = deque()
+        self.redo_entries = deque()
+
+    def record(self, journal_records: List[Dict], contacts_before: Dict[int, Dict]) -> None:
+        """
+        Record the operations performed on the store, as a single entry to be undone at once
+
+        :param journal_records: the journal records of the operations performed, in the order in which they were
+                                performed.
+        :param contacts_before: a dictionary mapping the id of each contact updated or removed by the operations to
+                                their details before the operations.
+        """
+
+        self.redo_entries.clear()
+
+        # The operations recorded before operations too many to be recorded can no longer be undone in order
+        if len(journal_records) > self.max_journal_records:
+            self.undo_entries.clear()
+            return
+
+        inverse_journal_records = [
+            create_inverse_journal_record(journal_record, contacts_before.get(journal_record['id']))
+            for journal_record in reversed(journal_records)
+        ]
+        self.undo_entries.append(create_history_entry(journal_records, inverse_journal_records))
+
+        number_of_journal_records = sum(len(entry['journal_records']) for entry in self.undo_entries)
+        while len(self.undo_entries) > self.depth or number_of_journal_records > self.max_journal_records:
+            number_of_journal_records -= len(self.undo_entries.popleft()['journal_records'])
+
+    def get_entry_to_undo(self) -> Optional[Dict]:
+        return self.undo_entries[-ONE_VALUE] if self.undo_entries else None
+
+    def get_entry_to_redo(self) -> Optional[Dict]:
+        return self.redo_entries[-ONE_VALUE] if self.redo_entries else None
+
+    def record_undone(self, journal_records: List[Dict]) -> None:
+        """
+        Move the last entry to undo to the entries to redo, once undone
+
+        :param journal_records: the journal records of the operations that undid it, which redoing it is to follow.
+        """
+
+        entry = self.undo_entries.pop()
+        self.redo_entries.append(create_history_entry(journal_records, entry['journal_records']))
+
+    def record_redone(self, journal_records: List[Dict]) -> None:
+        """
+        Move the last entry to redo to the entries to undo, once redone
+
+        :param journal_records: the journal records of the operations that redid it, which undoing it is to follow.
+        """
+
+        entry = self.redo_entries.pop()
+        self.undo_entries.append(create_history_entry(journal_records, entry['journal_records']))
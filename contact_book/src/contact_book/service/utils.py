@@ -2,39 +2,66 @@
 # and delete contacts, as well as search for a particular one based on a keyword/string.
 
 import json
-from tkinter import END
-from typing import Dict
-
-import pandas as pd
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, Optional
 
 from contact_book.root import get_contact_book_root
 from contact_book.src.contact_book.constants import (
-    FILE_NAME_CONTACTS_DICT, ONE_VALUE, ROOT_DIR_CONTACTS_DICT_FILE,
-    ZERO_VALUE)
+    FILE_NAME_CONTACTS_DICT, FILE_NAME_ID_SEQUENCE,
+    FILE_NAME_SUFFIX_TEMPORARY_FILE, INTERNED_CONTACTS_DICT_KEYS, ONE_VALUE,
+    ROOT_DIR_CONTACTS_DICT_FILE, ZERO_VALUE)
+
+from .contacts_dict_reader import ContactsDictReader
+from .metrics import instrument, record_bytes_read, record_bytes_written
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 root_dir = get_contact_book_root()
 
 
+@instrument('utils.get_contacts_dict')
 def get_contacts_dict(
         contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
-        contacts_file_name: str = FILE_NAME_CONTACTS_DICT
+        contacts_file_name: str = FILE_NAME_CONTACTS_DICT,
+        progress_callback: Callable[[float], None] = None
 ) -> Dict:
     """
-    Get dictionary of contacts from input .txt file
+    Get dictionary of contacts from input .txt file, which is parsed incrementally one block at a time (see
+    'contacts_dict_reader.py') rather than read as a whole, and whose forenames and surnames are interned as they are
+    parsed, such that the copies of the names shared by several contacts are released block by block
 
     :param contacts_file_root_dir: the root directory where the file with the saved contacts is stored.
     :param contacts_file_name: the .txt file with the saved contacts.
+    :param progress_callback: a function called with the fraction of the file read (from 0 to 1) whenever a chunk of
+                            contacts is parsed from a further block of the file, if any.
 
     :return: a dictionary with the saved contacts having the following keys:
             "id" (list of integers), "forename" (list of strings), "surname" (list of strings),
             "email_address" (list of strings), "mobile_number" (list of strings)
     """
 
-    with open(root_dir + '/' + contacts_file_root_dir + contacts_file_name) as contacts_dict_file:
-        contacts_dict = json.load(contacts_dict_file)
+    contacts_dict = {}
+    with open(root_dir + '/' + contacts_file_root_dir + contacts_file_name, 'rb') as contacts_dict_file:
+        file_size = os.fstat(contacts_dict_file.fileno()).st_size
+        contacts_dict_reader = ContactsDictReader(contacts_dict_file)
+        number_of_bytes_reported = ZERO_VALUE
+
+        for key, values in contacts_dict_reader.iter_chunks():
+            if key in INTERNED_CONTACTS_DICT_KEYS:
+                values = list(map(sys.intern, values))
+            contacts_dict.setdefault(key, []).extend(values)
+
+            if progress_callback is not None and contacts_dict_reader.number_of_bytes_read > number_of_bytes_reported:
+                number_of_bytes_reported = contacts_dict_reader.number_of_bytes_read
+                progress_callback(number_of_bytes_reported / max(file_size, ONE_VALUE))
+
+    record_bytes_read(contacts_file_name, contacts_dict_reader.number_of_bytes_read)
     return contacts_dict
 
 
+@instrument('utils.save_contacts_dict')
 def save_contacts_dict(
         modified_contacts_dict: Dict,
         contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
@@ -53,10 +80,73 @@ def save_contacts_dict(
             "email_address" (list of strings), "mobile_number" (list of strings)
     """
 
-    json.dump(modified_contacts_dict, open(root_dir + '/' + contacts_file_root_dir + contacts_file_name, 'w'))
+    # The columns are converted to lists, as the contacts' store packs the ids in an array (see 'contact_store.py')
+    write_file_atomically(
+        root_dir + '/' + contacts_file_root_dir + contacts_file_name,
+        json.dumps({key: list(values) for key, values in modified_contacts_dict.items()})
+    )
 
 
-def convert_contacts_dict_to_df(contacts_dict: Dict) -> pd.DataFrame:
+@instrument('utils.get_id_sequence')
+def get_id_sequence(
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        id_sequence_file_name: str = FILE_NAME_ID_SEQUENCE
+) -> Optional[int]:
+    """
+    Get the next id to be assigned to a new contact from the input .txt file storing the id sequence
+
+    :param contacts_file_root_dir: the root directory where the file with the id sequence is stored.
+    :param id_sequence_file_name: the .txt file with the id sequence.
+
+    :return: the next id to be assigned (int), or None if the id sequence has not been persisted yet
+    """
+
+    try:
+        with open(root_dir + '/' + contacts_file_root_dir + id_sequence_file_name) as id_sequence_file:
+            id_sequence = id_sequence_file.read()
+    except FileNotFoundError:
+        return None
+
+    record_bytes_read(id_sequence_file_name, len(id_sequence))
+    return int(id_sequence.strip())
+
+
+@instrument('utils.save_id_sequence')
+def save_id_sequence(
+        next_id: int,
+        contacts_file_root_dir: str = ROOT_DIR_CONTACTS_DICT_FILE,
+        id_sequence_file_name: str = FILE_NAME_ID_SEQUENCE
+) -> None:
+    """
+    Save the next id to be assigned to a new contact to the output .txt file storing the id sequence
+
+    :param next_id: the next id to be assigned to a new contact.
+    :param contacts_file_root_dir: the root directory where the file with the id sequence is stored.
+    :param id_sequence_file_name: the .txt file with the id sequence.
+    """
+
+    write_file_atomically(root_dir + '/' + contacts_file_root_dir + id_sequence_file_name, str(next_id))
+
+
+def write_file_atomically(file_path: str, file_content: str) -> None:
+    """
+    Write a text file such that a crash partway through the write leaves either its previous or its new content, but
+    never a truncated file, by writing a temporary file next to it, flushing it to disk, and renaming it over it
+
+    :param file_path: the path of the file to write.
+    :param file_content: the text to write to the file.
+    """
+
+    temporary_file_path = file_path + FILE_NAME_SUFFIX_TEMPORARY_FILE
+    with open(temporary_file_path, 'w') as temporary_file:
+        temporary_file.write(file_content)
+        temporary_file.flush()
+        os.fsync(temporary_file.fileno())
+        record_bytes_written(os.path.basename(file_path), os.fstat(temporary_file.fileno()).st_size)
+    os.replace(temporary_file_path, file_path)
+
+
+def convert_contacts_dict_to_df(contacts_dict: Dict) -> 'pd.DataFrame':
     """
     Convert a dictionary of contacts to a pandas dataframe
 
@@ -64,8 +154,13 @@ def convert_contacts_dict_to_df(contacts_dict: Dict) -> pd.DataFrame:
 
     :return: a pandas dataframe of contacts having the following columns:
             "id", "forename", "surname", "email_address", "mobile_number"
+
+    Note: pandas is only imported when a dataframe is asked for, as importing it makes up most of the time to start the
+            application, whose CRUD operations, sorting, and lookups work on the lists of the dictionary directly.
     """
 
+    import pandas as pd
+
     contacts_df_from_dict = pd.DataFrame.from_dict(contacts_dict)
     return contacts_df_from_dict
 
@@ -81,21 +176,15 @@ def insert_contacts_into_box(application) -> None:  # pragma: no cover
     displayed on the GUI correctly.
 
     :param application: the application passed as a context from which the 'contacts_list' and 'contacts_box' are taken.
-                'contacts_list' is a list of tuples of two elements for each contact (id, 'Forename Surname'),
-                e.g., [(1, 'Kate Beckett'), (2, 'Richard Castle'), etc.]. 'contacts_box' is a Listbox from the Python
-                library 'tkinter'.
+                'contacts_list' is a sequence of tuples of two elements for each contact (id, 'Forename Surname'),
+                e.g., [(1, 'Kate Beckett'), (2, 'Richard Castle'), etc.]. 'contacts_box' is a 'VirtualListbox' (a
+                tkinter Listbox only rendering the contacts in view).
 
     Note:
-         The contacts from the 'contacts_list' are inserted into the 'contacts_box' in the 'application'.
+         Only the contacts from the 'contacts_list' in view are inserted into the 'contacts_box' in the 'application'.
     """
 
-    application.contacts_box.delete(ZERO_VALUE, END)
-
-    if application.contacts_list:
-        # 'contact_id' is the id number (int) of the contact considered
-        # 'contact_tuple' is a tuple of two elements per each contact (id, 'Forename Surname')
-        for contact_id, contact_tuple in enumerate(application.contacts_list):
-            application.contacts_box.insert(contact_id, contact_tuple[ONE_VALUE])
+    application.contacts_box.set_contacts(application.contacts_list)
 
 
 def clear_window_frame(application) -> None:  # pragma: no cover
@@ -108,7 +197,7 @@ def clear_window_frame(application) -> None:  # pragma: no cover
     clear_window_frame_contacts_fields(application)
     create_gui_buttons(application)
     application.user_operation_frame.focus()
-    application.contacts_box.selection_clear(ZERO_VALUE, END)
+    application.contacts_box.clear_selection()
     application.contacts_box_running_index = ZERO_VALUE
 
 
@@ -0,0 +1,93 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from benchmarks.operations_benchmark import (
+    find_regressions, load_baseline, save_baseline)
+
+
+BASELINE = {
+    'search_contacts': {
+        '10000': {'seconds': 0.001, 'peak_bytes': 1000000},
+        '100000': {'seconds': 0.01, 'peak_bytes': 10000000}
+    }
+}
+
+
+class TestOperationsBenchmark(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp()
+        self.baseline_file_path = os.path.join(self.temporary_dir, 'operations_baseline.json')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_find_regressions(self):
+
+        results = {
+            'search_contacts': {
+                '10000': {'seconds': 0.002, 'peak_bytes': 1000000},
+                '100000': {'seconds': 0.01, 'peak_bytes': 12000000}
+            }
+        }
+
+        self.assertEqual(
+            [
+                'search_contacts on 10000 contacts: seconds went from 0.001 to 0.002',
+                'search_contacts on 100000 contacts: peak_bytes went from 1e+07 to 1.2e+07'
+            ],
+            find_regressions(results, BASELINE)
+        )
+
+    def test_find_regressions_within_tolerance(self):
+
+        # The time taken and the peak memory allocated increase by less than the tolerances
+        results = {
+            'search_contacts': {
+                '10000': {'seconds': 0.0014, 'peak_bytes': 1060000},
+                '100000': {'seconds': 0.0149, 'peak_bytes': 10900000}
+            }
+        }
+
+        self.assertEqual([], find_regressions(results, BASELINE))
+
+        # An increase above the tolerance is not reported below the minimum regression, e.g., for fast operations
+        results = {'search_contacts': {'10000': {'seconds': 0.00105, 'peak_bytes': 1000000}}}
+        self.assertEqual([], find_regressions(results, BASELINE, time_tolerance=0.01))
+
+    def test_find_regressions_without_baseline(self):
+
+        # The numbers of contacts and the operations missing from the baseline are not compared
+        results = {
+            'search_contacts': {'1000000': {'seconds': 1.0, 'peak_bytes': 1000000000}},
+            'fuzzy_search_contacts': {'10000': {'seconds': 1.0, 'peak_bytes': 1000000000}}
+        }
+
+        self.assertEqual([], find_regressions(results, BASELINE))
+        self.assertEqual([], find_regressions(results, {}))
+
+    def test_save_and_load_baseline(self):
+
+        self.assertEqual({}, load_baseline(self.baseline_file_path))
+
+        save_baseline(BASELINE, self.baseline_file_path)
+        self.assertEqual(BASELINE, load_baseline(self.baseline_file_path))
+
+        # Only the operations and numbers of contacts run are replaced
+        results = {'search_contacts': {'10000': {'seconds': 0.002, 'peak_bytes': 2000000}}}
+        save_baseline(results, self.baseline_file_path)
+
+        self.assertEqual(
+            {
+                'search_contacts': {
+                    '10000': {'seconds': 0.002, 'peak_bytes': 2000000},
+                    '100000': {'seconds': 0.01, 'peak_bytes': 10000000}
+                }
+            },
+            load_baseline(self.baseline_file_path)
+        )
@@ -0,0 +1,95 @@
+import unittest
+
+import json
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.binary_contacts_file import (
+    BinaryContactsFile, write_binary_contacts_file)
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+file_name_dummy_contacts_binary = 'dummy_contacts.bin'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+with open(concatenated_root_dirs_and_file_name) as dummy_contacts_dict_file:
+    expected_dummy_contacts_dict = json.load(dummy_contacts_dict_file)
+
+
+class TestBinaryContactsFile(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        self.binary_file_path = self.temporary_dir + '/' + file_name_dummy_contacts_binary
+
+        write_binary_contacts_file(expected_dummy_contacts_dict, 16, self.binary_file_path)
+        self.binary_contacts_file = BinaryContactsFile(self.binary_file_path)
+
+    def tearDown(self):
+
+        self.binary_contacts_file.close()
+        shutil.rmtree(self.temporary_dir)
+
+    def test_get_contacts_dict(self):
+
+        self.assertEqual(3, len(self.binary_contacts_file))
+        self.assertEqual(16, self.binary_contacts_file.next_id)
+        self.assertEqual(expected_dummy_contacts_dict, self.binary_contacts_file.get_contacts_dict())
+
+    def test_get_contact(self):
+
+        expected_contact = {
+            'id': 14,
+            'forename': 'Wolfgang',
+            'surname': 'Pauli',
+            'email_address': 'wolfy.pauli@mybestquantummail.com',
+            'mobile_number': '00000000022'
+        }
+
+        self.assertEqual(expected_contact, self.binary_contacts_file.get_contact(14))
+        self.assertIn(14, self.binary_contacts_file)
+        self.assertIsNone(self.binary_contacts_file.get_contact(16))
+        self.assertNotIn(16, self.binary_contacts_file)
+
+    def test_iter_contacts_sorted_by_surname(self):
+
+        self.assertEqual(
+            [(13, 'Richard', 'Feynman', 'rick.feynman@mytopquantummail.com', '00000000021'),
+             (14, 'Wolfgang', 'Pauli', 'wolfy.pauli@mybestquantummail.com', '00000000022')],
+            list(self.binary_contacts_file.iter_contacts_sorted_by_surname(limit=2))
+        )
+        self.assertEqual(
+            ['Feynman', 'Pauli', 'Schrodinger'],
+            [contact_row[2] for contact_row in self.binary_contacts_file.iter_contacts_sorted_by_surname()]
+        )
+
+    def test_non_ascii_contacts(self):
+
+        contacts_dict = {
+            'id': [21, 7],
+            'forename': ['Émilie', 'Lise'],
+            'surname': ['du Châtelet', 'Meitner'],
+            'email_address': ['émilie@example.com', ''],
+            'mobile_number': ['', '00000000031']
+        }
+
+        write_binary_contacts_file(contacts_dict, 22, self.binary_file_path)
+
+        with BinaryContactsFile(self.binary_file_path) as binary_contacts_file:
+            self.assertEqual(contacts_dict, binary_contacts_file.get_contacts_dict())
+            self.assertEqual('du Châtelet', binary_contacts_file.get_contact(21)['surname'])
+            self.assertEqual(
+                [7, 21],
+                [contact_row[0] for contact_row in binary_contacts_file.iter_contacts_sorted_by_surname()]
+            )
+
+    def test_not_binary_contacts_file(self):
+
+        with self.assertRaises(ValueError):
+            BinaryContactsFile(concatenated_root_dirs_and_file_name)
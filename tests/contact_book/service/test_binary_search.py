@@ -1,6 +1,8 @@
 import unittest
 
-from contact_book.src.contact_book.service.binary_search import binary_search, find_contact
+from contact_book.src.contact_book.service.binary_search import (
+    binary_search, binary_search_upper_bound, find_contact, find_prefix_range,
+    remove_sorted_keys)
 
 
 class TestBinarySearch(unittest.TestCase):
@@ -38,3 +40,31 @@ class TestBinarySearch(unittest.TestCase):
         result_boolean = find_contact(dummy_sorted_list_of_strings, dummy_string_to_be_searched, input_index)
 
         self.assertEqual(expected_boolean, result_boolean)
+
+    def test_binary_search_upper_bound(self):
+
+        dummy_sorted_list_of_strings = ['Cooper', 'Fowler', 'Fowler', 'Wolowitz']
+        dummy_string_to_be_searched = 'Fowler'
+
+        expected_index = 3
+        result_index = binary_search_upper_bound(dummy_sorted_list_of_strings, dummy_string_to_be_searched)
+
+        self.assertEqual(expected_index, result_index)
+
+    def test_find_prefix_range(self):
+
+        dummy_sorted_list_of_keys = [('cooper', 1), ('fowler', 2), ('hofstadter', 3), ('hofstetter', 4), ('koothrappali', 5)]
+
+        self.assertEqual((2, 4), find_prefix_range(dummy_sorted_list_of_keys, 'hofst'))
+        self.assertEqual((2, 3), find_prefix_range(dummy_sorted_list_of_keys, 'hofsta'))
+        self.assertEqual((5, 5), find_prefix_range(dummy_sorted_list_of_keys, 'wolowitz'))
+        self.assertEqual((0, 5), find_prefix_range(dummy_sorted_list_of_keys, ''))
+
+    def test_remove_sorted_keys(self):
+
+        dummy_sorted_list_of_keys = [('Cooper', 16), ('Feynman', 13), ('Pauli', 14), ('Schrodinger', 15)]
+
+        self.assertEqual(
+            [('Cooper', 16), ('Schrodinger', 15)],
+            remove_sorted_keys(dummy_sorted_list_of_keys, [('Pauli', 14), ('Feynman', 13), ('Born', 17)])
+        )
@@ -100,3 +100,58 @@ class TestContactService(unittest.TestCase):
         )
 
         self.assertEqual(expected_dummy_contacts_dict_wo_contact_removed, result_dict_wo_contact_removed)
+
+    def test_create_contacts(self):
+
+        result_updated_contacts_dict = contacts_service_object.create_contacts_logic(
+            {'id': [13], 'forename': ['Richard'], 'surname': ['Feynman'], 'email_address': [''], 'mobile_number': ['']},
+            [
+                {'forename': DUMMY_FORENAME, 'surname': DUMMY_SURNAME, 'email_address': DUMMY_EMAIL_ADDRESS,
+                 'mobile_number': DUMMY_MOBILE_NUMBER},
+                {'forename': 'Leonard', 'surname': 'Hofstadter', 'email_address': '', 'mobile_number': ''}
+            ]
+        )
+
+        self.assertEqual([13, 14, 15], result_updated_contacts_dict['id'])
+        self.assertEqual(['Feynman', DUMMY_SURNAME, 'Hofstadter'], result_updated_contacts_dict['surname'])
+
+    def test_update_contacts(self):
+
+        result_updated_contacts_dict = contacts_service_object.update_contacts_logic(
+            {'id': [13, 14], 'forename': ['Richard', 'Wolfgang'], 'surname': ['Feynman', 'Pauli']},
+            {14: {'forename': DUMMY_FORENAME, 'surname': DUMMY_SURNAME}}
+        )
+
+        self.assertEqual(
+            {'id': [13, 14], 'forename': ['Richard', DUMMY_FORENAME], 'surname': ['Feynman', DUMMY_SURNAME]},
+            result_updated_contacts_dict
+        )
+
+    def test_update_contacts_unknown(self):
+
+        contacts_dict = {'id': [13, 14], 'forename': ['Richard', 'Wolfgang'], 'surname': ['Feynman', 'Pauli']}
+
+        # No contact is updated if any contact to update, or any of their details, is unknown
+        with self.assertRaises(KeyError):
+            contacts_service_object.update_contacts_logic(
+                contacts_dict, {14: {'surname': DUMMY_SURNAME}, 16: {'surname': 'Hofstadter'}}
+            )
+        with self.assertRaises(ValueError):
+            contacts_service_object.update_contacts_logic(
+                contacts_dict, {14: {'surname': DUMMY_SURNAME}, 13: {'nickname': 'Dick'}}
+            )
+        with self.assertRaises(ValueError):
+            contacts_service_object.update_contacts_logic(contacts_dict, {14: {'id': 16}})
+
+        self.assertEqual(
+            {'id': [13, 14], 'forename': ['Richard', 'Wolfgang'], 'surname': ['Feynman', 'Pauli']}, contacts_dict
+        )
+
+    def test_remove_contacts(self):
+
+        result_dict_wo_contacts_removed = contacts_service_object.remove_contacts_logic(
+            {'id': [13, 14, 15], 'forename': ['Richard', 'Wolfgang', 'Erwin']},
+            [15, 13]
+        )
+
+        self.assertEqual({'id': [14], 'forename': ['Wolfgang']}, result_dict_wo_contacts_removed)
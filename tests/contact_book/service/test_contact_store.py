@@ -0,0 +1,632 @@
+import unittest
+from unittest import mock
+
+import json
+from array import array
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import (
+    ConcurrentModificationError, ContactStore, compact_contacts_dict)
+from contact_book.src.contact_book.service.journal import read_journal_records
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+from contact_book.src.contact_book.service.utils import get_id_sequence
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+with open(concatenated_root_dirs_and_file_name) as dummy_contacts_dict_file:
+    expected_dummy_contacts_dict = json.load(dummy_contacts_dict_file)
+
+DUMMY_FORENAME = 'Sheldon'
+DUMMY_SURNAME = 'Cooper'
+DUMMY_EMAIL_ADDRESS = 'sheldor@myphdmail.com'
+DUMMY_MOBILE_NUMBER = '00000000073'
+
+
+def create_contacts_in_process(contacts_file_root_dir, number_of_contacts):
+
+    contact_store = ContactStore(
+        storage_backend=JsonFileStorageBackend(contacts_file_root_dir, file_name_dummy_contacts_dict)
+    )
+    for _ in range(number_of_contacts):
+        contact_store.create_contact(DUMMY_FORENAME, DUMMY_SURNAME, DUMMY_EMAIL_ADDRESS, DUMMY_MOBILE_NUMBER)
+
+
+class TestContactStore(unittest.TestCase):
+
+    def setUp(self):
+
+        # Copy the dummy contacts into a temporary directory, such that the store can save them without altering the
+        # dummy data shared by the other tests
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(concatenated_root_dirs_and_file_name, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+        self.contact_store = ContactStore(
+            contacts_file_root_dir=self.root_dir_temporary_contacts_dict,
+            contacts_file_name=file_name_dummy_contacts_dict,
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_load_contacts(self):
+
+        self.assertEqual(expected_dummy_contacts_dict, self.contact_store.get_contacts_dict())
+        self.assertEqual([0, 1, 2], [self.contact_store.get_position(contact_id) for contact_id in (13, 14, 15)])
+        with self.assertRaises(KeyError):
+            self.contact_store.get_position(16)
+        self.assertEqual(16, self.contact_store.next_id)
+
+    def test_compact_contacts_dict(self):
+
+        # The names are built at runtime, as JSON parsing does, such that equal names are distinct objects beforehand
+        contacts_dict = {
+            'id': [15, 13, 14],
+            'forename': ['ERWIN'.capitalize(), 'RICHARD'.capitalize(), 'ERWIN'.capitalize()],
+            'surname': ['Schrodinger', 'Feynman', 'Pauli'],
+            'email_address': ['erwin@mycatsmailmaybe.com', 'rick@mytopquantummail.com', 'wolfy@mybestquantummail.com'],
+            'mobile_number': ['00000000023', '00000000021', '00000000022']
+        }
+
+        self.assertIsNot(contacts_dict['forename'][0], contacts_dict['forename'][2])
+
+        result_contacts_dict = compact_contacts_dict(contacts_dict)
+
+        self.assertEqual(array('q', [13, 14, 15]), result_contacts_dict['id'])
+        self.assertEqual(['Richard', 'Erwin', 'Erwin'], result_contacts_dict['forename'])
+        self.assertIs(result_contacts_dict['forename'][1], result_contacts_dict['forename'][2])
+        self.assertEqual(['Feynman', 'Pauli', 'Schrodinger'], result_contacts_dict['surname'])
+        self.assertEqual(['00000000021', '00000000022', '00000000023'], result_contacts_dict['mobile_number'])
+
+    def test_get_contact(self):
+
+        expected_contact = {
+            'id': 14,
+            'forename': "Wolfgang",
+            'surname': "Pauli",
+            'email_address': "wolfy.pauli@mybestquantummail.com",
+            'mobile_number': "00000000022"
+        }
+
+        self.assertEqual(expected_contact, self.contact_store.get_contact(14))
+        self.assertEqual(tuple(expected_contact.values()), self.contact_store.get_contact_values(14))
+
+    def test_get_contacts_df(self):
+
+        result_contacts_df = self.contact_store.get_contacts_df()
+
+        self.assertEqual(
+            ['id', 'forename', 'surname', 'email_address', 'mobile_number'],
+            list(result_contacts_df.columns)
+        )
+        self.assertEqual(expected_dummy_contacts_dict['surname'], result_contacts_df['surname'].tolist())
+
+    def test_create_contact(self):
+
+        result_id = self.contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+
+        self.assertEqual(16, result_id)
+        self.assertEqual(DUMMY_SURNAME, self.contact_store.get_contact(16)['surname'])
+        self.assertEqual(17, self.contact_store.next_id)
+        self.assertEqual((16, 'Sheldon Cooper'), self.contact_store.sorted_index.get_contacts_list()[0])
+
+    def test_create_contacts(self):
+
+        result_contact_ids = self.contact_store.create_contacts([
+            {
+                'forename': "Sheldon",
+                'surname': "Cooper",
+                'email_address': "sheldor@myphdmail.com",
+                'mobile_number': "00000000073"
+            },
+            {
+                'forename': "Leonard",
+                'surname': "Hofstadter",
+                'email_address': "leonard@mydndmail.com",
+                'mobile_number': "00000000074"
+            }
+        ])
+
+        self.assertEqual([16, 17], result_contact_ids)
+        self.assertEqual(18, self.contact_store.next_id)
+        self.assertEqual("Hofstadter", self.contact_store.get_contact(17)['surname'])
+        self.assertEqual((16, 'Sheldon Cooper'), self.contact_store.sorted_index.get_contact_entry(0))
+
+    def test_update_contact(self):
+
+        self.contact_store.update_contact(
+            13,
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+
+        self.assertEqual(
+            (13, DUMMY_FORENAME, DUMMY_SURNAME, DUMMY_EMAIL_ADDRESS, DUMMY_MOBILE_NUMBER),
+            self.contact_store.get_contact_values(13)
+        )
+
+    def test_remove_contact(self):
+
+        self.contact_store.remove_contact(13)
+
+        self.assertNotIn(13, self.contact_store)
+        self.assertEqual(
+            [(14, 'Wolfgang Pauli'), (15, 'Erwin Schrodinger')],
+            self.contact_store.sorted_index.get_contacts_list()
+        )
+        # The row of the contact removed is left as a tombstone, such that the other contacts keep their positions
+        self.assertEqual([1, 2], [self.contact_store.get_position(contact_id) for contact_id in (14, 15)])
+        self.assertEqual(2, len(self.contact_store))
+        self.assertEqual([14, 15], list(self.contact_store))
+        with self.assertRaises(KeyError):
+            self.contact_store.get_position(13)
+        self.assertEqual("Schrodinger", self.contact_store.get_contact(15)['surname'])
+
+    def test_update_contacts(self):
+
+        self.contact_store.update_contacts({
+            13: {'surname': DUMMY_SURNAME},
+            15: {'forename': DUMMY_FORENAME, 'surname': 'Schrodinger'}
+        })
+
+        self.assertEqual(DUMMY_SURNAME, self.contact_store.get_contact(13)['surname'])
+        self.assertEqual(
+            [(13, 'Richard Cooper'), (14, 'Wolfgang Pauli'), (15, 'Sheldon Schrodinger')],
+            self.contact_store.sorted_index.get_contacts_list()
+        )
+
+        # Only the fields whose values changed are journaled
+        self.assertEqual(
+            [{'surname': DUMMY_SURNAME}, {'forename': DUMMY_FORENAME}],
+            [
+                journal_record['fields']
+                for journal_record in read_journal_records(self.contact_store.storage_backend.journal_file_path)
+            ]
+        )
+
+    def test_remove_contacts(self):
+
+        self.contact_store.remove_contacts([15, 13])
+
+        self.assertEqual([14], self.contact_store.get_contacts_dict()['id'])
+        self.assertEqual([(14, 'Wolfgang Pauli')], self.contact_store.sorted_index.get_contacts_list())
+        self.assertEqual(1, self.contact_store.get_position(14))
+
+    def test_tombstones_compacted_past_threshold(self):
+
+        self.contact_store.tombstone_compaction_min_tombstones = 2
+        self.contact_store.tombstone_compaction_threshold_ratio = 0.5
+
+        self.contact_store.remove_contact(13)
+        self.assertIsNone(self.contact_store.tombstone_compaction_thread)
+
+        created_ids = self.contact_store.create_contacts([
+            {
+                'forename': DUMMY_FORENAME,
+                'surname': DUMMY_SURNAME,
+                'email_address': DUMMY_EMAIL_ADDRESS,
+                'mobile_number': DUMMY_MOBILE_NUMBER
+            }
+        ] * 2)
+        # The compacted columns only replace the columns of the store once the operations of a batch are performed, such
+        # that the operations performed while the columns are compacted are applied to the compacted columns
+        with self.contact_store.deferred_persistence() as journal_records:
+            self.contact_store.remove_contacts([created_ids[0], 15])
+            self.assertIsNotNone(self.contact_store.tombstone_compaction_thread)
+            self.contact_store.tombstone_compaction_thread.join()
+
+            self.contact_store.update_contact(14, "Wolfgang", "Pauli", "pauli@exclusionmail.com", "00000000022")
+            self.contact_store.remove_contact(created_ids[1])
+            self.contact_store.write_journal_records(journal_records)
+
+        self.assertEqual(5, len(self.contact_store.contacts_dict['id']))
+        self.contact_store.wait_for_tombstone_compaction()
+
+        self.assertEqual(array('q', [14, created_ids[1]]), self.contact_store.contacts_dict['id'])
+        self.assertEqual(1, self.contact_store.tombstones.count)
+        self.assertEqual([14], list(self.contact_store))
+        self.assertEqual("pauli@exclusionmail.com", self.contact_store.get_contact(14)['email_address'])
+        self.assertEqual(0, self.contact_store.get_position(14))
+
+        # A contact removed is created again by replaying the journal of another process in their tombstoned row
+        self.contact_store.insert_contact(created_ids[1], {
+            'forename': DUMMY_FORENAME,
+            'surname': DUMMY_SURNAME,
+            'email_address': DUMMY_EMAIL_ADDRESS,
+            'mobile_number': DUMMY_MOBILE_NUMBER
+        })
+        self.assertEqual([14, created_ids[1]], list(self.contact_store))
+        self.assertEqual(2, len(self.contact_store.contacts_dict['id']))
+
+    def test_apply_changeset(self):
+
+        created_ids = self.contact_store.apply_changeset(
+            contacts_to_create=[{
+                'forename': DUMMY_FORENAME,
+                'surname': DUMMY_SURNAME,
+                'email_address': DUMMY_EMAIL_ADDRESS,
+                'mobile_number': DUMMY_MOBILE_NUMBER
+            }],
+            contacts_to_update={14: {'email_address': 'pauli@exclusionmail.com'}},
+            contact_ids_to_remove=[13],
+            expected_versions={13: self.contact_store.get_contact_version(13)}
+        )
+
+        self.assertEqual([16], created_ids)
+        self.assertEqual([14, 15, 16], self.contact_store.get_contacts_dict()['id'])
+
+        # All the operations are persisted
+        self.assertEqual(
+            ['update', 'delete', 'create'],
+            [
+                journal_record['operation']
+                for journal_record in read_journal_records(self.contact_store.storage_backend.journal_file_path)
+            ]
+        )
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.assertEqual(self.contact_store.get_contacts_dict(), reloaded_contact_store.get_contacts_dict())
+
+    def test_apply_changeset_all_or_nothing(self):
+
+        contact_to_create = {
+            'forename': DUMMY_FORENAME,
+            'surname': DUMMY_SURNAME,
+            'email_address': DUMMY_EMAIL_ADDRESS,
+            'mobile_number': DUMMY_MOBILE_NUMBER
+        }
+        contacts_dict_before_changeset = self.contact_store.get_contacts_dict()
+
+        with self.assertRaises(KeyError):
+            self.contact_store.apply_changeset(contacts_to_create=[contact_to_create], contact_ids_to_remove=[13, 16])
+        with self.assertRaises(ValueError):
+            self.contact_store.apply_changeset(contacts_to_update={13: {'id': 16}})
+        with self.assertRaises(ValueError):
+            self.contact_store.apply_changeset(contacts_to_update={13: {'surname': 'Born'}}, contact_ids_to_remove=[13])
+        with self.assertRaises(ConcurrentModificationError):
+            self.contact_store.apply_changeset(contact_ids_to_remove=[13, 14], expected_versions={14: 1})
+
+        self.assertEqual(contacts_dict_before_changeset, self.contact_store.get_contacts_dict())
+        self.assertEqual(16, self.contact_store.next_id)
+        self.assertEqual([], read_journal_records(self.contact_store.storage_backend.journal_file_path))
+
+    def test_operations_not_persisted_not_kept(self):
+
+        contacts_dict_before_operations = self.contact_store.get_contacts_dict()
+
+        with mock.patch(
+                'contact_book.src.contact_book.service.storage_backends.append_journal_records',
+                side_effect=OSError("Disk full")
+        ):
+            with self.assertRaises(OSError):
+                self.contact_store.create_contact(
+                    DUMMY_FORENAME, DUMMY_SURNAME, DUMMY_EMAIL_ADDRESS, DUMMY_MOBILE_NUMBER
+                )
+            with self.assertRaises(OSError):
+                self.contact_store.update_contact(14, 'Wolf', 'Pauli', '', '')
+            with self.assertRaises(OSError):
+                self.contact_store.remove_contact(13)
+
+        # The store is loaded again from the saved contacts, such that the operations failing are not built upon
+        self.assertEqual(contacts_dict_before_operations, self.contact_store.get_contacts_dict())
+        self.assertEqual(16, self.contact_store.next_id)
+        self.assertEqual([], self.contact_store.undo())
+        with self.assertRaises(KeyError):
+            self.contact_store.update_contact(16, DUMMY_FORENAME, DUMMY_SURNAME, '', '')
+
+        created_id = self.contact_store.create_contact(
+            DUMMY_FORENAME, DUMMY_SURNAME, DUMMY_EMAIL_ADDRESS, DUMMY_MOBILE_NUMBER
+        )
+        self.assertEqual(16, created_id)
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.assertEqual(self.contact_store.get_contacts_dict(), reloaded_contact_store.get_contacts_dict())
+
+    def test_id_sequence_not_reused_after_removal(self):
+
+        self.contact_store.remove_contact(15)
+        self.contact_store.save()
+
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+        self.assertEqual(16, get_id_sequence(self.root_dir_temporary_contacts_dict))
+        self.assertEqual(16, reloaded_contact_store.next_id)
+        self.assertEqual([13, 14], reloaded_contact_store.get_contacts_dict()['id'])
+
+    def test_journal_replayed_on_load(self):
+
+        created_id = self.contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+        self.contact_store.update_contact(14, "Wolfgang", "Pauli", "pauli@exclusionmail.com", "00000000022")
+        self.contact_store.remove_contact(13)
+
+        # The snapshot is left untouched until the journal is compacted
+        with open(self.temporary_dir + '/' + file_name_dummy_contacts_dict) as snapshot_contacts_dict_file:
+            self.assertEqual(expected_dummy_contacts_dict, json.load(snapshot_contacts_dict_file))
+
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+        self.assertEqual(self.contact_store.get_contacts_dict(), reloaded_contact_store.get_contacts_dict())
+        self.assertEqual("pauli@exclusionmail.com", reloaded_contact_store.get_contact(14)['email_address'])
+        self.assertEqual(created_id + 1, reloaded_contact_store.next_id)
+
+    def test_journal_compacted_past_threshold(self):
+
+        storage_backend = self.contact_store.storage_backend
+        storage_backend.journal_compaction_threshold_bytes = 1
+
+        self.contact_store.create_contact(DUMMY_FORENAME, DUMMY_SURNAME, DUMMY_EMAIL_ADDRESS, DUMMY_MOBILE_NUMBER)
+        storage_backend.wait_for_compaction()
+
+        with open(self.temporary_dir + '/' + file_name_dummy_contacts_dict) as compacted_contacts_dict_file:
+            self.assertEqual(self.contact_store.get_contacts_dict(), json.load(compacted_contacts_dict_file))
+        self.assertFalse(os.path.exists(storage_backend.compacting_journal_file_path))
+        self.assertFalse(storage_backend.has_journal_records())
+        self.assertEqual(17, get_id_sequence(self.root_dir_temporary_contacts_dict))
+
+    def test_deferred_persistence(self):
+
+        with self.contact_store.deferred_persistence() as journal_records:
+            created_id = self.contact_store.create_contact(
+                DUMMY_FORENAME,
+                DUMMY_SURNAME,
+                DUMMY_EMAIL_ADDRESS,
+                DUMMY_MOBILE_NUMBER
+            )
+            self.contact_store.remove_contact(13)
+
+            with self.assertRaises(RuntimeError):
+                with self.contact_store.deferred_persistence():
+                    pass
+
+            # Nothing is persisted until the journal records collected are
+            self.assertEqual(2, len(journal_records))
+            self.assertEqual([], read_journal_records(self.contact_store.storage_backend.journal_file_path))
+
+            self.contact_store.write_journal_records(journal_records)
+
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+        self.assertEqual([14, 15, created_id], reloaded_contact_store.get_contacts_dict()['id'])
+
+    def get_other_contact_store(self):
+
+        # Another store of the same contacts, as loaded by another process
+        return ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+    def test_operations_of_other_stores_merged(self):
+
+        other_contact_store = self.get_other_contact_store()
+
+        created_id = self.contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+        other_contact_store.remove_contact(13)
+        other_created_id = other_contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+
+        # The other store merged the contact created before creating one, such that it was given the next id
+        self.assertEqual(created_id + 1, other_created_id)
+
+        self.contact_store.synchronize()
+
+        self.assertEqual(other_contact_store.get_contacts_dict(), self.contact_store.get_contacts_dict())
+        self.assertEqual(other_contact_store.sorted_index.sorted_keys, self.contact_store.sorted_index.sorted_keys)
+        self.assertEqual(other_contact_store.next_id, self.contact_store.next_id)
+        self.assertEqual(
+            other_contact_store.get_contact_version(other_created_id),
+            self.contact_store.get_contact_version(other_created_id)
+        )
+
+    def test_update_of_contact_modified_since_fails(self):
+
+        other_contact_store = self.get_other_contact_store()
+        version = self.contact_store.get_contact_version(14)
+
+        other_contact_store.update_contact(14, "Wolfgang", "Pauli", "pauli@exclusionmail.com", "00000000022")
+
+        with self.assertRaises(ConcurrentModificationError):
+            self.contact_store.update_contact(
+                14, "Wolfgang", "Pauli", "wolfgang@exclusionmail.com", "00000000022", expected_version=version
+            )
+        with self.assertRaises(ConcurrentModificationError):
+            self.contact_store.remove_contact(14, expected_version=version)
+
+        # The update of the other store was merged instead, and the removal based on the current version succeeds
+        self.assertEqual("pauli@exclusionmail.com", self.contact_store.get_contact(14)['email_address'])
+        self.assertLess(version, self.contact_store.get_contact_version(14))
+
+        self.contact_store.remove_contact(14, expected_version=self.contact_store.get_contact_version(14))
+
+        self.assertNotIn(14, self.contact_store)
+
+    def test_undo_and_redo(self):
+
+        self.contact_store.remove_contact(13)
+        self.contact_store.update_contact(14, "Wolfgang", "Pauli", "pauli@exclusionmail.com", "00000000022")
+        created_id = self.contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+        contacts_dict_after_operations = self.contact_store.get_contacts_dict()
+
+        self.assertEqual([created_id], self.contact_store.undo())
+        self.assertEqual([14], self.contact_store.undo())
+        self.assertEqual([13], self.contact_store.undo())
+        self.assertEqual([], self.contact_store.undo())
+
+        # The contact removed is restored with the same id, in their row left as a tombstone, and the sorted index too,
+        # whereas the row of the contact created is left as a tombstone
+        self.assertEqual(expected_dummy_contacts_dict, self.contact_store.get_contacts_dict())
+        self.assertEqual(1, self.contact_store.tombstones.count)
+        self.assertEqual(
+            ['Feynman', 'Pauli', 'Schrodinger'],
+            [sort_key[0] for sort_key in self.contact_store.sorted_index.sorted_keys]
+        )
+
+        self.assertEqual([13], self.contact_store.redo())
+        self.assertEqual([14], self.contact_store.redo())
+        self.assertEqual([created_id], self.contact_store.redo())
+        self.assertEqual([], self.contact_store.redo())
+
+        # The id of the contact created is not reused, and the operations undone and redone are persisted
+        self.assertEqual(contacts_dict_after_operations, self.contact_store.get_contacts_dict())
+        self.assertEqual(contacts_dict_after_operations, self.get_other_contact_store().get_contacts_dict())
+
+        # Performing an operation discards the operations undone
+        self.contact_store.undo()
+        self.contact_store.remove_contact(15)
+        self.assertEqual([], self.contact_store.redo())
+        self.assertEqual([15], self.contact_store.undo())
+        self.assertEqual([14], self.contact_store.undo())
+
+    def test_undo_history_depth(self):
+
+        storage_backend = JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        contact_store = ContactStore(storage_backend=storage_backend, undo_history_depth=2)
+        for contact_id in (13, 14, 15):
+            contact_store.remove_contact(contact_id)
+
+        # Only the last two operations can be undone
+        self.assertEqual([15], contact_store.undo())
+        self.assertEqual([14], contact_store.undo())
+        self.assertEqual([], contact_store.undo())
+        self.assertEqual([14, 15], list(contact_store))
+
+    def test_undo_of_changeset(self):
+
+        self.contact_store.apply_changeset(
+            contacts_to_create=[{
+                'forename': DUMMY_FORENAME,
+                'surname': DUMMY_SURNAME,
+                'email_address': DUMMY_EMAIL_ADDRESS,
+                'mobile_number': DUMMY_MOBILE_NUMBER
+            }],
+            contacts_to_update={14: {'email_address': 'pauli@exclusionmail.com'}},
+            contact_ids_to_remove=[13, 15]
+        )
+
+        # The whole changeset is undone at once
+        self.assertEqual([16, 15, 13, 14], self.contact_store.undo())
+        self.assertEqual(expected_dummy_contacts_dict, self.contact_store.get_contacts_dict())
+
+    def test_undo_of_removal_once_compacted(self):
+
+        self.contact_store.tombstone_compaction_min_tombstones = 1
+        self.contact_store.tombstone_compaction_threshold_ratio = 0.25
+
+        self.contact_store.remove_contact(13)
+        self.contact_store.wait_for_tombstone_compaction()
+        self.assertEqual(array('q', [14, 15]), self.contact_store.contacts_dict['id'])
+
+        # The row of the contact was reclaimed, such that they are inserted back before the rows of the others
+        self.assertEqual([13], self.contact_store.undo())
+        self.assertEqual(array('q', [13, 14, 15]), self.contact_store.contacts_dict['id'])
+        self.assertEqual(0, self.contact_store.tombstones.count)
+        self.assertEqual(expected_dummy_contacts_dict, self.contact_store.get_contacts_dict())
+        self.assertEqual(
+            ['Feynman', 'Pauli', 'Schrodinger'], [surname for surname, _, _ in self.contact_store.sorted_index]
+        )
+
+    def test_undo_of_contact_modified_since_fails(self):
+
+        other_contact_store = self.get_other_contact_store()
+
+        self.contact_store.update_contact(14, "Wolfgang", "Pauli", "pauli@exclusionmail.com", "00000000022")
+        other_contact_store.update_contact(14, "Wolfgang", "Pauli", "wolfgang@exclusionmail.com", "00000000022")
+
+        # Undoing the update would lose the update of the other store, which is kept instead
+        with self.assertRaises(ConcurrentModificationError):
+            self.contact_store.undo()
+        self.assertEqual("wolfgang@exclusionmail.com", self.contact_store.get_contact(14)['email_address'])
+
+        self.contact_store.remove_contact(13)
+        other_contact_store.synchronize()
+        other_contact_store.remove_contact(14)
+
+        # The contacts removed by the other store are not restored by undoing an operation of this one either
+        self.assertEqual([13], self.contact_store.undo())
+        with self.assertRaises(KeyError):
+            self.contact_store.undo()
+
+    def test_store_reloaded_once_operations_missed_are_compacted(self):
+
+        other_contact_store = self.get_other_contact_store()
+        storage_backend = self.contact_store.storage_backend
+        storage_backend.journal_compaction_threshold_bytes = 1
+
+        created_id = self.contact_store.create_contact(
+            DUMMY_FORENAME,
+            DUMMY_SURNAME,
+            DUMMY_EMAIL_ADDRESS,
+            DUMMY_MOBILE_NUMBER
+        )
+        storage_backend.wait_for_compaction()
+
+        # The journal record of the contact created was compacted into the snapshot before the other store read it
+        self.assertIsNone(other_contact_store.storage_backend.read_new_journal_records())
+
+        other_contact_store.synchronize()
+
+        self.assertEqual(self.contact_store.get_contacts_dict(), other_contact_store.get_contacts_dict())
+        self.assertEqual(created_id + 1, other_contact_store.next_id)
+
+    def test_contacts_created_by_several_processes_not_lost(self):
+
+        processes = [
+            multiprocessing.Process(
+                target=create_contacts_in_process, args=(self.root_dir_temporary_contacts_dict, 20)
+            )
+            for _ in range(2)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        self.contact_store.synchronize()
+
+        self.assertEqual([13, 14, 15] + list(range(16, 56)), list(self.contact_store.contacts_dict['id']))
+        self.assertEqual(self.contact_store.get_contacts_dict(), self.get_other_contact_store().get_contacts_dict())
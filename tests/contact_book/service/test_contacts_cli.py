@@ -0,0 +1,161 @@
+import unittest
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_cli import (
+    create_argument_parser, perform_operation, run_batch)
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+file_name_dummy_contacts_csv = 'dummy_contacts_to_import.csv'
+
+BATCH_OPERATIONS = """
+# Operations of a batch, one per line
+add Sheldon Cooper --email-address sheldor@myphdmail.com --mobile-number 00000000073
+update 16 --surname "Lee Cooper" --if-version {version_of_contact_created}
+search "Sheldon Lee"
+get 13
+remove 13
+get 13
+update 14 --if-version 1000 --forename Wolf
+add Leonard
+undo
+stats
+"""
+
+
+class TestContactsCli(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+        self.contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.contacts_service = ContactsService(application=None, contact_store=self.contact_store)
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def perform_operation(self, *argv):
+
+        return perform_operation(self.contacts_service, create_argument_parser().parse_args(argv))
+
+    def test_perform_operation(self):
+
+        created_contact = self.perform_operation('add', 'Sheldon', 'Cooper', '--mobile-number', '00000000073')
+        self.assertEqual(
+            {'id': 16, 'forename': 'Sheldon', 'surname': 'Cooper', 'email_address': '', 'mobile_number': '00000000073'},
+            {key: value for key, value in created_contact.items() if key != 'version'}
+        )
+
+        updated_contact = self.perform_operation('update', '16', '--email-address', 'sheldor@myphdmail.com')
+        self.assertEqual('Cooper', updated_contact['surname'])
+        self.assertEqual('sheldor@myphdmail.com', updated_contact['email_address'])
+        self.assertGreater(updated_contact['version'], created_contact['version'])
+
+        self.assertEqual([{'id': 14, 'name': 'Wolfgang Pauli'}], self.perform_operation('search', 'Paoli', '--fuzzy'))
+        self.assertEqual([14], [contact['id'] for contact in self.perform_operation(
+            'search', '--mobile-number-suffix', '22'
+        )])
+
+        self.assertEqual({'id': 16}, self.perform_operation('remove', '16'))
+        self.assertEqual(3, self.perform_operation('stats')['number_of_contacts'])
+
+    def test_import_and_export(self):
+
+        import_report = self.perform_operation(
+            'import', project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_csv
+        )
+        self.assertGreater(import_report['imported'], 0)
+
+        export_file_path = self.temporary_dir + '/contacts.jsonl'
+        self.assertEqual(
+            {'exported': len(self.contact_store)},
+            self.perform_operation('export', export_file_path, '--order', 'id')
+        )
+        with open(export_file_path) as export_file:
+            self.assertEqual(list(self.contact_store), [json.loads(line)['id'] for line in export_file])
+
+    def test_run_batch(self):
+
+        output_file = io.StringIO()
+
+        # The contact created first is given the version following the one of the contacts loaded
+        operation_lines = io.StringIO(
+            BATCH_OPERATIONS.format(version_of_contact_created=self.contact_store.storage_backend.version + 1)
+        )
+        number_of_failed_operations = run_batch(self.contacts_service, operation_lines, output_file)
+        operation_results = [json.loads(line) for line in output_file.getvalue().splitlines()]
+
+        # One result per operation, in order, the blank lines and comments being skipped
+        self.assertEqual(10, len(operation_results))
+        self.assertEqual(3, number_of_failed_operations)
+
+        self.assertEqual(16, operation_results[0]['id'])
+        self.assertEqual('Lee Cooper', operation_results[1]['surname'])
+        self.assertEqual([{'id': 16, 'name': 'Sheldon Lee Cooper'}], operation_results[2])
+        self.assertEqual('Feynman', operation_results[3]['surname'])
+        self.assertEqual({'id': 13}, operation_results[4])
+        self.assertEqual({'error': 'No contact has the id 13.'}, operation_results[5])
+
+        # The update conditional on an outdated version and the invalid arguments fail on their own
+        self.assertIn('error', operation_results[6])
+        self.assertIn('error', operation_results[7])
+        self.assertEqual('Wolfgang', self.contact_store.get_contact(14)['forename'])
+
+        # The last operation performed, i.e., the removal, is undone
+        self.assertEqual({'ids': [13]}, operation_results[8])
+        self.assertEqual(4, operation_results[9]['number_of_contacts'])
+
+        # The lines asking for help fail on their own, without printing the usage among the results nor ending the batch
+        output_file = io.StringIO()
+        number_of_failed_operations = run_batch(
+            self.contacts_service, io.StringIO('get 13\nget 999\nadd --help\nstats --help\nget 14\n'), output_file
+        )
+        operation_results = [json.loads(line) for line in output_file.getvalue().splitlines()]
+
+        self.assertEqual(5, len(operation_results))
+        self.assertEqual(3, number_of_failed_operations)
+        self.assertIn('error', operation_results[2])
+        self.assertIn('error', operation_results[3])
+        self.assertEqual('Pauli', operation_results[4]['surname'])
+
+    def test_tkinter_not_imported(self):
+
+        # The command line is used without the GUI, i.e., in a new interpreter without tkinter (nor a display)
+        completed_process = subprocess.run(
+            [
+                sys.executable, '-c',
+                'import sys; from contact_book.src.contact_book.service.contacts_cli import main; '
+                'status = main(sys.argv[1:]); print("tkinter" in sys.modules); sys.exit(status)',
+                '--contacts-file-root-dir', self.root_dir_temporary_contacts_dict,
+                '--contacts-file-name', file_name_dummy_contacts_dict,
+                'get', '14'
+            ],
+            cwd=project_root_dir,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        contact_line, tkinter_imported_line = completed_process.stdout.splitlines()
+        self.assertEqual('Pauli', json.loads(contact_line)['surname'])
+        self.assertEqual('False', tkinter_imported_line)
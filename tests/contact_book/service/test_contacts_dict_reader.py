@@ -0,0 +1,77 @@
+import unittest
+
+import io
+import json
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contacts_dict_reader import ContactsDictReader
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+with open(concatenated_root_dirs_and_file_name, 'rb') as dummy_contacts_dict_file:
+    dummy_contacts_dict_bytes = dummy_contacts_dict_file.read()
+
+
+def read_contacts_dict(contacts_dict_bytes: bytes, block_size: int) -> dict:
+
+    contacts_dict = {}
+    contacts_dict_reader = ContactsDictReader(io.BytesIO(contacts_dict_bytes), block_size)
+    for key, values in contacts_dict_reader.iter_chunks():
+        contacts_dict.setdefault(key, []).extend(values)
+    return contacts_dict
+
+
+class TestContactsDictReader(unittest.TestCase):
+
+    def test_iter_chunks(self):
+
+        expected_dummy_contacts_dict = json.loads(dummy_contacts_dict_bytes)
+
+        for block_size in (1, 2, 7, 64, 1024 * 1024):
+            self.assertEqual(expected_dummy_contacts_dict, read_contacts_dict(dummy_contacts_dict_bytes, block_size))
+
+    def test_iter_chunks_yields_chunks_of_a_block(self):
+
+        contacts_dict = {'id': list(range(1000)), 'forename': ['Richard'] * 1000}
+        contacts_dict_reader = ContactsDictReader(io.BytesIO(json.dumps(contacts_dict).encode('utf-8')), 256)
+
+        chunks = list(contacts_dict_reader.iter_chunks())
+
+        self.assertGreater(len(chunks), 10)
+        self.assertTrue(all(len(values) < 100 for _, values in chunks))
+        self.assertEqual(['id', 'forename'], list(dict.fromkeys(key for key, _ in chunks)))
+
+    def test_iter_chunks_of_values_with_delimiters_and_multibyte_characters(self):
+
+        contacts_dict = {
+            'id': [-1, 2.5e3, 123456789012345678, None, True],
+            'forename': ['Feynman, Richard', '[Wolfgang]', 'Erwin "Schrödinger", ', '\\\\', ''],
+            'surname': ['薛定谔', '🐈', 'a,]b', ',', ' ]'],
+            'email_address': [],
+            'mobile_number': [[1, [2, 3]], {'a': [',']}]
+        }
+        contacts_dict_bytes = json.dumps(contacts_dict, ensure_ascii=False, indent=2).encode('utf-8')
+
+        for block_size in (1, 3, 5, 16, 1024):
+            self.assertEqual(contacts_dict, read_contacts_dict(contacts_dict_bytes, block_size))
+
+    def test_iter_chunks_of_empty_dict(self):
+
+        self.assertEqual({}, read_contacts_dict(b' { } \n', 2))
+
+    def test_iter_chunks_rejects_invalid_json(self):
+
+        for contacts_dict_bytes in (
+                b'', b'[]', b'{"id": [1, 2}', b'{"id": [1, 2]', b'{"id": [1, 2],}', b'{"id": [1,, 2]}',
+                b'{"id": [1, 2 3]}', b'{"id": [1, 2,]}', b'{"id": 1}', b'{1: [1]}', b'{"id": [1]} []',
+                b'{"id": ["\xc3"]}'
+        ):
+            for block_size in (1, 1024):
+                with self.assertRaises(ValueError, msg=contacts_dict_bytes):
+                    read_contacts_dict(contacts_dict_bytes, block_size)
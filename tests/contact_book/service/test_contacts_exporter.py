@@ -0,0 +1,152 @@
+import unittest
+
+import io
+import json
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_exporter import (
+    export_contacts, export_contacts_file, iter_contacts)
+from contact_book.src.contact_book.service.contacts_importer import (
+    import_contacts, iter_vcard_contacts)
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+file_name_empty_contacts_dict = 'empty_contacts_dict.txt'
+
+
+class TestContactsExporter(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+        self.contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.contact_store.create_contact('Albert', 'Einstein', 'albert@mytopquantummail.com', '00000000024')
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_iter_contacts(self):
+
+        self.assertEqual(
+            ['Einstein', 'Feynman', 'Pauli', 'Schrodinger'],
+            [contact['surname'] for contact in iter_contacts(self.contact_store)]
+        )
+        self.assertEqual([13, 14, 15, 16], [contact['id'] for contact in iter_contacts(self.contact_store, 'id')])
+        self.assertEqual(
+            [16, 13],
+            [contact['id'] for contact in iter_contacts(self.contact_store, contact_ids={13, 16})]
+        )
+        with self.assertRaises(ValueError):
+            list(iter_contacts(self.contact_store, 'email_address'))
+
+    def test_export_json_lines(self):
+
+        contacts_file = io.StringIO()
+
+        number_of_contacts_exported = export_contacts_file(contacts_file, 'jsonl', self.contact_store, order='id')
+
+        self.assertEqual(4, number_of_contacts_exported)
+        exported_contacts = [json.loads(line) for line in contacts_file.getvalue().splitlines()]
+        self.assertEqual(
+            {
+                'id': 13,
+                'forename': 'Richard',
+                'surname': 'Feynman',
+                'email_address': 'rick.feynman@mytopquantummail.com',
+                'mobile_number': '00000000021'
+            },
+            exported_contacts[0]
+        )
+        self.assertEqual([13, 14, 15, 16], [contact['id'] for contact in exported_contacts])
+
+    def test_export_filtered_contacts(self):
+
+        contacts_file = io.StringIO()
+
+        export_contacts_file(contacts_file, 'jsonl', self.contact_store, email_domain='mytopquantummail.com')
+        self.assertEqual(
+            ['Einstein', 'Feynman'],
+            [json.loads(line)['surname'] for line in contacts_file.getvalue().splitlines()]
+        )
+
+        # All the filters given must match
+        contacts_file = io.StringIO()
+        export_contacts_file(
+            contacts_file, 'jsonl', self.contact_store, query='Ri', email_domain='mytopquantummail.com'
+        )
+        self.assertEqual(
+            ['Feynman'],
+            [json.loads(line)['surname'] for line in contacts_file.getvalue().splitlines()]
+        )
+
+        contacts_file = io.StringIO()
+        self.assertEqual(0, export_contacts_file(contacts_file, 'csv', self.contact_store, mobile_number_suffix='99'))
+
+    def test_export_vcard(self):
+
+        self.contact_store.create_contact('Ana; Maria', 'de la Cruz, Jr.', '', '00000000025')
+        contacts_file = io.StringIO(newline='')
+
+        export_contacts_file(contacts_file, 'vcard', self.contact_store)
+
+        vcard = contacts_file.getvalue()
+        self.assertIn('N:de la Cruz\\, Jr.;Ana\\; Maria;;;\r\n', vcard)
+        self.assertEqual(5, vcard.count('BEGIN:VCARD'))
+
+        # The contacts exported are read back as they were
+        contacts_file.seek(0)
+        self.assertEqual(
+            {
+                'forename': 'Ana; Maria',
+                'surname': 'de la Cruz, Jr.',
+                'email_address': '',
+                'mobile_number': '00000000025'
+            },
+            next(contact for _, contact in iter_vcard_contacts(contacts_file) if contact['surname'].startswith('de'))
+        )
+
+    def export_and_import(self, file_name_exported_contacts):
+
+        file_path_exported_contacts = self.temporary_dir + '/' + file_name_exported_contacts
+
+        self.assertEqual(4, export_contacts(file_path_exported_contacts, self.contact_store))
+
+        # The contacts are imported into an empty store in another directory, since journals are kept per directory
+        os.mkdir(self.temporary_dir + '/other')
+        with open(self.temporary_dir + '/other/' + file_name_empty_contacts_dict, 'w') as empty_contacts_dict_file:
+            json.dump({key: [] for key in self.contact_store.contacts_dict}, empty_contacts_dict_file)
+        other_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(
+                self.root_dir_temporary_contacts_dict + 'other/',
+                file_name_empty_contacts_dict
+            )
+        )
+        result_report = import_contacts(file_path_exported_contacts, other_contact_store)
+
+        self.assertEqual(4, result_report.number_of_contacts_imported)
+        self.assertEqual(
+            [contact_entry for _, contact_entry in self.contact_store.sorted_index.get_contacts_list()],
+            [contact_entry for _, contact_entry in other_contact_store.sorted_index.get_contacts_list()]
+        )
+
+    def test_export_and_import_csv(self):
+
+        self.export_and_import('exported_contacts.csv')
+
+    def test_export_and_import_json_lines(self):
+
+        self.export_and_import('exported_contacts.jsonl')
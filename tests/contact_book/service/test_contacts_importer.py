@@ -0,0 +1,142 @@
+import unittest
+
+import json
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_importer import (
+    get_contacts_file_format, import_contacts, normalise_email_address,
+    normalise_mobile_number_to_store)
+from contact_book.src.contact_book.service.journal import read_journal_records
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+file_name_dummy_contacts_csv = 'dummy_contacts_to_import.csv'
+file_name_dummy_contacts_vcard = 'dummy_contacts_to_import.vcf'
+
+
+class TestContactsImporter(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+        self.storage_backend = JsonFileStorageBackend(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict
+        )
+        self.contact_store = ContactStore(storage_backend=self.storage_backend)
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_normalise_email_address(self):
+
+        self.assertEqual('Sheldor@myphdmail.com', normalise_email_address(' Sheldor@MyPhdMail.com '))
+        self.assertEqual('', normalise_email_address('  '))
+        self.assertIsNone(normalise_email_address('sheldor@myphdmail'))
+        self.assertIsNone(normalise_email_address('sheldor at myphdmail.com'))
+
+    def test_normalise_mobile_number_to_store(self):
+
+        self.assertEqual('004407700900482', normalise_mobile_number_to_store('+44 (0)7700 900-482'))
+        self.assertEqual('00000000073', normalise_mobile_number_to_store('00000000073'))
+        self.assertEqual('', normalise_mobile_number_to_store(''))
+        self.assertIsNone(normalise_mobile_number_to_store('12345'))
+        self.assertIsNone(normalise_mobile_number_to_store('call me maybe'))
+
+    def test_get_contacts_file_format(self):
+
+        self.assertEqual('csv', get_contacts_file_format('crm_export.CSV'))
+        self.assertEqual('vcard', get_contacts_file_format('crm_export.vcf'))
+        self.assertEqual('jsonl', get_contacts_file_format('contacts.jsonl'))
+        with self.assertRaises(ValueError):
+            get_contacts_file_format('crm_export.xlsx')
+
+    def test_import_csv(self):
+
+        result_report = import_contacts(
+            project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_csv,
+            self.contact_store,
+            chunk_size=2
+        )
+
+        self.assertEqual(3, result_report.number_of_contacts_imported)
+        self.assertEqual(2, result_report.number_of_contacts_rejected)
+        self.assertEqual(
+            [(3, 'invalid email address'), (5, 'missing forename or surname')],
+            result_report.rejected_records
+        )
+        self.assertEqual(
+            {
+                'id': 16,
+                'forename': 'Leonard',
+                'surname': 'Hofstadter',
+                'email_address': 'leonard@myd&dmail.com',
+                'mobile_number': '00447700900074'
+            },
+            self.contact_store.get_contact(16)
+        )
+        self.assertEqual('00000000076', self.contact_store.get_contact(17)['mobile_number'])
+        self.assertEqual('', self.contact_store.get_contact(18)['mobile_number'])
+
+        # The contacts imported are listed in alphabetical order of their surnames, and journaled to be persisted
+        self.assertEqual(
+            ['Feynman', 'Fowler', 'Hofstadter', 'Koothrappali', 'Pauli', 'Schrodinger'],
+            [surname for surname, _, _ in self.contact_store.sorted_index]
+        )
+        journal_records = read_journal_records(self.storage_backend.journal_file_path)
+        self.assertEqual([16, 17, 18], [journal_record['id'] for journal_record in journal_records])
+
+    def test_import_vcard(self):
+
+        result_report = import_contacts(
+            project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_vcard,
+            self.contact_store
+        )
+
+        self.assertEqual(2, result_report.number_of_contacts_imported)
+        self.assertEqual([(3, 'invalid mobile number')], result_report.rejected_records)
+        self.assertEqual(
+            (16, 'Sheldon', 'Cooper', 'sheldor@myphdmail.com', '0016260000073'),
+            self.contact_store.get_contact_values(16)
+        )
+        self.assertEqual(
+            (17, 'Penny', 'Teller', '', '00000000078'),
+            self.contact_store.get_contact_values(17)
+        )
+
+    def test_import_json_lines(self):
+
+        file_path_contacts_json_lines = self.temporary_dir + '/contacts_to_import.jsonl'
+        with open(file_path_contacts_json_lines, 'w') as contacts_file:
+            contacts_file.write(json.dumps({
+                'id': 13,
+                'forename': 'Sheldon',
+                'surname': 'Cooper',
+                'email_address': 'Sheldor@MyPhdMail.com',
+                'mobile_number': '00000000073'
+            }) + '\n')
+            contacts_file.write('\n["Leonard", "Hofstadter"]\n')
+            contacts_file.write(json.dumps({'forename': 'Penny', 'surname': 'Teller'}) + '\n')
+
+        result_report = import_contacts(file_path_contacts_json_lines, self.contact_store)
+
+        # The ids of the file are ignored, and the lines which are not JSON objects are rejected
+        self.assertEqual(2, result_report.number_of_contacts_imported)
+        self.assertEqual([(3, 'invalid JSON object')], result_report.rejected_records)
+        self.assertEqual(
+            (16, 'Sheldon', 'Cooper', 'Sheldor@myphdmail.com', '00000000073'),
+            self.contact_store.get_contact_values(16)
+        )
+        self.assertEqual((17, 'Penny', 'Teller', '', ''), self.contact_store.get_contact_values(17))
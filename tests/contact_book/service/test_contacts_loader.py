@@ -0,0 +1,134 @@
+import unittest
+from unittest import mock
+
+import json
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service import contact_store
+from contact_book.src.contact_book.service.contact_store import get_contact_store
+from contact_book.src.contact_book.service.contacts_loader import ContactsLoader
+from contact_book.src.contact_book.service.journal import (
+    append_journal_records, create_journal_record)
+from contact_book.src.contact_book.service.storage_backends import (
+    BinaryFileStorageBackend, migrate_json_to_binary, migrate_json_to_sqlite)
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+with open(concatenated_root_dirs_and_file_name) as dummy_contacts_dict_file:
+    expected_dummy_contacts_dict = json.load(dummy_contacts_dict_file)
+
+
+class TestContactsLoader(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(concatenated_root_dirs_and_file_name, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+        self.contacts_loader = None
+
+    def tearDown(self):
+
+        if self.contacts_loader is not None:
+            self.contacts_loader.close()
+
+        loaded_contact_store = contact_store._contact_stores.pop(
+            (self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict), None
+        )
+        if loaded_contact_store is not None:
+            loaded_contact_store.storage_backend.close()
+        shutil.rmtree(self.temporary_dir)
+
+    def load_contacts(self, **kwargs) -> list:
+
+        self.contacts_loader = ContactsLoader(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict,
+            **kwargs
+        )
+        self.contacts_loader.start()
+        self.contacts_loader.loading_thread.join()
+
+        self.assertFalse(self.contacts_loader.is_loading())
+        return self.contacts_loader.get_events()
+
+    def test_load_contacts(self):
+
+        with mock.patch.dict(os.environ, {'CONTACT_BOOK_STORAGE_BACKEND': 'json'}):
+            events = self.load_contacts()
+
+        # The contacts' file is small enough to be read in a single chunk
+        self.assertEqual([('progress', 1.0)], events[:-1])
+        self.assertEqual('loaded', events[-1][0])
+        loaded_contact_store = events[-1][1]
+        self.assertEqual(len(expected_dummy_contacts_dict['id']), len(loaded_contact_store))
+
+        # The store loaded in the background is shared with the rest of the application
+        self.assertIs(
+            loaded_contact_store,
+            get_contact_store(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+    def test_load_contacts_previews_first_screen(self):
+
+        migrate_json_to_sqlite(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+
+        with mock.patch.dict(os.environ, {'CONTACT_BOOK_STORAGE_BACKEND': 'sqlite'}):
+            events = self.load_contacts(number_of_contacts_previewed=2)
+
+        self.assertEqual(['preview', 'loaded'], [event for event, _ in events])
+
+        contacts_previewed = events[0][1]
+        loaded_contact_store = events[1][1]
+        self.assertEqual(loaded_contact_store.sorted_index.get_contacts_list()[:2], contacts_previewed)
+
+    def test_load_contacts_previews_first_screen_of_binary_file(self):
+
+        migrate_json_to_binary(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+
+        with mock.patch.dict(os.environ, {'CONTACT_BOOK_STORAGE_BACKEND': 'binary'}):
+            events = self.load_contacts(number_of_contacts_previewed=2)
+
+        self.assertEqual(['preview', 'loaded'], [event for event, _ in events])
+        self.assertEqual([(13, 'Richard Feynman'), (14, 'Wolfgang Pauli')], events[0][1])
+
+        # The details of a contact previewed are read from their record only
+        self.assertEqual(
+            (14, 'Wolfgang', 'Pauli', 'wolfy.pauli@mybestquantummail.com', '00000000022'),
+            self.contacts_loader.get_contact_values(14)
+        )
+
+    def test_load_contacts_does_not_preview_out_of_date_binary_file(self):
+
+        migrate_json_to_binary(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        append_journal_records(
+            [create_journal_record('delete', 13)],
+            BinaryFileStorageBackend(self.root_dir_temporary_contacts_dict).journal_file_path
+        )
+
+        with mock.patch.dict(os.environ, {'CONTACT_BOOK_STORAGE_BACKEND': 'binary'}):
+            events = self.load_contacts()
+
+        self.assertEqual(['loaded'], [event for event, _ in events])
+        self.assertNotIn(13, events[0][1])
+        self.assertIsNone(self.contacts_loader.get_contact_values(14))
+
+    def test_load_contacts_failed(self):
+
+        os.remove(self.temporary_dir + '/' + file_name_dummy_contacts_dict)
+
+        with mock.patch.dict(os.environ, {'CONTACT_BOOK_STORAGE_BACKEND': 'json'}):
+            events = self.load_contacts()
+
+        self.assertEqual(['failed'], [event for event, _ in events])
+        self.assertIsInstance(events[0][1], FileNotFoundError)
+
@@ -0,0 +1,111 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.duplicate_contacts import (
+    apply_merge_proposals, find_candidate_pairs, find_merge_proposals,
+    get_blocking_keys, get_comparison_key, get_contact_similarity,
+    get_soundex_code)
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+dummy_contacts_dict = {
+    'id': [1, 2, 3, 4, 5, 6],
+    'forename': ["Sheldon", "Sheldon", "Leonard", "Leonard", "Howard", "Sheldon"],
+    'surname': ["Cooper", "Coopper", "Hofstadter", "Hofstadter", "Wolowitz", "Cooper"],
+    'email_address': ["sheldor@myphdmail.com", "", "leo@myphdmail.com", "Leo@MyPhdMail.com ", "howie@nasamail.com",
+                      ""],
+    'mobile_number': ["00000000073", "0000 000 0073", "", "00000000074", "00000000075", ""]
+}
+
+
+class TestDuplicateContacts(unittest.TestCase):
+
+    def test_get_soundex_code(self):
+
+        self.assertEqual('R163', get_soundex_code('Robert'))
+        self.assertEqual('R163', get_soundex_code('Rupert'))
+        self.assertEqual('A261', get_soundex_code('Ashcraft'))
+        self.assertEqual('T522', get_soundex_code('Tymczak'))
+        self.assertEqual('P236', get_soundex_code('Pfister'))
+        self.assertEqual(get_soundex_code('Schrodinger'), get_soundex_code('Schrödinger'))
+        self.assertEqual('', get_soundex_code(' - '))
+
+    def test_get_blocking_keys(self):
+
+        self.assertEqual(
+            [('surname', 'C160 s'), ('mobile_number', '00000000073')],
+            get_blocking_keys({
+                'forename': 'Sheldon', 'surname': 'Coopper', 'email_address': ' ', 'mobile_number': '0000 000 0073'
+            })
+        )
+
+    def test_get_contact_similarity(self):
+
+        sheldon_cooper = get_comparison_key({
+            'forename': 'Sheldon', 'surname': 'Cooper', 'email_address': '', 'mobile_number': '00000000073'
+        })
+        sheldon_coopper = get_comparison_key({
+            'forename': 'Sheldon', 'surname': 'Coopper', 'email_address': '', 'mobile_number': '00000000073'
+        })
+        sheldon_cooper_elsewhere = get_comparison_key({
+            'forename': 'Sheldon', 'surname': 'Cooper', 'email_address': '', 'mobile_number': '00000000074'
+        })
+
+        self.assertAlmostEqual((1 + 2 * (1 - 1 / 15)) / 3, get_contact_similarity(sheldon_cooper, sheldon_coopper))
+        self.assertAlmostEqual(2 / 3, get_contact_similarity(sheldon_cooper, sheldon_cooper_elsewhere))
+
+        # The similarity is only computed exactly from the threshold
+        self.assertEqual(0, get_contact_similarity(sheldon_cooper, sheldon_cooper_elsewhere, 0.75))
+
+    def test_find_candidate_pairs(self):
+
+        self.assertEqual({(1, 2), (1, 6), (2, 6), (3, 4)}, find_candidate_pairs(dummy_contacts_dict))
+
+        # The buckets of more contacts than the maximum are skipped
+        self.assertEqual({(1, 2), (3, 4)}, find_candidate_pairs(dummy_contacts_dict, max_bucket_size=2))
+
+    def test_find_merge_proposals(self):
+
+        expected_merge_proposals = [
+            {'kept_id': 1, 'duplicate_ids': [2, 6], 'fields': {}, 'similarity': 1 - 1 / 15},
+            {'kept_id': 3, 'duplicate_ids': [4], 'fields': {'mobile_number': '00000000074'}, 'similarity': 1.0}
+        ]
+
+        self.assertEqual(expected_merge_proposals, find_merge_proposals(dummy_contacts_dict))
+
+        # The pairs of contacts compared in several processes give the same proposals
+        self.assertEqual(
+            expected_merge_proposals,
+            find_merge_proposals(dummy_contacts_dict, max_workers=2, min_pairs_for_processes=1)
+        )
+
+    def test_apply_merge_proposals(self):
+
+        temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        self.addCleanup(shutil.rmtree, temporary_dir)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, temporary_dir)
+        root_dir_temporary_contacts_dict = os.path.relpath(temporary_dir, project_root_dir) + '/'
+
+        contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        contact_id = contact_store.create_contact('Wolfgang', 'Pauly', '', '')
+
+        merge_proposals = find_merge_proposals(contact_store.get_live_columns())
+        self.assertEqual([14], [merge_proposal['kept_id'] for merge_proposal in merge_proposals])
+        self.assertEqual([contact_id], merge_proposals[0]['duplicate_ids'])
+
+        apply_merge_proposals(contact_store, merge_proposals)
+
+        self.assertEqual([13, 14, 15], list(contact_store))
+        self.assertEqual([], find_merge_proposals(contact_store.get_live_columns()))
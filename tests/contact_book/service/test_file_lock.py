@@ -0,0 +1,52 @@
+import unittest
+
+import os
+import tempfile
+import threading
+
+from contact_book.src.contact_book.service.file_lock import InterProcessLock
+
+
+class TestInterProcessLock(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp()
+        self.lock_file_path = os.path.join(self.temporary_dir, 'contacts_journal.txt.lock')
+
+    def tearDown(self):
+
+        os.remove(self.lock_file_path)
+        os.rmdir(self.temporary_dir)
+
+    def test_lock_is_exclusive_across_lock_files_opened(self):
+
+        # Two locks of the same lock file behave as in two processes, since each of them opens the lock file on its own
+        inter_process_lock = InterProcessLock(self.lock_file_path)
+        other_inter_process_lock = InterProcessLock(self.lock_file_path)
+
+        with inter_process_lock:
+            self.assertFalse(other_inter_process_lock.acquire(blocking=False))
+
+        self.assertTrue(other_inter_process_lock.acquire(blocking=False))
+        other_inter_process_lock.release()
+
+    def test_lock_is_reentrant_for_the_thread_holding_it(self):
+
+        inter_process_lock = InterProcessLock(self.lock_file_path)
+        acquired_by_other_thread = []
+
+        with inter_process_lock:
+            with inter_process_lock:
+                pass
+
+            # The lock is still held after the nested release
+            other_thread = threading.Thread(
+                target=lambda: acquired_by_other_thread.append(inter_process_lock.acquire(blocking=False))
+            )
+            other_thread.start()
+            other_thread.join()
+
+        self.assertEqual([False], acquired_by_other_thread)
+        self.assertTrue(inter_process_lock.acquire(blocking=False))
+        inter_process_lock.release()
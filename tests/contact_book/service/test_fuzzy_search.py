@@ -0,0 +1,86 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.fuzzy_search import (
+    TrigramIndex, get_bounded_edit_distance, get_trigrams)
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+dummy_contacts_dict = {
+    'id': [1, 2, 3],
+    'forename': ["Sheldon", "Leonard", "Howard"],
+    'surname': ["Cooper", "Hofstadter", "Wolowitz"],
+    'email_address': ["sheldor@myphdmail.com", "leo@myphdmail.com", "howie@nasamail.com"],
+    'mobile_number': ["", "", ""]
+}
+
+
+class TestFuzzySearch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.trigram_index = TrigramIndex()
+        self.trigram_index.build(dummy_contacts_dict)
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_get_trigrams(self):
+
+        self.assertEqual({'  c', ' co', 'coo', 'oop', 'ope', 'per', 'er '}, get_trigrams('cooper'))
+
+    def test_get_bounded_edit_distance(self):
+
+        self.assertEqual(0, get_bounded_edit_distance('cooper', 'cooper', 2))
+        self.assertEqual(2, get_bounded_edit_distance('shledon', 'sheldon', 2))
+        self.assertEqual(3, get_bounded_edit_distance('kripke', 'cooper', 2))
+        self.assertEqual(3, get_bounded_edit_distance('cooper', 'hofstadter', 2))
+
+    def test_search_with_typos(self):
+
+        self.assertEqual([1], self.trigram_index.search('Coopre'))
+        self.assertEqual([2], self.trigram_index.search('hofstader'))
+        self.assertEqual([3], self.trigram_index.search('howie@nasamial.com'))
+
+    def test_search_ranked_by_edit_distance(self):
+
+        self.trigram_index.add_contact(4, {'forename': 'Coper', 'surname': 'Kripke', 'email_address': ''})
+
+        self.assertEqual([4, 1], self.trigram_index.search('coper'))
+
+    def test_search_not_found(self):
+
+        self.assertEqual([], self.trigram_index.search('kripke'))
+        self.assertEqual([], self.trigram_index.search('  '))
+
+    def test_remove_contact(self):
+
+        self.trigram_index.remove_contact(1, {})
+
+        self.assertEqual([], self.trigram_index.search('cooper'))
+        self.assertNotIn('coo', self.trigram_index.posting_lists)
+
+    def test_fuzzy_search_contacts_on_service(self):
+
+        contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        contacts_service_object = ContactsService(None, contact_store=contact_store)
+
+        self.assertEqual([(15, 'Erwin Schrodinger')], contacts_service_object.fuzzy_search_contacts('Shrodinger'))
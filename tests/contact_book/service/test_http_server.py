@@ -0,0 +1,238 @@
+import unittest
+from unittest import mock
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.constants import FILE_NAME_SUFFIX_LOCK
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.file_lock import InterProcessLock
+from contact_book.src.contact_book.service.http_server import ContactsHttpServer
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+DUMMY_CONTACT = {
+    'forename': 'Sheldon',
+    'surname': 'Cooper',
+    'email_address': 'sheldor@myphdmail.com',
+    'mobile_number': '00000000073'
+}
+
+
+class TestContactsHttpServer(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(concatenated_root_dirs_and_file_name, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+        self.contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.contacts_http_server = ContactsHttpServer(self.contact_store, port=0)
+        await self.contacts_http_server.start()
+
+        self.reader, self.writer = await asyncio.open_connection('127.0.0.1', self.contacts_http_server.port)
+
+    async def asyncTearDown(self):
+
+        self.writer.close()
+        await self.contacts_http_server.close()
+        shutil.rmtree(self.temporary_dir)
+
+    async def send_request(self, method, target, payload=None, reader=None, writer=None, headers=None):
+        """
+        Send a request on a keep-alive connection (the one opened by default) and read its response, whose headers are
+        kept in 'response_headers'
+
+        :return: a tuple (HTTP status code, the JSON body decoded, or None if empty)
+        """
+
+        reader, writer = reader or self.reader, writer or self.writer
+        body = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        header_lines = ''.join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+        writer.write(
+            f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n{header_lines}\r\n"
+            .encode() + body
+        )
+
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while True:
+            header_line = await reader.readline()
+            if header_line == b'\r\n':
+                break
+            name, _, value = header_line.decode().partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+        self.response_headers = headers
+        response_body = await reader.readexactly(int(headers['content-length']))
+        return status, json.loads(response_body) if response_body else None
+
+    async def test_list_contacts(self):
+
+        status, page = await self.send_request('GET', '/contacts?offset=1&limit=1')
+
+        self.assertEqual(200, status)
+        self.assertEqual(3, page['total'])
+        self.assertEqual(['Pauli'], [contact['surname'] for contact in page['contacts']])
+
+    async def test_crud(self):
+
+        status, created_contact = await self.send_request('POST', '/contacts', DUMMY_CONTACT)
+        self.assertEqual(201, status)
+        self.assertEqual(dict(DUMMY_CONTACT, id=16), created_contact)
+
+        status, updated_contact = await self.send_request(
+            'PUT', '/contacts/16', dict(DUMMY_CONTACT, email_address='sheldon@caltechmail.com')
+        )
+        self.assertEqual(200, status)
+        self.assertEqual('sheldon@caltechmail.com', updated_contact['email_address'])
+
+        self.assertEqual((200, updated_contact), await self.send_request('GET', '/contacts/16'))
+        self.assertEqual((204, None), await self.send_request('DELETE', '/contacts/13'))
+        self.assertEqual(404, (await self.send_request('GET', '/contacts/13'))[0])
+
+        # The writes acknowledged are persisted
+        reloaded_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        self.assertEqual(self.contact_store.get_contacts_dict(), reloaded_contact_store.get_contacts_dict())
+
+    async def test_conditional_update_and_removal(self):
+
+        await self.send_request('GET', '/contacts/14')
+        entity_tag = self.response_headers['etag']
+
+        status, _ = await self.send_request(
+            'PUT', '/contacts/14', dict(DUMMY_CONTACT, forename='Wolfgang'), headers={'If-Match': entity_tag}
+        )
+        self.assertEqual(200, status)
+        self.assertNotEqual(entity_tag, self.response_headers['etag'])
+
+        # The contact was modified since the version the removal is conditional on
+        status, _ = await self.send_request('DELETE', '/contacts/14', headers={'If-Match': entity_tag})
+        self.assertEqual(412, status)
+
+        await self.send_request('GET', '/contacts/14')
+        self.assertEqual(
+            (204, None),
+            await self.send_request('DELETE', '/contacts/14', headers={'If-Match': self.response_headers['etag']})
+        )
+
+    async def test_search(self):
+
+        self.assertEqual(
+            (200, [{'id': 14, 'name': 'Wolfgang Pauli'}]),
+            await self.send_request('GET', '/search?query=pau')
+        )
+        self.assertEqual(
+            (200, [{'id': 14, 'name': 'Wolfgang Pauli'}]),
+            await self.send_request('GET', '/search/fuzzy?query=Paoli&max_distance=1')
+        )
+
+        status, contacts_found = await self.send_request('GET', '/search/mobile-number-suffix?mobile_number_suffix=22')
+        self.assertEqual(200, status)
+        self.assertEqual([14], [contact['id'] for contact in contacts_found])
+
+    async def test_errors(self):
+
+        for method, target, payload, expected_status in (
+                ('GET', '/contacts/16', None, 404),
+                ('GET', '/contacts/sixteen', None, 400),
+                ('GET', '/contacts?limit=-1', None, 400),
+                ('GET', '/search', None, 400),
+                ('GET', '/search?query=pau&limit=0', None, 400),
+                ('GET', '/search/fuzzy?query=pau&limit=0', None, 400),
+                ('GET', '/unknown', None, 404),
+                ('DELETE', '/contacts', None, 405),
+                ('POST', '/contacts', ['Sheldon', 'Cooper'], 400),
+                ('POST', '/contacts', dict(DUMMY_CONTACT, forename=''), 400),
+                ('PUT', '/contacts/16', DUMMY_CONTACT, 404),
+        ):
+            status, response = await self.send_request(method, target, payload)
+            self.assertEqual(expected_status, status, msg=f"{method} {target}")
+            self.assertIn('error', response)
+
+        self.assertEqual(
+            (400, {'error': 'offset must be at least 0.'}), await self.send_request('GET', '/contacts?offset=-1')
+        )
+        self.assertEqual(
+            (400, {'error': 'limit must be between 0 and 1000.'}),
+            await self.send_request('GET', '/contacts?limit=1001')
+        )
+
+        # The connection is kept alive after the errors, and no contact was created
+        self.assertEqual(3, (await self.send_request('GET', '/contacts'))[1]['total'])
+
+    async def test_write_not_persisted(self):
+
+        with mock.patch.object(self.contact_store.storage_backend, 'persist', side_effect=OSError("Disk full")):
+            status, response = await self.send_request('POST', '/contacts', dict(DUMMY_CONTACT, surname='Phantom'))
+        self.assertEqual(500, status)
+        self.assertIn('error', response)
+
+        # The contact which was not persisted is not served
+        self.assertEqual(3, (await self.send_request('GET', '/contacts'))[1]['total'])
+        self.assertEqual((200, []), await self.send_request('GET', '/search?query=Phan'))
+        self.assertEqual(404, (await self.send_request('GET', '/contacts/16'))[0])
+
+    async def test_concurrent_writes_persisted_in_batches(self):
+
+        connections = [await asyncio.open_connection('127.0.0.1', self.contacts_http_server.port) for _ in range(10)]
+        try:
+            responses = await asyncio.gather(*[
+                self.send_request('POST', '/contacts', DUMMY_CONTACT, reader, writer) for reader, writer in connections
+            ])
+        finally:
+            for _, writer in connections:
+                writer.close()
+
+        self.assertEqual([201] * 10, [status for status, _ in responses])
+        self.assertEqual(list(range(16, 26)), sorted(created_contact['id'] for _, created_contact in responses))
+        self.assertLess(self.contacts_http_server.number_of_write_batches, 10)
+        self.assertEqual(13, len(self.contact_store))
+
+    async def test_reads_served_while_contacts_locked(self):
+
+        # Another process persists a contact, and then holds the lock of the contacts, e.g., while importing a file
+        other_contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        other_contact_store.create_contact(*DUMMY_CONTACT.values())
+        other_process_lock = InterProcessLock(
+            self.contact_store.storage_backend.journal_file_path + FILE_NAME_SUFFIX_LOCK
+        )
+        other_process_lock.acquire()
+
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.contacts_http_server.port)
+        try:
+            creation = asyncio.ensure_future(self.send_request('POST', '/contacts', DUMMY_CONTACT, reader, writer))
+
+            # The reads are served from the store as it is, without waiting for the lock, whereas the write waits for it
+            status, page = await asyncio.wait_for(self.send_request('GET', '/contacts'), timeout=1)
+            self.assertEqual((200, 3), (status, page['total']))
+            self.assertFalse(creation.done())
+        finally:
+            other_process_lock.release()
+
+        try:
+            status, created_contact = await creation
+        finally:
+            writer.close()
+        self.assertEqual((201, 17), (status, created_contact['id']))
+
+        # The contact persisted by the other process is merged once the lock is released
+        self.assertEqual(5, (await self.send_request('GET', '/contacts'))[1]['total'])
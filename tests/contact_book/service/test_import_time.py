@@ -0,0 +1,62 @@
+import unittest
+
+import json
+import subprocess
+import sys
+
+from contact_book.root import get_contact_book_root
+
+
+project_root_dir = get_contact_book_root()
+
+# Budget (in seconds) for importing the contacts' service, i.e., the application's modules without the GUI's main loop
+# running, which importing pandas alone would exceed on most machines
+IMPORT_TIME_BUDGET_SECONDS = 0.3
+
+IMPORT_CONTACTS_SERVICE_SCRIPT = """
+import json
+import sys
+import time
+
+start_time = time.perf_counter()
+import contact_book.src.contact_book.service.contacts_service
+import_time = time.perf_counter() - start_time
+
+print(json.dumps({
+    'import_time': import_time,
+    'pandas_imported': 'pandas' in sys.modules,
+    'tkinter_imported': 'tkinter' in sys.modules
+}))
+"""
+
+
+def import_contacts_service() -> dict:
+
+    # The service is imported by a new interpreter, such that none of its modules has already been imported
+    completed_process = subprocess.run(
+        [sys.executable, '-c', IMPORT_CONTACTS_SERVICE_SCRIPT],
+        cwd=project_root_dir,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(completed_process.stdout)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_pandas_not_imported(self):
+
+        self.assertFalse(import_contacts_service()['pandas_imported'])
+
+    def test_tkinter_not_imported(self):
+
+        # The service does not need the GUI, e.g., to be used from the command line without a display
+        self.assertFalse(import_contacts_service()['tkinter_imported'])
+
+    def test_import_time_within_budget(self):
+
+        # The fastest of a few imports is taken, such that the test is not failed by a slow disk or a busy machine
+        import_time = min(import_contacts_service()['import_time'] for _ in range(3))
+
+        self.assertLess(import_time, IMPORT_TIME_BUDGET_SECONDS)
@@ -0,0 +1,106 @@
+import unittest
+
+import json
+import os
+import tempfile
+
+from contact_book.src.contact_book.service.journal import (
+    append_journal_records, create_checkpoint_record, create_journal_record,
+    read_journal_records, replay_journal_records, tail_journal_records)
+
+
+def get_dummy_contacts_dict():
+
+    return {
+        'id': [13, 14, 15],
+        'forename': ["Richard", "Wolfgang", "Erwin"],
+        'surname': ["Feynman", "Pauli", "Schrodinger"],
+        'email_address': [
+            "rick.feynman@mytopquantummail.com",
+            "wolfy.pauli@mybestquantummail.com",
+            "erwin.schrodinger@mycatsmailmaybe.com"],
+        'mobile_number': ["00000000021", "00000000022", "00000000023"]
+    }
+
+
+DUMMY_CONTACT_FIELDS = {
+    'forename': 'Sheldon',
+    'surname': 'Cooper',
+    'email_address': 'sheldor@myphdmail.com',
+    'mobile_number': '00000000073'
+}
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+
+        file_descriptor, self.journal_file_path = tempfile.mkstemp()
+        os.close(file_descriptor)
+
+    def tearDown(self):
+
+        os.remove(self.journal_file_path)
+
+    def test_append_and_read_journal_records(self):
+
+        journal_records = [
+            create_journal_record('create', 16, DUMMY_CONTACT_FIELDS),
+            create_journal_record('delete', 13)
+        ]
+
+        journal_size = append_journal_records(journal_records, self.journal_file_path)
+
+        self.assertEqual(os.path.getsize(self.journal_file_path), journal_size)
+        self.assertEqual(journal_records, read_journal_records(self.journal_file_path))
+
+    def test_read_journal_records_discards_partly_written_record(self):
+
+        journal_record = create_journal_record('delete', 13)
+        append_journal_records([journal_record], self.journal_file_path)
+        with open(self.journal_file_path, 'a') as journal_file:
+            journal_file.write(json.dumps(create_journal_record('delete', 14))[:10])
+
+        self.assertEqual([journal_record], read_journal_records(self.journal_file_path))
+
+    def test_tail_journal_records(self):
+
+        first_journal_records = [create_journal_record('delete', 13)]
+        journal_offset = append_journal_records(first_journal_records, self.journal_file_path)
+
+        self.assertEqual((first_journal_records, journal_offset), tail_journal_records(self.journal_file_path))
+
+        # Only the records appended since the offset returned are read next
+        next_journal_records = [create_journal_record('delete', 14), create_checkpoint_record(2)]
+        journal_size = append_journal_records(next_journal_records, self.journal_file_path)
+
+        self.assertEqual(
+            (next_journal_records, journal_size), tail_journal_records(self.journal_file_path, journal_offset)
+        )
+        self.assertEqual(([], 0), tail_journal_records(self.journal_file_path + '.missing'))
+
+    def test_replay_journal_records(self):
+
+        journal_records = [
+            create_journal_record('create', 16, DUMMY_CONTACT_FIELDS),
+            create_journal_record('update', 14, {'surname': 'Pauly'}),
+            create_journal_record('delete', 15)
+        ]
+
+        expected_contacts_dict = {
+            'id': [13, 14, 16],
+            'forename': ["Richard", "Wolfgang", "Sheldon"],
+            'surname': ["Feynman", "Pauly", "Cooper"],
+            'email_address': [
+                "rick.feynman@mytopquantummail.com",
+                "wolfy.pauli@mybestquantummail.com",
+                "sheldor@myphdmail.com"],
+            'mobile_number': ["00000000021", "00000000022", "00000000073"]
+        }
+
+        result_contacts_dict = replay_journal_records(get_dummy_contacts_dict(), journal_records)
+
+        self.assertEqual(expected_contacts_dict, result_contacts_dict)
+
+        # Replaying the same records again on top of the result is idempotent
+        self.assertEqual(expected_contacts_dict, replay_journal_records(result_contacts_dict, journal_records))
@@ -0,0 +1,135 @@
+import unittest
+
+import json
+import os
+import pstats
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.metrics import (
+    disable_metrics, dump_metrics, dump_profile, enable_metrics,
+    format_metrics_as_prometheus_text, get_metrics, instrument,
+    reset_metrics)
+from contact_book.src.contact_book.service.prefix_search import PrefixSearchIndex
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+
+@instrument('test.divide')
+def divide(dividend: int, divisor: int) -> float:
+    return dividend / divisor
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(concatenated_root_dirs_and_file_name, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+        reset_metrics()
+
+    def tearDown(self):
+
+        disable_metrics()
+        reset_metrics()
+        shutil.rmtree(self.temporary_dir)
+
+    def test_instrument_does_not_record_while_disabled(self):
+
+        self.assertEqual(2, divide(4, 2))
+
+        self.assertEqual({}, get_metrics()['operations'])
+
+    def test_instrument_records_latency_and_errors(self):
+
+        enable_metrics()
+
+        divide(4, 2)
+        with self.assertRaises(ZeroDivisionError):
+            divide(4, 0)
+
+        divide_metrics = get_metrics()['operations']['test.divide']
+        self.assertEqual(2, divide_metrics['count'])
+        self.assertEqual(1, divide_metrics['errors'])
+        self.assertEqual(2, divide_metrics['latency_buckets']['+Inf'])
+        self.assertLessEqual(divide_metrics['max_seconds'], divide_metrics['total_seconds'])
+
+    def test_instrument_logs_slow_operations(self):
+
+        enable_metrics(slow_operation_threshold_seconds=0)
+
+        with self.assertLogs(level='WARNING') as logs:
+            divide(4, 2)
+
+        self.assertIn("Slow operation: test.divide took", logs.output[0])
+
+    def test_contacts_service_and_storage_calls_are_instrumented(self):
+
+        enable_metrics()
+
+        contact_store = ContactStore(storage_backend=JsonFileStorageBackend(
+            self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict
+        ))
+        contacts_service = ContactsService(application=None, contact_store=contact_store)
+        contacts_service.search_contacts('Pau')
+        contacts_service.search_contacts('Feyn')
+        contact_store.get_index(PrefixSearchIndex)
+        contact_store.save()
+
+        metrics = get_metrics()
+        self.assertEqual(2, metrics['operations']['ContactsService.search_contacts']['count'])
+        self.assertEqual(1, metrics['operations']['utils.get_contacts_dict']['count'])
+        self.assertEqual(1, metrics['operations']['utils.save_contacts_dict']['count'])
+        self.assertEqual(
+            os.path.getsize(concatenated_root_dirs_and_file_name),
+            metrics['bytes_read'][file_name_dummy_contacts_dict]
+        )
+        self.assertEqual(
+            os.path.getsize(self.temporary_dir + '/' + file_name_dummy_contacts_dict),
+            metrics['bytes_written'][file_name_dummy_contacts_dict]
+        )
+        self.assertEqual({'hits': 2, 'misses': 1, 'hit_rate': 2 / 3}, metrics['caches']['contact_indexes'])
+
+        contact_store.storage_backend.close()
+
+    def test_dump_metrics(self):
+
+        enable_metrics()
+        divide(4, 2)
+
+        dump_metrics(self.temporary_dir + '/metrics.json')
+        dump_metrics(self.temporary_dir + '/metrics.prom')
+
+        with open(self.temporary_dir + '/metrics.json') as metrics_file:
+            self.assertEqual(get_metrics(), json.load(metrics_file))
+        with open(self.temporary_dir + '/metrics.prom') as metrics_file:
+            prometheus_text = metrics_file.read()
+        self.assertEqual(format_metrics_as_prometheus_text(get_metrics()), prometheus_text)
+        self.assertIn('contact_book_operation_duration_seconds_count{operation="test.divide"} 1\n', prometheus_text)
+        self.assertIn('contact_book_operation_errors_total{operation="test.divide"} 0\n', prometheus_text)
+
+        with self.assertRaises(ValueError):
+            dump_metrics(self.temporary_dir + '/metrics.txt', 'xml')
+
+    def test_dump_profile(self):
+
+        with self.assertRaises(ValueError):
+            dump_profile(self.temporary_dir + '/operations.prof')
+
+        enable_metrics(profile=True)
+        divide(4, 2)
+        dump_profile(self.temporary_dir + '/operations.prof')
+
+        profile_stats = pstats.Stats(self.temporary_dir + '/operations.prof')
+        self.assertIn('divide', [function_name for _, _, function_name in profile_stats.stats])
@@ -0,0 +1,89 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.prefix_search import (
+    PrefixSearchIndex, normalise_search_key)
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+dummy_contacts_dict = {
+    'id': [1, 2, 3, 4],
+    'forename': ["Sheldon", "Leonard", "Howard", "Penny"],
+    'surname': ["Cooper", "Hofstadter", "Wolowitz", "Hofstadter"],
+    'email_address': ["", "", "", ""],
+    'mobile_number': ["", "", "", ""]
+}
+
+
+class TestPrefixSearch(unittest.TestCase):
+
+    def setUp(self):
+
+        self.prefix_search_index = PrefixSearchIndex()
+        self.prefix_search_index.build(dummy_contacts_dict)
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_normalise_search_key(self):
+
+        self.assertEqual('sheldon cooper', normalise_search_key('  Sheldon   COOPER'))
+
+    def test_search_by_surname_prefix(self):
+
+        self.assertEqual([2, 4], self.prefix_search_index.search('hof'))
+
+    def test_search_by_forename_prefix(self):
+
+        self.assertEqual([3], self.prefix_search_index.search('HOW'))
+
+    def test_search_by_full_name_prefix(self):
+
+        self.assertEqual([4], self.prefix_search_index.search('penny hof'))
+        self.assertEqual([4], self.prefix_search_index.search('Hofstadter P'))
+
+    def test_search_with_limit(self):
+
+        self.assertEqual([2], self.prefix_search_index.search('hof', limit=1))
+        self.assertEqual([], self.prefix_search_index.search('hof', limit=0))
+
+    def test_search_not_found(self):
+
+        self.assertEqual([], self.prefix_search_index.search('kripke'))
+
+    def test_add_and_remove_contact(self):
+
+        dummy_contact = {'forename': 'Barry', 'surname': 'Kripke'}
+
+        self.prefix_search_index.add_contact(5, dummy_contact)
+        self.assertEqual([5], self.prefix_search_index.search('kri'))
+
+        self.prefix_search_index.remove_contact(5, dummy_contact)
+        self.assertEqual([], self.prefix_search_index.search('kri'))
+        self.assertEqual(8, len(self.prefix_search_index.sorted_keys))
+
+    def test_search_contacts_on_service(self):
+
+        contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        contacts_service_object = ContactsService(None, contact_store=contact_store)
+
+        self.assertEqual([(14, 'Wolfgang Pauli')], contacts_service_object.search_contacts('pau'))
+        self.assertEqual([(15, 'Erwin Schrodinger')], contacts_service_object.search_contacts('erwin s'))
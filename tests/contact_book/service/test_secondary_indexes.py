@@ -0,0 +1,96 @@
+import unittest
+
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.contacts_service import ContactsService
+from contact_book.src.contact_book.service.secondary_indexes import (
+    EmailDomainIndex, MobileNumberSuffixIndex, get_email_domain,
+    normalise_mobile_number)
+from contact_book.src.contact_book.service.storage_backends import JsonFileStorageBackend
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+
+dummy_contacts_dict = {
+    'id': [1, 2, 3],
+    'forename': ["Sheldon", "Leonard", "Howard"],
+    'surname': ["Cooper", "Hofstadter", "Wolowitz"],
+    'email_address': ["sheldor@myphdmail.com", "leo@MyPhdMail.com", "howie@nasamail.com"],
+    'mobile_number': ["+44 7700 904821", "07700-900482", "00000004821"]
+}
+
+
+class TestSecondaryIndexes(unittest.TestCase):
+
+    def test_get_email_domain(self):
+
+        self.assertEqual('myphdmail.com', get_email_domain(' leo@MyPhdMail.com '))
+        self.assertEqual('', get_email_domain('no email'))
+
+    def test_normalise_mobile_number(self):
+
+        self.assertEqual('447700904821', normalise_mobile_number('+44 7700 904821'))
+
+    def test_email_domain_index(self):
+
+        email_domain_index = EmailDomainIndex()
+        email_domain_index.build(dummy_contacts_dict)
+
+        self.assertEqual([1, 2], email_domain_index.find('@myphdmail.COM'))
+        self.assertEqual([], email_domain_index.find('example.com'))
+
+        email_domain_index.update_contact(
+            2,
+            {'email_address': 'leo@MyPhdMail.com'},
+            {'email_address': 'leo@caltech.edu'}
+        )
+
+        self.assertEqual([1], email_domain_index.find('myphdmail.com'))
+        self.assertEqual([2], email_domain_index.find('caltech.edu'))
+
+    def test_mobile_number_suffix_index(self):
+
+        mobile_number_suffix_index = MobileNumberSuffixIndex()
+        mobile_number_suffix_index.build(dummy_contacts_dict)
+
+        self.assertEqual([1, 3], mobile_number_suffix_index.find('4821'))
+        self.assertEqual([2], mobile_number_suffix_index.find('0482'))
+        self.assertEqual([], mobile_number_suffix_index.find(''))
+
+        mobile_number_suffix_index.remove_contact(3, {'mobile_number': '00000004821'})
+
+        self.assertEqual([1], mobile_number_suffix_index.find('4821'))
+
+    def test_indexes_kept_in_sync_by_service(self):
+
+        temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict, temporary_dir)
+        root_dir_temporary_contacts_dict = os.path.relpath(temporary_dir, project_root_dir) + '/'
+
+        contact_store = ContactStore(
+            storage_backend=JsonFileStorageBackend(root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+        contacts_service_object = ContactsService(None, contact_store=contact_store)
+
+        self.assertEqual([14], [
+            contact['id'] for contact in contacts_service_object.find_contacts_by_email_domain('mybestquantummail.com')
+        ])
+
+        created_id = contact_store.create_contact('Sheldon', 'Cooper', 'sheldor@mybestquantummail.com', '00000004821')
+        contact_store.update_contact(14, 'Wolfgang', 'Pauli', 'wolfy.pauli@exclusionmail.com', '00000000022')
+
+        self.assertEqual([created_id], [
+            contact['id'] for contact in contacts_service_object.find_contacts_by_email_domain('mybestquantummail.com')
+        ])
+        self.assertEqual([created_id], [
+            contact['id'] for contact in contacts_service_object.find_contacts_by_mobile_number_suffix('4821')
+        ])
+
+        shutil.rmtree(temporary_dir)
@@ -0,0 +1,161 @@
+import unittest
+
+from contact_book.src.contact_book.service.sorted_index import (
+    ContactsListView, SortedContactIndex)
+
+
+dummy_contacts_dict = {
+    'id': [13, 14, 15],
+    'forename': ["Richard", "Wolfgang", "Erwin"],
+    'surname': ["Feynman", "Pauli", "Schrodinger"],
+    'email_address': [
+        "rick.feynman@mytopquantummail.com",
+        "wolfy.pauli@mybestquantummail.com",
+        "erwin.schrodinger@mycatsmailmaybe.com"],
+    'mobile_number': ["00000000021", "00000000022", "00000000023"]
+}
+
+DUMMY_CONTACT = {
+    'id': 16,
+    'forename': 'Sheldon',
+    'surname': 'Cooper',
+    'email_address': 'sheldor@myphdmail.com',
+    'mobile_number': '00000000073'
+}
+
+
+class TestSortedContactIndex(unittest.TestCase):
+
+    def setUp(self):
+
+        self.sorted_index = SortedContactIndex(dummy_contacts_dict)
+
+    def test_build_sorted_index(self):
+
+        expected_contacts_list = [(13, 'Richard Feynman'), (14, 'Wolfgang Pauli'), (15, 'Erwin Schrodinger')]
+
+        self.assertEqual(expected_contacts_list, self.sorted_index.get_contacts_list())
+
+    def test_add_contact(self):
+
+        result_position = self.sorted_index.add_contact(16, DUMMY_CONTACT)
+
+        self.assertEqual(0, result_position)
+        self.assertEqual('Sheldon Cooper', self.sorted_index.get_display_name(0))
+        self.assertEqual(4, len(self.sorted_index))
+
+    def test_add_contacts(self):
+
+        contacts_list_changes = []
+        self.sorted_index.add_change_listener(contacts_list_changes.append)
+
+        self.sorted_index.add_contacts([
+            (16, DUMMY_CONTACT),
+            (17, {'forename': 'Leonard', 'surname': 'Hofstadter'})
+        ])
+
+        self.assertEqual(
+            [(16, 'Sheldon Cooper'), (13, 'Richard Feynman'), (17, 'Leonard Hofstadter'), (14, 'Wolfgang Pauli'),
+             (15, 'Erwin Schrodinger')],
+            self.sorted_index.get_contacts_list()
+        )
+        self.assertEqual([{'change': 'reset', 'position': 0}], contacts_list_changes)
+
+    def test_remove_contact(self):
+
+        result_position = self.sorted_index.remove_contact(14, {'forename': 'Wolfgang', 'surname': 'Pauli'})
+
+        self.assertEqual(1, result_position)
+        self.assertEqual([(13, 'Richard Feynman'), (15, 'Erwin Schrodinger')], self.sorted_index.get_contacts_list())
+
+    def test_remove_contacts(self):
+
+        contacts_list_changes = []
+        self.sorted_index.add_change_listener(contacts_list_changes.append)
+
+        self.sorted_index.remove_contacts([
+            (13, {'forename': 'Richard', 'surname': 'Feynman'}),
+            (15, {'forename': 'Erwin', 'surname': 'Schrodinger'})
+        ])
+
+        self.assertEqual([(14, 'Wolfgang Pauli')], self.sorted_index.get_contacts_list())
+        self.assertEqual([{'change': 'reset', 'position': 0}], contacts_list_changes)
+
+    def test_update_contacts(self):
+
+        self.sorted_index.update_contacts([
+            (13, {'forename': 'Richard', 'surname': 'Feynman'}, DUMMY_CONTACT),
+            (15, {'forename': 'Erwin', 'surname': 'Schrodinger'}, {'forename': 'Erwin', 'surname': 'Born'})
+        ])
+
+        self.assertEqual(
+            [(15, 'Erwin Born'), (13, 'Sheldon Cooper'), (14, 'Wolfgang Pauli')],
+            self.sorted_index.get_contacts_list()
+        )
+
+    def test_update_contact_moves_it(self):
+
+        self.sorted_index.update_contact(
+            15,
+            {'forename': 'Erwin', 'surname': 'Schrodinger'},
+            {'forename': 'Erwin', 'surname': 'Born'}
+        )
+
+        self.assertEqual(
+            [(15, 'Erwin Born'), (13, 'Richard Feynman'), (14, 'Wolfgang Pauli')],
+            self.sorted_index.get_contacts_list()
+        )
+
+    def test_remove_contact_not_indexed(self):
+
+        with self.assertRaises(KeyError):
+            self.sorted_index.remove_contact(16, DUMMY_CONTACT)
+
+    def test_contacts_list_view(self):
+
+        contacts_list_view = ContactsListView(self.sorted_index)
+        self.assertEqual(3, len(contacts_list_view))
+        self.assertEqual((15, 'Erwin Schrodinger'), contacts_list_view[2])
+        self.assertEqual(self.sorted_index.get_contacts_list(), list(contacts_list_view))
+
+        # The view is live, such that it lists the contacts added to the index afterwards
+        self.sorted_index.add_contact(16, DUMMY_CONTACT)
+        self.assertEqual((16, 'Sheldon Cooper'), contacts_list_view[0])
+        self.assertEqual(4, len(contacts_list_view))
+
+    def test_change_listeners(self):
+
+        contacts_list_changes = []
+        self.sorted_index.add_change_listener(contacts_list_changes.append)
+
+        self.sorted_index.add_contact(16, DUMMY_CONTACT)
+        self.sorted_index.update_contact(
+            15,
+            {'forename': 'Erwin', 'surname': 'Schrodinger'},
+            {'forename': 'Erwin', 'surname': 'Born'}
+        )
+        self.sorted_index.remove_contact(14, {'forename': 'Wolfgang', 'surname': 'Pauli'})
+
+        self.assertEqual(
+            [
+                {'change': 'insert', 'position': 0},
+                {'change': 'move', 'position': 3, 'new_position': 0},
+                {'change': 'remove', 'position': 3}
+            ],
+            contacts_list_changes
+        )
+
+    def test_update_contact_without_changing_name_is_not_a_change(self):
+
+        contacts_list_changes = []
+        self.sorted_index.add_change_listener(contacts_list_changes.append)
+
+        self.sorted_index.update_contact(
+            13,
+            {'forename': 'Richard', 'surname': 'Feynman', 'email_address': 'rick.feynman@mytopquantummail.com'},
+            {'forename': 'Richard', 'surname': 'Feynman', 'email_address': 'dick.feynman@mytopquantummail.com'}
+        )
+        self.sorted_index.remove_change_listener(contacts_list_changes.append)
+        self.sorted_index.add_contact(16, DUMMY_CONTACT)
+
+        self.assertEqual([], contacts_list_changes)
@@ -0,0 +1,172 @@
+import unittest
+
+import json
+import os
+import shutil
+import tempfile
+
+from contact_book.root import get_contact_book_root
+
+from contact_book.src.contact_book.service.contact_store import ContactStore
+from contact_book.src.contact_book.service.storage_backends import (
+    BinaryFileStorageBackend, JsonFileStorageBackend, SQLiteStorageBackend,
+    get_storage_backend, migrate_binary_to_json, migrate_json_to_binary,
+    migrate_json_to_sqlite)
+from contact_book.src.contact_book.service.utils import get_contacts_dict
+
+
+project_root_dir = get_contact_book_root()
+root_dir_dummy_contacts_dict = '/tests/contact_book/dummy_data/'
+file_name_dummy_contacts_dict = 'dummy_contacts_dict.txt'
+file_name_dummy_contacts_database = 'dummy_contacts.db'
+file_name_dummy_contacts_binary = 'dummy_contacts.bin'
+
+concatenated_root_dirs_and_file_name = project_root_dir + root_dir_dummy_contacts_dict + file_name_dummy_contacts_dict
+
+with open(concatenated_root_dirs_and_file_name) as dummy_contacts_dict_file:
+    expected_dummy_contacts_dict = json.load(dummy_contacts_dict_file)
+
+
+class TestStorageBackends(unittest.TestCase):
+
+    def setUp(self):
+
+        self.temporary_dir = tempfile.mkdtemp(dir=project_root_dir + root_dir_dummy_contacts_dict)
+        shutil.copy(concatenated_root_dirs_and_file_name, self.temporary_dir)
+        self.root_dir_temporary_contacts_dict = os.path.relpath(self.temporary_dir, project_root_dir) + '/'
+
+    def tearDown(self):
+
+        shutil.rmtree(self.temporary_dir)
+
+    def test_get_storage_backend(self):
+
+        self.assertIsInstance(
+            get_storage_backend('json', self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict),
+            JsonFileStorageBackend
+        )
+        self.assertIsInstance(
+            get_storage_backend('sqlite', self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict),
+            SQLiteStorageBackend
+        )
+        self.assertIsInstance(
+            get_storage_backend('binary', self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict),
+            BinaryFileStorageBackend
+        )
+        with self.assertRaises(ValueError):
+            get_storage_backend('csv', self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+
+    def test_migrate_json_to_sqlite(self):
+
+        number_of_contacts_migrated = migrate_json_to_sqlite(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict,
+            file_name_dummy_contacts_database
+        )
+
+        sqlite_storage_backend = SQLiteStorageBackend(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_database
+        )
+        result_contacts_dict, result_next_id = sqlite_storage_backend.load()
+        sqlite_storage_backend.close()
+
+        self.assertEqual(3, number_of_contacts_migrated)
+        self.assertEqual(expected_dummy_contacts_dict, result_contacts_dict)
+        self.assertEqual(16, result_next_id)
+
+    def test_sqlite_storage_backend_persists_crud_operations(self):
+
+        migrate_json_to_sqlite(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict,
+            file_name_dummy_contacts_database
+        )
+        sqlite_storage_backend = SQLiteStorageBackend(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_database
+        )
+        contact_store = ContactStore(storage_backend=sqlite_storage_backend)
+
+        created_id = contact_store.create_contact('Sheldon', 'Cooper', 'sheldor@myphdmail.com', '00000000073')
+        contact_store.update_contact(14, 'Wolfgang', 'Pauli', 'pauli@exclusionmail.com', '00000000022')
+        contact_store.remove_contact(13)
+
+        self.assertEqual(contact_store.get_contact(created_id), sqlite_storage_backend.get_contact(created_id))
+        self.assertIsNone(sqlite_storage_backend.get_contact(13))
+        self.assertEqual(
+            [contact_store.get_contact(14)],
+            sqlite_storage_backend.find_contacts('email_address', 'pauli@exclusionmail.com')
+        )
+        self.assertEqual(
+            ['Cooper', 'Pauli', 'Schrodinger'],
+            [contact_row[2] for contact_row in sqlite_storage_backend.iter_contacts_sorted_by_surname()]
+        )
+        self.assertEqual((contact_store.get_contacts_dict(), created_id + 1), sqlite_storage_backend.load())
+
+        sqlite_storage_backend.close()
+
+    def test_sqlite_storage_backend_rejects_lookup_by_non_indexed_field(self):
+
+        sqlite_storage_backend = SQLiteStorageBackend(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_database
+        )
+
+        with self.assertRaises(ValueError):
+            sqlite_storage_backend.find_contacts('forename', 'Sheldon')
+
+        sqlite_storage_backend.close()
+
+    def test_migrate_json_to_binary_and_back(self):
+
+        number_of_contacts_migrated = migrate_json_to_binary(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict,
+            file_name_dummy_contacts_binary
+        )
+        os.remove(self.temporary_dir + '/' + file_name_dummy_contacts_dict)
+
+        self.assertEqual(3, number_of_contacts_migrated)
+        self.assertEqual(
+            (expected_dummy_contacts_dict, 16),
+            BinaryFileStorageBackend(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_binary).load()
+        )
+
+        # Migrating the contacts back gives the original contacts_dict.txt file
+        migrate_binary_to_json(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_binary,
+            file_name_dummy_contacts_dict
+        )
+        self.assertEqual(
+            expected_dummy_contacts_dict,
+            get_contacts_dict(self.root_dir_temporary_contacts_dict, file_name_dummy_contacts_dict)
+        )
+
+    def test_binary_storage_backend_persists_crud_operations(self):
+
+        migrate_json_to_binary(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_dict,
+            file_name_dummy_contacts_binary
+        )
+        binary_storage_backend = BinaryFileStorageBackend(
+            self.root_dir_temporary_contacts_dict,
+            file_name_dummy_contacts_binary
+        )
+        contact_store = ContactStore(storage_backend=binary_storage_backend)
+        self.assertFalse(binary_storage_backend.has_journal_records())
+
+        created_id = contact_store.create_contact('Sheldon', 'Cooper', 'sheldor@myphdmail.com', '00000000073')
+        contact_store.update_contact(14, 'Wolfgang', 'Pauli', 'pauli@exclusionmail.com', '00000000022')
+        contact_store.remove_contact(13)
+
+        # The operations are journaled on top of the binary snapshot, and saved into it with the contacts
+        self.assertTrue(binary_storage_backend.has_journal_records())
+        self.assertEqual((contact_store.get_contacts_dict(), created_id + 1), binary_storage_backend.load())
+
+        contact_store.save()
+
+        self.assertFalse(binary_storage_backend.has_journal_records())
+        self.assertEqual((contact_store.get_contacts_dict(), created_id + 1), binary_storage_backend.read_snapshot())
@@ -0,0 +1,63 @@
+import unittest
+
+from array import array
+
+from contact_book.src.contact_book.service.tombstones import (
+    LiveColumns, TombstoneBitmap)
+
+
+class TestTombstoneBitmap(unittest.TestCase):
+
+    def setUp(self):
+
+        self.tombstones = TombstoneBitmap(10)
+
+    def test_add_and_discard(self):
+
+        self.tombstones.add(3)
+        self.tombstones.add(9)
+        self.tombstones.add(9)
+
+        self.assertIn(9, self.tombstones)
+        self.assertNotIn(4, self.tombstones)
+        self.assertEqual(2, self.tombstones.count)
+
+        self.tombstones.discard(9)
+        self.tombstones.discard(5)
+
+        self.assertNotIn(9, self.tombstones)
+        self.assertEqual(1, self.tombstones.count)
+
+    def test_extend_and_insert(self):
+
+        self.tombstones.add(7)
+        self.tombstones.add(8)
+        self.tombstones.extend(7)
+        self.tombstones.add(16)
+        self.tombstones.insert(8)
+
+        self.assertEqual(18, len(self.tombstones))
+        self.assertEqual(3, len(self.tombstones.bits))
+        self.assertEqual(
+            [7, 9, 17],
+            [position for position in range(len(self.tombstones)) if position in self.tombstones]
+        )
+
+    def test_get_live_rows(self):
+
+        self.tombstones.add(0)
+        self.tombstones.add(8)
+
+        self.assertEqual([False] + [True] * 7 + [False, True], list(self.tombstones.get_live_rows()))
+
+    def test_live_columns(self):
+
+        self.tombstones = TombstoneBitmap(3)
+        self.tombstones.add(1)
+
+        live_columns = LiveColumns(
+            {'id': array('q', [13, 14, 15]), 'surname': ['Feynman', 'Pauli', 'Schrodinger']},
+            self.tombstones
+        )
+
+        self.assertEqual({'id': [13, 15], 'surname': ['Feynman', 'Schrodinger']}, dict(live_columns))
@@ -0,0 +1,101 @@
+import unittest
+
+from contact_book.src.contact_book.service.undo_history import (
+    UndoHistory, copy_journal_record, create_inverse_journal_record)
+
+
+DUMMY_CONTACT_FIELDS = {
+    'forename': 'Sheldon',
+    'surname': 'Cooper',
+    'email_address': 'sheldor@myphdmail.com',
+    'mobile_number': '00000000073'
+}
+DUMMY_CONTACT = dict(DUMMY_CONTACT_FIELDS, id=16)
+
+
+class TestUndoHistory(unittest.TestCase):
+
+    def test_create_inverse_journal_record(self):
+
+        self.assertEqual(
+            {'operation': 'delete', 'id': 16},
+            create_inverse_journal_record({'operation': 'create', 'id': 16, 'fields': {}})
+        )
+
+        # Only the fields changed by an update are kept to undo it
+        self.assertEqual(
+            {'operation': 'update', 'id': 16, 'fields': {'surname': 'Cooper'}},
+            create_inverse_journal_record(
+                {'operation': 'update', 'id': 16, 'fields': {'surname': 'Lee'}}, DUMMY_CONTACT
+            )
+        )
+
+        self.assertEqual(
+            {'operation': 'create', 'id': 16, 'fields': DUMMY_CONTACT_FIELDS},
+            create_inverse_journal_record({'operation': 'delete', 'id': 16}, DUMMY_CONTACT)
+        )
+
+    def test_copy_journal_record(self):
+
+        self.assertEqual(
+            {'operation': 'update', 'id': 16, 'fields': {'surname': 'Lee'}},
+            copy_journal_record({'operation': 'update', 'id': 16, 'fields': {'surname': 'Lee'}, 'version': 42})
+        )
+
+    def test_record_undone_and_redone(self):
+
+        undo_history = UndoHistory(depth=2)
+        self.assertIsNone(undo_history.get_entry_to_undo())
+
+        for contact_id in (14, 15, 16):
+            undo_history.record([{'operation': 'delete', 'id': contact_id}], {contact_id: DUMMY_CONTACT})
+
+        # The oldest entry was dropped beyond the depth of the history
+        self.assertEqual(2, len(undo_history.undo_entries))
+        self.assertEqual(
+            [{'operation': 'create', 'id': 16, 'fields': DUMMY_CONTACT_FIELDS}],
+            undo_history.get_entry_to_undo()['inverse_journal_records']
+        )
+
+        journal_records_undoing = [{'operation': 'create', 'id': 16, 'fields': {}, 'version': 7}]
+        undo_history.record_undone(journal_records_undoing)
+        self.assertEqual(
+            {
+                'journal_records': journal_records_undoing,
+                'inverse_journal_records': [{'operation': 'delete', 'id': 16}]
+            },
+            undo_history.get_entry_to_redo()
+        )
+
+        undo_history.record_redone([{'operation': 'delete', 'id': 16, 'version': 8}])
+        self.assertIsNone(undo_history.get_entry_to_redo())
+        self.assertEqual(journal_records_undoing, undo_history.get_entry_to_undo()['inverse_journal_records'])
+
+        # Recording a new operation discards the ones undone
+        undo_history.record_undone([])
+        undo_history.record([{'operation': 'create', 'id': 17, 'fields': {}}], {})
+        self.assertIsNone(undo_history.get_entry_to_redo())
+
+    def test_history_bounded_by_number_of_journal_records(self):
+
+        undo_history = UndoHistory(depth=10, max_journal_records=3)
+
+        undo_history.record([{'operation': 'create', 'id': 16, 'fields': {}}], {})
+        undo_history.record([{'operation': 'create', 'id': contact_id, 'fields': {}} for contact_id in (17, 18)], {})
+        undo_history.record([{'operation': 'create', 'id': 19, 'fields': {}}], {})
+
+        # The oldest entry was dropped to keep at most 3 journal records
+        self.assertEqual(
+            [[19], [17, 18]],
+            [
+                [journal_record['id'] for journal_record in entry['journal_records']]
+                for entry in reversed(undo_history.undo_entries)
+            ]
+        )
+
+        # An entry of more journal records than the maximum is not recorded, and the previous ones can no longer be
+        # undone
+        undo_history.record(
+            [{'operation': 'create', 'id': contact_id, 'fields': {}} for contact_id in range(20, 24)], {}
+        )
+        self.assertIsNone(undo_history.get_entry_to_undo())
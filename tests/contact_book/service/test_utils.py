@@ -7,7 +7,7 @@ import pandas as pd
 
 from contact_book.root import get_contact_book_root
 
-from contact_book.src.contact_book.service.contacts_service import (
+from contact_book.src.contact_book.service.utils import (
     convert_contacts_dict_to_df,
     get_contacts_dict,
     save_contacts_dict
@@ -35,6 +35,18 @@ class TestUtils(unittest.TestCase):
 
         self.assertEqual(expected_dummy_contacts_dict, result_dummy_contacts_dict)
 
+    def test_get_contacts_dict_reports_progress(self):
+
+        fractions_read = []
+        get_contacts_dict(
+            contacts_file_root_dir=root_dir_dummy_contacts_dict,
+            contacts_file_name=file_name_dummy_contacts_dict,
+            progress_callback=fractions_read.append
+        )
+
+        # The (small) dummy file is read in a single block
+        self.assertEqual([1.0], fractions_read)
+
     def test_save_contacts_dict(self):
 
         json.dump(expected_dummy_contacts_dict, open(concatenated_root_dirs_and_file_name, 'w'))